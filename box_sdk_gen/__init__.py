@@ -6,10 +6,24 @@ from box_sdk_gen.internal import *
 
 from box_sdk_gen.networking import *
 
-from box_sdk_gen.schemas import *
-
 from box_sdk_gen.parameters import *
 
-from box_sdk_gen.managers import *
-
 from box_sdk_gen.client import *
+
+from box_sdk_gen.async_client import *
+
+from box_sdk_gen import schemas, managers
+
+# Schemas and managers are only imported when first accessed, see `lazy_package_attributes`.
+_LAZY_ATTRIBUTES = {
+    **{name: f'schemas.{module}' for name, module in schemas._LAZY_ATTRIBUTES.items()},
+    **{
+        name: f'managers.{module}' for name, module in managers._LAZY_ATTRIBUTES.items()
+    },
+}
+
+__all__ = [name for name in globals() if not name.startswith('_')] + [
+    name for name in _LAZY_ATTRIBUTES if name not in globals()
+]
+
+__getattr__, __dir__ = lazy_package_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -0,0 +1,272 @@
+import asyncio
+import contextvars
+import functools
+from typing import Dict, Optional
+
+from box_sdk_gen.client import BoxClient
+
+from box_sdk_gen.networking.auth import Authentication
+
+from box_sdk_gen.networking.network import NetworkSession
+
+from box_sdk_gen.networking.fetch_options import FetchOptions
+
+from box_sdk_gen.networking.fetch_response import FetchResponse
+
+from box_sdk_gen.networking.async_network_client import AsyncNetworkClient
+
+from box_sdk_gen.networking.async_box_network_client import AsyncBoxNetworkClient
+
+from box_sdk_gen.networking.single_request import send_request_async
+
+from box_sdk_gen.networking.base_urls import BaseUrls
+
+from box_sdk_gen.networking.timeout_config import TimeoutConfig
+
+from box_sdk_gen.networking.proxy_config import ProxyConfig
+
+from box_sdk_gen.internal.utils import OutputStream
+
+
+class AsyncManager:
+    """
+    Exposes every public method of a manager as a coroutine function.
+
+    Methods decorated with `single_request` build their request on the event loop, then
+    `async_network_client` sends it and the method builds its result from the response.
+    Composite methods calling other methods of their manager, e.g. `upload_big_file` or
+    the auto-paginating iterators, are run with the synchronous network client in `executor`
+    (the default executor of the running loop when not provided), as are all methods when
+    `async_network_client` is not provided.
+    """
+
+    def __init__(
+        self,
+        manager,
+        *,
+        async_network_client: Optional[AsyncNetworkClient] = None,
+        executor=None
+    ):
+        self._manager = manager
+        self._async_network_client = async_network_client
+        self._executor = executor
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._manager, name)
+        if name.startswith('_') or not callable(attribute):
+            return attribute
+        request_generator = getattr(attribute, 'request_generator', None)
+        if self._async_network_client is not None and request_generator is not None:
+            method = self._send_natively(request_generator)
+        else:
+            method = self._run_in_executor(attribute)
+        method = functools.wraps(attribute)(method)
+        setattr(self, name, method)
+        return method
+
+    def _send_natively(self, request_generator):
+        async def method(*args, **kwargs):
+            return await send_request_async(
+                request_generator(self._manager, *args, **kwargs),
+                self._async_network_client,
+            )
+
+        return method
+
+    def _run_in_executor(self, attribute):
+        async def method(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            # Runs in the caller's context, e.g. with its `lazy_deserialization` setting
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(context.run, attribute, *args, **kwargs),
+            )
+
+        return method
+
+
+class AsyncDownloadsManager(AsyncManager):
+    """
+    Asynchronous downloads manager. `download_file` returns the file content as an
+    `AsyncResponseByteStream`, streamed natively on the event loop.
+    """
+
+    async def download_file_to_output_stream(
+        self,
+        file_id: str,
+        output_stream: OutputStream,
+        *,
+        version: Optional[str] = None,
+        access_token: Optional[str] = None,
+        range: Optional[str] = None,
+        boxapi: Optional[str] = None,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> None:
+        """
+        Downloads a file to a given output stream, writing chunks as they arrive.
+        Accepts the same arguments as `DownloadsManager.download_file_to_output_stream`.
+        """
+        download_stream = await self.download_file(
+            file_id,
+            version=version,
+            access_token=access_token,
+            range=range,
+            boxapi=boxapi,
+            extra_headers=extra_headers,
+        )
+        async for chunk in download_stream:
+            output_stream.write(chunk)
+
+
+class AsyncBoxClient:
+    """
+    Asynchronous Box client, exposing every manager of `BoxClient` with coroutine methods.
+
+    Custom requests and the manager methods sending a single request, including file downloads,
+    are sent natively by `async_network_client`, composite manager methods run in `executor`.
+
+    Example usage:
+        client = AsyncBoxClient(auth=auth)
+        folder, items = await asyncio.gather(
+            client.folders.get_folder_by_id('0'),
+            client.folders.get_folder_items('0'),
+        )
+    """
+
+    def __init__(
+        self,
+        auth: Authentication,
+        *,
+        network_session: NetworkSession = None,
+        async_network_client: AsyncNetworkClient = None,
+        executor=None
+    ):
+        """
+        :param auth: Authentication object used by all requests
+        :type auth: Authentication
+        :param network_session: Network session shared with the synchronous managers, defaults to None
+        :type network_session: NetworkSession, optional
+        :param async_network_client: Network client used for natively asynchronous requests, defaults to AsyncBoxNetworkClient
+        :type async_network_client: AsyncNetworkClient, optional
+        :param executor: Executor running the composite manager methods and reading upload streams, defaults to the loop default executor
+        :type executor: concurrent.futures.Executor, optional
+        """
+        if async_network_client is None:
+            async_network_client = AsyncBoxNetworkClient(executor=executor)
+        self._client = BoxClient(auth=auth, network_session=network_session)
+        self._executor = executor
+        self.auth = auth
+        self.network_session = self._client.network_session
+        self.async_network_client = async_network_client
+        self.downloads = AsyncDownloadsManager(
+            self._client.downloads,
+            async_network_client=async_network_client,
+            executor=executor,
+        )
+
+    def __getattr__(self, name: str) -> AsyncManager:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        manager = getattr(self._client, name)
+        if not hasattr(manager, 'network_session'):
+            raise AttributeError(name)
+        async_manager = AsyncManager(
+            manager,
+            async_network_client=self.async_network_client,
+            executor=self._executor,
+        )
+        setattr(self, name, async_manager)
+        return async_manager
+
+    async def make_request(self, fetch_options: FetchOptions) -> FetchResponse:
+        """
+        Make a custom http request using the client authentication and network session.
+        :param fetch_options: Options to be passed to the fetch call
+        :type fetch_options: FetchOptions
+        """
+        auth: Authentication = (
+            self.auth if fetch_options.auth == None else fetch_options.auth
+        )
+        network_session: NetworkSession = (
+            self.network_session
+            if fetch_options.network_session == None
+            else fetch_options.network_session
+        )
+        enriched_fetch_options: FetchOptions = FetchOptions(
+            auth=auth,
+            network_session=network_session,
+            url=fetch_options.url,
+            method=fetch_options.method,
+            params=fetch_options.params,
+            headers=fetch_options.headers,
+            data=fetch_options.data,
+            file_stream=fetch_options.file_stream,
+            multipart_data=fetch_options.multipart_data,
+            content_type=fetch_options.content_type,
+            response_format=fetch_options.response_format,
+            follow_redirects=fetch_options.follow_redirects,
+        )
+        return await self.async_network_client.fetch(enriched_fetch_options)
+
+    async def aclose(self) -> None:
+        """Close the connections held by the asynchronous network client."""
+        await self.async_network_client.aclose()
+
+    def _with_client(self, client: BoxClient) -> 'AsyncBoxClient':
+        return AsyncBoxClient(
+            auth=client.auth,
+            network_session=client.network_session,
+            async_network_client=self.async_network_client,
+            executor=self._executor,
+        )
+
+    def with_as_user_header(self, user_id: str) -> 'AsyncBoxClient':
+        """
+        Create a new client to impersonate user with the provided ID, leaving the original client unmodified.
+        :param user_id: ID of an user to impersonate
+        :type user_id: str
+        """
+        return self._with_client(self._client.with_as_user_header(user_id))
+
+    def with_suppressed_notifications(self) -> 'AsyncBoxClient':
+        """
+        Create a new client with suppressed notifications.
+        """
+        return self._with_client(self._client.with_suppressed_notifications())
+
+    def with_extra_headers(
+        self, *, extra_headers: Dict[str, str] = None
+    ) -> 'AsyncBoxClient':
+        """
+        Create a new client with a custom set of headers that will be included in every API call
+        :param extra_headers: Custom set of headers that will be included in every API call, defaults to None
+        :type extra_headers: Dict[str, str], optional
+        """
+        return self._with_client(
+            self._client.with_extra_headers(extra_headers=extra_headers)
+        )
+
+    def with_custom_base_urls(self, base_urls: BaseUrls) -> 'AsyncBoxClient':
+        """
+        Create a new client with a custom set of base urls that will be used for every API call
+        :param base_urls: Custom set of base urls that will be used for every API call
+        :type base_urls: BaseUrls
+        """
+        return self._with_client(self._client.with_custom_base_urls(base_urls))
+
+    def with_proxy(self, config: ProxyConfig) -> 'AsyncBoxClient':
+        """
+        Create a new client with a custom proxy used by the synchronous managers.
+        Configure proxies of natively asynchronous requests on the `httpx.AsyncClient`
+        passed to `AsyncBoxNetworkClient`.
+        """
+        return self._with_client(self._client.with_proxy(config))
+
+    def with_timeouts(self, config: TimeoutConfig) -> 'AsyncBoxClient':
+        """
+        Create a new client with custom timeouts that will be used for every API call
+        :param config: Timeout configuration.
+        :type config: TimeoutConfig
+        """
+        return self._with_client(self._client.with_timeouts(config))
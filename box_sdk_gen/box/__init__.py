@@ -4,6 +4,10 @@ from box_sdk_gen.box.errors import *
 
 from box_sdk_gen.box.token_storage import *
 
+from box_sdk_gen.box.token_refresh import *
+
+from box_sdk_gen.box.upload_session_storage import *
+
 from box_sdk_gen.box.developer_token_auth import *
 
 from box_sdk_gen.box.oauth import *
@@ -11,3 +15,15 @@ from box_sdk_gen.box.oauth import *
 from box_sdk_gen.box.jwt_auth import *
 
 from box_sdk_gen.box.ccg_auth import *
+
+from box_sdk_gen.box.pagination import *
+
+from box_sdk_gen.box.folder_sync import *
+
+from box_sdk_gen.box.change_feed import *
+
+from box_sdk_gen.box.admin_logs_exporter import *
+
+from box_sdk_gen.box.event_stream_multiplexer import *
+
+from box_sdk_gen.box.webhook_receiver import *
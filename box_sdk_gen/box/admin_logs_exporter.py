@@ -0,0 +1,318 @@
+import contextvars
+import datetime
+import json
+import os
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, IO, Any, Deque, Dict, List, Optional, Set, Tuple
+
+from ..internal.utils import date_time_from_string, date_time_to_string
+from ..serialization.json import sd_to_json_bytes, serialize
+
+if TYPE_CHECKING:
+    from ..client import BoxClient
+    from ..managers.events import GetEventsEventType
+
+ADMIN_LOGS_MAX_PAGE_SIZE = 500
+# Events created this close to the end of a window may also be returned for the following one
+_WINDOW_BOUNDARY_MARGIN = datetime.timedelta(seconds=1)
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+class AdminLogsExportReport:
+    def __init__(
+        self,
+        event_count: int,
+        duplicate_count: int,
+        *,
+        resumed_from: Optional[datetime.datetime] = None,
+    ):
+        """
+        :param event_count: Number of events in the output, including the ones exported before resuming
+        :type event_count: int
+        :param duplicate_count: Number of events returned more than once, which were skipped
+        :type duplicate_count: int
+        :param resumed_from: Date the export was resumed from, if it was interrupted before, defaults to None
+        :type resumed_from: Optional[datetime.datetime], optional
+        """
+        self.event_count = event_count
+        self.duplicate_count = duplicate_count
+        self.resumed_from = resumed_from
+
+
+class _Window:
+    """
+    Events of a time window, spooled to a temporary file as lines of the output.
+    The events created at the start of the window are kept with the position of their line,
+    so that the ones already written for the previous window can be skipped.
+    """
+
+    def __init__(self, start: datetime.datetime, end: datetime.datetime, spool: IO):
+        self.start = start
+        self.end = end
+        self.spool = spool
+        self.event_count = 0
+        self.duplicate_count = 0
+        self.leading_events: List[Tuple[str, int, int]] = []
+        self.boundary_event_ids: List[str] = []
+
+    def write_to(self, output: IO, skipped_event_ids: Set[str]) -> int:
+        """Copies the spooled lines to `output`, skipping the given events. Returns the number of skipped events."""
+        skipped_lines = sorted(
+            (start, end)
+            for event_id, start, end in self.leading_events
+            if event_id in skipped_event_ids
+        )
+        self.spool.seek(0)
+        position = 0
+        for start, end in skipped_lines:
+            remaining = start - position
+            while remaining > 0:
+                chunk = self.spool.read(min(remaining, _COPY_BUFFER_SIZE))
+                output.write(chunk)
+                remaining -= len(chunk)
+            self.spool.seek(end)
+            position = end
+        shutil.copyfileobj(self.spool, output, _COPY_BUFFER_SIZE)
+        return len(skipped_lines)
+
+
+class AdminLogsExporter:
+    """
+    Exports the enterprise events of the `admin_logs` stream created in a time range
+    to a newline-delimited JSON file.
+
+    The time range is split into windows of `window_size`, fetched concurrently by `max_workers`
+    threads and paginated with `stream_position` at the maximum page size. The events are written
+    window after window, in order, skipping the events returned more than once.
+    The events of the windows fetched ahead of the output are spooled to temporary files in the
+    directory of the output, so at most one copy buffer of events is held in memory.
+    After each written window, the position of the export is committed to a `.checkpoint` file
+    next to the output, so that an interrupted export resumes after the last committed window.
+
+    Example usage:
+        exporter = AdminLogsExporter(client, window_size=datetime.timedelta(minutes=15))
+        report = exporter.export('events.ndjson', created_after, created_before)
+        print(report.event_count)
+    """
+
+    def __init__(
+        self,
+        client: 'BoxClient',
+        *,
+        window_size: datetime.timedelta = datetime.timedelta(hours=1),
+        max_workers: int = 4,
+        page_size: int = ADMIN_LOGS_MAX_PAGE_SIZE,
+        event_types: Optional[List['GetEventsEventType']] = None,
+    ):
+        """
+        :param client: Client of an admin user, with the `manage enterprise properties` scope
+        :type client: BoxClient
+        :param window_size: Duration of the windows the time range is split into, defaults to one hour
+        :type window_size: datetime.timedelta, optional
+        :param max_workers: Maximum number of windows fetched concurrently, defaults to 4
+        :type max_workers: int, optional
+        :param page_size: Maximum number of events fetched per request, defaults to 500, the maximum
+        :type page_size: int, optional
+        :param event_types: Types of the exported events, defaults to all of them
+        :type event_types: Optional[List[GetEventsEventType]], optional
+        """
+        self.client = client
+        self.window_size = window_size
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.event_types = event_types
+
+    def export(
+        self,
+        output_path: str,
+        created_after: datetime.datetime,
+        created_before: datetime.datetime,
+    ) -> AdminLogsExportReport:
+        """
+        Writes the events created between `created_after` and `created_before` to `output_path`,
+        one JSON object per line. If a checkpoint of an interrupted export of the same time range
+        exists, the output is truncated to its last committed window and the export resumes from there.
+        :param output_path: Path of the newline-delimited JSON file
+        :type output_path: str
+        :param created_after: Start of the time range, with a timezone
+        :type created_after: datetime.datetime
+        :param created_before: End of the time range, with a timezone
+        :type created_before: datetime.datetime
+        """
+        for name, date in (
+            ('created_after', created_after),
+            ('created_before', created_before),
+        ):
+            if date.utcoffset() is None:
+                raise ValueError(
+                    f'`{name}` must be a timezone aware datetime, '
+                    f'e.g. datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)'
+                )
+        checkpoint_path = f'{output_path}.checkpoint'
+        checkpoint = self._read_checkpoint(
+            checkpoint_path, created_after, created_before
+        )
+        resumed_from: Optional[datetime.datetime] = None
+        event_count = duplicate_count = 0
+        boundary_event_ids: Set[str] = set()
+        window_start = created_after
+        if checkpoint is not None and os.path.exists(output_path):
+            resumed_from = window_start = date_time_from_string(
+                checkpoint['completed_until']
+            )
+            event_count = checkpoint['event_count']
+            duplicate_count = checkpoint['duplicate_count']
+            boundary_event_ids = set(checkpoint['boundary_event_ids'])
+            output = open(output_path, 'r+b')
+            output.truncate(checkpoint['output_size'])
+            output.seek(checkpoint['output_size'])
+        else:
+            output = open(output_path, 'wb')
+        windows: List[Tuple[datetime.datetime, datetime.datetime]] = []
+        while window_start < created_before:
+            window_end = min(window_start + self.window_size, created_before)
+            windows.append((window_start, window_end))
+            window_start = window_end
+        spool_directory = os.path.dirname(os.path.abspath(output_path))
+        with output, ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for window in self._fetch_windows(executor, windows, spool_directory):
+                with window.spool:
+                    skipped_count = window.write_to(output, boundary_event_ids)
+                output.flush()
+                os.fsync(output.fileno())
+                event_count += window.event_count - skipped_count
+                duplicate_count += window.duplicate_count + skipped_count
+                boundary_event_ids = set(window.boundary_event_ids)
+                self._write_checkpoint(
+                    checkpoint_path,
+                    {
+                        'created_after': date_time_to_string(created_after),
+                        'created_before': date_time_to_string(created_before),
+                        'completed_until': date_time_to_string(window.end),
+                        'output_size': output.tell(),
+                        'event_count': event_count,
+                        'duplicate_count': duplicate_count,
+                        'boundary_event_ids': sorted(boundary_event_ids),
+                    },
+                )
+        return AdminLogsExportReport(
+            event_count, duplicate_count, resumed_from=resumed_from
+        )
+
+    def _fetch_windows(
+        self,
+        executor: ThreadPoolExecutor,
+        windows: List[Tuple[datetime.datetime, datetime.datetime]],
+        spool_directory: str,
+    ):
+        """Yields the fetched windows in order, with at most `max_workers` windows fetched ahead."""
+        in_flight: Deque[Future] = deque()
+        try:
+            for window_start, window_end in windows:
+                in_flight.append(
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        self._fetch_window,
+                        window_start,
+                        window_end,
+                        spool_directory,
+                    )
+                )
+                if len(in_flight) >= self.max_workers:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+        finally:
+            for window in in_flight:
+                window.cancel()
+            for window in in_flight:
+                if not window.cancelled() and window.exception() is None:
+                    window.result().spool.close()
+
+    def _fetch_window(
+        self,
+        window_start: datetime.datetime,
+        window_end: datetime.datetime,
+        spool_directory: str,
+    ) -> _Window:
+        window = _Window(
+            window_start, window_end, tempfile.TemporaryFile(dir=spool_directory)
+        )
+        try:
+            self._spool_window(window)
+        except BaseException:
+            window.spool.close()
+            raise
+        return window
+
+    def _spool_window(self, window: _Window) -> None:
+        from ..managers.events import GetEventsStreamType
+
+        seen_event_ids: Set[str] = set()
+        stream_position: Optional[str] = None
+        while True:
+            page = self.client.events.get_events(
+                stream_type=GetEventsStreamType.ADMIN_LOGS,
+                stream_position=stream_position,
+                limit=self.page_size,
+                event_type=self.event_types,
+                created_after=window.start,
+                created_before=window.end,
+            )
+            entries: List[Any] = page.raw_data.get('entries', None) or serialize(
+                page.entries or []
+            )
+            if not entries:
+                break
+            for entry in entries:
+                event_id: str = entry.get('event_id', None)
+                if event_id is not None:
+                    if event_id in seen_event_ids:
+                        window.duplicate_count += 1
+                        continue
+                    seen_event_ids.add(event_id)
+                line_start = window.spool.tell()
+                window.spool.write(sd_to_json_bytes(entry) + b'\n')
+                window.event_count += 1
+                created_at: Optional[str] = entry.get('created_at', None)
+                if event_id is None or created_at is None:
+                    continue
+                created_at_date = date_time_from_string(created_at)
+                if created_at_date < window.start + _WINDOW_BOUNDARY_MARGIN:
+                    window.leading_events.append(
+                        (event_id, line_start, window.spool.tell())
+                    )
+                if created_at_date >= window.end - _WINDOW_BOUNDARY_MARGIN:
+                    window.boundary_event_ids.append(event_id)
+            if page.next_stream_position is None:
+                break
+            stream_position = str(page.next_stream_position)
+
+    def _read_checkpoint(
+        self,
+        checkpoint_path: str,
+        created_after: datetime.datetime,
+        created_before: datetime.datetime,
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            with open(checkpoint_path, 'r') as file:
+                checkpoint = json.load(file)
+        except FileNotFoundError:
+            return None
+        if checkpoint['created_after'] != date_time_to_string(
+            created_after
+        ) or checkpoint['created_before'] != date_time_to_string(created_before):
+            return None
+        return checkpoint
+
+    def _write_checkpoint(self, checkpoint_path: str, checkpoint: Dict[str, Any]):
+        # Replaced atomically, so that a crash never leaves a partially written checkpoint
+        temporary_path = f'{checkpoint_path}.tmp'
+        with open(temporary_path, 'w') as file:
+            json.dump(checkpoint, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, checkpoint_path)
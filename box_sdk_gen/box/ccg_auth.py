@@ -14,10 +14,22 @@ from box_sdk_gen.networking.auth import Authentication
 
 from box_sdk_gen.networking.network import NetworkSession
 
+from box_sdk_gen.networking.async_network_client import AsyncNetworkClient
+
+from box_sdk_gen.networking.single_request import RequestGenerator
+
+from box_sdk_gen.networking.single_request import send_request
+
+from box_sdk_gen.networking.single_request import send_request_async
+
 from box_sdk_gen.box.token_storage import TokenStorage
 
 from box_sdk_gen.box.token_storage import InMemoryTokenStorage
 
+from box_sdk_gen.box.token_refresh import DEFAULT_TOKEN_REFRESH_RATIO
+
+from box_sdk_gen.box.token_refresh import TokenRefresher
+
 from box_sdk_gen.managers.authorization import AuthorizationManager
 
 from box_sdk_gen.box.errors import BoxSDKError
@@ -35,7 +47,9 @@ class CCGConfig:
         *,
         enterprise_id: Optional[str] = None,
         user_id: Optional[str] = None,
-        token_storage: TokenStorage = None
+        token_storage: TokenStorage = None,
+        token_refresh_ratio: Optional[float] = DEFAULT_TOKEN_REFRESH_RATIO,
+        background_token_refresh: bool = False
     ):
         """
         :param client_id: Box API key used for identifying the application the user is authenticating with
@@ -48,6 +62,10 @@ class CCGConfig:
         :type user_id: Optional[str], optional
         :param token_storage: Object responsible for storing token. If no custom implementation provided,the token will be stored in memory., defaults to None
         :type token_storage: TokenStorage, optional
+        :param token_refresh_ratio: Fraction of the access token lifetime after which the token is refreshed before it is used. If None, the token is only refreshed when missing or rejected by the API, defaults to 0.9
+        :type token_refresh_ratio: Optional[float], optional
+        :param background_token_refresh: Refresh the access token in a background thread, while the current token is still in use, defaults to False
+        :type background_token_refresh: bool, optional
         """
         if token_storage is None:
             token_storage = InMemoryTokenStorage()
@@ -56,6 +74,8 @@ class CCGConfig:
         self.enterprise_id = enterprise_id
         self.user_id = user_id
         self.token_storage = token_storage
+        self.token_refresh_ratio = token_refresh_ratio
+        self.background_token_refresh = background_token_refresh
 
 
 class BoxCCGAuth(Authentication):
@@ -67,6 +87,11 @@ class BoxCCGAuth(Authentication):
         super().__init__(**kwargs)
         self.config = config
         self.token_storage = self.config.token_storage
+        self._token_refresher = TokenRefresher(
+            self.token_storage,
+            refresh_ratio=self.config.token_refresh_ratio,
+            background_refresh=self.config.background_token_refresh,
+        )
         self.subject_id = (
             self.config.user_id
             if not self.config.user_id == None
@@ -82,38 +107,75 @@ class BoxCCGAuth(Authentication):
         self, *, network_session: Optional[NetworkSession] = None
     ) -> AccessToken:
         """
-        Get a new access token using CCG auth
+        Get a new access token using CCG auth. Concurrent calls share a single token request.
+        :param network_session: An object to keep network session state, defaults to None
+        :type network_session: Optional[NetworkSession], optional
+        """
+        return self._token_refresher.refresh(
+            lambda: self._request_access_token(network_session)
+        )
+
+    def refresh_rejected_token(
+        self,
+        rejected_access_token: Optional[str],
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Get a new access token after the API rejected `rejected_access_token`. Returns the stored token
+        without requesting a new one if it was already refreshed since.
+        :param rejected_access_token: Access token rejected by the API
+        :type rejected_access_token: Optional[str]
         :param network_session: An object to keep network session state, defaults to None
         :type network_session: Optional[NetworkSession], optional
         """
+        return self._token_refresher.refresh(
+            lambda: self._request_access_token(network_session),
+            rejected_token=rejected_access_token,
+        )
+
+    def _access_token_request(
+        self, network_session: Optional[NetworkSession]
+    ) -> RequestGenerator:
         auth_manager: AuthorizationManager = AuthorizationManager(
             network_session=(
                 network_session if not network_session == None else NetworkSession()
             )
         )
-        token: AccessToken = auth_manager.request_access_token(
+        return auth_manager.request_access_token.request_generator(
+            auth_manager,
             PostOAuth2TokenGrantTypeField.CLIENT_CREDENTIALS,
             client_id=self.config.client_id,
             client_secret=self.config.client_secret,
             box_subject_type=self.subject_type,
             box_subject_id=self.subject_id,
         )
-        self.token_storage.store(token)
-        return token
+
+    def _request_access_token(
+        self, network_session: Optional[NetworkSession]
+    ) -> AccessToken:
+        return send_request(self._access_token_request(network_session))
+
+    async def _request_access_token_async(
+        self,
+        async_network_client: AsyncNetworkClient,
+        network_session: Optional[NetworkSession],
+    ) -> AccessToken:
+        return await send_request_async(
+            self._access_token_request(network_session), async_network_client
+        )
 
     def retrieve_token(
         self, *, network_session: Optional[NetworkSession] = None
     ) -> AccessToken:
         """
-        Return a current token or get a new one when not available.
+        Return a current token or get a new one when not available or due for refresh.
         :param network_session: An object to keep network session state, defaults to None
         :type network_session: Optional[NetworkSession], optional
         """
-        old_token: Optional[AccessToken] = self.token_storage.get()
-        if old_token == None:
-            new_token: AccessToken = self.refresh_token(network_session=network_session)
-            return new_token
-        return old_token
+        return self._token_refresher.retrieve(
+            lambda: self._request_access_token(network_session)
+        )
 
     def retrieve_authorization_header(
         self, *, network_session: Optional[NetworkSession] = None
@@ -121,6 +183,85 @@ class BoxCCGAuth(Authentication):
         token: AccessToken = self.retrieve_token(network_session=network_session)
         return ''.join(['Bearer ', token.access_token])
 
+    def needs_token_request(self) -> bool:
+        """
+        Returns whether the stored token is missing or due for refresh, so that retrieving
+        the authorization header requests a new token.
+        """
+        return self._token_refresher.is_refresh_due()
+
+    async def retrieve_token_async(
+        self,
+        async_network_client: AsyncNetworkClient,
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Asynchronous counterpart of `retrieve_token`, requesting the token with `async_network_client`.
+        :param async_network_client: Network client sending the token request
+        :type async_network_client: AsyncNetworkClient
+        :param network_session: An object to keep network session state, defaults to None
+        :type network_session: Optional[NetworkSession], optional
+        """
+        return await self._token_refresher.retrieve_async(
+            lambda: self._request_access_token_async(
+                async_network_client, network_session
+            )
+        )
+
+    async def refresh_token_async(
+        self,
+        async_network_client: AsyncNetworkClient,
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Asynchronous counterpart of `refresh_token`, requesting the token with `async_network_client`.
+        :param async_network_client: Network client sending the token request
+        :type async_network_client: AsyncNetworkClient
+        :param network_session: An object to keep network session state, defaults to None
+        :type network_session: Optional[NetworkSession], optional
+        """
+        return await self._token_refresher.refresh_async(
+            lambda: self._request_access_token_async(
+                async_network_client, network_session
+            )
+        )
+
+    async def refresh_rejected_token_async(
+        self,
+        rejected_access_token: Optional[str],
+        async_network_client: AsyncNetworkClient,
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Asynchronous counterpart of `refresh_rejected_token`, requesting the token with `async_network_client`.
+        :param rejected_access_token: Access token rejected by the API
+        :type rejected_access_token: Optional[str]
+        :param async_network_client: Network client sending the token request
+        :type async_network_client: AsyncNetworkClient
+        :param network_session: An object to keep network session state, defaults to None
+        :type network_session: Optional[NetworkSession], optional
+        """
+        return await self._token_refresher.refresh_async(
+            lambda: self._request_access_token_async(
+                async_network_client, network_session
+            ),
+            rejected_token=rejected_access_token,
+        )
+
+    async def retrieve_authorization_header_async(
+        self,
+        async_network_client: AsyncNetworkClient,
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> str:
+        token: AccessToken = await self.retrieve_token_async(
+            async_network_client, network_session=network_session
+        )
+        return ''.join(['Bearer ', token.access_token])
+
     def with_user_subject(
         self, user_id: str, *, token_storage: TokenStorage = None
     ) -> 'BoxCCGAuth':
@@ -148,6 +289,8 @@ class BoxCCGAuth(Authentication):
             enterprise_id=self.config.enterprise_id,
             user_id=user_id,
             token_storage=token_storage,
+            token_refresh_ratio=self.config.token_refresh_ratio,
+            background_token_refresh=self.config.background_token_refresh,
         )
         return BoxCCGAuth(config=new_config)
 
@@ -169,6 +312,8 @@ class BoxCCGAuth(Authentication):
             enterprise_id=enterprise_id,
             user_id=None,
             token_storage=token_storage,
+            token_refresh_ratio=self.config.token_refresh_ratio,
+            background_token_refresh=self.config.background_token_refresh,
         )
         return BoxCCGAuth(config=new_config)
 
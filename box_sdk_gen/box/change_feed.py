@@ -0,0 +1,364 @@
+import shelve
+import threading
+from abc import abstractmethod
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from ..schemas.event import Event, EventEventTypeField
+from ..schemas.events import Events
+from .event_stream import EventStream, EventStreamAction
+
+if TYPE_CHECKING:
+    from ..client import BoxClient
+
+
+class ItemChangeType(str, Enum):
+    UPLOAD = 'upload'
+    MOVE = 'move'
+    TRASH = 'trash'
+
+
+# Renames are moves within the same folder, restored and copied items are new content
+_ITEM_CHANGE_TYPES: Dict[str, ItemChangeType] = {
+    EventEventTypeField.ITEM_UPLOAD.value: ItemChangeType.UPLOAD,
+    EventEventTypeField.ITEM_CREATE.value: ItemChangeType.UPLOAD,
+    EventEventTypeField.ITEM_COPY.value: ItemChangeType.UPLOAD,
+    EventEventTypeField.ITEM_UNDELETE_VIA_TRASH.value: ItemChangeType.UPLOAD,
+    EventEventTypeField.ITEM_MOVE.value: ItemChangeType.MOVE,
+    EventEventTypeField.ITEM_RENAME.value: ItemChangeType.MOVE,
+    EventEventTypeField.ITEM_TRASH.value: ItemChangeType.TRASH,
+}
+
+
+class StreamPositionStorage:
+    """
+    Keeps the position in the event stream up to which the changes were handled,
+    and optionally the IDs of the last delivered events, to drop them if they are delivered again.
+    """
+
+    @abstractmethod
+    def store(self, stream_position: str) -> None:
+        pass
+
+    @abstractmethod
+    def get(self) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    def store_event_ids(self, event_ids: List[str]) -> None:
+        pass
+
+    def get_event_ids(self) -> List[str]:
+        return []
+
+
+class InMemoryStreamPositionStorage(StreamPositionStorage):
+    def __init__(self, stream_position: Optional[str] = None):
+        self._stream_position = stream_position
+        self._event_ids: List[str] = []
+
+    def store(self, stream_position: str) -> None:
+        self._stream_position = stream_position
+
+    def get(self) -> Optional[str]:
+        return self._stream_position
+
+    def clear(self) -> None:
+        self._stream_position = None
+        self._event_ids = []
+
+    def store_event_ids(self, event_ids: List[str]) -> None:
+        self._event_ids = list(event_ids)
+
+    def get_event_ids(self) -> List[str]:
+        return list(self._event_ids)
+
+
+class FileStreamPositionStorage(StreamPositionStorage):
+    """
+    Stores the stream position in a `shelve` database.
+    """
+
+    def __init__(self, filename: str = 'stream_position_storage'):
+        self.filename = filename
+        self._lock = threading.Lock()
+
+    def store(self, stream_position: str) -> None:
+        with self._lock, shelve.open(self.filename) as file:
+            file['stream_position'] = stream_position
+
+    def get(self) -> Optional[str]:
+        with self._lock, shelve.open(self.filename) as file:
+            return file.get('stream_position', None)
+
+    def clear(self) -> None:
+        with self._lock, shelve.open(self.filename) as file:
+            file.pop('stream_position', None)
+            file.pop('event_ids', None)
+
+    def store_event_ids(self, event_ids: List[str]) -> None:
+        with self._lock, shelve.open(self.filename) as file:
+            file['event_ids'] = list(event_ids)
+
+    def get_event_ids(self) -> List[str]:
+        with self._lock, shelve.open(self.filename) as file:
+            return file.get('event_ids', [])
+
+
+class ItemChange:
+    def __init__(
+        self,
+        type: ItemChangeType,
+        item_type: str,
+        item_id: str,
+        item: Any,
+        *,
+        events: Optional[List[Event]] = None,
+    ):
+        """
+        :param type: Change of the item, coalesced from all its events
+        :type type: ItemChangeType
+        :param item_type: Type of the item, `file` or `folder`
+        :type item_type: str
+        :param item_id: ID of the item
+        :type item_id: str
+        :param item: Item as reported by its latest event
+        :type item: Any
+        :param events: Events of the item, in the order they happened, defaults to None
+        :type events: Optional[List[Event]], optional
+        """
+        self.type = type
+        self.item_type = item_type
+        self.item_id = item_id
+        self.item = item
+        self.events = events if events is not None else []
+
+    def __repr__(self) -> str:
+        return f'ItemChange({self.type.value}, {self.item_type} {self.item_id})'
+
+
+class ChangeSet:
+    def __init__(
+        self,
+        changes: List[ItemChange],
+        next_stream_position: str,
+        *,
+        event_count: int = 0,
+        partial: bool = False,
+    ):
+        """
+        :param changes: Changed items, ordered by their latest event
+        :type changes: List[ItemChange]
+        :param next_stream_position: Position of the event stream following the changes
+        :type next_stream_position: str
+        :param event_count: Number of events the changes were coalesced from, defaults to 0
+        :type event_count: int, optional
+        :param partial: The stream was not caught up, more events follow `next_stream_position`, defaults to False
+        :type partial: bool, optional
+        """
+        self.changes = changes
+        self.next_stream_position = next_stream_position
+        self.event_count = event_count
+        self.partial = partial
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+
+def coalesce_events(events: List[Event]) -> List[ItemChange]:
+    """
+    Coalesces the upload, move and trash events of the changes stream into a single change per item,
+    ignoring the other events and the duplicated ones.
+    A trashed item stays trashed unless it is uploaded or restored afterwards, an uploaded item
+    stays uploaded when it is moved afterwards, since the item of its change has the latest parent.
+    :param events: Events in the order they happened
+    :type events: List[Event]
+    """
+    changes: Dict[Tuple[str, str], ItemChange] = {}
+    seen_event_ids = set()
+    for event in events:
+        if event.event_id is not None:
+            if event.event_id in seen_event_ids:
+                continue
+            seen_event_ids.add(event.event_id)
+        event_type = getattr(event.event_type, 'value', event.event_type)
+        change_type = _ITEM_CHANGE_TYPES.get(event_type, None)
+        source = event.source
+        item_type = getattr(source, 'type', None)
+        item_id = getattr(source, 'id', None)
+        if change_type is None or item_type not in ('file', 'folder') or not item_id:
+            continue
+        key = (item_type, item_id)
+        change = changes.pop(key, None)
+        if change is None:
+            change = ItemChange(change_type, item_type, item_id, source)
+        elif not (
+            change.type == ItemChangeType.UPLOAD and change_type == ItemChangeType.MOVE
+        ):
+            change.type = change_type
+        change.item = source
+        change.events.append(event)
+        # Re-inserted, so that the changes stay ordered by their latest event
+        changes[key] = change
+    return list(changes.values())
+
+
+class ChangeFeed:
+    """
+    Consumes the changes stream of the user incrementally, handing the upload, move and trash
+    events to a handler as a set of coalesced changes, one per item.
+
+    The stream position up to which the changes were handled is kept in `position_storage`,
+    so a consumer restarted with a persistent storage continues where it stopped.
+    The position is only stored after the handler returned, so a change set whose handler failed
+    is delivered again by the next poll.
+
+    Example usage:
+        feed = ChangeFeed(client, position_storage=FileStreamPositionStorage('position'))
+        feed.run(lambda change_set: print(change_set.changes))
+    """
+
+    def __init__(
+        self,
+        client: 'BoxClient',
+        *,
+        position_storage: Optional[StreamPositionStorage] = None,
+        page_size: int = 500,
+        max_events: int = 10000,
+    ):
+        """
+        :param client: Client of the user whose changes are consumed
+        :type client: BoxClient
+        :param position_storage: Storage of the handled stream position, defaults to InMemoryStreamPositionStorage
+        :type position_storage: Optional[StreamPositionStorage], optional
+        :param page_size: Maximum number of events fetched per request, defaults to 500
+        :type page_size: int, optional
+        :param max_events: Number of events after which a poll stops fetching and returns a partial change set, defaults to 10000
+        :type max_events: int, optional
+        """
+        self.client = client
+        self.position_storage = (
+            position_storage
+            if position_storage is not None
+            else InMemoryStreamPositionStorage()
+        )
+        self.page_size = page_size
+        self.max_events = max_events
+        self._stop_event = threading.Event()
+        self._event_stream: Optional[EventStream] = None
+
+    def reset(self) -> str:
+        """
+        Stores the current position of the stream, so that the following polls only return
+        the changes made after this call. Returns the stored position.
+        Call it before a full scan of the replica, so that no change made during the scan is missed.
+        """
+        stream_position = self._get_events('now').next_stream_position
+        self.position_storage.store(str(stream_position))
+        return str(stream_position)
+
+    def poll(self) -> ChangeSet:
+        """
+        Fetches the events following the stored position until the stream is caught up,
+        and returns them as a change set, without storing the new position.
+        Once `max_events` events were fetched, the change set is returned as partial, and the following
+        events are returned by the next poll once it is committed.
+        Without a stored position, the stream is read from its current position.
+        """
+        stream_position = self.position_storage.get() or 'now'
+        events: List[Event] = []
+        while True:
+            page = self._get_events(stream_position)
+            entries = page.entries or []
+            events.extend(entries)
+            if page.next_stream_position is not None:
+                stream_position = str(page.next_stream_position)
+            if len(entries) < self.page_size:
+                partial = False
+                break
+            if len(events) >= self.max_events:
+                partial = True
+                break
+        return ChangeSet(
+            coalesce_events(events),
+            stream_position,
+            event_count=len(events),
+            partial=partial,
+        )
+
+    def commit(self, change_set: ChangeSet) -> None:
+        """
+        Stores the position following the change set, once it was handled.
+        :param change_set: Handled change set
+        :type change_set: ChangeSet
+        """
+        self.position_storage.store(change_set.next_stream_position)
+
+    def process(self, handler: Callable[[ChangeSet], Any]) -> ChangeSet:
+        """
+        Polls the changes, hands them to `handler` if there are any, and stores the new position
+        once it returned. If `handler` raises, the position is not stored and the error is propagated.
+        :param handler: Function applying a change set, e.g. to a local replica
+        :type handler: Callable[[ChangeSet], Any]
+        """
+        change_set = self.poll()
+        if change_set:
+            handler(change_set)
+        self.commit(change_set)
+        return change_set
+
+    def run(self, handler: Callable[[ChangeSet], Any]) -> None:
+        """
+        Processes the changes as they happen until `stop` is called, long polling the changes stream
+        while there are none.
+        :param handler: Function applying a change set, e.g. to a local replica
+        :type handler: Callable[[ChangeSet], Any]
+        """
+        from ..managers.events import (
+            GetEventStreamHeaders,
+            GetEventStreamQueryParams,
+            GetEventStreamQueryParamsStreamTypeField,
+        )
+
+        self._stop_event.clear()
+        # Only used for its long polling, the events are fetched by `poll`
+        self._event_stream = EventStream(
+            events_manager=self.client.events,
+            query_params=GetEventStreamQueryParams(
+                stream_type=GetEventStreamQueryParamsStreamTypeField.CHANGES
+            ),
+            headers_input=GetEventStreamHeaders(),
+        )
+        while not self._stop_event.is_set():
+            change_set = self.process(handler)
+            if change_set.partial or self._stop_event.is_set():
+                continue
+            try:
+                action = self._event_stream.wait_for_changes(
+                    change_set.next_stream_position
+                )
+            except Exception:
+                action = EventStreamAction.RETRY
+            if action == EventStreamAction.RETRY:
+                self._stop_event.wait(5)
+
+    def stop(self) -> None:
+        """Stops `run` once the current long poll or change set handling is done."""
+        self._stop_event.set()
+        if self._event_stream is not None:
+            self._event_stream.stop()
+
+    def _get_events(self, stream_position: str) -> Events:
+        from ..managers.events import GetEventsStreamType
+
+        return self.client.events.get_events(
+            stream_type=GetEventsStreamType.CHANGES,
+            stream_position=stream_position,
+            limit=self.page_size,
+        )
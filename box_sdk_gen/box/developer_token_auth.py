@@ -77,6 +77,12 @@ class BoxDeveloperTokenAuth(Authentication):
         token: AccessToken = self.retrieve_token(network_session=network_session)
         return ''.join(['Bearer ', token.access_token])
 
+    def needs_token_request(self) -> bool:
+        """
+        Developer token is never requested from the API
+        """
+        return False
+
     def revoke_token(self, *, network_session: Optional[NetworkSession] = None) -> None:
         """
         Revoke an active Access Token, effectively logging a user out that has been previously authenticated.
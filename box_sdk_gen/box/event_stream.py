@@ -1,14 +1,23 @@
 import threading
+import time
+from collections import OrderedDict
 from enum import Enum
-from typing import Optional, Generator
+from queue import Empty, Full, Queue
+from typing import TYPE_CHECKING, Iterable, List, Optional, Generator, Tuple
 
-from ..box.errors import BoxSDKError
+from ..box.errors import BoxAPIError, BoxSDKError
 from ..schemas.events import Events
 from ..schemas.event import Event
 from ..schemas.realtime_server import RealtimeServer
 from ..networking.fetch_options import FetchOptions, ResponseFormat
 from ..networking.fetch_response import FetchResponse
 
+if TYPE_CHECKING:
+    from .change_feed import StreamPositionStorage
+
+EVENTS_MAX_LIMIT = 500
+_EVENTS_DEFAULT_LIMIT = 100
+
 
 class RealtimeServerEvent(str, Enum):
     NEW_CHANGE = 'new_change'
@@ -22,6 +31,73 @@ class EventStreamAction(str, Enum):
     STOP = 'stop'
 
 
+class EventDeduplicator:
+    """
+    Remembers the IDs of the last `size` distinct events, dropping the least recently seen one
+    when full, to detect the events delivered more than once.
+    """
+
+    def __init__(self, size: int = 1000, *, event_ids: Iterable[str] = ()):
+        """
+        :param size: Maximum number of remembered event IDs, defaults to 1000
+        :type size: int, optional
+        :param event_ids: Event IDs to remember initially, from the least to the most recently seen, defaults to none
+        :type event_ids: Iterable[str], optional
+        """
+        self.size = size
+        self.duplicates_dropped: int = 0
+        self._event_ids: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        for event_id in event_ids:
+            self.is_duplicate(event_id)
+
+    def is_duplicate(self, event_id: Optional[str]) -> bool:
+        """Returns whether the event was already seen, and remembers it as the most recently seen one."""
+        if event_id is None:
+            return False
+        with self._lock:
+            if event_id in self._event_ids:
+                self._event_ids.move_to_end(event_id)
+                self.duplicates_dropped += 1
+                return True
+            self._event_ids[event_id] = None
+            if len(self._event_ids) > self.size:
+                self._event_ids.popitem(last=False)
+            return False
+
+    @property
+    def event_ids(self) -> List[str]:
+        """Remembered event IDs, from the least to the most recently seen."""
+        with self._lock:
+            return list(self._event_ids)
+
+    def __len__(self) -> int:
+        return len(self._event_ids)
+
+
+class _FetchedPosition:
+    """Queued after the events fetched with the previous stream position."""
+
+    def __init__(self, stream_position: str, event_ids: Optional[List[str]]):
+        self.stream_position = stream_position
+        self.event_ids = event_ids
+
+
+class _EndOfStream:
+    """Queued once the stream ends, with the error which ended it, if any."""
+
+    def __init__(self, error: Optional[Exception] = None):
+        self.error = error
+
+
+def _is_retryable_error(error: Exception) -> bool:
+    """Returns whether fetching events failed with a network or server error, which may not happen again."""
+    if isinstance(error, BoxAPIError):
+        status_code = error.response_info.status_code
+        return status_code >= 500 or status_code == 429
+    return isinstance(error, (BoxSDKError, OSError))
+
+
 class EventStream:
     """
     EventStream is an iterator that fetches events from the Box API.
@@ -34,25 +110,46 @@ class EventStream:
             print(event)
     """
 
-    def __init__(self, *, events_manager, query_params, headers_input):
+    def __init__(
+        self,
+        *,
+        events_manager,
+        query_params,
+        headers_input,
+        deduplication_size: int = 1000,
+        position_storage: Optional['StreamPositionStorage'] = None,
+    ):
         """
         Initialize the EventStream.
 
         :param events_manager: The EventsManager instance which provides relevant methods to fetch events.
         :param query_params: The query parameters to use for fetching events.
         :param headers_input: The headers to include in the request.
+        :param deduplication_size: The number of most recent event IDs remembered to drop duplicated events.
+        :param position_storage: The storage in which the stream position and the remembered event IDs are kept
+            once the fetched events were consumed, and from which the stream resumes if no stream position is given.
         """
         self._events_manager = events_manager
         self._query_params = query_params
         self._headers_input = headers_input
-        self._stream_position = query_params.stream_position or 'now'
+        self._position_storage = position_storage
+        stored_position: Optional[str] = (
+            position_storage.get() if position_storage is not None else None
+        )
+        self._stream_position = query_params.stream_position or stored_position or 'now'
         self._long_polling_info: Optional[RealtimeServer] = None
         self._long_polling_retries: int = 0
         self._started: bool = False
         self._stopped: bool = False
         self._stop_event = threading.Event()
-        self._deduplication_size = 1000
-        self._dedupHash = dict()
+        self._deduplicator = EventDeduplicator(
+            deduplication_size,
+            event_ids=(
+                position_storage.get_event_ids()
+                if position_storage is not None and stored_position is not None
+                else ()
+            ),
+        )
 
     def __iter__(self) -> Generator[Event, None, None]:
         """Make EventStream iterable. Yields Event objects."""
@@ -102,11 +199,174 @@ class EventStream:
                 pass
             return
 
+    def iter_batches(
+        self,
+        max_batch: int = EVENTS_MAX_LIMIT,
+        max_wait: float = 1.0,
+        *,
+        max_queued_events: Optional[int] = None,
+    ) -> Generator[List[Event], None, None]:
+        """
+        Yields the events of the stream in batches, for bulk processing.
+
+        The events are fetched by a background thread into a bounded queue. While the stream has
+        a backlog, they are fetched one full page after another, without waiting for long polling
+        notifications. When the queue is full, fetching waits for the consumer to catch up.
+        With a `position_storage`, the stream position is stored once the events fetched before it
+        were yielded and the consumer asked for the next batch. Network and server errors are retried
+        every 5 seconds, other errors are raised once the events fetched before them were yielded.
+
+        Example usage:
+            for batch in client.events.get_event_stream().iter_batches(max_batch=500, max_wait=5):
+                index(batch)
+
+        :param max_batch: Maximum number of events per batch, defaults to 500
+        :type max_batch: int, optional
+        :param max_wait: Maximum number of seconds waited for a batch to fill up once it has its first event, defaults to 1
+        :type max_wait: float, optional
+        :param max_queued_events: Maximum number of events fetched ahead of the consumer, defaults to twice the page size
+        :type max_queued_events: Optional[int], optional
+        """
+        limit = self._query_params.limit or EVENTS_MAX_LIMIT
+        queue: Queue = Queue(maxsize=max_queued_events or 2 * max(limit, max_batch))
+        batches_closed = threading.Event()
+        fetcher = threading.Thread(
+            target=self._fetch_into_queue,
+            args=(queue, limit, batches_closed),
+            daemon=True,
+        )
+        self._started = True
+        fetcher.start()
+        batch: List[Event] = []
+        fetched_position: Optional[_FetchedPosition] = None
+        deadline: Optional[float] = None
+        try:
+            while True:
+                timeout = (
+                    max(deadline - time.monotonic(), 0)
+                    if deadline is not None
+                    else None
+                )
+                try:
+                    item = queue.get(timeout=timeout)
+                except Empty:
+                    item = None
+                if isinstance(item, _EndOfStream):
+                    if batch:
+                        yield batch
+                        self._store_fetched_position(fetched_position)
+                    if item.error is not None:
+                        raise item.error
+                    return
+                if isinstance(item, _FetchedPosition):
+                    if batch:
+                        fetched_position = item
+                    else:
+                        self._store_fetched_position(item)
+                elif item is not None:
+                    batch.append(item)
+                    if deadline is None:
+                        deadline = time.monotonic() + max_wait
+                # Once `max_wait` elapsed, the batch still takes the events already queued
+                if batch and (
+                    len(batch) >= max_batch or
+                    item is None or
+                    (queue.empty() and deadline <= time.monotonic())
+                ):
+                    yield batch
+                    self._store_fetched_position(fetched_position)
+                    batch, fetched_position, deadline = [], None, None
+        finally:
+            batches_closed.set()
+
+    def _fetch_into_queue(
+        self, queue: Queue, limit: int, batches_closed: threading.Event
+    ) -> None:
+        """
+        Fetches the events of the stream into `queue`, followed by their stream position.
+        The stream ends with the first error which is not retried.
+        """
+        error: Optional[Exception] = None
+
+        def stopped() -> bool:
+            return self._stopped or self._stop_event.is_set() or batches_closed.is_set()
+
+        def put(item) -> bool:
+            while not stopped():
+                try:
+                    queue.put(item, timeout=1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        try:
+            while not stopped():
+                try:
+                    events, has_backlog = self._fetch_page(limit)
+                    for event in events:
+                        if not put(event):
+                            return
+                    event_ids = (
+                        self._deduplicator.event_ids
+                        if self._position_storage is not None
+                        else None
+                    )
+                    if not put(_FetchedPosition(self._stream_position, event_ids)):
+                        return
+                    # Polls only once the backlog is fetched
+                    action = None if has_backlog else EventStreamAction.RECONNECT
+                    while action not in (None, EventStreamAction.FETCH_EVENTS):
+                        action = self._get_long_poll_info_and_poll()
+                        if action == EventStreamAction.STOP or stopped():
+                            return
+                        if action == EventStreamAction.RETRY:
+                            self._stop_event.wait(5)
+                except Exception as fetch_error:
+                    if stopped():
+                        return
+                    if not _is_retryable_error(fetch_error):
+                        error = fetch_error
+                        return
+                    if self._stop_event.wait(5):
+                        return
+        finally:
+            while True:
+                try:
+                    queue.put(_EndOfStream(error), timeout=1)
+                    return
+                except Full:
+                    if batches_closed.is_set():
+                        return
+
+    def _store_fetched_position(
+        self, fetched_position: Optional[_FetchedPosition]
+    ) -> None:
+        if fetched_position is None or self._position_storage is None:
+            return
+        self._position_storage.store(fetched_position.stream_position)
+        self._position_storage.store_event_ids(fetched_position.event_ids)
+
+    @property
+    def duplicates_dropped(self) -> int:
+        """Number of events dropped because they were already delivered."""
+        return self._deduplicator.duplicates_dropped
+
     def stop(self):
         """Stop the event stream."""
         self._stopped = True
         self._stop_event.set()
 
+    def wait_for_changes(self, stream_position: str) -> str:
+        """
+        Long polls the stream until there are events following `stream_position`, without fetching them.
+        Returns the action to take, `EventStreamAction.FETCH_EVENTS` once there are new events.
+        :param stream_position: Position of the stream following the events already fetched
+        :type stream_position: str
+        """
+        self._stream_position = stream_position
+        return self._get_long_poll_info_and_poll()
+
     def _get_long_poll_info(self):
         """Fetch long polling info from the server."""
         if self._stopped or self._stop_event.is_set():
@@ -199,38 +459,52 @@ class EventStream:
             return
 
         try:
-            # Prepare query parameters for the get_events call
-            fetch_params = self._query_params.__dict__
-            fetch_params['stream_position'] = self._stream_position
-
-            # Add extra headers if provided
-            if self._headers_input and self._headers_input.extra_headers:
-                fetch_params['extra_headers'] = self._headers_input.extra_headers
-
-            events: Events = self._events_manager.get_events(**fetch_params)
-
-            # Update stream position for next request
-            if events.next_stream_position is not None:
-                self._stream_position = str(events.next_stream_position)
-            else:
-                self._stream_position = 'now'
+            events, _ = self._fetch_page()
 
             # Yield Event objects if any
-            if events.entries:
-                for event in events.entries:
-                    event_id = event.event_id
-                    if event_id not in self._dedupHash:
-                        self._dedupHash[event_id] = True
-                        if self._stopped or self._stop_event.is_set():
-                            return
-                        yield event
+            for event in events:
+                if self._stopped or self._stop_event.is_set():
+                    return
+                yield event
 
-            if len(self._dedupHash) > self._deduplication_size:
-                self._dedupHash.clear()
-                event_ids = list(events.entries.map(lambda e: e.event_id))
-                for event_id in event_ids:
-                    self._dedupHash[event_id] = True
+            # All the fetched events were consumed
+            if self._position_storage is not None:
+                self._position_storage.store(self._stream_position)
+                self._position_storage.store_event_ids(self._deduplicator.event_ids)
 
         except Exception as error:
             if not self._stopped and not self._stop_event.is_set():
                 raise error
+
+    def _fetch_page(self, limit: Optional[int] = None) -> Tuple[List[Event], bool]:
+        """
+        Fetches the events following the stream position and moves the position after them.
+        Returns the events which were not delivered before, and whether more events are waiting.
+        """
+        # Prepare query parameters for the get_events call
+        fetch_params = dict(self._query_params.__dict__)
+        fetch_params['stream_position'] = self._stream_position
+        if limit is not None:
+            fetch_params['limit'] = limit
+
+        # Add extra headers if provided
+        if self._headers_input and self._headers_input.extra_headers:
+            fetch_params['extra_headers'] = self._headers_input.extra_headers
+
+        events: Events = self._events_manager.get_events(**fetch_params)
+
+        # Update stream position for next request
+        if events.next_stream_position is not None:
+            self._stream_position = str(events.next_stream_position)
+        else:
+            self._stream_position = 'now'
+
+        entries: List[Event] = events.entries or []
+        has_backlog = len(entries) >= (
+            fetch_params.get('limit', None) or _EVENTS_DEFAULT_LIMIT
+        )
+        return [
+            event
+            for event in entries
+            if not self._deduplicator.is_duplicate(event.event_id)
+        ], has_backlog
@@ -0,0 +1,301 @@
+import heapq
+import itertools
+import threading
+import time
+from queue import Empty, Full, Queue
+from typing import TYPE_CHECKING, Callable, Dict, Generator, List, Optional, Tuple
+
+from ..schemas.event import Event
+from .change_feed import InMemoryStreamPositionStorage, StreamPositionStorage
+from .event_stream import EVENTS_MAX_LIMIT, EventDeduplicator
+
+if TYPE_CHECKING:
+    from ..client import BoxClient
+    from ..managers.events import GetEventsStreamType
+
+
+class UserEvent:
+    def __init__(self, user_id: str, event: Event):
+        """
+        :param user_id: ID of the user whose stream returned the event
+        :type user_id: str
+        :param event: Event of the stream
+        :type event: Event
+        """
+        self.user_id = user_id
+        self.event = event
+
+    def __repr__(self) -> str:
+        return f'UserEvent({self.user_id!r}, {self.event.event_id!r})'
+
+
+class _UserStream:
+    def __init__(
+        self,
+        user_id: str,
+        client: 'BoxClient',
+        position_storage: StreamPositionStorage,
+        deduplication_size: int,
+    ):
+        self.user_id = user_id
+        self.client = client
+        self.position_storage = position_storage
+        stored_position: Optional[str] = position_storage.get()
+        self.stream_position: str = stored_position or 'now'
+        self.deduplicator = EventDeduplicator(
+            deduplication_size,
+            event_ids=(
+                position_storage.get_event_ids() if stored_position is not None else ()
+            ),
+        )
+        self.removed = False
+        self.idle_polls: int = 0
+
+
+class _FetchedPosition:
+    """Queued after the events of a stream fetched with the previous stream position."""
+
+    def __init__(self, stream: _UserStream, stream_position: str, event_ids: List[str]):
+        self.stream = stream
+        self.stream_position = stream_position
+        self.event_ids = event_ids
+
+
+class EventStreamMultiplexer:
+    """
+    Follows the event streams of many users with a few worker threads, fanning all their events
+    into a single bounded queue, tagged with the ID of their user.
+
+    Instead of a long polling loop and a thread per stream, the streams are polled in turn:
+    a stream with a backlog is polled again right away, one which returned events after `poll_interval`
+    seconds. The delay doubles with each consecutive poll of a stream returning no events, or failing,
+    up to `max_poll_interval` seconds. Following N idle users thus costs about N / `max_poll_interval`
+    requests per second, and a new event of an idle stream is fetched within `max_poll_interval` seconds.
+    All the users' clients share the connection pool of their network session.
+    The position of each stream is stored in its own storage, once the events fetched before it
+    were consumed and the consumer asked for the next event.
+
+    Example usage:
+        multiplexer = EventStreamMultiplexer(
+            client,
+            position_storage_factory=lambda user_id: FileStreamPositionStorage(f'positions/{user_id}'),
+        )
+        for user_id in user_ids:
+            multiplexer.add_user(user_id)
+        multiplexer.start()
+        for user_event in multiplexer:
+            print(user_event.user_id, user_event.event.event_type)
+    """
+
+    def __init__(
+        self,
+        client: 'BoxClient',
+        *,
+        max_workers: int = 4,
+        poll_interval: float = 10,
+        max_poll_interval: float = 300,
+        max_queued_events: int = 10000,
+        page_size: int = EVENTS_MAX_LIMIT,
+        stream_type: Optional['GetEventsStreamType'] = None,
+        deduplication_size: int = 1000,
+        position_storage_factory: Optional[
+            Callable[[str], StreamPositionStorage]
+        ] = None,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+    ):
+        """
+        :param client: Client used to follow the streams, impersonating each user with the `As-User` header
+        :type client: BoxClient
+        :param max_workers: Number of threads polling the streams, defaults to 4
+        :type max_workers: int, optional
+        :param poll_interval: Number of seconds between two polls of a stream without backlog, defaults to 10
+        :type poll_interval: float, optional
+        :param max_poll_interval: Maximum number of seconds between two polls of a stream which returned no events, defaults to 300
+        :type max_poll_interval: float, optional
+        :param max_queued_events: Maximum number of events fetched ahead of the consumer, defaults to 10000
+        :type max_queued_events: int, optional
+        :param page_size: Maximum number of events fetched per request, defaults to 500
+        :type page_size: int, optional
+        :param stream_type: Type of the followed streams, defaults to `all`
+        :type stream_type: Optional[GetEventsStreamType], optional
+        :param deduplication_size: Number of most recent event IDs remembered per stream to drop duplicated events, defaults to 1000
+        :type deduplication_size: int, optional
+        :param position_storage_factory: Function returning the storage of the position of a user's stream, defaults to InMemoryStreamPositionStorage
+        :type position_storage_factory: Optional[Callable[[str], StreamPositionStorage]], optional
+        :param on_error: Function called with the user ID and the error when polling a stream fails, before it is polled again with the delay of an idle stream, defaults to None
+        :type on_error: Optional[Callable[[str, Exception], None]], optional
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max(max_poll_interval, poll_interval)
+        self.page_size = page_size
+        self.stream_type = stream_type
+        self.deduplication_size = deduplication_size
+        self.position_storage_factory = position_storage_factory
+        self.on_error = on_error
+        self._queue: Queue = Queue(maxsize=max_queued_events)
+        self._streams: Dict[str, _UserStream] = {}
+        self._schedule: List[Tuple[float, int, _UserStream]] = []
+        self._schedule_order = itertools.count()
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._workers: List[threading.Thread] = []
+
+    def add_user(self, user_id: str, *, client: Optional['BoxClient'] = None) -> None:
+        """
+        Starts following the event stream of a user, from its stored position if there is one,
+        otherwise from now.
+        :param user_id: ID of the user
+        :type user_id: str
+        :param client: Client authenticated as the user, e.g. with an auth created by `with_user_subject`, defaults to the multiplexer client with the `As-User` header
+        :type client: Optional[BoxClient], optional
+        """
+        if client is None:
+            client = self.client.with_as_user_header(user_id)
+        position_storage = (
+            self.position_storage_factory(user_id)
+            if self.position_storage_factory is not None
+            else InMemoryStreamPositionStorage()
+        )
+        stream = _UserStream(user_id, client, position_storage, self.deduplication_size)
+        with self._condition:
+            previous_stream = self._streams.get(user_id, None)
+            if previous_stream is not None:
+                previous_stream.removed = True
+            self._streams[user_id] = stream
+            self._schedule_stream(stream, 0)
+
+    def remove_user(self, user_id: str) -> None:
+        """
+        Stops following the event stream of a user.
+        :param user_id: ID of the user
+        :type user_id: str
+        """
+        with self._condition:
+            stream = self._streams.pop(user_id, None)
+            if stream is not None:
+                stream.removed = True
+
+    @property
+    def user_ids(self) -> List[str]:
+        """IDs of the followed users."""
+        with self._condition:
+            return list(self._streams)
+
+    def start(self) -> None:
+        """Starts the worker threads polling the streams."""
+        self._stop_event.clear()
+        self._workers = [
+            threading.Thread(target=self._poll_streams, daemon=True)
+            for _ in range(self.max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def stop(self) -> None:
+        """Stops polling the streams. The iteration ends once the queued events were consumed."""
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()
+
+    def __iter__(self) -> Generator[UserEvent, None, None]:
+        """Yields the events of all the streams, as they are fetched."""
+        while True:
+            try:
+                item = self._queue.get(timeout=1)
+            except Empty:
+                if self._stop_event.is_set():
+                    return
+                continue
+            if isinstance(item, _FetchedPosition):
+                item.stream.position_storage.store(item.stream_position)
+                item.stream.position_storage.store_event_ids(item.event_ids)
+                continue
+            yield item
+
+    def _schedule_stream(self, stream: _UserStream, delay: float) -> None:
+        # Called with the condition acquired
+        heapq.heappush(
+            self._schedule,
+            (time.monotonic() + delay, next(self._schedule_order), stream),
+        )
+        self._condition.notify()
+
+    def _next_due_stream(self) -> Optional[_UserStream]:
+        with self._condition:
+            while not self._stop_event.is_set():
+                if not self._schedule:
+                    self._condition.wait()
+                    continue
+                due_at, _, stream = self._schedule[0]
+                if due_at > time.monotonic():
+                    self._condition.wait(due_at - time.monotonic())
+                    continue
+                heapq.heappop(self._schedule)
+                if not stream.removed:
+                    return stream
+            return None
+
+    def _poll_streams(self) -> None:
+        while True:
+            stream = self._next_due_stream()
+            if stream is None:
+                return
+            try:
+                delay = self._get_poll_delay(stream, self._poll_stream(stream))
+            except Exception as error:
+                delay = self._get_poll_delay(stream, 0)
+                if self.on_error is not None:
+                    self.on_error(stream.user_id, error)
+            with self._condition:
+                if not stream.removed:
+                    self._schedule_stream(stream, delay)
+
+    def _get_poll_delay(self, stream: _UserStream, fetched_events: int) -> float:
+        """
+        Returns the number of seconds before polling the stream again: none while it has a backlog,
+        `poll_interval` after events, and twice the previous delay after each poll without events,
+        up to `max_poll_interval`.
+        """
+        if fetched_events >= self.page_size:
+            stream.idle_polls = 0
+            return 0
+        if fetched_events > 0:
+            stream.idle_polls = 0
+            return self.poll_interval
+        stream.idle_polls = min(stream.idle_polls + 1, 32)
+        return min(
+            self.poll_interval * 2 ** (stream.idle_polls - 1), self.max_poll_interval
+        )
+
+    def _poll_stream(self, stream: _UserStream) -> int:
+        """Queues the new events of the stream, returns the number of fetched events."""
+        page = stream.client.events.get_events(
+            stream_type=self.stream_type,
+            stream_position=stream.stream_position,
+            limit=self.page_size,
+        )
+        entries: List[Event] = page.entries or []
+        previous_position = stream.stream_position
+        if page.next_stream_position is not None:
+            stream.stream_position = str(page.next_stream_position)
+        for event in entries:
+            if not stream.deduplicator.is_duplicate(event.event_id):
+                self._put(UserEvent(stream.user_id, event))
+        if stream.stream_position != previous_position:
+            self._put(
+                _FetchedPosition(
+                    stream, stream.stream_position, stream.deduplicator.event_ids
+                )
+            )
+        return len(entries)
+
+    def _put(self, item) -> None:
+        # Waits for the consumer while the queue is full, unless the multiplexer is stopped
+        while not self._stop_event.is_set():
+            try:
+                self._queue.put(item, timeout=1)
+                return
+            except Full:
+                continue
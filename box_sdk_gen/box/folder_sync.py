@@ -0,0 +1,852 @@
+import datetime
+import hashlib
+import os
+import shelve
+import shutil
+import threading
+from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from ..schemas.file_full import FileFull
+from .errors import BoxAPIError, BoxSDKError
+
+if TYPE_CHECKING:
+    from ..client import BoxClient
+    from .change_feed import ChangeSet, ItemChange
+
+DEFAULT_CHUNKED_UPLOAD_THRESHOLD = 50 * 1024 * 1024
+_SYNC_FIELDS = [
+    'name',
+    'size',
+    'sha1',
+    'etag',
+    'file_version',
+    'modified_at',
+    'content_modified_at',
+]
+_HASH_BUFFER_SIZE = 1024 * 1024
+_TEMPORARY_SUFFIX = '.boxsync'
+
+
+class SyncDirection(str, Enum):
+    DOWNLOAD = 'download'
+    UPLOAD = 'upload'
+
+
+class SyncActionType(str, Enum):
+    CREATE_FOLDER = 'create_folder'
+    DELETE_FOLDER = 'delete_folder'
+    DOWNLOAD = 'download'
+    UPLOAD = 'upload'
+    UPLOAD_VERSION = 'upload_version'
+    MOVE = 'move'
+    DELETE = 'delete'
+
+
+class SyncAction:
+    def __init__(
+        self,
+        type: SyncActionType,
+        path: str,
+        *,
+        file_id: Optional[str] = None,
+        size: Optional[int] = None,
+        previous_path: Optional[str] = None,
+    ):
+        """
+        :param type: Operation performed on the destination
+        :type type: SyncActionType
+        :param path: Path of the file or folder relative to the synced folders, with `/` separators
+        :type path: str
+        :param file_id: ID of the Box file the action applies to, if it exists, defaults to None
+        :type file_id: Optional[str], optional
+        :param size: Number of transferred bytes, defaults to None
+        :type size: Optional[int], optional
+        :param previous_path: Path the file is moved from, for `MOVE` actions, defaults to None
+        :type previous_path: Optional[str], optional
+        """
+        self.type = type
+        self.path = path
+        self.file_id = file_id
+        self.size = size
+        self.previous_path = previous_path
+
+    def __repr__(self) -> str:
+        return f'SyncAction({self.type.value}, {self.path!r})'
+
+
+class SyncedFileState:
+    def __init__(
+        self, file_id: str, sha1: str, etag: Optional[str], size: int, mtime_ns: int
+    ):
+        """
+        :param file_id: ID of the Box file
+        :type file_id: str
+        :param sha1: SHA-1 of the content, as a hex string
+        :type sha1: str
+        :param etag: Etag of the Box file when it was last synced
+        :type etag: Optional[str]
+        :param size: Size of the local file when it was last synced
+        :type size: int
+        :param mtime_ns: Modification time of the local file when it was last synced, in nanoseconds
+        :type mtime_ns: int
+        """
+        self.file_id = file_id
+        self.sha1 = sha1
+        self.etag = etag
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+
+class SyncStateStorage:
+    """
+    Keeps the state of the files synced by the last run, under a key identifying the synced folders,
+    so that unchanged files are neither hashed nor transferred again.
+    """
+
+    @abstractmethod
+    def store(self, key: str, files: Dict[str, SyncedFileState]) -> None:
+        pass
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, SyncedFileState]]:
+        pass
+
+    @abstractmethod
+    def clear(self, key: str) -> None:
+        pass
+
+
+class InMemorySyncStateStorage(SyncStateStorage):
+    def __init__(self):
+        self._states: Dict[str, Dict[str, SyncedFileState]] = {}
+        self._lock = threading.Lock()
+
+    def store(self, key: str, files: Dict[str, SyncedFileState]) -> None:
+        with self._lock:
+            self._states[key] = dict(files)
+
+    def get(self, key: str) -> Optional[Dict[str, SyncedFileState]]:
+        with self._lock:
+            files = self._states.get(key, None)
+            return dict(files) if files is not None else None
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._states.pop(key, None)
+
+
+class FileSyncStateStorage(SyncStateStorage):
+    """
+    Stores the sync state in a `shelve` database.
+    """
+
+    def __init__(self, filename: str = 'sync_state_storage'):
+        self.filename = filename
+        self._lock = threading.Lock()
+
+    def store(self, key: str, files: Dict[str, SyncedFileState]) -> None:
+        with self._lock, shelve.open(self.filename) as file:
+            file[key] = files
+
+    def get(self, key: str) -> Optional[Dict[str, SyncedFileState]]:
+        with self._lock, shelve.open(self.filename) as file:
+            return file.get(key, None)
+
+    def clear(self, key: str) -> None:
+        with self._lock, shelve.open(self.filename) as file:
+            file.pop(key, None)
+
+
+class SyncReport:
+    def __init__(
+        self,
+        direction: SyncDirection,
+        *,
+        dry_run: bool,
+        actions: List[SyncAction],
+        unchanged: int,
+        failed: List[Tuple[SyncAction, Exception]] = None,
+    ):
+        """
+        :param direction: Direction of the sync
+        :type direction: SyncDirection
+        :param dry_run: Whether the actions were only planned
+        :type dry_run: bool
+        :param actions: Actions needed to sync the folders, performed unless `dry_run` is set
+        :type actions: List[SyncAction]
+        :param unchanged: Number of files which were already in sync
+        :type unchanged: int
+        :param failed: Actions which failed, with their error, defaults to None
+        :type failed: List[Tuple[SyncAction, Exception]], optional
+        """
+        self.direction = direction
+        self.dry_run = dry_run
+        self.actions = actions
+        self.unchanged = unchanged
+        self.failed = failed if failed is not None else []
+
+    @property
+    def transfer_size(self) -> int:
+        """Number of bytes transferred by the actions."""
+        return sum(action.size or 0 for action in self.actions)
+
+
+class _LocalFile:
+    def __init__(self, path: str, size: int, mtime_ns: int):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+
+def _sha1_of_file(path: str) -> str:
+    file_hash = hashlib.sha1()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(_HASH_BUFFER_SIZE), b''):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _join(parent: str, name: str) -> str:
+    return f'{parent}/{name}' if parent else name
+
+
+def _is_in_folders(path: str, folders: Set[str]) -> bool:
+    parent = path.rpartition('/')[0]
+    while parent:
+        if parent in folders:
+            return True
+        parent = parent.rpartition('/')[0]
+    return False
+
+
+class _HashingOutputStream:
+    """Computes the SHA-1 of the content written to the wrapped output stream."""
+
+    def __init__(self, output_stream):
+        self.output_stream = output_stream
+        self.hash = hashlib.sha1()
+
+    def write(self, data) -> int:
+        self.hash.update(data)
+        return self.output_stream.write(data)
+
+
+class FolderSync:
+    """
+    Mirrors a Box folder to a local folder, or a local folder to a Box folder.
+
+    Files are compared by their SHA-1. The state of the synced files is kept in `state_storage`,
+    so on the following runs, files whose local size and modification time and whose Box etag
+    did not change are neither hashed nor transferred again.
+    Changed files are transferred by a pool of `max_workers` threads, files of at least
+    `chunked_upload_threshold` bytes are uploaded with chunked uploads.
+
+    Example usage:
+        sync = FolderSync(client, state_storage=FileSyncStateStorage('sync_state'))
+        report = sync.sync('12345', '/mnt/mirror', SyncDirection.DOWNLOAD, dry_run=True)
+        for action in report.actions:
+            print(action.type, action.path)
+    """
+
+    def __init__(
+        self,
+        client: 'BoxClient',
+        *,
+        state_storage: Optional[SyncStateStorage] = None,
+        max_workers: int = 4,
+        chunked_upload_threshold: int = DEFAULT_CHUNKED_UPLOAD_THRESHOLD,
+        delete: bool = False,
+    ):
+        """
+        :param client: Client used to access the Box folder
+        :type client: BoxClient
+        :param state_storage: Storage of the state of the synced files, defaults to InMemorySyncStateStorage
+        :type state_storage: Optional[SyncStateStorage], optional
+        :param max_workers: Maximum number of files hashed or transferred concurrently, defaults to 4
+        :type max_workers: int, optional
+        :param chunked_upload_threshold: Size in bytes from which files are uploaded with chunked uploads, defaults to 50 MiB
+        :type chunked_upload_threshold: int, optional
+        :param delete: Delete the destination files which do not exist in the source folder, defaults to False
+        :type delete: bool, optional
+        """
+        self.client = client
+        self.state_storage = (
+            state_storage if state_storage is not None else InMemorySyncStateStorage()
+        )
+        self.max_workers = max_workers
+        self.chunked_upload_threshold = chunked_upload_threshold
+        self.delete = delete
+
+    def sync(
+        self,
+        folder_id: str,
+        local_path: str,
+        direction: SyncDirection,
+        *,
+        dry_run: bool = False,
+    ) -> SyncReport:
+        """
+        Syncs the Box folder and the local folder in the given direction.
+        Failed actions are reported, the other ones are still performed.
+        :param folder_id: ID of the synced Box folder
+        :type folder_id: str
+        :param local_path: Path of the synced local folder
+        :type local_path: str
+        :param direction: `DOWNLOAD` mirrors the Box folder to the local folder, `UPLOAD` the other way around
+        :type direction: SyncDirection
+        :param dry_run: Only report the actions needed to sync the folders, defaults to False
+        :type dry_run: bool, optional
+        """
+        local_path = os.path.abspath(local_path)
+        state_key = f'{direction.value}:{folder_id}:{local_path}'
+        previous_state: Dict[str, SyncedFileState] = (
+            self.state_storage.get(state_key) or {}
+        )
+        remote_folders, remote_files = self._scan_remote(folder_id)
+        local_folders, local_files = self._scan_local(local_path)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            unchanged = self._find_unchanged(
+                executor, local_files, remote_files, previous_state
+            )
+            actions = self._plan(
+                direction,
+                remote_folders,
+                remote_files,
+                local_folders,
+                local_files,
+                unchanged,
+            )
+            report = SyncReport(
+                direction, dry_run=dry_run, actions=actions, unchanged=len(unchanged)
+            )
+            if dry_run:
+                return report
+            sync_run = _SyncRun(self, direction, local_path, remote_folders, report)
+            sync_run.files.update(unchanged)
+            sync_run.run(executor, remote_files, local_files)
+        self.state_storage.store(state_key, sync_run.files)
+        return report
+
+    def apply_changes(
+        self,
+        change_set: 'ChangeSet',
+        folder_id: str,
+        local_path: str,
+        *,
+        dry_run: bool = False,
+    ) -> SyncReport:
+        """
+        Applies the changes returned by a `ChangeFeed` to a local folder mirroring a Box folder,
+        without scanning the folders again.
+        Changed files are downloaded and moved files are moved locally. Files trashed or moved out
+        of the Box folder are deleted if `delete` is set.
+        A change of a folder changes the paths of all its content, so it falls back to a full
+        `sync` in the `DOWNLOAD` direction, as does a local folder which was never synced.
+        :param change_set: Changes to apply
+        :type change_set: ChangeSet
+        :param folder_id: ID of the mirrored Box folder
+        :type folder_id: str
+        :param local_path: Path of the local folder
+        :type local_path: str
+        :param dry_run: Only report the actions needed to apply the changes, defaults to False
+        :type dry_run: bool, optional
+        """
+        local_path = os.path.abspath(local_path)
+        state_key = f'{SyncDirection.DOWNLOAD.value}:{folder_id}:{local_path}'
+        state: Optional[Dict[str, SyncedFileState]] = self.state_storage.get(state_key)
+        if state is None or any(
+            change.item_type == 'folder' for change in change_set.changes
+        ):
+            return self.sync(
+                folder_id, local_path, SyncDirection.DOWNLOAD, dry_run=dry_run
+            )
+        paths_by_file_id = {file.file_id: path for path, file in state.items()}
+        remote_files: Dict[str, FileFull] = {}
+        local_files: Dict[str, _LocalFile] = {}
+        actions: List[SyncAction] = []
+        for change in change_set.changes:
+            previous_path = paths_by_file_id.get(change.item_id, None)
+            previous = state.pop(previous_path, None) if previous_path else None
+            previous_file = (
+                self._stat_local(local_path, previous_path) if previous_path else None
+            )
+            remote_file, path = self._get_changed_file(change, folder_id)
+            if remote_file is None:
+                if self.delete and previous_file is not None:
+                    local_files[previous_path] = previous_file
+                    actions.append(SyncAction(SyncActionType.DELETE, previous_path))
+                continue
+            replaced = state.pop(path, None)
+            if replaced is not None:
+                paths_by_file_id.pop(replaced.file_id, None)
+            remote_files[path] = remote_file
+            local_unchanged = (
+                previous is not None and
+                previous_file is not None and
+                previous.size == previous_file.size and
+                previous.mtime_ns == previous_file.mtime_ns
+            )
+            if local_unchanged and previous.sha1 == remote_file.sha_1:
+                if previous_path == path:
+                    state[path] = SyncedFileState(
+                        remote_file.id,
+                        previous.sha1,
+                        remote_file.etag,
+                        previous.size,
+                        previous.mtime_ns,
+                    )
+                    continue
+                local_files[path] = previous_file
+                actions.append(
+                    SyncAction(
+                        SyncActionType.MOVE,
+                        path,
+                        file_id=remote_file.id,
+                        previous_path=previous_path,
+                    )
+                )
+                continue
+            actions.append(
+                SyncAction(
+                    SyncActionType.DOWNLOAD,
+                    path,
+                    file_id=remote_file.id,
+                    size=remote_file.size,
+                )
+            )
+            if self.delete and previous_file is not None and previous_path != path:
+                local_files[previous_path] = previous_file
+                actions.append(SyncAction(SyncActionType.DELETE, previous_path))
+        report = SyncReport(
+            SyncDirection.DOWNLOAD,
+            dry_run=dry_run,
+            actions=actions,
+            unchanged=len(state),
+        )
+        if dry_run:
+            return report
+        sync_run = _SyncRun(self, SyncDirection.DOWNLOAD, local_path, {}, report)
+        sync_run.files.update(state)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            sync_run.run(executor, remote_files, local_files)
+        self.state_storage.store(state_key, sync_run.files)
+        return report
+
+    def _get_changed_file(
+        self, change: 'ItemChange', folder_id: str
+    ) -> Tuple[Optional[FileFull], Optional[str]]:
+        """Returns the changed file and its path in the Box folder, None if it is no longer in it."""
+        from .change_feed import ItemChangeType
+
+        if change.type == ItemChangeType.TRASH:
+            return None, None
+        try:
+            remote_file = self.client.files.get_file_by_id(
+                change.item_id,
+                fields=_SYNC_FIELDS + ['path_collection', 'item_status'],
+            )
+        except BoxAPIError as error:
+            if error.response_info.status_code == 404:
+                return None, None
+            raise
+        if remote_file.item_status is not None and remote_file.item_status != 'active':
+            return None, None
+        ancestor_ids = [folder.id for folder in remote_file.path_collection.entries]
+        if folder_id not in ancestor_ids:
+            return None, None
+        names = [
+            folder.name
+            for folder in remote_file.path_collection.entries[
+                ancestor_ids.index(folder_id) + 1:
+            ]
+        ]
+        return remote_file, '/'.join(names + [remote_file.name])
+
+    def _stat_local(self, local_path: str, path: str) -> Optional[_LocalFile]:
+        full_path = os.path.join(local_path, *path.split('/'))
+        try:
+            stat = os.stat(full_path)
+        except FileNotFoundError:
+            return None
+        return _LocalFile(full_path, stat.st_size, stat.st_mtime_ns)
+
+    def _scan_remote(
+        self, folder_id: str
+    ) -> Tuple[Dict[str, str], Dict[str, FileFull]]:
+        folders: Dict[str, str] = {'': folder_id}
+        files: Dict[str, FileFull] = {}
+        walked_path_prefix: Optional[str] = None
+        for path, subfolders, items in self.client.folders.walk(
+            folder_id, fields=_SYNC_FIELDS
+        ):
+            if walked_path_prefix is None:
+                walked_path_prefix = path
+            relative_path = path[len(walked_path_prefix) + 1:]
+            for folder in subfolders:
+                folders[_join(relative_path, folder.name)] = folder.id
+            for item in items:
+                if item.type == 'file':
+                    files[_join(relative_path, item.name)] = item
+        return folders, files
+
+    def _scan_local(self, local_path: str) -> Tuple[List[str], Dict[str, _LocalFile]]:
+        folders: List[str] = []
+        files: Dict[str, _LocalFile] = {}
+        for path, subfolders, names in os.walk(local_path):
+            relative_path = os.path.relpath(path, local_path).replace(os.sep, '/')
+            if relative_path == '.':
+                relative_path = ''
+            folders.extend(_join(relative_path, name) for name in subfolders)
+            for name in names:
+                # Leftovers of downloads interrupted by a crash are neither synced nor uploaded
+                if name.endswith(_TEMPORARY_SUFFIX):
+                    continue
+                stat = os.stat(os.path.join(path, name))
+                files[_join(relative_path, name)] = _LocalFile(
+                    os.path.join(path, name), stat.st_size, stat.st_mtime_ns
+                )
+        return folders, files
+
+    def _find_unchanged(
+        self,
+        executor: ThreadPoolExecutor,
+        local_files: Dict[str, _LocalFile],
+        remote_files: Dict[str, FileFull],
+        previous_state: Dict[str, SyncedFileState],
+    ) -> Dict[str, SyncedFileState]:
+        """Returns the state of the files present on both sides with the same content."""
+        unchanged: Dict[str, SyncedFileState] = {}
+        to_hash: List[str] = []
+        for path, remote_file in remote_files.items():
+            local_file = local_files.get(path, None)
+            if local_file is None:
+                continue
+            previous = previous_state.get(path, None)
+            if (
+                previous is not None and
+                previous.size == local_file.size and
+                previous.mtime_ns == local_file.mtime_ns
+            ):
+                if previous.file_id == remote_file.id and (
+                    previous.etag == remote_file.etag or
+                    previous.sha1 == remote_file.sha_1
+                ):
+                    unchanged[path] = previous
+                    continue
+                if previous.sha1 != remote_file.sha_1:
+                    continue
+            to_hash.append(path)
+        hashes = executor.map(
+            lambda path: _sha1_of_file(local_files[path].path), to_hash
+        )
+        for path, sha1 in zip(to_hash, hashes):
+            if sha1 == remote_files[path].sha_1:
+                unchanged[path] = SyncedFileState(
+                    remote_files[path].id,
+                    sha1,
+                    remote_files[path].etag,
+                    local_files[path].size,
+                    local_files[path].mtime_ns,
+                )
+        return unchanged
+
+    def _plan(
+        self,
+        direction: SyncDirection,
+        remote_folders: Dict[str, str],
+        remote_files: Dict[str, FileFull],
+        local_folders: List[str],
+        local_files: Dict[str, _LocalFile],
+        unchanged: Dict[str, SyncedFileState],
+    ) -> List[SyncAction]:
+        actions: List[SyncAction] = []
+        # Only the topmost removed folders are deleted, along with all their content
+        removed_folders: Set[str] = set()
+        if self.delete:
+            source_folders = (
+                remote_folders
+                if direction == SyncDirection.DOWNLOAD
+                else set(local_folders)
+            )
+            destination_folders = (
+                local_folders if direction == SyncDirection.DOWNLOAD else remote_folders
+            )
+            # Parents sort before their subfolders
+            for path in sorted(destination_folders):
+                if not path or path in source_folders:
+                    continue
+                if not _is_in_folders(path, removed_folders):
+                    actions.append(SyncAction(SyncActionType.DELETE_FOLDER, path))
+                removed_folders.add(path)
+        if direction == SyncDirection.DOWNLOAD:
+            for path in remote_folders:
+                if path and path not in local_folders:
+                    actions.append(SyncAction(SyncActionType.CREATE_FOLDER, path))
+            for path, remote_file in remote_files.items():
+                if path not in unchanged:
+                    actions.append(
+                        SyncAction(
+                            SyncActionType.DOWNLOAD,
+                            path,
+                            file_id=remote_file.id,
+                            size=remote_file.size,
+                        )
+                    )
+            if self.delete:
+                for path in local_files:
+                    if path not in remote_files and not _is_in_folders(
+                        path, removed_folders
+                    ):
+                        actions.append(SyncAction(SyncActionType.DELETE, path))
+            return actions
+        for path in sorted(local_folders):
+            if path not in remote_folders:
+                actions.append(SyncAction(SyncActionType.CREATE_FOLDER, path))
+        for path, local_file in local_files.items():
+            if path in unchanged:
+                continue
+            remote_file = remote_files.get(path, None)
+            actions.append(
+                SyncAction(
+                    (
+                        SyncActionType.UPLOAD
+                        if remote_file is None
+                        else SyncActionType.UPLOAD_VERSION
+                    ),
+                    path,
+                    file_id=remote_file.id if remote_file is not None else None,
+                    size=local_file.size,
+                )
+            )
+        if self.delete:
+            for path, remote_file in remote_files.items():
+                if path not in local_files and not _is_in_folders(
+                    path, removed_folders
+                ):
+                    actions.append(
+                        SyncAction(SyncActionType.DELETE, path, file_id=remote_file.id)
+                    )
+        return actions
+
+
+class _SyncRun:
+    """Performs the planned actions of a sync and collects the new state of the synced files."""
+
+    def __init__(
+        self,
+        sync: FolderSync,
+        direction: SyncDirection,
+        local_path: str,
+        remote_folders: Dict[str, str],
+        report: SyncReport,
+    ):
+        self.client = sync.client
+        self.chunked_upload_threshold = sync.chunked_upload_threshold
+        self.direction = direction
+        self.local_path = local_path
+        self.remote_folders = remote_folders
+        self.report = report
+        self.files: Dict[str, SyncedFileState] = {}
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        executor: ThreadPoolExecutor,
+        remote_files: Dict[str, FileFull],
+        local_files: Dict[str, _LocalFile],
+    ) -> None:
+        # Folders are deleted and created first and in order, so that parents exist before their content
+        transfers = []
+        for action in self.report.actions:
+            if action.type == SyncActionType.DELETE_FOLDER:
+                self._perform(self._delete_folder, action)
+        for action in self.report.actions:
+            if action.type == SyncActionType.CREATE_FOLDER:
+                self._perform(self._create_folder, action)
+            elif action.type != SyncActionType.DELETE_FOLDER:
+                transfers.append(action)
+        for future in [
+            executor.submit(
+                self._perform,
+                self._transfer,
+                action,
+                remote_files.get(action.path, None),
+                local_files.get(action.path, None),
+            )
+            for action in transfers
+        ]:
+            future.result()
+
+    def _perform(self, operation, action: SyncAction, *args) -> None:
+        try:
+            operation(action, *args)
+        except Exception as error:
+            with self._lock:
+                self.report.failed.append((action, error))
+
+    def _local_path(self, path: str) -> str:
+        return os.path.join(self.local_path, *path.split('/'))
+
+    def _create_folder(self, action: SyncAction) -> None:
+        if self.direction == SyncDirection.DOWNLOAD:
+            os.makedirs(self._local_path(action.path), exist_ok=True)
+            return
+        # Managers are imported when used, to keep `import box_sdk_gen` fast
+        from ..managers.folders import CreateFolderParent
+
+        parent, _, name = action.path.rpartition('/')
+        folder = self.client.folders.create_folder(
+            name, CreateFolderParent(id=self.remote_folders[parent])
+        )
+        self.remote_folders[action.path] = folder.id
+
+    def _delete_folder(self, action: SyncAction) -> None:
+        if self.direction == SyncDirection.DOWNLOAD:
+            shutil.rmtree(self._local_path(action.path))
+        else:
+            self.client.folders.delete_folder_by_id(
+                self.remote_folders[action.path], recursive=True
+            )
+
+    def _transfer(
+        self,
+        action: SyncAction,
+        remote_file: Optional[FileFull],
+        local_file: Optional[_LocalFile],
+    ) -> None:
+        if action.type == SyncActionType.DELETE:
+            if self.direction == SyncDirection.DOWNLOAD:
+                os.remove(local_file.path)
+            else:
+                self.client.files.delete_file_by_id(action.file_id)
+            return
+        if action.type == SyncActionType.MOVE:
+            self._move(action, remote_file, local_file)
+        elif action.type == SyncActionType.DOWNLOAD:
+            self._download(action, remote_file)
+        else:
+            self._upload(action, local_file, remote_file)
+
+    def _move(
+        self, action: SyncAction, remote_file: FileFull, local_file: _LocalFile
+    ) -> None:
+        path = self._local_path(action.path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(local_file.path, path)
+        self._record(
+            action.path,
+            SyncedFileState(
+                remote_file.id,
+                remote_file.sha_1,
+                remote_file.etag,
+                local_file.size,
+                local_file.mtime_ns,
+            ),
+        )
+
+    def _download(self, action: SyncAction, remote_file: FileFull) -> None:
+        path = self._local_path(action.path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Writes to a temporary file, so that an interrupted download never replaces the local file
+        temporary_path = f'{path}{_TEMPORARY_SUFFIX}'
+        # Downloads the scanned version, whose SHA-1 and etag are recorded, even if a new one was uploaded since
+        version: Optional[str] = (
+            remote_file.file_version.id
+            if remote_file.file_version is not None
+            else None
+        )
+        try:
+            with open(temporary_path, 'wb') as file:
+                output_stream = _HashingOutputStream(file)
+                self.client.downloads.download_file_to_output_stream(
+                    remote_file.id, output_stream, version=version
+                )
+            sha1 = output_stream.hash.hexdigest()
+            if remote_file.sha_1 is not None and sha1 != remote_file.sha_1:
+                raise BoxSDKError(
+                    message=f'SHA-1 of the downloaded content does not match file {remote_file.id}'
+                )
+            os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+        modified_at: Optional[datetime.datetime] = (
+            remote_file.content_modified_at or remote_file.modified_at
+        )
+        if modified_at is not None:
+            os.utime(path, (modified_at.timestamp(), modified_at.timestamp()))
+        stat = os.stat(path)
+        self._record(
+            action.path,
+            SyncedFileState(
+                remote_file.id,
+                remote_file.sha_1,
+                remote_file.etag,
+                stat.st_size,
+                stat.st_mtime_ns,
+            ),
+        )
+
+    def _upload(
+        self,
+        action: SyncAction,
+        local_file: _LocalFile,
+        remote_file: Optional[FileFull],
+    ) -> None:
+        from ..managers.uploads import (
+            UploadFileAttributes,
+            UploadFileAttributesParentField,
+            UploadFileVersionAttributes,
+        )
+
+        parent, _, name = action.path.rpartition('/')
+        sha1 = _sha1_of_file(local_file.path)
+        content_modified_at = datetime.datetime.fromtimestamp(
+            local_file.mtime_ns / 1e9, datetime.timezone.utc
+        ).replace(microsecond=0)
+        with open(local_file.path, 'rb') as file:
+            if local_file.size >= self.chunked_upload_threshold:
+                if remote_file is None:
+                    uploaded_file = self.client.chunked_uploads.upload_big_file(
+                        file, name, local_file.size, self.remote_folders[parent]
+                    )
+                else:
+                    uploaded_file = self.client.chunked_uploads.upload_big_file_version(
+                        file, remote_file.id, local_file.size
+                    )
+            elif remote_file is None:
+                uploaded_file = self.client.uploads.upload_file(
+                    UploadFileAttributes(
+                        name,
+                        UploadFileAttributesParentField(id=self.remote_folders[parent]),
+                        content_modified_at=content_modified_at,
+                    ),
+                    file,
+                ).entries[0]
+            else:
+                uploaded_file = self.client.uploads.upload_file_version(
+                    remote_file.id,
+                    UploadFileVersionAttributes(
+                        name, content_modified_at=content_modified_at
+                    ),
+                    file,
+                    if_match=remote_file.etag,
+                ).entries[0]
+        self._record(
+            action.path,
+            SyncedFileState(
+                uploaded_file.id,
+                sha1,
+                uploaded_file.etag,
+                local_file.size,
+                local_file.mtime_ns,
+            ),
+        )
+
+    def _record(self, path: str, state: SyncedFileState) -> None:
+        with self._lock:
+            self.files[path] = state
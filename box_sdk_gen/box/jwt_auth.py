@@ -16,6 +16,14 @@ from box_sdk_gen.networking.auth import Authentication
 
 from box_sdk_gen.networking.network import NetworkSession
 
+from box_sdk_gen.networking.async_network_client import AsyncNetworkClient
+
+from box_sdk_gen.networking.single_request import RequestGenerator
+
+from box_sdk_gen.networking.single_request import send_request
+
+from box_sdk_gen.networking.single_request import send_request_async
+
 from box_sdk_gen.schemas.access_token import AccessToken
 
 from box_sdk_gen.schemas.post_o_auth_2_token import PostOAuth2Token
@@ -26,6 +34,10 @@ from box_sdk_gen.box.token_storage import TokenStorage
 
 from box_sdk_gen.box.token_storage import InMemoryTokenStorage
 
+from box_sdk_gen.box.token_refresh import DEFAULT_TOKEN_REFRESH_RATIO
+
+from box_sdk_gen.box.token_refresh import TokenRefresher
+
 from box_sdk_gen.serialization.json import json_to_serialized_data
 
 from box_sdk_gen.serialization.json import SerializedData
@@ -166,7 +178,9 @@ class JWTConfig:
         user_id: Optional[str] = None,
         algorithm: Optional[JwtAlgorithm] = JwtAlgorithm.RS256,
         token_storage: TokenStorage = None,
-        private_key_decryptor: PrivateKeyDecryptor = None
+        private_key_decryptor: PrivateKeyDecryptor = None,
+        token_refresh_ratio: Optional[float] = DEFAULT_TOKEN_REFRESH_RATIO,
+        background_token_refresh: bool = False
     ):
         """
         :param client_id: App client ID
@@ -183,6 +197,10 @@ class JWTConfig:
         :type enterprise_id: Optional[str], optional
         :param user_id: User ID, defaults to None
         :type user_id: Optional[str], optional
+        :param token_refresh_ratio: Fraction of the access token lifetime after which the token is refreshed before it is used. If None, the token is only refreshed when missing or rejected by the API, defaults to 0.9
+        :type token_refresh_ratio: Optional[float], optional
+        :param background_token_refresh: Refresh the access token in a background thread, while the current token is still in use, defaults to False
+        :type background_token_refresh: bool, optional
         """
         if token_storage is None:
             token_storage = InMemoryTokenStorage()
@@ -198,6 +216,8 @@ class JWTConfig:
         self.algorithm = algorithm
         self.token_storage = token_storage
         self.private_key_decryptor = private_key_decryptor
+        self.token_refresh_ratio = token_refresh_ratio
+        self.background_token_refresh = background_token_refresh
 
     @staticmethod
     def from_config_json_string(
@@ -278,6 +298,11 @@ class BoxJWTAuth(Authentication):
         super().__init__(**kwargs)
         self.config = config
         self.token_storage = self.config.token_storage
+        self._token_refresher = TokenRefresher(
+            self.token_storage,
+            refresh_ratio=self.config.token_refresh_ratio,
+            background_refresh=self.config.background_token_refresh,
+        )
         self.subject_id = (
             self.config.enterprise_id
             if not self.config.enterprise_id == None
@@ -291,10 +316,36 @@ class BoxJWTAuth(Authentication):
         self, *, network_session: Optional[NetworkSession] = None
     ) -> AccessToken:
         """
-        Get new access token using JWT auth.
+        Get new access token using JWT auth. Concurrent calls share a single token request.
+        :param network_session: An object to keep network session state, defaults to None
+        :type network_session: Optional[NetworkSession], optional
+        """
+        return self._token_refresher.refresh(
+            lambda: self._request_access_token(network_session)
+        )
+
+    def refresh_rejected_token(
+        self,
+        rejected_access_token: Optional[str],
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Get a new access token after the API rejected `rejected_access_token`. Returns the stored token
+        without requesting a new one if it was already refreshed since.
+        :param rejected_access_token: Access token rejected by the API
+        :type rejected_access_token: Optional[str]
         :param network_session: An object to keep network session state, defaults to None
         :type network_session: Optional[NetworkSession], optional
         """
+        return self._token_refresher.refresh(
+            lambda: self._request_access_token(network_session),
+            rejected_token=rejected_access_token,
+        )
+
+    def _access_token_request(
+        self, network_session: Optional[NetworkSession]
+    ) -> RequestGenerator:
         if is_browser():
             raise BoxSDKError(
                 message='JWT auth is not supported in browser environment.'
@@ -326,28 +377,39 @@ class BoxJWTAuth(Authentication):
                 network_session if not network_session == None else NetworkSession()
             )
         )
-        token: AccessToken = auth_manager.request_access_token(
+        return auth_manager.request_access_token.request_generator(
+            auth_manager,
             PostOAuth2TokenGrantTypeField.URN_IETF_PARAMS_OAUTH_GRANT_TYPE_JWT_BEARER,
             assertion=assertion,
             client_id=self.config.client_id,
             client_secret=self.config.client_secret,
         )
-        self.token_storage.store(token)
-        return token
+
+    def _request_access_token(
+        self, network_session: Optional[NetworkSession]
+    ) -> AccessToken:
+        return send_request(self._access_token_request(network_session))
+
+    async def _request_access_token_async(
+        self,
+        async_network_client: AsyncNetworkClient,
+        network_session: Optional[NetworkSession],
+    ) -> AccessToken:
+        return await send_request_async(
+            self._access_token_request(network_session), async_network_client
+        )
 
     def retrieve_token(
         self, *, network_session: Optional[NetworkSession] = None
     ) -> AccessToken:
         """
-        Get the current access token. If the current access token is expired or not found, this method will attempt to refresh the token.
+        Get the current access token. If the current access token is expired, due for refresh or not found, this method will attempt to refresh the token.
         :param network_session: An object to keep network session state, defaults to None
         :type network_session: Optional[NetworkSession], optional
         """
-        old_token: Optional[AccessToken] = self.token_storage.get()
-        if old_token == None:
-            new_token: AccessToken = self.refresh_token(network_session=network_session)
-            return new_token
-        return old_token
+        return self._token_refresher.retrieve(
+            lambda: self._request_access_token(network_session)
+        )
 
     def retrieve_authorization_header(
         self, *, network_session: Optional[NetworkSession] = None
@@ -355,6 +417,85 @@ class BoxJWTAuth(Authentication):
         token: AccessToken = self.retrieve_token(network_session=network_session)
         return ''.join(['Bearer ', token.access_token])
 
+    def needs_token_request(self) -> bool:
+        """
+        Returns whether the stored token is missing or due for refresh, so that retrieving
+        the authorization header requests a new token.
+        """
+        return self._token_refresher.is_refresh_due()
+
+    async def retrieve_token_async(
+        self,
+        async_network_client: AsyncNetworkClient,
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Asynchronous counterpart of `retrieve_token`, requesting the token with `async_network_client`.
+        :param async_network_client: Network client sending the token request
+        :type async_network_client: AsyncNetworkClient
+        :param network_session: An object to keep network session state, defaults to None
+        :type network_session: Optional[NetworkSession], optional
+        """
+        return await self._token_refresher.retrieve_async(
+            lambda: self._request_access_token_async(
+                async_network_client, network_session
+            )
+        )
+
+    async def refresh_token_async(
+        self,
+        async_network_client: AsyncNetworkClient,
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Asynchronous counterpart of `refresh_token`, requesting the token with `async_network_client`.
+        :param async_network_client: Network client sending the token request
+        :type async_network_client: AsyncNetworkClient
+        :param network_session: An object to keep network session state, defaults to None
+        :type network_session: Optional[NetworkSession], optional
+        """
+        return await self._token_refresher.refresh_async(
+            lambda: self._request_access_token_async(
+                async_network_client, network_session
+            )
+        )
+
+    async def refresh_rejected_token_async(
+        self,
+        rejected_access_token: Optional[str],
+        async_network_client: AsyncNetworkClient,
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Asynchronous counterpart of `refresh_rejected_token`, requesting the token with `async_network_client`.
+        :param rejected_access_token: Access token rejected by the API
+        :type rejected_access_token: Optional[str]
+        :param async_network_client: Network client sending the token request
+        :type async_network_client: AsyncNetworkClient
+        :param network_session: An object to keep network session state, defaults to None
+        :type network_session: Optional[NetworkSession], optional
+        """
+        return await self._token_refresher.refresh_async(
+            lambda: self._request_access_token_async(
+                async_network_client, network_session
+            ),
+            rejected_token=rejected_access_token,
+        )
+
+    async def retrieve_authorization_header_async(
+        self,
+        async_network_client: AsyncNetworkClient,
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> str:
+        token: AccessToken = await self.retrieve_token_async(
+            async_network_client, network_session=network_session
+        )
+        return ''.join(['Bearer ', token.access_token])
+
     def with_user_subject(
         self, user_id: str, *, token_storage: TokenStorage = None
     ) -> 'BoxJWTAuth':
@@ -385,6 +526,8 @@ class BoxJWTAuth(Authentication):
             private_key=self.config.private_key,
             private_key_passphrase=self.config.private_key_passphrase,
             token_storage=token_storage,
+            token_refresh_ratio=self.config.token_refresh_ratio,
+            background_token_refresh=self.config.background_token_refresh,
         )
         new_auth: 'BoxJWTAuth' = BoxJWTAuth(config=new_config)
         return new_auth
@@ -410,6 +553,8 @@ class BoxJWTAuth(Authentication):
             private_key=self.config.private_key,
             private_key_passphrase=self.config.private_key_passphrase,
             token_storage=token_storage,
+            token_refresh_ratio=self.config.token_refresh_ratio,
+            background_token_refresh=self.config.background_token_refresh,
         )
         new_auth: 'BoxJWTAuth' = BoxJWTAuth(config=new_config)
         return new_auth
@@ -14,6 +14,14 @@ from box_sdk_gen.networking.auth import Authentication
 
 from box_sdk_gen.networking.network import NetworkSession
 
+from box_sdk_gen.networking.async_network_client import AsyncNetworkClient
+
+from box_sdk_gen.networking.single_request import RequestGenerator
+
+from box_sdk_gen.networking.single_request import send_request
+
+from box_sdk_gen.networking.single_request import send_request_async
+
 from box_sdk_gen.schemas.access_token import AccessToken
 
 from box_sdk_gen.schemas.post_o_auth_2_token import PostOAuth2Token
@@ -26,6 +34,10 @@ from box_sdk_gen.box.token_storage import TokenStorage
 
 from box_sdk_gen.box.token_storage import InMemoryTokenStorage
 
+from box_sdk_gen.box.token_refresh import DEFAULT_TOKEN_REFRESH_RATIO
+
+from box_sdk_gen.box.token_refresh import TokenRefresher
+
 from box_sdk_gen.serialization.json import sd_to_url_params
 
 from box_sdk_gen.internal.utils import prepare_params
@@ -37,13 +49,33 @@ from box_sdk_gen.serialization.json import SerializedData
 
 class OAuthConfig:
     def __init__(
-        self, client_id: str, client_secret: str, *, token_storage: TokenStorage = None
+        self,
+        client_id: str,
+        client_secret: str,
+        *,
+        token_storage: TokenStorage = None,
+        token_refresh_ratio: Optional[float] = DEFAULT_TOKEN_REFRESH_RATIO,
+        background_token_refresh: bool = False
     ):
+        """
+        :param client_id: Box API key used for identifying the application the user is authenticating with
+        :type client_id: str
+        :param client_secret: Box API secret used for making auth requests.
+        :type client_secret: str
+        :param token_storage: Object responsible for storing token. If no custom implementation provided, the token will be stored in memory., defaults to None
+        :type token_storage: TokenStorage, optional
+        :param token_refresh_ratio: Fraction of the access token lifetime after which the token is refreshed before it is used. If None, the token is only refreshed when rejected by the API, defaults to 0.9
+        :type token_refresh_ratio: Optional[float], optional
+        :param background_token_refresh: Refresh the access token in a background thread, while the current token is still in use, defaults to False
+        :type background_token_refresh: bool, optional
+        """
         if token_storage is None:
             token_storage = InMemoryTokenStorage()
         self.client_id = client_id
         self.client_secret = client_secret
         self.token_storage = token_storage
+        self.token_refresh_ratio = token_refresh_ratio
+        self.background_token_refresh = background_token_refresh
 
 
 class GetAuthorizeUrlOptions:
@@ -84,6 +116,11 @@ class BoxOAuth(Authentication):
         super().__init__(**kwargs)
         self.config = config
         self.token_storage = self.config.token_storage
+        self._token_refresher = TokenRefresher(
+            self.token_storage,
+            refresh_ratio=self.config.token_refresh_ratio,
+            background_refresh=self.config.background_token_refresh,
+        )
 
     def get_authorize_url(self, *, options: GetAuthorizeUrlOptions = None) -> str:
         """
@@ -139,14 +176,13 @@ class BoxOAuth(Authentication):
             client_id=self.config.client_id,
             client_secret=self.config.client_secret,
         )
-        self.token_storage.store(token)
-        return token
+        return self._token_refresher.store(token)
 
     def retrieve_token(
         self, *, network_session: Optional[NetworkSession] = None
     ) -> AccessToken:
         """
-        Get the current access token. If the current access token is expired or not found, this method will attempt to refresh the token.
+        Get the current access token. If the current access token is expired or due for refresh, this method will attempt to refresh the token.
         :param network_session: An object to keep network session state, defaults to None
         :type network_session: Optional[NetworkSession], optional
         """
@@ -155,16 +191,47 @@ class BoxOAuth(Authentication):
             raise BoxSDKError(
                 message='Access and refresh tokens not available. Authenticate before making any API call first.'
             )
-        return token
+        if token.refresh_token == None:
+            return token
+        return self._token_refresher.retrieve(
+            lambda: self._request_refreshed_token(network_session)
+        )
 
     def refresh_token(
         self, *, network_session: Optional[NetworkSession] = None
     ) -> AccessToken:
         """
-        Get a new access token for the platform app user.
+        Get a new access token for the platform app user. Concurrent calls share a single token request.
         :param network_session: An object to keep network session state, defaults to None
         :type network_session: Optional[NetworkSession], optional
         """
+        return self._token_refresher.refresh(
+            lambda: self._request_refreshed_token(network_session)
+        )
+
+    def refresh_rejected_token(
+        self,
+        rejected_access_token: Optional[str],
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Get a new access token after the API rejected `rejected_access_token`. Returns the stored token
+        without requesting a new one if it was already refreshed since.
+        :param rejected_access_token: Access token rejected by the API
+        :type rejected_access_token: Optional[str]
+        :param network_session: An object to keep network session state, defaults to None
+        :type network_session: Optional[NetworkSession], optional
+        """
+        return self._token_refresher.refresh(
+            lambda: self._request_refreshed_token(network_session),
+            rejected_token=rejected_access_token,
+        )
+
+    def _access_token_request(
+        self, network_session: Optional[NetworkSession]
+    ) -> RequestGenerator:
+        # Read under the refresh lock, refresh tokens can only be used once
         old_token: Optional[AccessToken] = self.token_storage.get()
         token_used_for_refresh: Optional[str] = (
             old_token.refresh_token if not old_token == None else None
@@ -174,14 +241,27 @@ class BoxOAuth(Authentication):
                 network_session if not network_session == None else NetworkSession()
             )
         )
-        token: AccessToken = auth_manager.request_access_token(
+        return auth_manager.request_access_token.request_generator(
+            auth_manager,
             PostOAuth2TokenGrantTypeField.REFRESH_TOKEN,
             client_id=self.config.client_id,
             client_secret=self.config.client_secret,
             refresh_token=token_used_for_refresh,
         )
-        self.token_storage.store(token)
-        return token
+
+    def _request_refreshed_token(
+        self, network_session: Optional[NetworkSession]
+    ) -> AccessToken:
+        return send_request(self._access_token_request(network_session))
+
+    async def _request_refreshed_token_async(
+        self,
+        async_network_client: AsyncNetworkClient,
+        network_session: Optional[NetworkSession],
+    ) -> AccessToken:
+        return await send_request_async(
+            self._access_token_request(network_session), async_network_client
+        )
 
     def retrieve_authorization_header(
         self, *, network_session: Optional[NetworkSession] = None
@@ -189,6 +269,92 @@ class BoxOAuth(Authentication):
         token: AccessToken = self.retrieve_token(network_session=network_session)
         return ''.join(['Bearer ', token.access_token])
 
+    def needs_token_request(self) -> bool:
+        """
+        Returns whether the stored token is missing or due for refresh, so that retrieving
+        the authorization header requests a new token.
+        """
+        return self._token_refresher.is_refresh_due()
+
+    async def retrieve_token_async(
+        self,
+        async_network_client: AsyncNetworkClient,
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Asynchronous counterpart of `retrieve_token`, requesting the token with `async_network_client`.
+        :param async_network_client: Network client sending the token request
+        :type async_network_client: AsyncNetworkClient
+        :param network_session: An object to keep network session state, defaults to None
+        :type network_session: Optional[NetworkSession], optional
+        """
+        token: Optional[AccessToken] = self.token_storage.get()
+        if token == None:
+            raise BoxSDKError(
+                message='Access and refresh tokens not available. Authenticate before making any API call first.'
+            )
+        if token.refresh_token == None:
+            return token
+        return await self._token_refresher.retrieve_async(
+            lambda: self._request_refreshed_token_async(
+                async_network_client, network_session
+            )
+        )
+
+    async def refresh_token_async(
+        self,
+        async_network_client: AsyncNetworkClient,
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Asynchronous counterpart of `refresh_token`, requesting the token with `async_network_client`.
+        :param async_network_client: Network client sending the token request
+        :type async_network_client: AsyncNetworkClient
+        :param network_session: An object to keep network session state, defaults to None
+        :type network_session: Optional[NetworkSession], optional
+        """
+        return await self._token_refresher.refresh_async(
+            lambda: self._request_refreshed_token_async(
+                async_network_client, network_session
+            )
+        )
+
+    async def refresh_rejected_token_async(
+        self,
+        rejected_access_token: Optional[str],
+        async_network_client: AsyncNetworkClient,
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Asynchronous counterpart of `refresh_rejected_token`, requesting the token with `async_network_client`.
+        :param rejected_access_token: Access token rejected by the API
+        :type rejected_access_token: Optional[str]
+        :param async_network_client: Network client sending the token request
+        :type async_network_client: AsyncNetworkClient
+        :param network_session: An object to keep network session state, defaults to None
+        :type network_session: Optional[NetworkSession], optional
+        """
+        return await self._token_refresher.refresh_async(
+            lambda: self._request_refreshed_token_async(
+                async_network_client, network_session
+            ),
+            rejected_token=rejected_access_token,
+        )
+
+    async def retrieve_authorization_header_async(
+        self,
+        async_network_client: AsyncNetworkClient,
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> str:
+        token: AccessToken = await self.retrieve_token_async(
+            async_network_client, network_session=network_session
+        )
+        return ''.join(['Bearer ', token.access_token])
+
     def revoke_token(self, *, network_session: Optional[NetworkSession] = None) -> None:
         """
         Revoke an active Access Token, effectively logging a user out that has been previously authenticated.
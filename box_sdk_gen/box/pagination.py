@@ -0,0 +1,297 @@
+import contextvars
+from abc import abstractmethod
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Generic,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+_Entry = TypeVar('_Entry')
+
+# Offsets above this limit are rejected by most offset-paginated endpoints, or unreliable
+MAX_OFFSET = 10000
+
+
+class Paginator(Generic[_Entry]):
+    """
+    Iterates over the entries of a paginated list endpoint, fetching the following pages
+    as the previous ones are consumed.
+
+    `fetch_page` is the manager method returning a single page, with every argument except
+    the pagination ones already bound, e.g. with `functools.partial`.
+
+    Example usage:
+        paginator = MarkerPaginator(
+            functools.partial(client.folders.get_folder_items, '0', usemarker=True),
+            page_size=1000,
+        )
+        for item in paginator:
+            print(item.name)
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[..., Any],
+        *,
+        page_size: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        prefetch: bool = False
+    ):
+        """
+        :param fetch_page: Function fetching a single page, called with the `limit`, `fields` and pagination keyword arguments
+        :type fetch_page: Callable[..., Any]
+        :param page_size: Maximum number of entries requested per page, defaults to the endpoint default
+        :type page_size: Optional[int], optional
+        :param fields: Attributes to include in the returned entries, defaults to the endpoint default
+        :type fields: Optional[List[str]], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        """
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.fields = fields
+        self.prefetch = prefetch
+
+    def __iter__(self) -> Generator[_Entry, None, None]:
+        for page in self.pages():
+            yield from page.entries or []
+
+    def pages(self) -> Generator[Any, None, None]:
+        """Yields the pages of the collection, as returned by `fetch_page`."""
+        page_arguments = self._first_page_arguments()
+        yield from self._following_pages(
+            self._fetch_page(page_arguments), page_arguments
+        )
+
+    def _following_pages(
+        self, page: Any, page_arguments: Dict[str, Any]
+    ) -> Generator[Any, None, None]:
+        """Yields `page` and then the pages following it, one after another."""
+        executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        )
+        try:
+            while True:
+                next_page_arguments = self._next_page_arguments(page, page_arguments)
+                next_page: Optional[Future] = None
+                if executor is not None and next_page_arguments is not None:
+                    next_page = self._submit_fetch_page(executor, next_page_arguments)
+                yield page
+                if next_page_arguments is None:
+                    return
+                page_arguments = next_page_arguments
+                page = (
+                    next_page.result()
+                    if next_page is not None
+                    else self._fetch_page(next_page_arguments)
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def _fetch_page(self, arguments: Dict[str, Any]) -> Any:
+        if self.page_size is not None:
+            arguments = {**arguments, 'limit': self.page_size}
+        if self.fields is not None:
+            arguments = {**arguments, 'fields': self.fields}
+        return self.fetch_page(**arguments)
+
+    def _submit_fetch_page(
+        self, executor: ThreadPoolExecutor, arguments: Dict[str, Any]
+    ) -> Future:
+        # Runs in the caller's context, e.g. with its `lazy_deserialization` setting
+        return executor.submit(
+            contextvars.copy_context().run, self._fetch_page, arguments
+        )
+
+    def _first_page_arguments(self) -> Dict[str, Any]:
+        return {}
+
+    @abstractmethod
+    def _next_page_arguments(
+        self, page: Any, page_arguments: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Returns the pagination arguments of the page following `page`, None if it is the last one.
+        :param page_arguments: Pagination arguments `page` was fetched with
+        """
+        pass
+
+
+class MarkerPaginator(Paginator[_Entry]):
+    """
+    Iterates over the entries of an endpoint paginated with `marker`, following `next_marker`
+    until it is empty.
+    """
+
+    def _next_page_arguments(
+        self, page: Any, page_arguments: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        next_marker: Optional[str] = getattr(page, 'next_marker', None)
+        if not next_marker:
+            return None
+        return {'marker': next_marker}
+
+
+class OffsetPaginator(Paginator[_Entry]):
+    """
+    Iterates over the entries of an endpoint paginated with `offset`, until `total_count`
+    entries were returned or a page is empty.
+
+    With `max_concurrency`, once the first page revealed `total_count`, the remaining pages
+    are fetched concurrently, with at most `max_concurrency` requests in flight.
+    They are yielded in order, or as soon as they are fetched when `ordered` is False.
+
+    With `max_offset`, collections whose `total_count` reaches past `max_offset` are iterated
+    with `fallback` instead, e.g. a `MarkerPaginator` over the same endpoint.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[..., Any],
+        *,
+        offset: int = 0,
+        page_size: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        prefetch: bool = False,
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+        max_offset: Optional[int] = None,
+        fallback: Optional[Paginator] = None
+    ):
+        """
+        :param fetch_page: Function fetching a single page, called with the `offset`, `limit` and `fields` keyword arguments
+        :type fetch_page: Callable[..., Any]
+        :param offset: Offset of the first returned entry, defaults to 0
+        :type offset: int, optional
+        :param page_size: Maximum number of entries requested per page, defaults to the endpoint default
+        :type page_size: Optional[int], optional
+        :param fields: Attributes to include in the returned entries, defaults to the endpoint default
+        :type fields: Optional[List[str]], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        :param max_concurrency: Maximum number of pages fetched concurrently after the first one, defaults to fetching them one by one
+        :type max_concurrency: Optional[int], optional
+        :param ordered: Yield the concurrently fetched pages in order, defaults to True
+        :type ordered: bool, optional
+        :param max_offset: Highest offset accepted by the endpoint, defaults to no limit
+        :type max_offset: Optional[int], optional
+        :param fallback: Paginator iterating over the collections too large for `max_offset`, from their start, defaults to None
+        :type fallback: Optional[Paginator], optional
+        """
+        super().__init__(
+            fetch_page, page_size=page_size, fields=fields, prefetch=prefetch
+        )
+        self.offset = offset
+        self.max_concurrency = max_concurrency
+        self.ordered = ordered
+        self.max_offset = max_offset
+        self.fallback = fallback
+
+    def pages(self) -> Generator[Any, None, None]:
+        page_arguments = self._first_page_arguments()
+        page = self._fetch_page(page_arguments)
+        total_count: Optional[int] = getattr(page, 'total_count', None)
+        if self._exceeds_max_offset(page, total_count):
+            yield from self.fallback.pages()
+            return
+        if (
+            self.max_concurrency is None or
+            self.max_concurrency <= 1 or
+            total_count is None or
+            not page.entries
+        ):
+            yield from self._following_pages(page, page_arguments)
+            return
+        yield page
+        page_size: int = self._page_step(page)
+        offsets = iter(range(self.offset + page_size, total_count, page_size))
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        if self.ordered:
+            pages = self._fetch_ordered_pages(executor, offsets)
+        else:
+            pages = self._fetch_unordered_pages(executor, offsets)
+        try:
+            yield from pages
+        finally:
+            pages.close()
+            executor.shutdown(wait=False)
+
+    def _fetch_ordered_pages(
+        self, executor: ThreadPoolExecutor, offsets
+    ) -> Generator[Any, None, None]:
+        in_flight: Deque[Future] = deque()
+        try:
+            for offset in offsets:
+                in_flight.append(self._submit_fetch_page(executor, {'offset': offset}))
+                if len(in_flight) >= self.max_concurrency:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+        finally:
+            for page in in_flight:
+                page.cancel()
+
+    def _fetch_unordered_pages(
+        self, executor: ThreadPoolExecutor, offsets
+    ) -> Generator[Any, None, None]:
+        in_flight: Set[Future] = set()
+        try:
+            for offset in offsets:
+                in_flight.add(self._submit_fetch_page(executor, {'offset': offset}))
+                if len(in_flight) >= self.max_concurrency:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for page in done:
+                        yield page.result()
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for page in done:
+                    yield page.result()
+        finally:
+            for page in in_flight:
+                page.cancel()
+
+    def _first_page_arguments(self) -> Dict[str, Any]:
+        return {'offset': self.offset}
+
+    def _exceeds_max_offset(self, page: Any, total_count: Optional[int]) -> bool:
+        """Returns whether the pages following `page` cannot all be fetched by offset."""
+        if self.max_offset is None or self.fallback is None or total_count is None:
+            return False
+        page_step: int = self._page_step(page)
+        last_page_offset: int = (
+            self.offset + max(total_count - 1 - self.offset, 0) // page_step * page_step
+        )
+        return last_page_offset > self.max_offset
+
+    def _page_step(self, page: Any) -> int:
+        """
+        Returns the number of entries between the offsets of two pages, i.e. the limit
+        reported by the API or the requested one. A page may contain less entries than that,
+        e.g. when some of them are hidden from the user.
+        """
+        return getattr(page, 'limit', None) or self.page_size or len(page.entries or [])
+
+    def _next_page_arguments(
+        self, page: Any, page_arguments: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        entries = page.entries or []
+        total_count: Optional[int] = getattr(page, 'total_count', None)
+        # Without `total_count`, an empty page is the only sign of the end of the collection
+        if total_count is None and not entries:
+            return None
+        next_offset: int = page_arguments['offset'] + self._page_step(page)
+        if next_offset == page_arguments['offset'] or (
+            total_count is not None and next_offset >= total_count
+        ):
+            return None
+        return {'offset': next_offset}
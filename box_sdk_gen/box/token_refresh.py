@@ -0,0 +1,258 @@
+import asyncio
+import threading
+import time
+import weakref
+from typing import Awaitable, Callable, Optional
+
+from ..schemas.access_token import AccessToken
+from .token_storage import TokenStorage
+
+DEFAULT_TOKEN_REFRESH_RATIO = 0.9
+
+
+def stamp_token_acquisition(token: AccessToken) -> AccessToken:
+    """
+    Records on the token the time when it was acquired. Private attributes are not serialized,
+    but are kept by token storages which pickle tokens.
+    """
+    token._acquired_at = time.time()
+    return token
+
+
+def get_token_lifetime_ratio(token: AccessToken) -> Optional[float]:
+    """
+    Returns the elapsed fraction of the token lifetime,
+    or None if the token was not stamped with its acquisition time or has no expiration.
+    """
+    acquired_at: Optional[float] = getattr(token, '_acquired_at', None)
+    if acquired_at is None or not token.expires_in:
+        return None
+    return (time.time() - acquired_at) / token.expires_in
+
+
+def _is_same_token(token: Optional[AccessToken], other: Optional[AccessToken]) -> bool:
+    if token is None or other is None:
+        return token is other
+    return token.access_token == other.access_token
+
+
+class TokenRefresher:
+    """
+    Refreshes the access token kept in a token storage.
+
+    Only one refresh is in flight at a time: callers which asked for a refresh while another one
+    was running get the token it acquired instead of requesting yet another one.
+    Tokens are refreshed before they are used once `refresh_ratio` of their lifetime has elapsed,
+    either by the caller or, with `background_refresh`, by a background thread while the caller
+    keeps using the current token. `refresh_async` and `retrieve_async` await tokens requested
+    by coroutines, e.g. with an asynchronous network client, without blocking their loop.
+    """
+
+    def __init__(
+        self,
+        token_storage: TokenStorage,
+        *,
+        refresh_ratio: Optional[float] = DEFAULT_TOKEN_REFRESH_RATIO,
+        background_refresh: bool = False
+    ):
+        """
+        :param token_storage: Storage of the refreshed token
+        :type token_storage: TokenStorage
+        :param refresh_ratio: Fraction of the token lifetime after which the token is refreshed before it is used.
+            If None, tokens are only refreshed when missing or rejected by the API, defaults to 0.9
+        :type refresh_ratio: Optional[float], optional
+        :param background_refresh: Refresh tokens in a background thread while the current token is still valid, defaults to False
+        :type background_refresh: bool, optional
+        """
+        self.token_storage = token_storage
+        self.refresh_ratio = refresh_ratio
+        self.background_refresh = background_refresh
+        self._lock = threading.Lock()
+        self._background_thread: Optional[threading.Thread] = None
+        self._background_task: Optional[asyncio.Task] = None
+        # Coroutines of each event loop wait for the refresh lock behind a lock of their loop
+        self._loop_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def store(self, token: AccessToken) -> AccessToken:
+        self.token_storage.store(stamp_token_acquisition(token))
+        return token
+
+    def refresh(
+        self,
+        request_token: Callable[[], AccessToken],
+        *,
+        rejected_token: Optional[str] = None
+    ) -> AccessToken:
+        """
+        Requests a new token with `request_token` and stores it, unless the stored token
+        was already replaced: by a refresh completed while waiting for the refresh lock or,
+        with `rejected_token`, by any refresh since the rejected token was used.
+        :param request_token: Function requesting a new token from the API
+        :param rejected_token: Access token rejected by the API, e.g. with a 401 response, defaults to None
+        """
+        token_before_lock: Optional[AccessToken] = self.token_storage.get()
+        with self._lock:
+            replaced_token: Optional[AccessToken] = self._get_replaced_token(
+                token_before_lock, rejected_token
+            )
+            if replaced_token is not None:
+                return replaced_token
+            return self.store(request_token())
+
+    async def refresh_async(
+        self,
+        request_token: Callable[[], Awaitable[AccessToken]],
+        *,
+        rejected_token: Optional[str] = None
+    ) -> AccessToken:
+        """
+        Asynchronous counterpart of `refresh`, awaiting the token requested with `request_token`.
+        Coroutines of a loop wait for the refresh lock on the loop, only one of them waits
+        in the default executor while a thread or another loop holds it.
+        :param request_token: Coroutine function requesting a new token from the API
+        :param rejected_token: Access token rejected by the API, e.g. with a 401 response, defaults to None
+        """
+        token_before_lock: Optional[AccessToken] = self.token_storage.get()
+        async with self._get_loop_lock():
+            await self._acquire_lock_async()
+            try:
+                replaced_token: Optional[AccessToken] = self._get_replaced_token(
+                    token_before_lock, rejected_token
+                )
+                if replaced_token is not None:
+                    return replaced_token
+                return self.store(await request_token())
+            finally:
+                self._lock.release()
+
+    def retrieve(
+        self, request_token: Optional[Callable[[], AccessToken]]
+    ) -> Optional[AccessToken]:
+        """
+        Returns the stored token, refreshing it first if it is missing or due for refresh.
+        :param request_token: Function requesting a new token from the API, None if the token cannot be refreshed
+        """
+        token: Optional[AccessToken] = self.token_storage.get()
+        if request_token is None:
+            return token
+        if self._must_refresh(token):
+            return self.refresh(request_token)
+        if self._may_refresh_in_background(token):
+            self._start_background_refresh(request_token)
+        return token
+
+    async def retrieve_async(
+        self, request_token: Callable[[], Awaitable[AccessToken]]
+    ) -> Optional[AccessToken]:
+        """
+        Asynchronous counterpart of `retrieve`. With `background_refresh`,
+        the token is refreshed in a task of the running loop instead of a thread.
+        :param request_token: Coroutine function requesting a new token from the API
+        """
+        token: Optional[AccessToken] = self.token_storage.get()
+        if self._must_refresh(token):
+            return await self.refresh_async(request_token)
+        if self._may_refresh_in_background(token):
+            self._start_background_refresh_async(request_token)
+        return token
+
+    def is_refresh_due(self) -> bool:
+        """
+        Returns whether `retrieve` would request a new token before returning,
+        because the stored token is missing or due for refresh.
+        """
+        return self._must_refresh(self.token_storage.get())
+
+    def _must_refresh(self, token: Optional[AccessToken]) -> bool:
+        if token is None:
+            return True
+        lifetime_ratio: Optional[float] = get_token_lifetime_ratio(token)
+        if lifetime_ratio is None or self.refresh_ratio is None:
+            return False
+        if lifetime_ratio >= 1:
+            return True
+        return lifetime_ratio >= self.refresh_ratio and not self.background_refresh
+
+    def _may_refresh_in_background(self, token: AccessToken) -> bool:
+        lifetime_ratio: Optional[float] = get_token_lifetime_ratio(token)
+        return (
+            self.background_refresh and
+            lifetime_ratio is not None and
+            self.refresh_ratio is not None and
+            lifetime_ratio >= self.refresh_ratio
+        )
+
+    def _get_replaced_token(
+        self,
+        token_before_lock: Optional[AccessToken],
+        rejected_token: Optional[str],
+    ) -> Optional[AccessToken]:
+        # Called with the refresh lock acquired
+        current_token: Optional[AccessToken] = self.token_storage.get()
+        if current_token is None:
+            return None
+        if rejected_token is not None:
+            if current_token.access_token != rejected_token:
+                return current_token
+        elif not _is_same_token(current_token, token_before_lock):
+            return current_token
+        return None
+
+    def _get_loop_lock(self) -> asyncio.Lock:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        loop_lock: Optional[asyncio.Lock] = self._loop_locks.get(loop, None)
+        if loop_lock is None:
+            loop_lock = self._loop_locks.setdefault(loop, asyncio.Lock())
+        return loop_lock
+
+    async def _acquire_lock_async(self) -> None:
+        if self._lock.acquire(blocking=False):
+            return
+        acquisition = asyncio.get_running_loop().run_in_executor(
+            None, self._lock.acquire
+        )
+        try:
+            await asyncio.shield(acquisition)
+        except asyncio.CancelledError:
+            # The lock is still acquired by the executor once the waiting coroutine is cancelled
+            acquisition.add_done_callback(lambda _: self._lock.release())
+            raise
+
+    def _start_background_refresh(self, request_token: Callable[[], AccessToken]):
+        with self._lock:
+            if (
+                self._background_thread is not None and
+                self._background_thread.is_alive()
+            ):
+                return
+            self._background_thread = threading.Thread(
+                target=self._refresh_in_background, args=(request_token,), daemon=True
+            )
+            self._background_thread.start()
+
+    def _refresh_in_background(self, request_token: Callable[[], AccessToken]):
+        try:
+            self.refresh(request_token)
+        except Exception:
+            # The current token is still valid, it will be refreshed
+            # by the caller once it expires.
+            pass
+
+    def _start_background_refresh_async(
+        self, request_token: Callable[[], Awaitable[AccessToken]]
+    ):
+        if self._background_task is not None and not self._background_task.done():
+            return
+        self._background_task = asyncio.get_running_loop().create_task(
+            self._refresh_in_background_async(request_token)
+        )
+
+    async def _refresh_in_background_async(
+        self, request_token: Callable[[], Awaitable[AccessToken]]
+    ):
+        try:
+            await self.refresh_async(request_token)
+        except Exception:
+            # The current token is still valid, it will be refreshed
+            # by the caller once it expires.
+            pass
@@ -0,0 +1,69 @@
+import shelve
+import threading
+from abc import abstractmethod
+from typing import Dict, Optional
+
+from ..schemas.upload_session import UploadSession
+from ..serialization.json import deserialize, serialize
+
+
+class UploadSessionStorage:
+    """
+    Saves the upload sessions of resumable chunked uploads, under a key chosen by the caller.
+    The parts already uploaded are listed from the server when an upload is resumed.
+    """
+
+    @abstractmethod
+    def store(self, key: str, upload_session: UploadSession) -> None:
+        pass
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[UploadSession]:
+        pass
+
+    @abstractmethod
+    def clear(self, key: str) -> None:
+        pass
+
+
+class InMemoryUploadSessionStorage(UploadSessionStorage):
+    def __init__(self):
+        self._upload_sessions: Dict[str, UploadSession] = {}
+        self._lock = threading.Lock()
+
+    def store(self, key: str, upload_session: UploadSession) -> None:
+        with self._lock:
+            self._upload_sessions[key] = upload_session
+
+    def get(self, key: str) -> Optional[UploadSession]:
+        with self._lock:
+            return self._upload_sessions.get(key, None)
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._upload_sessions.pop(key, None)
+
+
+class FileUploadSessionStorage(UploadSessionStorage):
+    """
+    Stores upload sessions in a `shelve` database.
+    """
+
+    def __init__(self, filename: str = 'upload_session_storage'):
+        self.filename = filename
+        self._lock = threading.Lock()
+
+    def store(self, key: str, upload_session: UploadSession) -> None:
+        with self._lock, shelve.open(self.filename) as file:
+            file[key] = serialize(upload_session)
+
+    def get(self, key: str) -> Optional[UploadSession]:
+        with self._lock, shelve.open(self.filename) as file:
+            upload_session = file.get(key, None)
+        if upload_session is None:
+            return None
+        return deserialize(upload_session, UploadSession)
+
+    def clear(self, key: str) -> None:
+        with self._lock, shelve.open(self.filename) as file:
+            file.pop(key, None)
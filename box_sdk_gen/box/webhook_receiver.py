@@ -0,0 +1,338 @@
+import base64
+import hashlib
+import hmac
+import logging
+import threading
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from ..internal.base_object import BaseObject
+from ..internal.utils import (
+    DateTime,
+    compare_signatures,
+    date_time_from_string,
+    date_time_to_epoch_seconds,
+    escape_unicode,
+    get_epoch_time_in_seconds,
+    needs_unicode_escaping,
+)
+from ..schemas.event_source_resource import EventSourceResource
+from ..schemas.user_mini import UserMini
+from ..schemas.webhook import WebhookTriggersField
+from ..schemas.webhook_mini import WebhookMini
+from ..serialization.json import deserialize, json_to_serialized_data
+
+logger = logging.getLogger(__name__)
+
+_SIGNATURE_HEADERS = ('box-signature-primary', 'box-signature-secondary')
+_HTTP_STATUSES = {
+    200: '200 OK',
+    400: '400 Bad Request',
+    403: '403 Forbidden',
+    405: '405 Method Not Allowed',
+    503: '503 Service Unavailable',
+}
+
+
+class WebhookNotification(BaseObject):
+    def __init__(
+        self,
+        *,
+        type: Optional[str] = None,
+        id: Optional[str] = None,
+        created_at: Optional[DateTime] = None,
+        trigger: Optional[WebhookTriggersField] = None,
+        webhook: Optional[WebhookMini] = None,
+        created_by: Optional[UserMini] = None,
+        source: Optional[EventSourceResource] = None,
+        additional_info: Optional[Dict] = None,
+        **kwargs
+    ):
+        """
+        :param type: The value will always be `webhook_event`., defaults to None
+        :type type: Optional[str], optional
+        :param id: The unique identifier of the notification., defaults to None
+        :type id: Optional[str], optional
+        :param created_at: When the notification was created., defaults to None
+        :type created_at: Optional[DateTime], optional
+        :param trigger: The event which triggered the webhook., defaults to None
+        :type trigger: Optional[WebhookTriggersField], optional
+        :param webhook: The webhook which sent the notification., defaults to None
+        :type webhook: Optional[WebhookMini], optional
+        :param created_by: The user who triggered the event., defaults to None
+        :type created_by: Optional[UserMini], optional
+        :param source: The item the event happened to., defaults to None
+        :type source: Optional[EventSourceResource], optional
+        :param additional_info: Additional information about the event., defaults to None
+        :type additional_info: Optional[Dict], optional
+        """
+        super().__init__(**kwargs)
+        self.type = type
+        self.id = id
+        self.created_at = created_at
+        self.trigger = trigger
+        self.webhook = webhook
+        self.created_by = created_by
+        self.source = source
+        self.additional_info = additional_info
+
+
+class WebhookSignatureValidator:
+    """
+    Validates the signatures of webhook notifications, like `WebhooksManager.validate_message`.
+
+    The HMAC state of each key is computed once and copied for every message, and the escaped body
+    is only computed when the body has characters to escape and no signature of the raw body matched.
+    """
+
+    def __init__(
+        self,
+        primary_key: Optional[str],
+        *,
+        secondary_key: Optional[str] = None,
+        max_age: Optional[int] = 600
+    ):
+        """
+        :param primary_key: The primary signature key of the application
+        :type primary_key: Optional[str]
+        :param secondary_key: The secondary signature key of the application, defaults to None
+        :type secondary_key: Optional[str], optional
+        :param max_age: The maximum age of the messages in seconds, defaults to 10 minutes
+        :type max_age: Optional[int], optional
+        """
+        self.max_age = max_age
+        self._keys: List[Tuple[str, Any]] = [
+            (header, hmac.new(key.encode('utf-8'), digestmod=hashlib.sha256))
+            for header, key in zip(_SIGNATURE_HEADERS, (primary_key, secondary_key))
+            if key is not None
+        ]
+
+    def validate(self, body: Union[str, bytes], headers: Dict[str, str]) -> bool:
+        """
+        Returns whether the message is signed with one of the keys and was delivered recently.
+        :param body: The request body of the webhook message
+        :type body: Union[str, bytes]
+        :param headers: The headers of the webhook message, with lower case names
+        :type headers: Dict[str, str]
+        """
+        if (
+            headers.get('box-signature-version') != '1' or
+            headers.get('box-signature-algorithm') != 'HmacSHA256'
+        ):
+            return False
+        delivery_timestamp: Optional[str] = headers.get('box-delivery-timestamp')
+        if delivery_timestamp is None:
+            return False
+        try:
+            delivery_epoch = date_time_to_epoch_seconds(
+                date_time_from_string(delivery_timestamp)
+            )
+        except ValueError:
+            return False
+        current_epoch: int = get_epoch_time_in_seconds()
+        if (
+            self.max_age is not None and current_epoch - self.max_age > delivery_epoch
+        ) or delivery_epoch > current_epoch:
+            return False
+        signatures = [
+            (key_hmac, headers.get(header))
+            for header, key_hmac in self._keys
+            if headers.get(header) is not None
+        ]
+        if not signatures:
+            return False
+        encoded_delivery_timestamp = delivery_timestamp.encode('utf-8')
+        try:
+            for encoded_body in self._encoded_bodies(body):
+                for key_hmac, received_signature in signatures:
+                    message_hmac = key_hmac.copy()
+                    message_hmac.update(encoded_body)
+                    message_hmac.update(encoded_delivery_timestamp)
+                    if compare_signatures(
+                        expected_signature=base64.b64encode(
+                            message_hmac.digest()
+                        ).decode(),
+                        received_signature=received_signature,
+                    ):
+                        return True
+        except UnicodeDecodeError:
+            # Box only sends UTF-8 bodies, so a body which is not cannot be authentic
+            return False
+        return False
+
+    def _encoded_bodies(self, body: Union[str, bytes]) -> Iterable[bytes]:
+        """Yields the raw body, then the escaped one if it differs."""
+        if isinstance(body, bytes):
+            yield body
+            body = body.decode('utf-8')
+        else:
+            yield body.encode('utf-8')
+        if needs_unicode_escaping(body):
+            yield escape_unicode(body).encode('utf-8')
+
+
+class WebhookReceiver:
+    """
+    WSGI application receiving webhook notifications, which can be served by any WSGI server,
+    e.g. `wsgiref.simple_server` locally.
+
+    The signature of each notification is validated, then the notification is deserialized
+    and queued, and the request is answered right away. A pool of `max_workers` threads
+    dispatches the queued notifications to the handlers of their trigger.
+    When `max_queued_notifications` notifications are waiting, new ones are answered with
+    `503 Service Unavailable`, so that Box delivers them again later.
+
+    Example usage:
+        receiver = WebhookReceiver(primary_key, secondary_key=secondary_key)
+        receiver.add_handler(print, triggers=[WebhookTriggersField.FILE_UPLOADED])
+        receiver.start()
+        wsgiref.simple_server.make_server('', 8000, receiver).serve_forever()
+    """
+
+    def __init__(
+        self,
+        primary_key: Optional[str],
+        *,
+        secondary_key: Optional[str] = None,
+        max_age: Optional[int] = 600,
+        max_workers: int = 4,
+        max_queued_notifications: int = 1000,
+        on_error: Optional[Callable[[WebhookNotification, Exception], None]] = None
+    ):
+        """
+        :param primary_key: The primary signature key of the application
+        :type primary_key: Optional[str]
+        :param secondary_key: The secondary signature key of the application, defaults to None
+        :type secondary_key: Optional[str], optional
+        :param max_age: The maximum age of the notifications in seconds, defaults to 10 minutes
+        :type max_age: Optional[int], optional
+        :param max_workers: Number of threads dispatching the notifications to the handlers, defaults to 4
+        :type max_workers: int, optional
+        :param max_queued_notifications: Maximum number of notifications waiting to be dispatched, defaults to 1000
+        :type max_queued_notifications: int, optional
+        :param on_error: Function called with the notification and the error when a handler fails, defaults to logging the error
+        :type on_error: Optional[Callable[[WebhookNotification, Exception], None]], optional
+        """
+        self.validator = WebhookSignatureValidator(
+            primary_key, secondary_key=secondary_key, max_age=max_age
+        )
+        self.max_workers = max_workers
+        self.on_error = on_error
+        self._handlers: List[
+            Tuple[Optional[Set[str]], Callable[[WebhookNotification], Any]]
+        ] = []
+        self._queue: Queue = Queue(maxsize=max_queued_notifications)
+        self._stop_event = threading.Event()
+        self._workers: List[threading.Thread] = []
+
+    def add_handler(
+        self,
+        handler: Callable[[WebhookNotification], Any],
+        *,
+        triggers: Optional[List[WebhookTriggersField]] = None
+    ) -> None:
+        """
+        Dispatches the notifications of the given triggers to `handler`.
+        :param handler: Function called with each notification, from a worker thread
+        :type handler: Callable[[WebhookNotification], Any]
+        :param triggers: Triggers of the handled notifications, defaults to all of them
+        :type triggers: Optional[List[WebhookTriggersField]], optional
+        """
+        self._handlers.append(
+            (
+                (
+                    {getattr(trigger, 'value', trigger) for trigger in triggers}
+                    if triggers is not None
+                    else None
+                ),
+                handler,
+            )
+        )
+
+    def start(self) -> None:
+        """Starts the worker threads dispatching the notifications."""
+        self._stop_event.clear()
+        self._workers = [
+            threading.Thread(target=self._dispatch_notifications, daemon=True)
+            for _ in range(self.max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def stop(self, *, wait: bool = True) -> None:
+        """
+        Stops the worker threads once the queued notifications were dispatched.
+        :param wait: Wait for the queued notifications to be dispatched, if the workers were started, defaults to True
+        :type wait: bool, optional
+        """
+        if wait and any(worker.is_alive() for worker in self._workers):
+            self._queue.join()
+        self._stop_event.set()
+        for worker in self._workers:
+            worker.join()
+
+    def receive(self, body: bytes, headers: Dict[str, str]) -> int:
+        """
+        Validates and queues a notification, returning the HTTP status code to answer with.
+        Usable from web frameworks which are not WSGI based.
+        :param body: The request body of the notification
+        :type body: bytes
+        :param headers: The headers of the notification, with lower case names
+        :type headers: Dict[str, str]
+        """
+        if not self.validator.validate(body, headers):
+            return 403
+        try:
+            notification = deserialize(
+                json_to_serialized_data(body), WebhookNotification
+            )
+        except Exception:
+            return 400
+        try:
+            self._queue.put_nowait(notification)
+        except Full:
+            return 503
+        return 200
+
+    def __call__(
+        self, environ: Dict[str, Any], start_response: Callable
+    ) -> List[bytes]:
+        if environ.get('REQUEST_METHOD') != 'POST':
+            status = 405
+        else:
+            content_length = int(environ.get('CONTENT_LENGTH') or 0)
+            body: bytes = environ['wsgi.input'].read(content_length)
+            headers = {
+                name[5:].replace('_', '-').lower(): value
+                for name, value in environ.items()
+                if name.startswith('HTTP_BOX_')
+            }
+            status = self.receive(body, headers)
+        start_response(
+            _HTTP_STATUSES[status],
+            [('Content-Type', 'text/plain'), ('Content-Length', '0')],
+        )
+        return []
+
+    def _dispatch_notifications(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                notification: WebhookNotification = self._queue.get(timeout=1)
+            except Empty:
+                continue
+            try:
+                trigger = getattr(notification.trigger, 'value', notification.trigger)
+                for triggers, handler in self._handlers:
+                    if triggers is None or trigger in triggers:
+                        try:
+                            handler(notification)
+                        except Exception as error:
+                            if self.on_error is not None:
+                                self.on_error(notification, error)
+                            else:
+                                logger.exception(
+                                    'Webhook notification %s handler failed',
+                                    notification.id,
+                                )
+            finally:
+                self._queue.task_done()
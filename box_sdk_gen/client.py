@@ -1,477 +1,427 @@
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
-from box_sdk_gen.managers.authorization import AuthorizationManager
+from box_sdk_gen.networking.auth import Authentication
 
-from box_sdk_gen.managers.files import FilesManager
+from box_sdk_gen.networking.network import NetworkSession
 
-from box_sdk_gen.managers.trashed_files import TrashedFilesManager
+from box_sdk_gen.box.errors import BoxSDKError
 
-from box_sdk_gen.managers.app_item_associations import AppItemAssociationsManager
+from box_sdk_gen.networking.fetch_options import FetchOptions
 
-from box_sdk_gen.managers.downloads import DownloadsManager
+from box_sdk_gen.networking.fetch_response import FetchResponse
 
-from box_sdk_gen.managers.uploads import UploadsManager
+from box_sdk_gen.networking.base_urls import BaseUrls
 
-from box_sdk_gen.managers.chunked_uploads import ChunkedUploadsManager
+from box_sdk_gen.networking.timeout_config import TimeoutConfig
 
-from box_sdk_gen.managers.list_collaborations import ListCollaborationsManager
+from box_sdk_gen.networking.proxy_config import ProxyConfig
 
-from box_sdk_gen.managers.comments import CommentsManager
+from box_sdk_gen.internal.lazy_imports import LazyManager
 
-from box_sdk_gen.managers.tasks import TasksManager
+if TYPE_CHECKING:
+    from box_sdk_gen.managers.authorization import AuthorizationManager
 
-from box_sdk_gen.managers.file_versions import FileVersionsManager
+    from box_sdk_gen.managers.files import FilesManager
 
-from box_sdk_gen.managers.file_metadata import FileMetadataManager
+    from box_sdk_gen.managers.trashed_files import TrashedFilesManager
 
-from box_sdk_gen.managers.file_classifications import FileClassificationsManager
+    from box_sdk_gen.managers.app_item_associations import AppItemAssociationsManager
 
-from box_sdk_gen.managers.skills import SkillsManager
+    from box_sdk_gen.managers.downloads import DownloadsManager
 
-from box_sdk_gen.managers.file_watermarks import FileWatermarksManager
+    from box_sdk_gen.managers.uploads import UploadsManager
 
-from box_sdk_gen.managers.file_requests import FileRequestsManager
+    from box_sdk_gen.managers.chunked_uploads import ChunkedUploadsManager
 
-from box_sdk_gen.managers.folders import FoldersManager
+    from box_sdk_gen.managers.list_collaborations import ListCollaborationsManager
 
-from box_sdk_gen.managers.trashed_folders import TrashedFoldersManager
+    from box_sdk_gen.managers.comments import CommentsManager
 
-from box_sdk_gen.managers.folder_metadata import FolderMetadataManager
+    from box_sdk_gen.managers.tasks import TasksManager
 
-from box_sdk_gen.managers.folder_classifications import FolderClassificationsManager
+    from box_sdk_gen.managers.file_versions import FileVersionsManager
 
-from box_sdk_gen.managers.trashed_items import TrashedItemsManager
+    from box_sdk_gen.managers.file_metadata import FileMetadataManager
 
-from box_sdk_gen.managers.folder_watermarks import FolderWatermarksManager
+    from box_sdk_gen.managers.file_classifications import FileClassificationsManager
 
-from box_sdk_gen.managers.folder_locks import FolderLocksManager
+    from box_sdk_gen.managers.skills import SkillsManager
 
-from box_sdk_gen.managers.metadata_templates import MetadataTemplatesManager
+    from box_sdk_gen.managers.file_watermarks import FileWatermarksManager
 
-from box_sdk_gen.managers.classifications import ClassificationsManager
+    from box_sdk_gen.managers.file_requests import FileRequestsManager
 
-from box_sdk_gen.managers.metadata_cascade_policies import (
-    MetadataCascadePoliciesManager,
-)
+    from box_sdk_gen.managers.folders import FoldersManager
 
-from box_sdk_gen.managers.search import SearchManager
+    from box_sdk_gen.managers.trashed_folders import TrashedFoldersManager
 
-from box_sdk_gen.managers.user_collaborations import UserCollaborationsManager
+    from box_sdk_gen.managers.folder_metadata import FolderMetadataManager
 
-from box_sdk_gen.managers.task_assignments import TaskAssignmentsManager
+    from box_sdk_gen.managers.folder_classifications import FolderClassificationsManager
 
-from box_sdk_gen.managers.shared_links_files import SharedLinksFilesManager
+    from box_sdk_gen.managers.trashed_items import TrashedItemsManager
 
-from box_sdk_gen.managers.shared_links_folders import SharedLinksFoldersManager
+    from box_sdk_gen.managers.folder_watermarks import FolderWatermarksManager
 
-from box_sdk_gen.managers.web_links import WebLinksManager
+    from box_sdk_gen.managers.folder_locks import FolderLocksManager
 
-from box_sdk_gen.managers.trashed_web_links import TrashedWebLinksManager
+    from box_sdk_gen.managers.metadata_templates import MetadataTemplatesManager
 
-from box_sdk_gen.managers.shared_links_web_links import SharedLinksWebLinksManager
+    from box_sdk_gen.managers.classifications import ClassificationsManager
 
-from box_sdk_gen.managers.shared_links_app_items import SharedLinksAppItemsManager
+    from box_sdk_gen.managers.metadata_cascade_policies import (
+        MetadataCascadePoliciesManager,
+    )
 
-from box_sdk_gen.managers.users import UsersManager
+    from box_sdk_gen.managers.search import SearchManager
 
-from box_sdk_gen.managers.session_termination import SessionTerminationManager
+    from box_sdk_gen.managers.user_collaborations import UserCollaborationsManager
 
-from box_sdk_gen.managers.avatars import AvatarsManager
+    from box_sdk_gen.managers.task_assignments import TaskAssignmentsManager
 
-from box_sdk_gen.managers.transfer import TransferManager
+    from box_sdk_gen.managers.shared_links_files import SharedLinksFilesManager
 
-from box_sdk_gen.managers.email_aliases import EmailAliasesManager
+    from box_sdk_gen.managers.shared_links_folders import SharedLinksFoldersManager
 
-from box_sdk_gen.managers.memberships import MembershipsManager
+    from box_sdk_gen.managers.web_links import WebLinksManager
 
-from box_sdk_gen.managers.invites import InvitesManager
+    from box_sdk_gen.managers.trashed_web_links import TrashedWebLinksManager
 
-from box_sdk_gen.managers.groups import GroupsManager
+    from box_sdk_gen.managers.shared_links_web_links import SharedLinksWebLinksManager
 
-from box_sdk_gen.managers.webhooks import WebhooksManager
+    from box_sdk_gen.managers.shared_links_app_items import SharedLinksAppItemsManager
 
-from box_sdk_gen.managers.events import EventsManager
+    from box_sdk_gen.managers.users import UsersManager
 
-from box_sdk_gen.managers.collections import CollectionsManager
+    from box_sdk_gen.managers.session_termination import SessionTerminationManager
 
-from box_sdk_gen.managers.recent_items import RecentItemsManager
+    from box_sdk_gen.managers.avatars import AvatarsManager
 
-from box_sdk_gen.managers.retention_policies import RetentionPoliciesManager
+    from box_sdk_gen.managers.transfer import TransferManager
 
-from box_sdk_gen.managers.retention_policy_assignments import (
-    RetentionPolicyAssignmentsManager,
-)
+    from box_sdk_gen.managers.email_aliases import EmailAliasesManager
 
-from box_sdk_gen.managers.legal_hold_policies import LegalHoldPoliciesManager
+    from box_sdk_gen.managers.memberships import MembershipsManager
 
-from box_sdk_gen.managers.legal_hold_policy_assignments import (
-    LegalHoldPolicyAssignmentsManager,
-)
+    from box_sdk_gen.managers.invites import InvitesManager
 
-from box_sdk_gen.managers.file_version_retentions import FileVersionRetentionsManager
+    from box_sdk_gen.managers.groups import GroupsManager
 
-from box_sdk_gen.managers.file_version_legal_holds import FileVersionLegalHoldsManager
+    from box_sdk_gen.managers.webhooks import WebhooksManager
 
-from box_sdk_gen.managers.shield_information_barriers import (
-    ShieldInformationBarriersManager,
-)
+    from box_sdk_gen.managers.events import EventsManager
 
-from box_sdk_gen.managers.shield_information_barrier_reports import (
-    ShieldInformationBarrierReportsManager,
-)
+    from box_sdk_gen.managers.collections import CollectionsManager
 
-from box_sdk_gen.managers.shield_information_barrier_segments import (
-    ShieldInformationBarrierSegmentsManager,
-)
+    from box_sdk_gen.managers.recent_items import RecentItemsManager
 
-from box_sdk_gen.managers.shield_information_barrier_segment_members import (
-    ShieldInformationBarrierSegmentMembersManager,
-)
+    from box_sdk_gen.managers.retention_policies import RetentionPoliciesManager
 
-from box_sdk_gen.managers.shield_information_barrier_segment_restrictions import (
-    ShieldInformationBarrierSegmentRestrictionsManager,
-)
+    from box_sdk_gen.managers.retention_policy_assignments import (
+        RetentionPolicyAssignmentsManager,
+    )
 
-from box_sdk_gen.managers.device_pinners import DevicePinnersManager
+    from box_sdk_gen.managers.legal_hold_policies import LegalHoldPoliciesManager
 
-from box_sdk_gen.managers.terms_of_services import TermsOfServicesManager
+    from box_sdk_gen.managers.legal_hold_policy_assignments import (
+        LegalHoldPolicyAssignmentsManager,
+    )
 
-from box_sdk_gen.managers.terms_of_service_user_statuses import (
-    TermsOfServiceUserStatusesManager,
-)
+    from box_sdk_gen.managers.file_version_retentions import (
+        FileVersionRetentionsManager,
+    )
 
-from box_sdk_gen.managers.collaboration_allowlist_entries import (
-    CollaborationAllowlistEntriesManager,
-)
+    from box_sdk_gen.managers.file_version_legal_holds import (
+        FileVersionLegalHoldsManager,
+    )
 
-from box_sdk_gen.managers.collaboration_allowlist_exempt_targets import (
-    CollaborationAllowlistExemptTargetsManager,
-)
+    from box_sdk_gen.managers.shield_information_barriers import (
+        ShieldInformationBarriersManager,
+    )
 
-from box_sdk_gen.managers.storage_policies import StoragePoliciesManager
+    from box_sdk_gen.managers.shield_information_barrier_reports import (
+        ShieldInformationBarrierReportsManager,
+    )
 
-from box_sdk_gen.managers.storage_policy_assignments import (
-    StoragePolicyAssignmentsManager,
-)
+    from box_sdk_gen.managers.shield_information_barrier_segments import (
+        ShieldInformationBarrierSegmentsManager,
+    )
 
-from box_sdk_gen.managers.zip_downloads import ZipDownloadsManager
+    from box_sdk_gen.managers.shield_information_barrier_segment_members import (
+        ShieldInformationBarrierSegmentMembersManager,
+    )
 
-from box_sdk_gen.managers.sign_requests import SignRequestsManager
+    from box_sdk_gen.managers.shield_information_barrier_segment_restrictions import (
+        ShieldInformationBarrierSegmentRestrictionsManager,
+    )
 
-from box_sdk_gen.managers.workflows import WorkflowsManager
+    from box_sdk_gen.managers.device_pinners import DevicePinnersManager
 
-from box_sdk_gen.managers.sign_templates import SignTemplatesManager
+    from box_sdk_gen.managers.terms_of_services import TermsOfServicesManager
 
-from box_sdk_gen.managers.integration_mappings import IntegrationMappingsManager
+    from box_sdk_gen.managers.terms_of_service_user_statuses import (
+        TermsOfServiceUserStatusesManager,
+    )
 
-from box_sdk_gen.managers.ai import AiManager
+    from box_sdk_gen.managers.collaboration_allowlist_entries import (
+        CollaborationAllowlistEntriesManager,
+    )
 
-from box_sdk_gen.managers.ai_studio import AiStudioManager
+    from box_sdk_gen.managers.collaboration_allowlist_exempt_targets import (
+        CollaborationAllowlistExemptTargetsManager,
+    )
 
-from box_sdk_gen.managers.metadata_taxonomies import MetadataTaxonomiesManager
+    from box_sdk_gen.managers.storage_policies import StoragePoliciesManager
 
-from box_sdk_gen.managers.docgen_template import DocgenTemplateManager
+    from box_sdk_gen.managers.storage_policy_assignments import (
+        StoragePolicyAssignmentsManager,
+    )
 
-from box_sdk_gen.managers.docgen import DocgenManager
+    from box_sdk_gen.managers.zip_downloads import ZipDownloadsManager
 
-from box_sdk_gen.managers.enterprise_configurations import (
-    EnterpriseConfigurationsManager,
-)
+    from box_sdk_gen.managers.sign_requests import SignRequestsManager
 
-from box_sdk_gen.managers.hubs import HubsManager
+    from box_sdk_gen.managers.workflows import WorkflowsManager
 
-from box_sdk_gen.managers.hub_collaborations import HubCollaborationsManager
+    from box_sdk_gen.managers.sign_templates import SignTemplatesManager
 
-from box_sdk_gen.managers.hub_items import HubItemsManager
+    from box_sdk_gen.managers.integration_mappings import IntegrationMappingsManager
 
-from box_sdk_gen.managers.hub_document import HubDocumentManager
+    from box_sdk_gen.managers.ai import AiManager
 
-from box_sdk_gen.managers.shield_lists import ShieldListsManager
+    from box_sdk_gen.managers.ai_studio import AiStudioManager
 
-from box_sdk_gen.managers.archives import ArchivesManager
+    from box_sdk_gen.managers.metadata_taxonomies import MetadataTaxonomiesManager
 
-from box_sdk_gen.managers.external_users import ExternalUsersManager
+    from box_sdk_gen.managers.docgen_template import DocgenTemplateManager
 
-from box_sdk_gen.managers.automate_workflows import AutomateWorkflowsManager
+    from box_sdk_gen.managers.docgen import DocgenManager
 
-from box_sdk_gen.managers.notes import NotesManager
+    from box_sdk_gen.managers.enterprise_configurations import (
+        EnterpriseConfigurationsManager,
+    )
 
-from box_sdk_gen.networking.auth import Authentication
+    from box_sdk_gen.managers.hubs import HubsManager
 
-from box_sdk_gen.networking.network import NetworkSession
+    from box_sdk_gen.managers.hub_collaborations import HubCollaborationsManager
 
-from box_sdk_gen.box.errors import BoxSDKError
+    from box_sdk_gen.managers.hub_items import HubItemsManager
 
-from box_sdk_gen.networking.fetch_options import FetchOptions
+    from box_sdk_gen.managers.hub_document import HubDocumentManager
 
-from box_sdk_gen.networking.fetch_response import FetchResponse
+    from box_sdk_gen.managers.shield_lists import ShieldListsManager
 
-from box_sdk_gen.networking.base_urls import BaseUrls
+    from box_sdk_gen.managers.archives import ArchivesManager
 
-from box_sdk_gen.networking.timeout_config import TimeoutConfig
+    from box_sdk_gen.managers.external_users import ExternalUsersManager
 
-from box_sdk_gen.networking.proxy_config import ProxyConfig
+    from box_sdk_gen.managers.automate_workflows import AutomateWorkflowsManager
+
+    from box_sdk_gen.managers.notes import NotesManager
 
 
 class BoxClient:
+    authorization: LazyManager['AuthorizationManager'] = LazyManager(
+        'AuthorizationManager'
+    )
+    files: LazyManager['FilesManager'] = LazyManager('FilesManager')
+    trashed_files: LazyManager['TrashedFilesManager'] = LazyManager(
+        'TrashedFilesManager'
+    )
+    app_item_associations: LazyManager['AppItemAssociationsManager'] = LazyManager(
+        'AppItemAssociationsManager'
+    )
+    downloads: LazyManager['DownloadsManager'] = LazyManager('DownloadsManager')
+    uploads: LazyManager['UploadsManager'] = LazyManager('UploadsManager')
+    chunked_uploads: LazyManager['ChunkedUploadsManager'] = LazyManager(
+        'ChunkedUploadsManager'
+    )
+    list_collaborations: LazyManager['ListCollaborationsManager'] = LazyManager(
+        'ListCollaborationsManager'
+    )
+    comments: LazyManager['CommentsManager'] = LazyManager('CommentsManager')
+    tasks: LazyManager['TasksManager'] = LazyManager('TasksManager')
+    file_versions: LazyManager['FileVersionsManager'] = LazyManager(
+        'FileVersionsManager'
+    )
+    file_metadata: LazyManager['FileMetadataManager'] = LazyManager(
+        'FileMetadataManager'
+    )
+    file_classifications: LazyManager['FileClassificationsManager'] = LazyManager(
+        'FileClassificationsManager'
+    )
+    skills: LazyManager['SkillsManager'] = LazyManager('SkillsManager')
+    file_watermarks: LazyManager['FileWatermarksManager'] = LazyManager(
+        'FileWatermarksManager'
+    )
+    file_requests: LazyManager['FileRequestsManager'] = LazyManager(
+        'FileRequestsManager'
+    )
+    folders: LazyManager['FoldersManager'] = LazyManager('FoldersManager')
+    trashed_folders: LazyManager['TrashedFoldersManager'] = LazyManager(
+        'TrashedFoldersManager'
+    )
+    folder_metadata: LazyManager['FolderMetadataManager'] = LazyManager(
+        'FolderMetadataManager'
+    )
+    folder_classifications: LazyManager['FolderClassificationsManager'] = LazyManager(
+        'FolderClassificationsManager'
+    )
+    trashed_items: LazyManager['TrashedItemsManager'] = LazyManager(
+        'TrashedItemsManager'
+    )
+    folder_watermarks: LazyManager['FolderWatermarksManager'] = LazyManager(
+        'FolderWatermarksManager'
+    )
+    folder_locks: LazyManager['FolderLocksManager'] = LazyManager('FolderLocksManager')
+    metadata_templates: LazyManager['MetadataTemplatesManager'] = LazyManager(
+        'MetadataTemplatesManager'
+    )
+    classifications: LazyManager['ClassificationsManager'] = LazyManager(
+        'ClassificationsManager'
+    )
+    metadata_cascade_policies: LazyManager['MetadataCascadePoliciesManager'] = (
+        LazyManager('MetadataCascadePoliciesManager')
+    )
+    search: LazyManager['SearchManager'] = LazyManager('SearchManager')
+    user_collaborations: LazyManager['UserCollaborationsManager'] = LazyManager(
+        'UserCollaborationsManager'
+    )
+    task_assignments: LazyManager['TaskAssignmentsManager'] = LazyManager(
+        'TaskAssignmentsManager'
+    )
+    shared_links_files: LazyManager['SharedLinksFilesManager'] = LazyManager(
+        'SharedLinksFilesManager'
+    )
+    shared_links_folders: LazyManager['SharedLinksFoldersManager'] = LazyManager(
+        'SharedLinksFoldersManager'
+    )
+    web_links: LazyManager['WebLinksManager'] = LazyManager('WebLinksManager')
+    trashed_web_links: LazyManager['TrashedWebLinksManager'] = LazyManager(
+        'TrashedWebLinksManager'
+    )
+    shared_links_web_links: LazyManager['SharedLinksWebLinksManager'] = LazyManager(
+        'SharedLinksWebLinksManager'
+    )
+    shared_links_app_items: LazyManager['SharedLinksAppItemsManager'] = LazyManager(
+        'SharedLinksAppItemsManager'
+    )
+    users: LazyManager['UsersManager'] = LazyManager('UsersManager')
+    session_termination: LazyManager['SessionTerminationManager'] = LazyManager(
+        'SessionTerminationManager'
+    )
+    avatars: LazyManager['AvatarsManager'] = LazyManager('AvatarsManager')
+    transfer: LazyManager['TransferManager'] = LazyManager('TransferManager')
+    email_aliases: LazyManager['EmailAliasesManager'] = LazyManager(
+        'EmailAliasesManager'
+    )
+    memberships: LazyManager['MembershipsManager'] = LazyManager('MembershipsManager')
+    invites: LazyManager['InvitesManager'] = LazyManager('InvitesManager')
+    groups: LazyManager['GroupsManager'] = LazyManager('GroupsManager')
+    webhooks: LazyManager['WebhooksManager'] = LazyManager('WebhooksManager')
+    events: LazyManager['EventsManager'] = LazyManager('EventsManager')
+    collections: LazyManager['CollectionsManager'] = LazyManager('CollectionsManager')
+    recent_items: LazyManager['RecentItemsManager'] = LazyManager('RecentItemsManager')
+    retention_policies: LazyManager['RetentionPoliciesManager'] = LazyManager(
+        'RetentionPoliciesManager'
+    )
+    retention_policy_assignments: LazyManager['RetentionPolicyAssignmentsManager'] = (
+        LazyManager('RetentionPolicyAssignmentsManager')
+    )
+    legal_hold_policies: LazyManager['LegalHoldPoliciesManager'] = LazyManager(
+        'LegalHoldPoliciesManager'
+    )
+    legal_hold_policy_assignments: LazyManager['LegalHoldPolicyAssignmentsManager'] = (
+        LazyManager('LegalHoldPolicyAssignmentsManager')
+    )
+    file_version_retentions: LazyManager['FileVersionRetentionsManager'] = LazyManager(
+        'FileVersionRetentionsManager'
+    )
+    file_version_legal_holds: LazyManager['FileVersionLegalHoldsManager'] = LazyManager(
+        'FileVersionLegalHoldsManager'
+    )
+    shield_information_barriers: LazyManager['ShieldInformationBarriersManager'] = (
+        LazyManager('ShieldInformationBarriersManager')
+    )
+    shield_information_barrier_reports: LazyManager[
+        'ShieldInformationBarrierReportsManager'
+    ] = LazyManager('ShieldInformationBarrierReportsManager')
+    shield_information_barrier_segments: LazyManager[
+        'ShieldInformationBarrierSegmentsManager'
+    ] = LazyManager('ShieldInformationBarrierSegmentsManager')
+    shield_information_barrier_segment_members: LazyManager[
+        'ShieldInformationBarrierSegmentMembersManager'
+    ] = LazyManager('ShieldInformationBarrierSegmentMembersManager')
+    shield_information_barrier_segment_restrictions: LazyManager[
+        'ShieldInformationBarrierSegmentRestrictionsManager'
+    ] = LazyManager('ShieldInformationBarrierSegmentRestrictionsManager')
+    device_pinners: LazyManager['DevicePinnersManager'] = LazyManager(
+        'DevicePinnersManager'
+    )
+    terms_of_services: LazyManager['TermsOfServicesManager'] = LazyManager(
+        'TermsOfServicesManager'
+    )
+    terms_of_service_user_statuses: LazyManager['TermsOfServiceUserStatusesManager'] = (
+        LazyManager('TermsOfServiceUserStatusesManager')
+    )
+    collaboration_allowlist_entries: LazyManager[
+        'CollaborationAllowlistEntriesManager'
+    ] = LazyManager('CollaborationAllowlistEntriesManager')
+    collaboration_allowlist_exempt_targets: LazyManager[
+        'CollaborationAllowlistExemptTargetsManager'
+    ] = LazyManager('CollaborationAllowlistExemptTargetsManager')
+    storage_policies: LazyManager['StoragePoliciesManager'] = LazyManager(
+        'StoragePoliciesManager'
+    )
+    storage_policy_assignments: LazyManager['StoragePolicyAssignmentsManager'] = (
+        LazyManager('StoragePolicyAssignmentsManager')
+    )
+    zip_downloads: LazyManager['ZipDownloadsManager'] = LazyManager(
+        'ZipDownloadsManager'
+    )
+    sign_requests: LazyManager['SignRequestsManager'] = LazyManager(
+        'SignRequestsManager'
+    )
+    workflows: LazyManager['WorkflowsManager'] = LazyManager('WorkflowsManager')
+    sign_templates: LazyManager['SignTemplatesManager'] = LazyManager(
+        'SignTemplatesManager'
+    )
+    integration_mappings: LazyManager['IntegrationMappingsManager'] = LazyManager(
+        'IntegrationMappingsManager'
+    )
+    ai: LazyManager['AiManager'] = LazyManager('AiManager')
+    ai_studio: LazyManager['AiStudioManager'] = LazyManager('AiStudioManager')
+    metadata_taxonomies: LazyManager['MetadataTaxonomiesManager'] = LazyManager(
+        'MetadataTaxonomiesManager'
+    )
+    docgen_template: LazyManager['DocgenTemplateManager'] = LazyManager(
+        'DocgenTemplateManager'
+    )
+    docgen: LazyManager['DocgenManager'] = LazyManager('DocgenManager')
+    enterprise_configurations: LazyManager['EnterpriseConfigurationsManager'] = (
+        LazyManager('EnterpriseConfigurationsManager')
+    )
+    hubs: LazyManager['HubsManager'] = LazyManager('HubsManager')
+    hub_collaborations: LazyManager['HubCollaborationsManager'] = LazyManager(
+        'HubCollaborationsManager'
+    )
+    hub_items: LazyManager['HubItemsManager'] = LazyManager('HubItemsManager')
+    hub_document: LazyManager['HubDocumentManager'] = LazyManager('HubDocumentManager')
+    shield_lists: LazyManager['ShieldListsManager'] = LazyManager('ShieldListsManager')
+    archives: LazyManager['ArchivesManager'] = LazyManager('ArchivesManager')
+    external_users: LazyManager['ExternalUsersManager'] = LazyManager(
+        'ExternalUsersManager'
+    )
+    automate_workflows: LazyManager['AutomateWorkflowsManager'] = LazyManager(
+        'AutomateWorkflowsManager'
+    )
+    notes: LazyManager['NotesManager'] = LazyManager('NotesManager')
+
     def __init__(self, auth: Authentication, *, network_session: NetworkSession = None):
         if network_session is None:
             network_session = NetworkSession(base_urls=BaseUrls())
         self.auth = auth
         self.network_session = network_session
-        self.authorization = AuthorizationManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.files = FilesManager(auth=self.auth, network_session=self.network_session)
-        self.trashed_files = TrashedFilesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.app_item_associations = AppItemAssociationsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.downloads = DownloadsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.uploads = UploadsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.chunked_uploads = ChunkedUploadsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.list_collaborations = ListCollaborationsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.comments = CommentsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.tasks = TasksManager(auth=self.auth, network_session=self.network_session)
-        self.file_versions = FileVersionsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.file_metadata = FileMetadataManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.file_classifications = FileClassificationsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.skills = SkillsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.file_watermarks = FileWatermarksManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.file_requests = FileRequestsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.folders = FoldersManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.trashed_folders = TrashedFoldersManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.folder_metadata = FolderMetadataManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.folder_classifications = FolderClassificationsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.trashed_items = TrashedItemsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.folder_watermarks = FolderWatermarksManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.folder_locks = FolderLocksManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.metadata_templates = MetadataTemplatesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.classifications = ClassificationsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.metadata_cascade_policies = MetadataCascadePoliciesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.search = SearchManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.user_collaborations = UserCollaborationsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.task_assignments = TaskAssignmentsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.shared_links_files = SharedLinksFilesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.shared_links_folders = SharedLinksFoldersManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.web_links = WebLinksManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.trashed_web_links = TrashedWebLinksManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.shared_links_web_links = SharedLinksWebLinksManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.shared_links_app_items = SharedLinksAppItemsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.users = UsersManager(auth=self.auth, network_session=self.network_session)
-        self.session_termination = SessionTerminationManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.avatars = AvatarsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.transfer = TransferManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.email_aliases = EmailAliasesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.memberships = MembershipsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.invites = InvitesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.groups = GroupsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.webhooks = WebhooksManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.events = EventsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.collections = CollectionsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.recent_items = RecentItemsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.retention_policies = RetentionPoliciesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.retention_policy_assignments = RetentionPolicyAssignmentsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.legal_hold_policies = LegalHoldPoliciesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.legal_hold_policy_assignments = LegalHoldPolicyAssignmentsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.file_version_retentions = FileVersionRetentionsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.file_version_legal_holds = FileVersionLegalHoldsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.shield_information_barriers = ShieldInformationBarriersManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.shield_information_barrier_reports = (
-            ShieldInformationBarrierReportsManager(
-                auth=self.auth, network_session=self.network_session
-            )
-        )
-        self.shield_information_barrier_segments = (
-            ShieldInformationBarrierSegmentsManager(
-                auth=self.auth, network_session=self.network_session
-            )
-        )
-        self.shield_information_barrier_segment_members = (
-            ShieldInformationBarrierSegmentMembersManager(
-                auth=self.auth, network_session=self.network_session
-            )
-        )
-        self.shield_information_barrier_segment_restrictions = (
-            ShieldInformationBarrierSegmentRestrictionsManager(
-                auth=self.auth, network_session=self.network_session
-            )
-        )
-        self.device_pinners = DevicePinnersManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.terms_of_services = TermsOfServicesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.terms_of_service_user_statuses = TermsOfServiceUserStatusesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.collaboration_allowlist_entries = CollaborationAllowlistEntriesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.collaboration_allowlist_exempt_targets = (
-            CollaborationAllowlistExemptTargetsManager(
-                auth=self.auth, network_session=self.network_session
-            )
-        )
-        self.storage_policies = StoragePoliciesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.storage_policy_assignments = StoragePolicyAssignmentsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.zip_downloads = ZipDownloadsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.sign_requests = SignRequestsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.workflows = WorkflowsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.sign_templates = SignTemplatesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.integration_mappings = IntegrationMappingsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.ai = AiManager(auth=self.auth, network_session=self.network_session)
-        self.ai_studio = AiStudioManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.metadata_taxonomies = MetadataTaxonomiesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.docgen_template = DocgenTemplateManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.docgen = DocgenManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.enterprise_configurations = EnterpriseConfigurationsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.hubs = HubsManager(auth=self.auth, network_session=self.network_session)
-        self.hub_collaborations = HubCollaborationsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.hub_items = HubItemsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.hub_document = HubDocumentManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.shield_lists = ShieldListsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.archives = ArchivesManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.external_users = ExternalUsersManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.automate_workflows = AutomateWorkflowsManager(
-            auth=self.auth, network_session=self.network_session
-        )
-        self.notes = NotesManager(auth=self.auth, network_session=self.network_session)
 
     def make_request(self, fetch_options: FetchOptions) -> FetchResponse:
         """
@@ -7,3 +7,5 @@ from box_sdk_gen.internal.errors import *
 from box_sdk_gen.internal.base_object import *
 
 from box_sdk_gen.internal.null_value import *
+
+from box_sdk_gen.internal.lazy_imports import *
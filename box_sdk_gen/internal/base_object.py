@@ -1,6 +1,7 @@
 from datetime import datetime, date
 from enum import EnumMeta, Enum
-from typing import get_args, get_origin, Union, Optional
+from inspect import Parameter, signature
+from typing import Any, Callable, Dict, get_args, get_origin, Tuple, Union, Optional
 from .null_value import NullValue
 
 
@@ -8,171 +9,431 @@ class BaseObject:
     _discriminator = (None, {})
     _json_to_fields_mapping = {}
     _fields_to_json_mapping = {}
+    _raw_data: Optional[dict] = None
+    _lazy = False
 
     def __init__(self, **kwargs):
-        self._raw_data: dict = {}
-        self.__dict__.update(kwargs)
+        if kwargs:
+            self.__dict__.update(kwargs)
 
     @classmethod
     def from_dict(cls, data: dict):
+        plan = cls.__dict__.get('_deserialization_plan', None)
+        if plan is None:
+            plan = cls._get_deserialization_plan()
         unpacked_attributes = {}
         for key, value in data.items():
-            mapping_field_name = cls._json_to_fields_mapping.get(key, key)
-            annotation = cls.__init__.__annotations__.get(mapping_field_name, None)
-            unpacked_attributes[mapping_field_name] = cls._deserialize(
-                key, value, annotation
+            field = plan.get(key, None)
+            if field is None:
+                unpacked_attributes[key] = value
+                continue
+            field_name, converter = field
+            unpacked_attributes[field_name] = (
+                value if converter is None or value is None else converter(value)
             )
         return cls(**unpacked_attributes)
 
+    @classmethod
+    def _from_dict_lazy(cls, data: dict):
+        """
+        Returns an object deserializing its fields from `data` on their first access.
+        Nested objects and lists are deserialized lazily as well.
+        """
+        lazy_plan = cls.__dict__.get('_lazy_deserialization_plan', None)
+        if lazy_plan is None:
+            lazy_plan = cls._get_lazy_deserialization_plan()
+        if type(data) is not dict or any(
+            not any(key in data for key in keys) for keys in lazy_plan.required_keys
+        ):
+            # Fails the same way as eager deserialization
+            return cls.from_dict(data)
+        obj = cls.__new__(cls)
+        obj._raw_data = data
+        obj._lazy = True
+        return obj
+
+    def __getattr__(self, name: str):
+        # Only called for attributes missing from the instance,
+        # i.e. fields of lazily deserialized objects which were not accessed yet
+        if name.startswith('_') or not self._lazy:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        lazy_plan = type(self)._get_lazy_deserialization_plan()
+        data = self._raw_data
+        field = lazy_plan.fields.get(name, None)
+        if field is not None and field[0] in data:
+            key, converter = field
+            value = data[key]
+            if converter is not None and value is not None:
+                value = converter(value)
+        elif field is not None and name in lazy_plan.defaults:
+            value = lazy_plan.defaults[name]
+        else:
+            # Other attributes, e.g. set by `__init__` from unknown keys
+            self._materialize()
+            return object.__getattribute__(self, name)
+        self.__dict__[name] = value
+        return value
+
+    def _materialize(self) -> None:
+        """
+        Deserializes all remaining fields of a lazily deserialized object,
+        keeping the values of fields which were already accessed or assigned.
+        """
+        if not self._lazy:
+            return
+        del self._lazy
+        plan = self._get_deserialization_plan(lazy=True)
+        attributes = dict(vars(self))
+        unpacked_attributes = {}
+        for key, value in self._raw_data.items():
+            field = plan.get(key, None)
+            field_name, converter = field if field is not None else (key, None)
+            if field_name in attributes:
+                unpacked_attributes[field_name] = attributes.pop(field_name)
+            else:
+                unpacked_attributes[field_name] = (
+                    value if converter is None or value is None else converter(value)
+                )
+        vars(self).clear()
+        self.__init__(**unpacked_attributes)
+        vars(self).update(attributes)
+
     @property
     def raw_data(self):
         """
         Returns the raw json representation returned by the API
         :return: dict with the raw json data
         """
-        return self._raw_data
+        return self._raw_data if self._raw_data is not None else {}
 
     def to_dict(self) -> dict:
+        if self._lazy:
+            self._materialize()
+        return type(self)._serialize_fields(vars(self))
+
+    @classmethod
+    def _serialize_fields(cls, fields: Dict[str, Any]) -> dict:
+        """
+        Returns the JSON representation of the fields, skipping private and null ones.
+        JSON names of the fields are cached per class, values are encoded by functions
+        cached per type.
+        """
+        json_names = cls.__dict__.get('_serialization_json_names', None)
+        if json_names is None:
+            json_names = {}
+            if cls is not BaseObject:
+                # Keys of plain dicts serialized as `BaseObject` are not bounded by a schema
+                cls._serialization_json_names = json_names
         result_dict = {}
-        for k, v in vars(self).items():
-            # Skip private and protected attributes
-            if k.startswith("_"):
+        for name, value in fields.items():
+            if value is None:
                 continue
-            if v is None:
+            try:
+                json_name = json_names[name]
+            except KeyError:
+                json_name = json_names[name] = (
+                    None
+                    if name.startswith('_')
+                    else cls._fields_to_json_mapping.get(name, name)
+                )
+            if json_name is None:
                 continue
-            if isinstance(v, NullValue):
-                value = None
-            elif type(v) is list:
-                value = [
-                    item.to_dict() if isinstance(item, BaseObject) else item
-                    for item in v
-                ]
-            elif type(v) is dict:
-                value = {
-                    key: value.to_dict() if isinstance(value, BaseObject) else value
-                    for key, value in v.items()
-                }
-            elif isinstance(v, BaseObject):
-                value = v.to_dict()
-            elif isinstance(v, Enum):
-                value = v.value
-            elif isinstance(v, date):
-                value = v.isoformat()
-            elif isinstance(v, datetime):
-                value = v.isoformat().replace('+00:00', 'Z')
-            else:
-                value = v
-            result_dict[self._fields_to_json_mapping.get(k, k)] = value
-
+            try:
+                encoder = _encoders[type(value)]
+            except KeyError:
+                encoder = _get_encoder(type(value))
+            result_dict[json_name] = value if encoder is None else encoder(value)
         return result_dict
 
     @classmethod
-    def _deserialize(cls, key, value, annotation=None):
-        if annotation is None or value is None:
-            return value
-        if get_origin(annotation) == Optional:
-            return cls._deserialize(key, value, get_args(annotation))
-        if get_origin(annotation) == Union:
-            union_without_none_type = [
-                arg for arg in get_args(annotation) if arg is not type(None)
-            ]
-            if len(union_without_none_type) == 1:
-                return cls._deserialize(key, value, union_without_none_type[0])
-
-        if get_origin(annotation) == list:
-            return cls._deserialize_list(key, value, annotation)
-        elif get_origin(annotation) == dict:
-            return cls._deserialize_dict(key, value, annotation)
-        elif get_origin(annotation) == Union:
-            return cls._deserialize_union(key, value, annotation)
-        elif isinstance(annotation, EnumMeta):
-            return cls._deserialize_enum(key, value, annotation)
-        elif annotation == datetime:
-            return cls._deserialize_datetime(key, value, annotation)
-        elif annotation == date:
-            return cls._deserialize_date(key, value, annotation)
-        elif isinstance(annotation, type) and issubclass(annotation, BaseObject):
-            return cls._deserialize_nested_type(key, value, annotation)
-        else:
+    def _deserialize(cls, key, value, annotation=None, lazy: bool = False):
+        converter = _get_converter(annotation, lazy)
+        if converter is None or value is None:
             return value
+        return converter(value)
 
     @classmethod
-    def _deserialize_list(cls, key, value, annotation: list):
+    def _get_deserialization_plan(
+        cls, lazy: bool = False
+    ) -> Dict[str, Tuple[str, Optional[Callable[[Any], Any]]]]:
+        """
+        Returns the mapping of JSON keys to field names and converters of their values,
+        resolved from the `__init__` annotations once per class.
+        """
+        plan_name = '_lazy_fields_plan' if lazy else '_deserialization_plan'
+        plan = cls.__dict__.get(plan_name, None)
+        if plan is None:
+            annotations = cls.__init__.__annotations__
+            plan = {}
+            for key in (*annotations, *cls._json_to_fields_mapping):
+                field_name = cls._json_to_fields_mapping.get(key, key)
+                plan[key] = (
+                    field_name,
+                    _get_converter(annotations.get(field_name, None), lazy),
+                )
+            setattr(cls, plan_name, plan)
+        return plan
+
+    @classmethod
+    def _get_lazy_deserialization_plan(cls) -> '_LazyDeserializationPlan':
+        lazy_plan = cls.__dict__.get('_lazy_deserialization_plan', None)
+        if lazy_plan is None:
+            lazy_plan = cls._lazy_deserialization_plan = _LazyDeserializationPlan(cls)
+        return lazy_plan
+
+    def __repr__(self) -> str:
+        return f'{self.__class__} {self.to_dict()}'
+
+
+class _LazyDeserializationPlan:
+    """
+    Describes how fields of lazily deserialized objects of a class are resolved:
+
+    - `fields` - field name to its JSON key and converter
+    - `defaults` - default values of fields missing from the JSON data
+    - `required_keys` - for each required field, the JSON keys providing it
+    """
+
+    def __init__(self, cls: type):
+        plan = cls._get_deserialization_plan(lazy=True)
+        self.fields: Dict[str, Tuple[str, Optional[Converter]]] = {}
+        for key, (field_name, converter) in plan.items():
+            if cls._fields_to_json_mapping.get(field_name, field_name) == key:
+                self.fields[field_name] = (key, converter)
+        self.defaults: Dict[str, Any] = {}
+        self.required_keys = []
+        for parameter in list(signature(cls.__init__).parameters.values())[1:]:
+            if parameter.kind not in (
+                Parameter.POSITIONAL_OR_KEYWORD,
+                Parameter.KEYWORD_ONLY,
+            ):
+                continue
+            if parameter.default is not Parameter.empty:
+                self.defaults[parameter.name] = parameter.default
+            else:
+                keys = tuple(
+                    key
+                    for key, (field_name, _) in plan.items()
+                    if field_name == parameter.name
+                )
+                self.required_keys.append(keys or (parameter.name,))
+
+
+_NONE_TYPE = type(None)
+
+Converter = Callable[[Any], Any]
+
+_converters: Dict[Any, Optional[Converter]] = {}
+
+
+def _get_converter(annotation, lazy: bool = False) -> Optional[Converter]:
+    """
+    Returns the function deserializing non-null values of the annotated type,
+    or None if the values are kept as they are. Converters never raise,
+    values which do not match the annotation are returned unchanged.
+    Lazy converters return objects deserialized on first access, in plain lists.
+    """
+    try:
+        return _converters[annotation, lazy]
+    except KeyError:
+        converter = _converters[annotation, lazy] = _compile_converter(annotation, lazy)
+        return converter
+    except TypeError:
+        return _compile_converter(annotation, lazy)
+
+
+_encoders: Dict[type, Optional[Converter]] = {}
+
+
+def _get_encoder(value_type: type) -> Optional[Converter]:
+    """
+    Returns the function encoding values of the type in `to_dict`,
+    or None if the values are kept as they are.
+    """
+    encoder = _encoders.get(value_type, None)
+    if encoder is None and value_type not in _encoders:
+        if issubclass(value_type, NullValue):
+            encoder = _encode_null
+        elif value_type is list:
+            encoder = _encode_list
+        elif value_type is dict:
+            encoder = _encode_dict
+        elif issubclass(value_type, BaseObject):
+            encoder = _encode_object
+        elif issubclass(value_type, Enum):
+            encoder = _encode_enum
+        elif issubclass(value_type, date):
+            # Includes `datetime`
+            encoder = _encode_date
+        _encoders[value_type] = encoder
+    return encoder
+
+
+def _encode_null(value: NullValue) -> None:
+    return None
+
+
+def _encode_list(value: list) -> list:
+    return [item.to_dict() if isinstance(item, BaseObject) else item for item in value]
+
+
+def _encode_dict(value: dict) -> dict:
+    return {
+        key: item.to_dict() if isinstance(item, BaseObject) else item
+        for key, item in value.items()
+    }
+
+
+def _encode_object(value: BaseObject) -> dict:
+    return value.to_dict()
+
+
+def _encode_enum(value: Enum):
+    return value.value
+
+
+def _encode_date(value: date) -> str:
+    return value.isoformat()
+
+
+def _compile_converter(annotation, lazy: bool) -> Optional[Converter]:
+    if annotation is None:
+        return None
+    origin = get_origin(annotation)
+    if origin == Union:
+        union_without_none_type = [
+            arg for arg in get_args(annotation) if arg is not _NONE_TYPE
+        ]
+        if len(union_without_none_type) == 1:
+            return _get_converter(union_without_none_type[0], lazy)
+        return _compile_union_converter(get_args(annotation), lazy)
+    if origin == list:
+        args = get_args(annotation)
+        if not args:
+            return None
+        return _compile_list_converter(_get_converter(args[0], lazy))
+    if origin == dict:
+        args = get_args(annotation)
+        if len(args) < 2:
+            return None
+        return _compile_dict_converter(_get_converter(args[1], lazy))
+    if isinstance(annotation, EnumMeta):
+        return _compile_enum_converter(annotation)
+    if annotation == datetime:
+        return _deserialize_datetime
+    if annotation == date:
+        return _deserialize_date
+    if isinstance(annotation, type) and issubclass(annotation, BaseObject):
+        return _compile_nested_type_converter(annotation, lazy)
+    return None
+
+
+def _compile_list_converter(item_converter: Optional[Converter]) -> Converter:
+    def deserialize_list(value):
         try:
-            list_type = get_args(annotation)[0]
+            if item_converter is None:
+                return list(value)
             return [
-                cls._deserialize(key, list_entry, list_type) for list_entry in value
+                item_converter(item) if item is not None else None for item in value
             ]
         except Exception:
             return value
 
-    @classmethod
-    def _deserialize_dict(cls, key, value, annotation):
-        try:
-            args = get_args(annotation)
-            if len(args) < 2:
-                return value
-            value_type = args[1]
-            return {k: cls._deserialize(key, v, value_type) for k, v in value.items()}
-        except Exception:
-            return value
+    return deserialize_list
 
-    @classmethod
-    def _deserialize_union(cls, key, value, annotation):
-        try:
-            possible_types = get_args(annotation)
-            if value is None:
-                if type(None) not in possible_types:
-                    print(
-                        'Value: ', value, 'should not be allowed in Union:', annotation
-                    )
-                return value
-
-            for possible_type in possible_types:
-                if (
-                    isinstance(possible_type, type)
-                    and issubclass(possible_type, BaseObject)
-                    and value.get(possible_type._discriminator[0], None)
-                    in possible_type._discriminator[1]
-                ):
-                    return cls._deserialize(key, value, possible_type)
-
-            for possible_type in possible_types:
-                try:
-                    return cls._deserialize(key, value, possible_type)
-                except Exception:
-                    continue
-            return value
-        except Exception:
-            return value
 
-    @classmethod
-    def _deserialize_enum(cls, key, value, annotation):
+def _compile_dict_converter(value_converter: Optional[Converter]) -> Converter:
+    def deserialize_dict(value):
         try:
-            return getattr(annotation, value.upper().replace(' ', '_'))
+            if value_converter is None:
+                return dict(value.items())
+            return {
+                key: value_converter(item) if item is not None else None
+                for key, item in value.items()
+            }
         except Exception:
             return value
 
-    @classmethod
-    def _deserialize_datetime(cls, key, value, annotation):
+    return deserialize_dict
+
+
+def _compile_union_converter(possible_types: tuple, lazy: bool) -> Converter:
+    """
+    Values are dispatched by the discriminator of the first matching union member,
+    with one lookup table per discriminator key. Values matching none of them
+    are deserialized as the first member.
+    """
+    tables: Dict[Any, Tuple[int, Dict[Any, Tuple[int, Optional[Converter]]]]] = {}
+    for priority, possible_type in enumerate(possible_types):
+        if isinstance(possible_type, type) and issubclass(possible_type, BaseObject):
+            discriminator_key, discriminator_values = possible_type._discriminator
+            _, table = tables.setdefault(discriminator_key, (priority, {}))
+            for discriminator_value in discriminator_values:
+                table.setdefault(
+                    discriminator_value,
+                    (priority, _get_converter(possible_type, lazy)),
+                )
+    # Ordered by the position of the first member using the discriminator key
+    dispatch = [
+        (first_priority, discriminator_key, table)
+        for discriminator_key, (first_priority, table) in tables.items()
+    ]
+    fallback = _get_converter(possible_types[0], lazy)
+
+    def deserialize_union(value):
         try:
-            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+            match = None
+            for first_priority, discriminator_key, table in dispatch:
+                if match is not None and match[0] < first_priority:
+                    break
+                candidate = table.get(value.get(discriminator_key, None), None)
+                if candidate is not None and (match is None or candidate[0] < match[0]):
+                    match = candidate
+            converter = match[1] if match is not None else fallback
+            return converter(value) if converter is not None else value
         except Exception:
             return value
 
-    @classmethod
-    def _deserialize_date(cls, key, value, annotation):
+    return deserialize_union
+
+
+def _compile_enum_converter(enum_type: EnumMeta) -> Converter:
+    members = dict(enum_type.__members__)
+
+    def deserialize_enum(value):
         try:
-            return date.fromisoformat(value)
+            name = value.upper().replace(' ', '_')
+            member = members.get(name, None)
+            return member if member is not None else getattr(enum_type, name)
         except Exception:
             return value
 
-    @classmethod
-    def _deserialize_nested_type(cls, key, value, annotation):
+    return deserialize_enum
+
+
+def _compile_nested_type_converter(object_type: type, lazy: bool) -> Converter:
+    from_dict = object_type._from_dict_lazy if lazy else object_type.from_dict
+
+    def deserialize_nested_type(value):
         try:
-            return annotation.from_dict(value)
+            return from_dict(value)
         except Exception:
             return value
 
-    def __repr__(self) -> str:
-        return f'{self.__class__} {self.to_dict()}'
+    return deserialize_nested_type
+
+
+def _deserialize_datetime(value):
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except Exception:
+        return value
+
+
+def _deserialize_date(value):
+    try:
+        return date.fromisoformat(value)
+    except Exception:
+        return value
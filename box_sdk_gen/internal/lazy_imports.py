@@ -0,0 +1,76 @@
+import importlib
+import sys
+from typing import Any, Callable, Dict, Generic, List, Tuple, TypeVar
+
+_Manager = TypeVar('_Manager')
+
+
+def lazy_package_attributes(
+    package_name: str, attributes: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Returns the module level `__getattr__` and `__dir__` functions (PEP 562) of a package,
+    importing the module defining an attribute only when the attribute is first accessed.
+    The names the modules only import, e.g. `Optional`, are resolved as the former star imports
+    of the modules did, by importing the modules until one of them has the name.
+    :param package_name: Name of the package, i.e. its `__name__`
+    :type package_name: str
+    :param attributes: Names of the attributes mapped to the modules defining them, relative to the package
+    :type attributes: Dict[str, str]
+    """
+    # Ordered as the star imports were, the last module importing a name was the one exporting it
+    star_imported_modules = list(reversed(dict.fromkeys(attributes.values())))
+
+    def __getattr__(name: str) -> Any:
+        module_name = attributes.get(name, None)
+        if module_name is not None:
+            value = getattr(
+                importlib.import_module(f'{package_name}.{module_name}'), name
+            )
+        else:
+            value = _get_star_imported(name)
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def _get_star_imported(name: str) -> Any:
+        if not name.startswith('_'):
+            for module_name in star_imported_modules:
+                module = importlib.import_module(f'{package_name}.{module_name}')
+                exported = getattr(module, '__all__', None)
+                if name in vars(module) and (exported is None or name in exported):
+                    return vars(module)[name]
+        raise AttributeError(f'module {package_name!r} has no attribute {name!r}')
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(attributes))
+
+    return __getattr__, __dir__
+
+
+class LazyManager(Generic[_Manager]):
+    """
+    Client attribute creating its manager on first access, so that the manager module
+    is only imported by the clients using it.
+    """
+
+    def __init__(self, class_name: str):
+        """
+        :param class_name: Name of the manager class exported by `box_sdk_gen.managers`
+        :type class_name: str
+        """
+        self.class_name = class_name
+        self.name = class_name
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, client, owner=None) -> _Manager:
+        if client is None:
+            return self
+        manager_class = getattr(
+            importlib.import_module('box_sdk_gen.managers'), self.class_name
+        )
+        manager = manager_class(
+            auth=client.auth, network_session=client.network_session
+        )
+        return client.__dict__.setdefault(self.name, manager)
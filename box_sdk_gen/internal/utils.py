@@ -7,9 +7,18 @@ import shutil
 import uuid
 import time
 import hmac
+import mmap
+import stat
 from random import uniform
 from enum import Enum
-from io import SEEK_CUR, SEEK_END, SEEK_SET, BufferedIOBase, BytesIO
+from io import (
+    SEEK_CUR,
+    SEEK_END,
+    SEEK_SET,
+    BufferedIOBase,
+    BytesIO,
+    UnsupportedOperation,
+)
 from typing import Any, Callable, Dict, Iterable, Optional, TypeVar, BinaryIO
 
 from abc import abstractmethod
@@ -32,28 +41,89 @@ OutputStream = BinaryIO
 Buffer = bytes
 
 
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
 class ResponseByteStream(ByteStream):
-    def __init__(self, request_iterator):
-        self._iterator = request_iterator
-        self._buffer = b''
+    """
+    Read-only stream over an iterator of response body chunks.
+
+    Chunks are appended to a single `bytearray` read from a moving offset, which is compacted
+    once more than half of it has been consumed, so every byte is copied in and out of
+    the buffer at most once. `readinto` copies chunks straight into the caller buffer.
+
+    When the iterator fails after part of the requested bytes were read, these bytes are returned
+    and the error is raised by the next read, so callers always know how much was received.
+    Closing the stream calls `close_response`, to release the connection of a response which was not read to its end.
+    """
+
+    def __init__(
+        self,
+        request_iterator,
+        *,
+        close_response: Optional[Callable[[], None]] = None,
+    ):
+        self._iterator = iter(request_iterator)
+        self._close_response = close_response
+        self._buffer = bytearray()
+        self._offset = 0
         self._position = 0
         self._eos = False
+        self._error: Optional[Exception] = None
 
-    def _read_from_iterator(self, size):
+    def readable(self):
+        return True
+
+    def close(self) -> None:
+        if not self.closed and self._close_response is not None:
+            self._close_response()
+        super().close()
+
+    def _buffered(self) -> int:
+        return len(self._buffer) - self._offset
+
+    def _next_chunk(self, deferrable: bool = False) -> Optional[bytes]:
         """
-        Read up to `size` bytes from the iterator into the buffer
-        :param size: Number of bytes to read. If None, read the entire stream.
+        :param deferrable: If True, an error raised by the iterator is kept to be raised by the next call,
+        and None is returned as if the stream was exhausted.
         """
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
         if self._eos:
-            return
+            return None
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            self._eos = True
+            return None
+        except Exception as error:
+            if not deferrable:
+                raise
+            self._error = error
+            return None
+
+    def _consume(self, size: int) -> None:
+        self._offset += size
+        self._position += size
+        if self._offset == len(self._buffer):
+            self._buffer.clear()
+            self._offset = 0
+        elif self._offset > len(self._buffer) // 2:
+            del self._buffer[: self._offset]
+            self._offset = 0
 
-        while len(self._buffer) < size:
-            try:
-                chunk = next(self._iterator)
-                self._buffer += chunk
-            except StopIteration:
-                self._eos = True
+    def _read_from_iterator(self, size):
+        """
+        Read from the iterator into the buffer until it holds at least `size` bytes
+        :param size: Number of bytes the buffer should hold.
+        """
+        while self._buffered() < size:
+            chunk = self._next_chunk(deferrable=self._buffered() > 0)
+            if chunk is None:
                 break
+            self._buffer += chunk
 
     def tell(self):
         """
@@ -68,20 +138,64 @@ class ResponseByteStream(ByteStream):
         :param size: Read up to `size` bytes from the stream. If None read the entire stream.
         :return: Bytes read from the stream
         """
-        if size is None:
+        if size is None or size < 0:
             # Read everything remaining in the stream.
-            result = self._buffer + b''.join(self._iterator)
-            self._buffer = b''
-            self._position += len(result)
-            self._eos = True
-            return result
+            chunks = [bytes(memoryview(self._buffer)[self._offset:])]
+            self._buffer.clear()
+            self._offset = 0
+            self._position += len(chunks[0])
+            # Raises the error deferred by a previous read, or raised while reading the rest
+            while True:
+                chunk = self._next_chunk()
+                if chunk is None:
+                    break
+                chunks.append(chunk)
+                self._position += len(chunk)
+            return b''.join(chunks)
+
+        if self._buffered() == 0:
+            # Hand over whole chunks without copying them when they fit.
+            chunk = self._next_chunk()
+            if chunk is None:
+                return b''
+            if len(chunk) == size:
+                self._position += size
+                return chunk
+            self._buffer += chunk
 
         self._read_from_iterator(size)
-        result = self._buffer[:size]
-        self._buffer = self._buffer[size:]
-        self._position += len(result)
+        end = min(self._offset + size, len(self._buffer))
+        result = bytes(memoryview(self._buffer)[self._offset:end])
+        self._consume(len(result))
         return result
 
+    def readinto(self, buffer) -> int:
+        """
+        Reads bytes from the stream into a pre-allocated, writable bytes-like object,
+        until it is full or the stream is exhausted
+        :param buffer: Buffer to read into
+        :return: Number of bytes read
+        """
+        target = memoryview(buffer).cast('B')
+        written = min(self._buffered(), len(target))
+        if written:
+            target[:written] = memoryview(self._buffer)[
+                self._offset:self._offset + written
+            ]
+            self._consume(written)
+
+        while written < len(target):
+            chunk = self._next_chunk(deferrable=written > 0)
+            if chunk is None:
+                break
+            size = min(len(chunk), len(target) - written)
+            target[written:written + size] = memoryview(chunk)[:size]
+            written += size
+            self._position += size
+            if size < len(chunk):
+                self._buffer += memoryview(chunk)[size:]
+        return written
+
     def seek(self, position, whence=SEEK_SET):
         """
         Move the stream to given position
@@ -92,9 +206,9 @@ class ResponseByteStream(ByteStream):
         if whence == SEEK_SET:
             if position < self._position:
                 raise ValueError('Cannot seek backwards in a stream')
-            self.read(position - self._position)
+            self._skip(position - self._position)
         elif whence == SEEK_CUR:
-            self.read(position)
+            self._skip(position)
         elif whence == SEEK_END:
             raise NotImplementedError('SEEK_END is not supported for streams')
         else:
@@ -102,6 +216,72 @@ class ResponseByteStream(ByteStream):
 
         return self._position
 
+    def _skip(self, size: int) -> None:
+        while size > 0:
+            if self._buffered() == 0:
+                chunk = self._next_chunk()
+                if chunk is None:
+                    return
+                self._buffer += chunk
+            skipped = min(size, self._buffered())
+            self._consume(skipped)
+            size -= skipped
+
+
+class BufferByteStream(ByteStream):
+    """
+    Read-only, seekable stream over a bytes-like object, which is never copied as a whole.
+    `getbuffer` exposes the unread part of the data as a memoryview.
+    """
+
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast('B')
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, position, whence=SEEK_SET):
+        if whence == SEEK_CUR:
+            position += self._position
+        elif whence == SEEK_END:
+            position += len(self._view)
+        elif whence != SEEK_SET:
+            raise ValueError('Invalid value for `whence`')
+        if position < 0:
+            raise ValueError('Negative seek position')
+        self._position = position
+        return self._position
+
+    def getbuffer(self) -> memoryview:
+        return self._view[self._position:]
+
+    def read(self, size=None):
+        end = (
+            len(self._view)
+            if size is None or size < 0
+            else min(self._position + size, len(self._view))
+        )
+        start = min(self._position, end)
+        self._position = max(self._position, end)
+        return self._view[start:end].tobytes()
+
+    def read1(self, size=-1):
+        return self.read(size)
+
+    def readinto(self, buffer) -> int:
+        target = memoryview(buffer).cast('B')
+        data = self.getbuffer()[: len(target)]
+        target[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
 
 def get_env_var(name: str) -> str:
     return os.getenv(name)
@@ -150,7 +330,16 @@ def read_byte_stream(byte_stream: ByteStream) -> Buffer:
 def write_input_stream_to_output_stream(
     input_stream: ByteStream, output_stream: OutputStream
 ):
-    shutil.copyfileobj(input_stream, output_stream)
+    if not hasattr(input_stream, 'readinto'):
+        shutil.copyfileobj(input_stream, output_stream, COPY_BUFFER_SIZE)
+        return
+    buffer = bytearray(COPY_BUFFER_SIZE)
+    view = memoryview(buffer)
+    while True:
+        bytes_read = input_stream.readinto(buffer)
+        if not bytes_read:
+            break
+        output_stream.write(view[:bytes_read])
 
 
 def get_file_output_stream(file_path: str) -> OutputStream:
@@ -219,12 +408,23 @@ Accumulator = TypeVar('Accumulator')
 def iterate_chunks(
     stream: ByteStream, chunk_size: int, file_size: int
 ) -> Iterable[ByteStream]:
+    """
+    Splits the stream into chunks of `chunk_size` bytes. Chunks of regular files are memory mapped,
+    other streams are read into a `bytearray` allocated for each chunk, so no chunk is copied
+    after it has been read and only chunks still referenced by the caller are kept in memory.
+    """
+    file_chunks = _iterate_file_chunks(stream, chunk_size)
+    if file_chunks is not None:
+        yield from file_chunks
+        return
+
     stream_is_finished = False
     while not stream_is_finished:
+        chunk = bytearray(chunk_size)
+        view = memoryview(chunk)
         copied_length = 0
-        chunk = b''
         while copied_length < chunk_size:
-            bytes_read = stream.read(chunk_size - copied_length)
+            bytes_read = _read_into(stream, view[copied_length:])
             if bytes_read is None:
                 # stream returns none when no bytes are ready currently but there are
                 # potentially more bytes in the stream to be read.
@@ -233,10 +433,64 @@ def iterate_chunks(
                 # stream is exhausted.
                 stream_is_finished = True
                 break
-            chunk += bytes_read
-            copied_length += len(bytes_read)
-        if chunk:
-            yield BytesIO(chunk)
+            copied_length += bytes_read
+        view.release()
+        if copied_length:
+            if copied_length < chunk_size:
+                del chunk[copied_length:]
+            yield BufferByteStream(chunk)
+
+
+def _read_into(stream: ByteStream, view: memoryview) -> Optional[int]:
+    readinto = getattr(stream, 'readinto', None)
+    if readinto is not None:
+        try:
+            return readinto(view)
+        except (AttributeError, UnsupportedOperation):
+            pass
+    bytes_read = stream.read(len(view))
+    if bytes_read is None:
+        return None
+    view[: len(bytes_read)] = bytes_read
+    return len(bytes_read)
+
+
+def _iterate_file_chunks(
+    stream: ByteStream, chunk_size: int
+) -> Optional[Iterable[ByteStream]]:
+    try:
+        fileno = stream.fileno()
+        if not stat.S_ISREG(os.fstat(fileno).st_mode) or not stream.seekable():
+            return None
+        start = stream.tell()
+        end = os.fstat(fileno).st_size
+    except (AttributeError, OSError, ValueError):
+        return None
+    if start >= end:
+        return None
+    return _generate_file_chunks(stream, fileno, start, end, chunk_size)
+
+
+def _generate_file_chunks(
+    stream: ByteStream, fileno: int, start: int, end: int, chunk_size: int
+) -> Iterable[ByteStream]:
+    # Each chunk has its own mapping, which is unmapped once the chunk is no longer referenced
+    for chunk_start in range(start, end, chunk_size):
+        chunk_end = min(chunk_start + chunk_size, end)
+        map_start = chunk_start - chunk_start % mmap.ALLOCATIONGRANULARITY
+        chunk = BufferByteStream(
+            memoryview(
+                mmap.mmap(
+                    fileno,
+                    chunk_end - map_start,
+                    access=mmap.ACCESS_READ,
+                    offset=map_start,
+                )
+            )[chunk_start - map_start:]
+        )
+        stream.seek(chunk_end)
+        yield chunk
+        del chunk
 
 
 def reduce_iterator(
@@ -416,29 +670,38 @@ def create_null():
     return null
 
 
+# Backslashes not escaping a `/`, special and non-ASCII characters
+_UNICODE_ESCAPED_CHARACTERS = re.compile(r'\\(?!/)|[^\x20-\x7e]')
+
+
+def _escape_character(match) -> str:
+    char = match.group(0)
+    code_point = ord(char)
+    if char == '\\':
+        return '\\\\'
+    elif char == '\n':
+        return '\\n'
+    elif char == '\r':
+        return '\\r'
+    elif char == '\t':
+        return '\\t'
+    elif code_point <= 0xFFFF:  # Basic Multilingual Plane (BMP)
+        return f"\\u{code_point:04x}"
+    else:  # Supplementary Plane (Surrogate Pair)
+        code_point -= 0x10000
+        high_surrogate = 0xD800 + (code_point >> 10)
+        low_surrogate = 0xDC00 + (code_point & 0x3FF)
+        return f"\\u{high_surrogate:04x}\\u{low_surrogate:04x}"
+
+
+def needs_unicode_escaping(value: str) -> bool:
+    """Returns whether `escape_unicode` changes the value."""
+    return _UNICODE_ESCAPED_CHARACTERS.search(value) is not None
+
+
 def escape_unicode(value: str) -> str:
-    def replace_char(match):
-        char = match.group(0)
-        code_point = ord(char)
-        if char == '\n':
-            return '\\n'
-        elif char == '\r':
-            return '\\r'
-        elif char == '\t':
-            return '\\t'
-        elif code_point <= 0xFFFF:  # Basic Multilingual Plane (BMP)
-            return f"\\u{code_point:04x}"
-        else:  # Supplementary Plane (Surrogate Pair)
-            code_point -= 0x10000
-            high_surrogate = 0xD800 + (code_point >> 10)
-            low_surrogate = 0xDC00 + (code_point & 0x3FF)
-            return f"\\u{high_surrogate:04x}\\u{low_surrogate:04x}"
-
-    # Replace any backslashes that are NOT part of a \/ with double backslash
-    temp = re.sub(r'\\(?!/)', r'\\\\', value)
-
-    # Match special characters, non-ASCII characters
-    return re.sub(r'[^\x20-\x7e]|[\n\r\t]', replace_char, temp)
+    # Escapes in a single pass, backslashes never being part of the escaped special characters
+    return _UNICODE_ESCAPED_CHARACTERS.sub(_escape_character, value)
 
 
 def compute_webhook_signature(
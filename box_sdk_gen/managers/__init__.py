@@ -1,169 +1,538 @@
-from box_sdk_gen.managers.authorization import *
+from typing import TYPE_CHECKING
+
+from box_sdk_gen.internal.lazy_imports import lazy_package_attributes
+
+_LAZY_ATTRIBUTES = {
+    'AuthorizeUserResponseType': 'authorization',
+    'RequestAccessTokenGrantType': 'authorization',
+    'RequestAccessTokenSubjectTokenType': 'authorization',
+    'RequestAccessTokenActorTokenType': 'authorization',
+    'RequestAccessTokenBoxSubjectType': 'authorization',
+    'RefreshAccessTokenGrantType': 'authorization',
+    'AuthorizationManager': 'authorization',
+    'UpdateFileByIdParent': 'files',
+    'UpdateFileByIdSharedLinkAccessField': 'files',
+    'UpdateFileByIdSharedLinkPermissionsField': 'files',
+    'UpdateFileByIdSharedLink': 'files',
+    'UpdateFileByIdLockAccessField': 'files',
+    'UpdateFileByIdLock': 'files',
+    'UpdateFileByIdPermissionsCanDownloadField': 'files',
+    'UpdateFileByIdPermissions': 'files',
+    'UpdateFileByIdCollections': 'files',
+    'CopyFileParent': 'files',
+    'GetFileThumbnailUrlExtension': 'files',
+    'GetFileThumbnailByIdExtension': 'files',
+    'FilesManager': 'files',
+    'RestoreFileFromTrashParent': 'trashed_files',
+    'TrashedFilesManager': 'trashed_files',
+    'AppItemAssociationsManager': 'app_item_associations',
+    'DownloadsManager': 'downloads',
+    'UploadFileVersionAttributes': 'uploads',
+    'PreflightFileUploadCheckParent': 'uploads',
+    'UploadFileAttributesParentField': 'uploads',
+    'UploadFileAttributes': 'uploads',
+    'UploadWithPreflightCheckAttributesParentField': 'uploads',
+    'UploadWithPreflightCheckAttributes': 'uploads',
+    'UploadsManager': 'uploads',
+    'ChunkedUploadsManager': 'chunked_uploads',
+    'GetCollaborationsStatus': 'list_collaborations',
+    'ListCollaborationsManager': 'list_collaborations',
+    'CreateCommentItemTypeField': 'comments',
+    'CreateCommentItem': 'comments',
+    'CommentsManager': 'comments',
+    'CreateTaskItemTypeField': 'tasks',
+    'CreateTaskItem': 'tasks',
+    'CreateTaskAction': 'tasks',
+    'CreateTaskCompletionRule': 'tasks',
+    'UpdateTaskByIdAction': 'tasks',
+    'UpdateTaskByIdCompletionRule': 'tasks',
+    'TasksManager': 'tasks',
+    'PromoteFileVersionType': 'file_versions',
+    'FileVersionsManager': 'file_versions',
+    'GetFileMetadataByIdScope': 'file_metadata',
+    'CreateFileMetadataByIdScope': 'file_metadata',
+    'UpdateFileMetadataByIdScope': 'file_metadata',
+    'UpdateFileMetadataByIdRequestBodyOpField': 'file_metadata',
+    'UpdateFileMetadataByIdRequestBody': 'file_metadata',
+    'DeleteFileMetadataByIdScope': 'file_metadata',
+    'FileMetadataManager': 'file_metadata',
+    'UpdateClassificationOnFileRequestBodyOpField': 'file_classifications',
+    'UpdateClassificationOnFileRequestBodyPathField': 'file_classifications',
+    'UpdateClassificationOnFileRequestBody': 'file_classifications',
+    'FileClassificationsManager': 'file_classifications',
+    'UpdateBoxSkillCardsOnFileRequestBodyOpField': 'skills',
+    'UpdateBoxSkillCardsOnFileRequestBody': 'skills',
+    'UpdateAllSkillCardsOnFileStatus': 'skills',
+    'UpdateAllSkillCardsOnFileMetadata': 'skills',
+    'UpdateAllSkillCardsOnFileFileTypeField': 'skills',
+    'UpdateAllSkillCardsOnFileFile': 'skills',
+    'UpdateAllSkillCardsOnFileFileVersionTypeField': 'skills',
+    'UpdateAllSkillCardsOnFileFileVersion': 'skills',
+    'UpdateAllSkillCardsOnFileUsage': 'skills',
+    'SkillsManager': 'skills',
+    'UpdateFileWatermarkWatermarkImprintField': 'file_watermarks',
+    'UpdateFileWatermarkWatermark': 'file_watermarks',
+    'FileWatermarksManager': 'file_watermarks',
+    'UpdateFileRequestByIdStatus': 'file_requests',
+    'CreateFileRequestCopyFolderTypeField': 'file_requests',
+    'CreateFileRequestCopyFolder': 'file_requests',
+    'CreateFileRequestCopyStatus': 'file_requests',
+    'FileRequestsManager': 'file_requests',
+    'GetFolderByIdSort': 'folders',
+    'GetFolderByIdDirection': 'folders',
+    'UpdateFolderByIdSyncState': 'folders',
+    'UpdateFolderByIdParent': 'folders',
+    'UpdateFolderByIdSharedLinkAccessField': 'folders',
+    'UpdateFolderByIdSharedLinkPermissionsField': 'folders',
+    'UpdateFolderByIdSharedLink': 'folders',
+    'UpdateFolderByIdFolderUploadEmailAccessField': 'folders',
+    'UpdateFolderByIdFolderUploadEmail': 'folders',
+    'UpdateFolderByIdCollections': 'folders',
+    'GetFolderItemsSort': 'folders',
+    'GetFolderItemsDirection': 'folders',
+    'CreateFolderParent': 'folders',
+    'CreateFolderFolderUploadEmailAccessField': 'folders',
+    'CreateFolderFolderUploadEmail': 'folders',
+    'CreateFolderSyncState': 'folders',
+    'CopyFolderParent': 'folders',
+    'FoldersManager': 'folders',
+    'RestoreFolderFromTrashParent': 'trashed_folders',
+    'TrashedFoldersManager': 'trashed_folders',
+    'GetFolderMetadataByIdScope': 'folder_metadata',
+    'CreateFolderMetadataByIdScope': 'folder_metadata',
+    'UpdateFolderMetadataByIdScope': 'folder_metadata',
+    'UpdateFolderMetadataByIdRequestBodyOpField': 'folder_metadata',
+    'UpdateFolderMetadataByIdRequestBody': 'folder_metadata',
+    'DeleteFolderMetadataByIdScope': 'folder_metadata',
+    'FolderMetadataManager': 'folder_metadata',
+    'UpdateClassificationOnFolderRequestBodyOpField': 'folder_classifications',
+    'UpdateClassificationOnFolderRequestBodyPathField': 'folder_classifications',
+    'UpdateClassificationOnFolderRequestBody': 'folder_classifications',
+    'FolderClassificationsManager': 'folder_classifications',
+    'GetTrashedItemsDirection': 'trashed_items',
+    'GetTrashedItemsSort': 'trashed_items',
+    'TrashedItemsManager': 'trashed_items',
+    'UpdateFolderWatermarkWatermarkImprintField': 'folder_watermarks',
+    'UpdateFolderWatermarkWatermark': 'folder_watermarks',
+    'FolderWatermarksManager': 'folder_watermarks',
+    'CreateFolderLockLockedOperations': 'folder_locks',
+    'CreateFolderLockFolder': 'folder_locks',
+    'FolderLocksManager': 'folder_locks',
+    'GetMetadataTemplateScope': 'metadata_templates',
+    'UpdateMetadataTemplateScope': 'metadata_templates',
+    'UpdateMetadataTemplateRequestBodyOpField': 'metadata_templates',
+    'UpdateMetadataTemplateRequestBody': 'metadata_templates',
+    'DeleteMetadataTemplateScope': 'metadata_templates',
+    'CreateMetadataTemplateFieldsTypeField': 'metadata_templates',
+    'CreateMetadataTemplateFieldsOptionsField': 'metadata_templates',
+    'CreateMetadataTemplateFieldsOptionsRulesField': 'metadata_templates',
+    'CreateMetadataTemplateFields': 'metadata_templates',
+    'MetadataTemplatesManager': 'metadata_templates',
+    'AddClassificationRequestBodyOpField': 'classifications',
+    'AddClassificationRequestBodyFieldKeyField': 'classifications',
+    'AddClassificationRequestBodyDataStaticConfigClassificationField': 'classifications',
+    'AddClassificationRequestBodyDataStaticConfigField': 'classifications',
+    'AddClassificationRequestBodyDataField': 'classifications',
+    'AddClassificationRequestBody': 'classifications',
+    'UpdateClassificationRequestBodyOpField': 'classifications',
+    'UpdateClassificationRequestBodyFieldKeyField': 'classifications',
+    'UpdateClassificationRequestBodyDataStaticConfigClassificationField': 'classifications',
+    'UpdateClassificationRequestBodyDataStaticConfigField': 'classifications',
+    'UpdateClassificationRequestBodyDataField': 'classifications',
+    'UpdateClassificationRequestBody': 'classifications',
+    'CreateClassificationTemplateScope': 'classifications',
+    'CreateClassificationTemplateTemplateKey': 'classifications',
+    'CreateClassificationTemplateDisplayName': 'classifications',
+    'CreateClassificationTemplateFieldsTypeField': 'classifications',
+    'CreateClassificationTemplateFieldsKeyField': 'classifications',
+    'CreateClassificationTemplateFieldsDisplayNameField': 'classifications',
+    'CreateClassificationTemplateFieldsOptionsStaticConfigClassificationField': 'classifications',
+    'CreateClassificationTemplateFieldsOptionsStaticConfigField': 'classifications',
+    'CreateClassificationTemplateFieldsOptionsField': 'classifications',
+    'CreateClassificationTemplateFields': 'classifications',
+    'ClassificationsManager': 'classifications',
+    'CreateMetadataCascadePolicyScope': 'metadata_cascade_policies',
+    'ApplyMetadataCascadePolicyConflictResolution': 'metadata_cascade_policies',
+    'MetadataCascadePoliciesManager': 'metadata_cascade_policies',
+    'SearchByMetadataQueryOrderByDirectionField': 'search',
+    'SearchByMetadataQueryOrderBy': 'search',
+    'SearchForContentScope': 'search',
+    'SearchForContentContentTypes': 'search',
+    'SearchForContentType': 'search',
+    'SearchForContentTrashContent': 'search',
+    'SearchForContentSort': 'search',
+    'SearchForContentDirection': 'search',
+    'SearchManager': 'search',
+    'UpdateCollaborationByIdRole': 'user_collaborations',
+    'UpdateCollaborationByIdStatus': 'user_collaborations',
+    'CreateCollaborationItemTypeField': 'user_collaborations',
+    'CreateCollaborationItem': 'user_collaborations',
+    'CreateCollaborationAccessibleByTypeField': 'user_collaborations',
+    'CreateCollaborationAccessibleBy': 'user_collaborations',
+    'CreateCollaborationRole': 'user_collaborations',
+    'UserCollaborationsManager': 'user_collaborations',
+    'CreateTaskAssignmentTaskTypeField': 'task_assignments',
+    'CreateTaskAssignmentTask': 'task_assignments',
+    'CreateTaskAssignmentAssignTo': 'task_assignments',
+    'UpdateTaskAssignmentByIdResolutionState': 'task_assignments',
+    'TaskAssignmentsManager': 'task_assignments',
+    'AddShareLinkToFileSharedLinkAccessField': 'shared_links_files',
+    'AddShareLinkToFileSharedLinkPermissionsField': 'shared_links_files',
+    'AddShareLinkToFileSharedLink': 'shared_links_files',
+    'UpdateSharedLinkOnFileSharedLinkAccessField': 'shared_links_files',
+    'UpdateSharedLinkOnFileSharedLinkPermissionsField': 'shared_links_files',
+    'UpdateSharedLinkOnFileSharedLink': 'shared_links_files',
+    'RemoveSharedLinkFromFileSharedLink': 'shared_links_files',
+    'SharedLinksFilesManager': 'shared_links_files',
+    'AddShareLinkToFolderSharedLinkAccessField': 'shared_links_folders',
+    'AddShareLinkToFolderSharedLinkPermissionsField': 'shared_links_folders',
+    'AddShareLinkToFolderSharedLink': 'shared_links_folders',
+    'UpdateSharedLinkOnFolderSharedLinkAccessField': 'shared_links_folders',
+    'UpdateSharedLinkOnFolderSharedLinkPermissionsField': 'shared_links_folders',
+    'UpdateSharedLinkOnFolderSharedLink': 'shared_links_folders',
+    'RemoveSharedLinkFromFolderSharedLink': 'shared_links_folders',
+    'SharedLinksFoldersManager': 'shared_links_folders',
+    'CreateWebLinkParent': 'web_links',
+    'UpdateWebLinkByIdParent': 'web_links',
+    'UpdateWebLinkByIdSharedLinkAccessField': 'web_links',
+    'UpdateWebLinkByIdSharedLink': 'web_links',
+    'WebLinksManager': 'web_links',
+    'RestoreWeblinkFromTrashParent': 'trashed_web_links',
+    'TrashedWebLinksManager': 'trashed_web_links',
+    'AddShareLinkToWebLinkSharedLinkAccessField': 'shared_links_web_links',
+    'AddShareLinkToWebLinkSharedLinkPermissionsField': 'shared_links_web_links',
+    'AddShareLinkToWebLinkSharedLink': 'shared_links_web_links',
+    'UpdateSharedLinkOnWebLinkSharedLinkAccessField': 'shared_links_web_links',
+    'UpdateSharedLinkOnWebLinkSharedLinkPermissionsField': 'shared_links_web_links',
+    'UpdateSharedLinkOnWebLinkSharedLink': 'shared_links_web_links',
+    'RemoveSharedLinkFromWebLinkSharedLink': 'shared_links_web_links',
+    'SharedLinksWebLinksManager': 'shared_links_web_links',
+    'SharedLinksAppItemsManager': 'shared_links_app_items',
+    'GetUsersUserType': 'users',
+    'CreateUserRole': 'users',
+    'CreateUserStatus': 'users',
+    'UpdateUserByIdRole': 'users',
+    'UpdateUserByIdStatus': 'users',
+    'UpdateUserByIdNotificationEmail': 'users',
+    'UsersManager': 'users',
+    'SessionTerminationManager': 'session_termination',
+    'AvatarsManager': 'avatars',
+    'TransferOwnedFolderOwnedBy': 'transfer',
+    'TransferManager': 'transfer',
+    'EmailAliasesManager': 'email_aliases',
+    'CreateGroupMembershipUser': 'memberships',
+    'CreateGroupMembershipGroup': 'memberships',
+    'CreateGroupMembershipRole': 'memberships',
+    'UpdateGroupMembershipByIdRole': 'memberships',
+    'MembershipsManager': 'memberships',
+    'CreateInviteEnterprise': 'invites',
+    'CreateInviteActionableBy': 'invites',
+    'InvitesManager': 'invites',
+    'CreateGroupInvitabilityLevel': 'groups',
+    'CreateGroupMemberViewabilityLevel': 'groups',
+    'UpdateGroupByIdInvitabilityLevel': 'groups',
+    'UpdateGroupByIdMemberViewabilityLevel': 'groups',
+    'GroupsManager': 'groups',
+    'CreateWebhookTargetTypeField': 'webhooks',
+    'CreateWebhookTarget': 'webhooks',
+    'CreateWebhookTriggers': 'webhooks',
+    'UpdateWebhookByIdTargetTypeField': 'webhooks',
+    'UpdateWebhookByIdTarget': 'webhooks',
+    'UpdateWebhookByIdTriggers': 'webhooks',
+    'WebhooksManager': 'webhooks',
+    'GetEventsStreamType': 'events',
+    'GetEventsEventType': 'events',
+    'GetEventStreamQueryParamsStreamTypeField': 'events',
+    'GetEventStreamQueryParamsEventTypeField': 'events',
+    'GetEventStreamQueryParams': 'events',
+    'GetEventStreamHeaders': 'events',
+    'EventsManager': 'events',
+    'CollectionsManager': 'collections',
+    'RecentItemsManager': 'recent_items',
+    'GetRetentionPoliciesPolicyType': 'retention_policies',
+    'CreateRetentionPolicyPolicyType': 'retention_policies',
+    'CreateRetentionPolicyDispositionAction': 'retention_policies',
+    'CreateRetentionPolicyRetentionType': 'retention_policies',
+    'RetentionPoliciesManager': 'retention_policies',
+    'GetRetentionPolicyAssignmentsType': 'retention_policy_assignments',
+    'CreateRetentionPolicyAssignmentAssignToTypeField': 'retention_policy_assignments',
+    'CreateRetentionPolicyAssignmentAssignTo': 'retention_policy_assignments',
+    'CreateRetentionPolicyAssignmentFilterFields': 'retention_policy_assignments',
+    'RetentionPolicyAssignmentsManager': 'retention_policy_assignments',
+    'LegalHoldPoliciesManager': 'legal_hold_policies',
+    'GetLegalHoldPolicyAssignmentsAssignToType': 'legal_hold_policy_assignments',
+    'CreateLegalHoldPolicyAssignmentAssignToTypeField': 'legal_hold_policy_assignments',
+    'CreateLegalHoldPolicyAssignmentAssignTo': 'legal_hold_policy_assignments',
+    'LegalHoldPolicyAssignmentsManager': 'legal_hold_policy_assignments',
+    'GetFileVersionRetentionsDispositionAction': 'file_version_retentions',
+    'FileVersionRetentionsManager': 'file_version_retentions',
+    'FileVersionLegalHoldsManager': 'file_version_legal_holds',
+    'UpdateShieldInformationBarrierStatusStatus': 'shield_information_barriers',
+    'ShieldInformationBarriersManager': 'shield_information_barriers',
+    'ShieldInformationBarrierReportsManager': 'shield_information_barrier_reports',
+    'ShieldInformationBarrierSegmentsManager': 'shield_information_barrier_segments',
+    'CreateShieldInformationBarrierSegmentMemberType': 'shield_information_barrier_segment_members',
+    'CreateShieldInformationBarrierSegmentMemberShieldInformationBarrierSegmentTypeField': 'shield_information_barrier_segment_members',
+    'CreateShieldInformationBarrierSegmentMemberShieldInformationBarrierSegment': 'shield_information_barrier_segment_members',
+    'ShieldInformationBarrierSegmentMembersManager': 'shield_information_barrier_segment_members',
+    'CreateShieldInformationBarrierSegmentRestrictionType': 'shield_information_barrier_segment_restrictions',
+    'CreateShieldInformationBarrierSegmentRestrictionShieldInformationBarrierSegmentTypeField': 'shield_information_barrier_segment_restrictions',
+    'CreateShieldInformationBarrierSegmentRestrictionShieldInformationBarrierSegment': 'shield_information_barrier_segment_restrictions',
+    'CreateShieldInformationBarrierSegmentRestrictionRestrictedSegmentTypeField': 'shield_information_barrier_segment_restrictions',
+    'CreateShieldInformationBarrierSegmentRestrictionRestrictedSegment': 'shield_information_barrier_segment_restrictions',
+    'ShieldInformationBarrierSegmentRestrictionsManager': 'shield_information_barrier_segment_restrictions',
+    'GetEnterpriseDevicePinnersDirection': 'device_pinners',
+    'DevicePinnersManager': 'device_pinners',
+    'GetTermsOfServiceTosType': 'terms_of_services',
+    'CreateTermsOfServiceStatus': 'terms_of_services',
+    'CreateTermsOfServiceTosType': 'terms_of_services',
+    'UpdateTermsOfServiceByIdStatus': 'terms_of_services',
+    'TermsOfServicesManager': 'terms_of_services',
+    'CreateTermsOfServiceStatusForUserTosTypeField': 'terms_of_service_user_statuses',
+    'CreateTermsOfServiceStatusForUserTos': 'terms_of_service_user_statuses',
+    'CreateTermsOfServiceStatusForUserUserTypeField': 'terms_of_service_user_statuses',
+    'CreateTermsOfServiceStatusForUserUser': 'terms_of_service_user_statuses',
+    'TermsOfServiceUserStatusesManager': 'terms_of_service_user_statuses',
+    'CreateCollaborationWhitelistEntryDirection': 'collaboration_allowlist_entries',
+    'CollaborationAllowlistEntriesManager': 'collaboration_allowlist_entries',
+    'CreateCollaborationWhitelistExemptTargetUser': 'collaboration_allowlist_exempt_targets',
+    'CollaborationAllowlistExemptTargetsManager': 'collaboration_allowlist_exempt_targets',
+    'StoragePoliciesManager': 'storage_policies',
+    'GetStoragePolicyAssignmentsResolvedForType': 'storage_policy_assignments',
+    'CreateStoragePolicyAssignmentStoragePolicyTypeField': 'storage_policy_assignments',
+    'CreateStoragePolicyAssignmentStoragePolicy': 'storage_policy_assignments',
+    'CreateStoragePolicyAssignmentAssignedToTypeField': 'storage_policy_assignments',
+    'CreateStoragePolicyAssignmentAssignedTo': 'storage_policy_assignments',
+    'UpdateStoragePolicyAssignmentByIdStoragePolicyTypeField': 'storage_policy_assignments',
+    'UpdateStoragePolicyAssignmentByIdStoragePolicy': 'storage_policy_assignments',
+    'StoragePolicyAssignmentsManager': 'storage_policy_assignments',
+    'CreateZipDownloadItemsTypeField': 'zip_downloads',
+    'CreateZipDownloadItems': 'zip_downloads',
+    'DownloadZipItemsTypeField': 'zip_downloads',
+    'DownloadZipItems': 'zip_downloads',
+    'ZipDownloadsManager': 'zip_downloads',
+    'CreateSignRequestSignatureColor': 'sign_requests',
+    'SignRequestsManager': 'sign_requests',
+    'StartWorkflowType': 'workflows',
+    'StartWorkflowFlow': 'workflows',
+    'StartWorkflowFilesTypeField': 'workflows',
+    'StartWorkflowFiles': 'workflows',
+    'StartWorkflowFolderTypeField': 'workflows',
+    'StartWorkflowFolder': 'workflows',
+    'WorkflowsManager': 'workflows',
+    'SignTemplatesManager': 'sign_templates',
+    'GetSlackIntegrationMappingPartnerItemType': 'integration_mappings',
+    'GetSlackIntegrationMappingBoxItemType': 'integration_mappings',
+    'GetTeamsIntegrationMappingPartnerItemType': 'integration_mappings',
+    'GetTeamsIntegrationMappingBoxItemType': 'integration_mappings',
+    'IntegrationMappingsManager': 'integration_mappings',
+    'CreateAiAskMode': 'ai',
+    'CreateAiTextGenItemsTypeField': 'ai',
+    'CreateAiTextGenItems': 'ai',
+    'GetAiAgentDefaultConfigMode': 'ai',
+    'CreateAiExtractStructuredMetadataTemplateTypeField': 'ai',
+    'CreateAiExtractStructuredMetadataTemplate': 'ai',
+    'CreateAiExtractStructuredFieldsOptionsField': 'ai',
+    'CreateAiExtractStructuredFields': 'ai',
+    'AiManager': 'ai',
+    'CreateAiAgentType': 'ai_studio',
+    'UpdateAiAgentByIdType': 'ai_studio',
+    'AiStudioManager': 'ai_studio',
+    'MetadataTaxonomiesManager': 'metadata_taxonomies',
+    'DocgenTemplateManager': 'docgen_template',
+    'CreateDocgenBatchV2025R0DestinationFolderTypeField': 'docgen',
+    'CreateDocgenBatchV2025R0DestinationFolder': 'docgen',
+    'DocgenManager': 'docgen',
+    'EnterpriseConfigurationsManager': 'enterprise_configurations',
+    'GetHubsV2025R0Direction': 'hubs',
+    'GetEnterpriseHubsV2025R0Direction': 'hubs',
+    'UpdateHubByIdV2025R0CopyHubAccess': 'hubs',
+    'HubsManager': 'hubs',
+    'CreateHubCollaborationV2025R0HubTypeField': 'hub_collaborations',
+    'CreateHubCollaborationV2025R0Hub': 'hub_collaborations',
+    'CreateHubCollaborationV2025R0AccessibleBy': 'hub_collaborations',
+    'HubCollaborationsManager': 'hub_collaborations',
+    'HubItemsManager': 'hub_items',
+    'HubDocumentManager': 'hub_document',
+    'ShieldListsManager': 'shield_lists',
+    'ArchivesManager': 'archives',
+    'ExternalUsersManager': 'external_users',
+    'AutomateWorkflowsManager': 'automate_workflows',
+    'CreateNoteConvertV2026R0ContentFormat': 'notes',
+    'NotesManager': 'notes',
+}
 
-from box_sdk_gen.managers.files import *
+__all__ = list(_LAZY_ATTRIBUTES)
 
-from box_sdk_gen.managers.trashed_files import *
+__getattr__, __dir__ = lazy_package_attributes(__name__, _LAZY_ATTRIBUTES)
 
-from box_sdk_gen.managers.app_item_associations import *
+if TYPE_CHECKING:
+    from box_sdk_gen.managers.authorization import *
 
-from box_sdk_gen.managers.downloads import *
+    from box_sdk_gen.managers.files import *
 
-from box_sdk_gen.managers.uploads import *
+    from box_sdk_gen.managers.trashed_files import *
 
-from box_sdk_gen.managers.chunked_uploads import *
+    from box_sdk_gen.managers.app_item_associations import *
 
-from box_sdk_gen.managers.list_collaborations import *
+    from box_sdk_gen.managers.downloads import *
 
-from box_sdk_gen.managers.comments import *
+    from box_sdk_gen.managers.uploads import *
 
-from box_sdk_gen.managers.tasks import *
+    from box_sdk_gen.managers.chunked_uploads import *
 
-from box_sdk_gen.managers.file_versions import *
+    from box_sdk_gen.managers.list_collaborations import *
 
-from box_sdk_gen.managers.file_metadata import *
+    from box_sdk_gen.managers.comments import *
 
-from box_sdk_gen.managers.file_classifications import *
+    from box_sdk_gen.managers.tasks import *
 
-from box_sdk_gen.managers.skills import *
+    from box_sdk_gen.managers.file_versions import *
 
-from box_sdk_gen.managers.file_watermarks import *
+    from box_sdk_gen.managers.file_metadata import *
 
-from box_sdk_gen.managers.file_requests import *
+    from box_sdk_gen.managers.file_classifications import *
 
-from box_sdk_gen.managers.folders import *
+    from box_sdk_gen.managers.skills import *
 
-from box_sdk_gen.managers.trashed_folders import *
+    from box_sdk_gen.managers.file_watermarks import *
 
-from box_sdk_gen.managers.folder_metadata import *
+    from box_sdk_gen.managers.file_requests import *
 
-from box_sdk_gen.managers.folder_classifications import *
+    from box_sdk_gen.managers.folders import *
 
-from box_sdk_gen.managers.trashed_items import *
+    from box_sdk_gen.managers.trashed_folders import *
 
-from box_sdk_gen.managers.folder_watermarks import *
+    from box_sdk_gen.managers.folder_metadata import *
 
-from box_sdk_gen.managers.folder_locks import *
+    from box_sdk_gen.managers.folder_classifications import *
 
-from box_sdk_gen.managers.metadata_templates import *
+    from box_sdk_gen.managers.trashed_items import *
 
-from box_sdk_gen.managers.classifications import *
+    from box_sdk_gen.managers.folder_watermarks import *
 
-from box_sdk_gen.managers.metadata_cascade_policies import *
+    from box_sdk_gen.managers.folder_locks import *
 
-from box_sdk_gen.managers.search import *
+    from box_sdk_gen.managers.metadata_templates import *
 
-from box_sdk_gen.managers.user_collaborations import *
+    from box_sdk_gen.managers.classifications import *
 
-from box_sdk_gen.managers.task_assignments import *
+    from box_sdk_gen.managers.metadata_cascade_policies import *
 
-from box_sdk_gen.managers.shared_links_files import *
+    from box_sdk_gen.managers.search import *
 
-from box_sdk_gen.managers.shared_links_folders import *
+    from box_sdk_gen.managers.user_collaborations import *
 
-from box_sdk_gen.managers.web_links import *
+    from box_sdk_gen.managers.task_assignments import *
 
-from box_sdk_gen.managers.trashed_web_links import *
+    from box_sdk_gen.managers.shared_links_files import *
 
-from box_sdk_gen.managers.shared_links_web_links import *
+    from box_sdk_gen.managers.shared_links_folders import *
 
-from box_sdk_gen.managers.shared_links_app_items import *
+    from box_sdk_gen.managers.web_links import *
 
-from box_sdk_gen.managers.users import *
+    from box_sdk_gen.managers.trashed_web_links import *
 
-from box_sdk_gen.managers.session_termination import *
+    from box_sdk_gen.managers.shared_links_web_links import *
 
-from box_sdk_gen.managers.avatars import *
+    from box_sdk_gen.managers.shared_links_app_items import *
 
-from box_sdk_gen.managers.transfer import *
+    from box_sdk_gen.managers.users import *
 
-from box_sdk_gen.managers.email_aliases import *
+    from box_sdk_gen.managers.session_termination import *
 
-from box_sdk_gen.managers.memberships import *
+    from box_sdk_gen.managers.avatars import *
 
-from box_sdk_gen.managers.invites import *
+    from box_sdk_gen.managers.transfer import *
 
-from box_sdk_gen.managers.groups import *
+    from box_sdk_gen.managers.email_aliases import *
 
-from box_sdk_gen.managers.webhooks import *
+    from box_sdk_gen.managers.memberships import *
 
-from box_sdk_gen.managers.events import *
+    from box_sdk_gen.managers.invites import *
 
-from box_sdk_gen.managers.collections import *
+    from box_sdk_gen.managers.groups import *
 
-from box_sdk_gen.managers.recent_items import *
+    from box_sdk_gen.managers.webhooks import *
 
-from box_sdk_gen.managers.retention_policies import *
+    from box_sdk_gen.managers.events import *
 
-from box_sdk_gen.managers.retention_policy_assignments import *
+    from box_sdk_gen.managers.collections import *
 
-from box_sdk_gen.managers.legal_hold_policies import *
+    from box_sdk_gen.managers.recent_items import *
 
-from box_sdk_gen.managers.legal_hold_policy_assignments import *
+    from box_sdk_gen.managers.retention_policies import *
 
-from box_sdk_gen.managers.file_version_retentions import *
+    from box_sdk_gen.managers.retention_policy_assignments import *
 
-from box_sdk_gen.managers.file_version_legal_holds import *
+    from box_sdk_gen.managers.legal_hold_policies import *
 
-from box_sdk_gen.managers.shield_information_barriers import *
+    from box_sdk_gen.managers.legal_hold_policy_assignments import *
 
-from box_sdk_gen.managers.shield_information_barrier_reports import *
+    from box_sdk_gen.managers.file_version_retentions import *
 
-from box_sdk_gen.managers.shield_information_barrier_segments import *
+    from box_sdk_gen.managers.file_version_legal_holds import *
 
-from box_sdk_gen.managers.shield_information_barrier_segment_members import *
+    from box_sdk_gen.managers.shield_information_barriers import *
 
-from box_sdk_gen.managers.shield_information_barrier_segment_restrictions import *
+    from box_sdk_gen.managers.shield_information_barrier_reports import *
 
-from box_sdk_gen.managers.device_pinners import *
+    from box_sdk_gen.managers.shield_information_barrier_segments import *
 
-from box_sdk_gen.managers.terms_of_services import *
+    from box_sdk_gen.managers.shield_information_barrier_segment_members import *
 
-from box_sdk_gen.managers.terms_of_service_user_statuses import *
+    from box_sdk_gen.managers.shield_information_barrier_segment_restrictions import *
 
-from box_sdk_gen.managers.collaboration_allowlist_entries import *
+    from box_sdk_gen.managers.device_pinners import *
 
-from box_sdk_gen.managers.collaboration_allowlist_exempt_targets import *
+    from box_sdk_gen.managers.terms_of_services import *
 
-from box_sdk_gen.managers.storage_policies import *
+    from box_sdk_gen.managers.terms_of_service_user_statuses import *
 
-from box_sdk_gen.managers.storage_policy_assignments import *
+    from box_sdk_gen.managers.collaboration_allowlist_entries import *
 
-from box_sdk_gen.managers.zip_downloads import *
+    from box_sdk_gen.managers.collaboration_allowlist_exempt_targets import *
 
-from box_sdk_gen.managers.sign_requests import *
+    from box_sdk_gen.managers.storage_policies import *
 
-from box_sdk_gen.managers.workflows import *
+    from box_sdk_gen.managers.storage_policy_assignments import *
 
-from box_sdk_gen.managers.sign_templates import *
+    from box_sdk_gen.managers.zip_downloads import *
 
-from box_sdk_gen.managers.integration_mappings import *
+    from box_sdk_gen.managers.sign_requests import *
 
-from box_sdk_gen.managers.ai import *
+    from box_sdk_gen.managers.workflows import *
 
-from box_sdk_gen.managers.ai_studio import *
+    from box_sdk_gen.managers.sign_templates import *
 
-from box_sdk_gen.managers.metadata_taxonomies import *
+    from box_sdk_gen.managers.integration_mappings import *
 
-from box_sdk_gen.managers.docgen_template import *
+    from box_sdk_gen.managers.ai import *
 
-from box_sdk_gen.managers.docgen import *
+    from box_sdk_gen.managers.ai_studio import *
 
-from box_sdk_gen.managers.enterprise_configurations import *
+    from box_sdk_gen.managers.metadata_taxonomies import *
 
-from box_sdk_gen.managers.hubs import *
+    from box_sdk_gen.managers.docgen_template import *
 
-from box_sdk_gen.managers.hub_collaborations import *
+    from box_sdk_gen.managers.docgen import *
 
-from box_sdk_gen.managers.hub_items import *
+    from box_sdk_gen.managers.enterprise_configurations import *
 
-from box_sdk_gen.managers.hub_document import *
+    from box_sdk_gen.managers.hubs import *
 
-from box_sdk_gen.managers.shield_lists import *
+    from box_sdk_gen.managers.hub_collaborations import *
 
-from box_sdk_gen.managers.archives import *
+    from box_sdk_gen.managers.hub_items import *
 
-from box_sdk_gen.managers.external_users import *
+    from box_sdk_gen.managers.hub_document import *
 
-from box_sdk_gen.managers.automate_workflows import *
+    from box_sdk_gen.managers.shield_lists import *
 
-from box_sdk_gen.managers.notes import *
+    from box_sdk_gen.managers.archives import *
+
+    from box_sdk_gen.managers.external_users import *
+
+    from box_sdk_gen.managers.automate_workflows import *
+
+    from box_sdk_gen.managers.notes import *
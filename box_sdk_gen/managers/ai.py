@@ -80,6 +80,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -246,6 +248,7 @@ class AiManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def create_ai_ask(
         self,
         mode: CreateAiAskMode,
@@ -299,22 +302,21 @@ class AiManager:
             'ai_agent': ai_agent,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join([self.network_session.base_urls.base_url, '/2.0/ai/ask']),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/ai/ask']),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         if to_string(response.status) == '204':
             return None
         return deserialize(response.data, AiResponseFull)
 
+    @single_request
     def create_ai_text_gen(
         self,
         prompt: str,
@@ -348,22 +350,19 @@ class AiManager:
             'ai_agent': ai_agent,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [self.network_session.base_urls.base_url, '/2.0/ai/text_gen']
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/ai/text_gen']),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, AiResponse)
 
+    @single_request
     def get_ai_agent_default_config(
         self,
         mode: GetAiAgentDefaultConfigMode,
@@ -394,21 +393,20 @@ class AiManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [self.network_session.base_urls.base_url, '/2.0/ai_agent_default']
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [self.network_session.base_urls.base_url, '/2.0/ai_agent_default']
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, AiAgent)
 
+    @single_request
     def create_ai_extract(
         self,
         prompt: str,
@@ -436,22 +434,19 @@ class AiManager:
             extra_headers = {}
         request_body: Dict = {'prompt': prompt, 'items': items, 'ai_agent': ai_agent}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [self.network_session.base_urls.base_url, '/2.0/ai/extract']
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/ai/extract']),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, AiResponse)
 
+    @single_request
     def create_ai_extract_structured(
         self,
         items: List[AiItemBase],
@@ -508,21 +503,19 @@ class AiManager:
             'taxonomy_sources': taxonomy_sources,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/ai/extract_structured',
-                    ]
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/ai/extract_structured',
+                ]
+            ),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, AiExtractStructuredResponse)
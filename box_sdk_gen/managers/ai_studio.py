@@ -44,6 +44,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -75,6 +77,7 @@ class AiStudioManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_ai_agents(
         self,
         *,
@@ -116,21 +119,18 @@ class AiStudioManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [self.network_session.base_urls.base_url, '/2.0/ai_agents']
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/ai_agents']),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, AiMultipleAgentResponse)
 
+    @single_request
     def create_ai_agent(
         self,
         name: str,
@@ -173,22 +173,19 @@ class AiStudioManager:
             'extract': extract,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [self.network_session.base_urls.base_url, '/2.0/ai_agents']
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/ai_agents']),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, AiSingleAgentResponseFull)
 
+    @single_request
     def update_ai_agent_by_id(
         self,
         agent_id: str,
@@ -235,26 +232,25 @@ class AiStudioManager:
             'extract': extract,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/ai_agents/',
-                        to_string(agent_id),
-                    ]
-                ),
-                method='PUT',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/ai_agents/',
+                    to_string(agent_id),
+                ]
+            ),
+            method='PUT',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, AiSingleAgentResponseFull)
 
+    @single_request
     def get_ai_agent_by_id(
         self,
         agent_id: str,
@@ -276,25 +272,24 @@ class AiStudioManager:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/ai_agents/',
-                        to_string(agent_id),
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/ai_agents/',
+                    to_string(agent_id),
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, AiSingleAgentResponseFull)
 
+    @single_request
     def delete_ai_agent_by_id(
         self, agent_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
     ) -> None:
@@ -309,20 +304,18 @@ class AiStudioManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/ai_agents/',
-                        to_string(agent_id),
-                    ]
-                ),
-                method='DELETE',
-                headers=headers_map,
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/ai_agents/',
+                    to_string(agent_id),
+                ]
+            ),
+            method='DELETE',
+            headers=headers_map,
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
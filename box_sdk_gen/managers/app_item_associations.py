@@ -22,6 +22,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -45,6 +47,7 @@ class AppItemAssociationsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_file_app_item_associations(
         self,
         file_id: str,
@@ -99,26 +102,25 @@ class AppItemAssociationsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/files/',
-                        to_string(file_id),
-                        '/app_item_associations',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/files/',
+                    to_string(file_id),
+                    '/app_item_associations',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, AppItemAssociations)
 
+    @single_request
     def get_folder_app_item_associations(
         self,
         folder_id: str,
@@ -176,22 +178,20 @@ class AppItemAssociationsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/folders/',
-                        to_string(folder_id),
-                        '/app_item_associations',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/folders/',
+                    to_string(folder_id),
+                    '/app_item_associations',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, AppItemAssociations)
@@ -30,6 +30,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -53,6 +55,7 @@ class ArchivesManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_archives_v2025_r0(
         self,
         *,
@@ -84,19 +87,18 @@ class ArchivesManager:
         headers_map: Dict[str, str] = prepare_params(
             {'box-version': to_string(box_version), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join([self.network_session.base_urls.base_url, '/2.0/archives']),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/archives']),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, ArchivesV2025R0)
 
+    @single_request
     def create_archive_v2025_r0(
         self,
         name: str,
@@ -132,20 +134,19 @@ class ArchivesManager:
         headers_map: Dict[str, str] = prepare_params(
             {'box-version': to_string(box_version), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join([self.network_session.base_urls.base_url, '/2.0/archives']),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/archives']),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, ArchiveV2025R0)
 
+    @single_request
     def delete_archive_by_id_v2025_r0(
         self,
         archive_id: str,
@@ -180,24 +181,23 @@ class ArchivesManager:
         headers_map: Dict[str, str] = prepare_params(
             {'box-version': to_string(box_version), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/archives/',
-                        to_string(archive_id),
-                    ]
-                ),
-                method='DELETE',
-                headers=headers_map,
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/archives/',
+                    to_string(archive_id),
+                ]
+            ),
+            method='DELETE',
+            headers=headers_map,
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
 
+    @single_request
     def update_archive_by_id_v2025_r0(
         self,
         archive_id: str,
@@ -230,22 +230,20 @@ class ArchivesManager:
         headers_map: Dict[str, str] = prepare_params(
             {'box-version': to_string(box_version), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/archives/',
-                        to_string(archive_id),
-                    ]
-                ),
-                method='PUT',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/archives/',
+                    to_string(archive_id),
+                ]
+            ),
+            method='PUT',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, ArchiveV2025R0)
@@ -40,6 +40,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -100,6 +102,7 @@ class AuthorizationManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def authorize_user(
         self,
         response_type: AuthorizeUserResponseType,
@@ -170,19 +173,18 @@ class AuthorizationManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join([self.network_session.base_urls.oauth_2_url, '/authorize']),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.oauth_2_url, '/authorize']),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
 
+    @single_request
     def request_access_token(
         self,
         grant_type: RequestAccessTokenGrantType,
@@ -324,20 +326,19 @@ class AuthorizationManager:
             'box_shared_link': box_shared_link,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join([self.network_session.base_urls.base_url, '/oauth2/token']),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/x-www-form-urlencoded',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/oauth2/token']),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/x-www-form-urlencoded',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, AccessToken)
 
+    @single_request
     def refresh_access_token(
         self,
         client_id: str,
@@ -369,22 +370,21 @@ class AuthorizationManager:
             'refresh_token': refresh_token,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [self.network_session.base_urls.base_url, '/oauth2/token#refresh']
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/x-www-form-urlencoded',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [self.network_session.base_urls.base_url, '/oauth2/token#refresh']
+            ),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/x-www-form-urlencoded',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, AccessToken)
 
+    @single_request
     def revoke_access_token(
         self,
         *,
@@ -417,18 +417,14 @@ class AuthorizationManager:
             'token': token,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [self.network_session.base_urls.base_url, '/oauth2/revoke']
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/x-www-form-urlencoded',
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/oauth2/revoke']),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/x-www-form-urlencoded',
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
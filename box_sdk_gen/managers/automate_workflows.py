@@ -36,6 +36,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -59,6 +61,7 @@ class AutomateWorkflowsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_automate_workflows_v2026_r0(
         self,
         folder_id: str,
@@ -106,21 +109,20 @@ class AutomateWorkflowsManager:
         headers_map: Dict[str, str] = prepare_params(
             {'box-version': to_string(box_version), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [self.network_session.base_urls.base_url, '/2.0/automate_workflows']
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [self.network_session.base_urls.base_url, '/2.0/automate_workflows']
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, AutomateWorkflowsV2026R0)
 
+    @single_request
     def create_automate_workflow_start_v2026_r0(
         self,
         workflow_id: str,
@@ -153,23 +155,21 @@ class AutomateWorkflowsManager:
         headers_map: Dict[str, str] = prepare_params(
             {'box-version': to_string(box_version), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/automate_workflows/',
-                        to_string(workflow_id),
-                        '/start',
-                    ]
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/automate_workflows/',
+                    to_string(workflow_id),
+                    '/start',
+                ]
+            ),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
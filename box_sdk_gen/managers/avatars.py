@@ -22,6 +22,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -47,6 +49,7 @@ class AvatarsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_user_avatar(
         self, user_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
     ) -> ByteStream:
@@ -61,25 +64,24 @@ class AvatarsManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/users/',
-                        to_string(user_id),
-                        '/avatar',
-                    ]
-                ),
-                method='GET',
-                headers=headers_map,
-                response_format=ResponseFormat.BINARY,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/users/',
+                    to_string(user_id),
+                    '/avatar',
+                ]
+            ),
+            method='GET',
+            headers=headers_map,
+            response_format=ResponseFormat.BINARY,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return response.content
 
+    @single_request
     def create_user_avatar(
         self,
         user_id: str,
@@ -109,34 +111,33 @@ class AvatarsManager:
             'pic_content_type': pic_content_type,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/users/',
-                        to_string(user_id),
-                        '/avatar',
-                    ]
-                ),
-                method='POST',
-                headers=headers_map,
-                multipart_data=[
-                    MultipartItem(
-                        part_name='pic',
-                        file_stream=pic,
-                        file_name=pic_file_name,
-                        content_type=pic_content_type,
-                    )
-                ],
-                content_type='multipart/form-data',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/users/',
+                    to_string(user_id),
+                    '/avatar',
+                ]
+            ),
+            method='POST',
+            headers=headers_map,
+            multipart_data=[
+                MultipartItem(
+                    part_name='pic',
+                    file_stream=pic,
+                    file_name=pic_file_name,
+                    content_type=pic_content_type,
+                )
+            ],
+            content_type='multipart/form-data',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, UserAvatar)
 
+    @single_request
     def delete_user_avatar(
         self, user_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
     ) -> None:
@@ -154,21 +155,19 @@ class AvatarsManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/users/',
-                        to_string(user_id),
-                        '/avatar',
-                    ]
-                ),
-                method='DELETE',
-                headers=headers_map,
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/users/',
+                    to_string(user_id),
+                    '/avatar',
+                ]
+            ),
+            method='DELETE',
+            headers=headers_map,
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
@@ -4,6 +4,8 @@ from typing import Optional
 
 from typing import Dict
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 from box_sdk_gen.serialization.json import serialize
 
 from box_sdk_gen.serialization.json import deserialize
@@ -32,6 +34,10 @@ from box_sdk_gen.schemas.upload_part import UploadPart
 
 from box_sdk_gen.box.errors import BoxSDKError
 
+from box_sdk_gen.box.errors import BoxAPIError
+
+from box_sdk_gen.box.upload_session_storage import UploadSessionStorage
+
 from box_sdk_gen.networking.auth import Authentication
 
 from box_sdk_gen.networking.network import NetworkSession
@@ -40,6 +46,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -50,7 +58,7 @@ from box_sdk_gen.serialization.json import SerializedData
 
 from box_sdk_gen.serialization.json import sd_to_json
 
-from box_sdk_gen.internal.utils import generate_byte_stream_from_buffer
+from box_sdk_gen.internal.utils import BufferByteStream
 
 from box_sdk_gen.internal.utils import hex_to_base_64
 
@@ -58,6 +66,8 @@ from box_sdk_gen.internal.utils import iterate_chunks
 
 from box_sdk_gen.internal.utils import read_byte_stream
 
+from io import SEEK_END
+
 from box_sdk_gen.internal.utils import reduce_iterator
 
 from box_sdk_gen.internal.utils import Hash
@@ -67,6 +77,15 @@ from box_sdk_gen.internal.utils import buffer_length
 from box_sdk_gen.schemas.file_full import FileFull
 
 
+def _read_chunk_buffer(chunk: ByteStream) -> Buffer:
+    if isinstance(chunk, BufferByteStream):
+        # Hands over the memory of the chunks built by `iterate_chunks` instead of copying it
+        buffer = chunk.getbuffer()
+        chunk.seek(0, SEEK_END)
+        return buffer
+    return read_byte_stream(chunk)
+
+
 class _PartAccumulator:
     def __init__(
         self,
@@ -75,12 +94,14 @@ class _PartAccumulator:
         file_size: int,
         upload_part_url: str,
         file_hash: Hash,
+        max_part_retries: int = 0
     ):
         self.last_index = last_index
         self.parts = parts
         self.file_size = file_size
         self.upload_part_url = upload_part_url
         self.file_hash = file_hash
+        self.max_part_retries = max_part_retries
 
 
 class ChunkedUploadsManager:
@@ -95,6 +116,7 @@ class ChunkedUploadsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def create_file_upload_session(
         self,
         folder_id: str,
@@ -122,25 +144,24 @@ class ChunkedUploadsManager:
             'file_name': file_name,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.upload_url,
-                        '/2.0/files/upload_sessions',
-                    ]
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.upload_url,
+                    '/2.0/files/upload_sessions',
+                ]
+            ),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, UploadSession)
 
+    @single_request
     def create_file_upload_session_for_existing_file(
         self,
         file_id: str,
@@ -171,27 +192,26 @@ class ChunkedUploadsManager:
             extra_headers = {}
         request_body: Dict = {'file_size': file_size, 'file_name': file_name}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.upload_url,
-                        '/2.0/files/',
-                        to_string(file_id),
-                        '/upload_sessions',
-                    ]
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.upload_url,
+                    '/2.0/files/',
+                    to_string(file_id),
+                    '/upload_sessions',
+                ]
+            ),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, UploadSession)
 
+    @single_request
     def get_file_upload_session_by_url(
         self, url: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
     ) -> UploadSession:
@@ -214,18 +234,17 @@ class ChunkedUploadsManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=url,
-                method='GET',
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=url,
+            method='GET',
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, UploadSession)
 
+    @single_request
     def get_file_upload_session_by_id(
         self,
         upload_session_id: str,
@@ -246,24 +265,23 @@ class ChunkedUploadsManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.upload_url,
-                        '/2.0/files/upload_sessions/',
-                        to_string(upload_session_id),
-                    ]
-                ),
-                method='GET',
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.upload_url,
+                    '/2.0/files/upload_sessions/',
+                    to_string(upload_session_id),
+                ]
+            ),
+            method='GET',
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, UploadSession)
 
+    @single_request
     def upload_file_part_by_url(
         self,
         url: str,
@@ -329,20 +347,19 @@ class ChunkedUploadsManager:
                 **extra_headers,
             }
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=url,
-                method='PUT',
-                headers=headers_map,
-                file_stream=request_body,
-                content_type='application/octet-stream',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=url,
+            method='PUT',
+            headers=headers_map,
+            file_stream=request_body,
+            content_type='application/octet-stream',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, UploadedPart)
 
+    @single_request
     def upload_file_part(
         self,
         upload_session_id: str,
@@ -403,26 +420,25 @@ class ChunkedUploadsManager:
                 **extra_headers,
             }
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.upload_url,
-                        '/2.0/files/upload_sessions/',
-                        to_string(upload_session_id),
-                    ]
-                ),
-                method='PUT',
-                headers=headers_map,
-                file_stream=request_body,
-                content_type='application/octet-stream',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.upload_url,
+                    '/2.0/files/upload_sessions/',
+                    to_string(upload_session_id),
+                ]
+            ),
+            method='PUT',
+            headers=headers_map,
+            file_stream=request_body,
+            content_type='application/octet-stream',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, UploadedPart)
 
+    @single_request
     def delete_file_upload_session_by_url(
         self, url: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
     ) -> None:
@@ -451,18 +467,17 @@ class ChunkedUploadsManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=url,
-                method='DELETE',
-                headers=headers_map,
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=url,
+            method='DELETE',
+            headers=headers_map,
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
 
+    @single_request
     def delete_file_upload_session_by_id(
         self,
         upload_session_id: str,
@@ -489,24 +504,23 @@ class ChunkedUploadsManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.upload_url,
-                        '/2.0/files/upload_sessions/',
-                        to_string(upload_session_id),
-                    ]
-                ),
-                method='DELETE',
-                headers=headers_map,
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.upload_url,
+                    '/2.0/files/upload_sessions/',
+                    to_string(upload_session_id),
+                ]
+            ),
+            method='DELETE',
+            headers=headers_map,
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
 
+    @single_request
     def get_file_upload_session_parts_by_url(
         self,
         url: str,
@@ -548,19 +562,18 @@ class ChunkedUploadsManager:
             {'offset': to_string(offset), 'limit': to_string(limit)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=url,
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=url,
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, UploadParts)
 
+    @single_request
     def get_file_upload_session_parts(
         self,
         upload_session_id: str,
@@ -597,26 +610,25 @@ class ChunkedUploadsManager:
             {'offset': to_string(offset), 'limit': to_string(limit)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.upload_url,
-                        '/2.0/files/upload_sessions/',
-                        to_string(upload_session_id),
-                        '/parts',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.upload_url,
+                    '/2.0/files/upload_sessions/',
+                    to_string(upload_session_id),
+                    '/parts',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, UploadParts)
 
+    @single_request
     def create_file_upload_session_commit_by_url(
         self,
         url: str,
@@ -682,22 +694,21 @@ class ChunkedUploadsManager:
                 **extra_headers,
             }
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=url,
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=url,
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         if to_string(response.status) == '202':
             return None
         return deserialize(response.data, Files)
 
+    @single_request
     def create_file_upload_session_commit(
         self,
         upload_session_id: str,
@@ -758,24 +769,22 @@ class ChunkedUploadsManager:
                 **extra_headers,
             }
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.upload_url,
-                        '/2.0/files/upload_sessions/',
-                        to_string(upload_session_id),
-                        '/commit',
-                    ]
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.upload_url,
+                    '/2.0/files/upload_sessions/',
+                    to_string(upload_session_id),
+                    '/commit',
+                ]
+            ),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         if to_string(response.status) == '202':
             return None
@@ -784,14 +793,40 @@ class ChunkedUploadsManager:
     def _reducer(self, acc: _PartAccumulator, chunk: ByteStream) -> _PartAccumulator:
         last_index: int = acc.last_index
         parts: List[UploadPart] = acc.parts
-        chunk_buffer: Buffer = read_byte_stream(chunk)
+        chunk_buffer: Buffer = _read_chunk_buffer(chunk)
+        bytes_start: int = last_index + 1
+        part: UploadPart = self._upload_part(
+            acc.upload_part_url,
+            chunk_buffer,
+            bytes_start,
+            acc.file_size,
+            max_retries=acc.max_part_retries,
+        )
+        acc.file_hash.update_hash(chunk_buffer)
+        parts.append(part)
+        acc.last_index = last_index + buffer_length(chunk_buffer)
+        return acc
+
+    def _upload_part(
+        self,
+        upload_part_url: str,
+        chunk_buffer: Buffer,
+        bytes_start: int,
+        file_size: int,
+        *,
+        max_retries: int = 0
+    ) -> UploadPart:
+        """
+        Uploads a single part and verifies the part received by the server,
+        retrying the part up to `max_retries` times without restarting the upload session.
+        Only network errors, server errors and parts received corrupted are retried.
+        """
         hash: Hash = Hash(algorithm=HashName.SHA1)
         hash.update_hash(chunk_buffer)
         sha_1: str = hash.digest_hash('base64')
         digest: str = ''.join(['sha=', sha_1])
         chunk_size: int = buffer_length(chunk_buffer)
-        bytes_start: int = last_index + 1
-        bytes_end: int = last_index + chunk_size
+        bytes_end: int = bytes_start + chunk_size - 1
         content_range: str = ''.join(
             [
                 'bytes ',
@@ -799,31 +834,141 @@ class ChunkedUploadsManager:
                 '-',
                 to_string(bytes_end),
                 '/',
-                to_string(acc.file_size),
+                to_string(file_size),
             ]
         )
-        uploaded_part: UploadedPart = self.upload_file_part_by_url(
-            acc.upload_part_url,
-            generate_byte_stream_from_buffer(chunk_buffer),
-            digest,
-            content_range,
-        )
-        part: UploadPart = uploaded_part.part
-        part_sha_1: str = hex_to_base_64(part.sha_1)
-        assert part_sha_1 == sha_1
-        assert part.size == chunk_size
-        assert part.offset == bytes_start
-        acc.file_hash.update_hash(chunk_buffer)
-        return _PartAccumulator(
-            last_index=bytes_end,
-            parts=parts + [part],
-            file_size=acc.file_size,
-            upload_part_url=acc.upload_part_url,
-            file_hash=acc.file_hash,
-        )
+        attempt: int = 0
+        while True:
+            try:
+                uploaded_part: UploadedPart = self.upload_file_part_by_url(
+                    upload_part_url,
+                    BufferByteStream(chunk_buffer),
+                    digest,
+                    content_range,
+                )
+                part: UploadPart = uploaded_part.part
+                if (
+                    hex_to_base_64(part.sha_1) != sha_1 or
+                    part.size != chunk_size or
+                    part.offset != bytes_start
+                ):
+                    raise BoxSDKError(
+                        message=''.join(
+                            [
+                                'Part received by the server does not match uploaded range ',
+                                content_range,
+                            ]
+                        )
+                    )
+                return part
+            except BoxSDKError as error:
+                # Client errors, e.g. of an expired upload session, would fail again
+                if attempt >= max_retries or (
+                    isinstance(error, BoxAPIError) and
+                    error.response_info.status_code < 500
+                ):
+                    raise
+                attempt += 1
+
+    def _upload_parts_concurrently(
+        self,
+        chunks: Iterator,
+        upload_part_url: str,
+        file_size: int,
+        file_hash: Hash,
+        *,
+        max_in_flight_parts: int,
+        max_part_retries: int = 0,
+        uploaded_parts: Optional[Dict[int, UploadPart]] = None
+    ) -> List[UploadPart]:
+        """
+        Uploads parts using up to `max_in_flight_parts` threads. Chunks are read and added to
+        `file_hash` in order, and the next chunk is only read once fewer than `max_in_flight_parts`
+        parts are being uploaded, so at most `max_in_flight_parts` part buffers are kept in memory.
+        Chunks matching a part of `uploaded_parts`, keyed by offset, are hashed but not uploaded again.
+        Returns the uploaded parts sorted by offset.
+        """
+        if uploaded_parts is None:
+            uploaded_parts = {}
+        parts: List[UploadPart] = []
+        pending = set()
+
+        def collect(futures) -> None:
+            for future in futures:
+                pending.discard(future)
+                part: UploadPart = future.result()
+                parts.append(part)
+
+        with ThreadPoolExecutor(max_workers=max_in_flight_parts) as executor:
+            try:
+                bytes_start: int = 0
+                for chunk in chunks:
+                    chunk_buffer: Buffer = _read_chunk_buffer(chunk)
+                    file_hash.update_hash(chunk_buffer)
+                    uploaded_part: Optional[UploadPart] = uploaded_parts.get(
+                        bytes_start, None
+                    )
+                    if uploaded_part is not None:
+                        self._verify_uploaded_part(uploaded_part, chunk_buffer)
+                        parts.append(uploaded_part)
+                        bytes_start += buffer_length(chunk_buffer)
+                        continue
+                    pending.add(
+                        executor.submit(
+                            self._upload_part,
+                            upload_part_url,
+                            chunk_buffer,
+                            bytes_start,
+                            file_size,
+                            max_retries=max_part_retries,
+                        )
+                    )
+                    bytes_start += buffer_length(chunk_buffer)
+                    del chunk, chunk_buffer
+                    if len(pending) >= max_in_flight_parts:
+                        collect(wait(pending, return_when=FIRST_COMPLETED).done)
+                collect(wait(pending).done)
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+        return sorted(parts, key=lambda part: part.offset)
+
+    def _verify_uploaded_part(self, part: UploadPart, chunk_buffer: Buffer) -> None:
+        hash: Hash = Hash(algorithm=HashName.SHA1)
+        hash.update_hash(chunk_buffer)
+        if hex_to_base_64(part.sha_1) != hash.digest_hash(
+            'base64'
+        ) or part.size != buffer_length(chunk_buffer):
+            raise BoxSDKError(
+                message=''.join(
+                    [
+                        'Content of the file at offset ',
+                        to_string(part.offset),
+                        ' does not match the part already uploaded to the upload session',
+                    ]
+                )
+            )
+
+    def _get_all_upload_session_parts(self, list_parts_url: str) -> List[UploadPart]:
+        parts: List[UploadPart] = []
+        while True:
+            page: UploadParts = self.get_file_upload_session_parts_by_url(
+                list_parts_url, offset=len(parts), limit=1000
+            )
+            parts.extend(page.entries or [])
+            if not page.entries or len(parts) >= (page.total_count or 0):
+                return parts
 
     def upload_big_file(
-        self, file: ByteStream, file_name: str, file_size: int, parent_folder_id: str
+        self,
+        file: ByteStream,
+        file_name: str,
+        file_size: int,
+        parent_folder_id: str,
+        *,
+        max_in_flight_parts: int = 1,
+        max_part_retries: int = 2
     ) -> FileFull:
         """
         Starts the process of chunk uploading a big file. Should return a File object representing uploaded file.
@@ -835,38 +980,199 @@ class ChunkedUploadsManager:
         :type file_size: int
         :param parent_folder_id: The ID of the folder where the file should be uploaded.
         :type parent_folder_id: str
+        :param max_in_flight_parts: Maximum number of parts uploaded concurrently. Only this many parts are kept in memory at once, defaults to 1
+        :type max_in_flight_parts: int, optional
+        :param max_part_retries: Number of times a part failing with a network or server error is uploaded again before the upload is aborted, defaults to 2
+        :type max_part_retries: int, optional
         """
+        if max_in_flight_parts < 1:
+            raise ValueError('max_in_flight_parts must be a positive number')
         upload_session: UploadSession = self.create_file_upload_session(
             parent_folder_id, file_size, file_name
         )
+        return self._upload_to_session(
+            upload_session,
+            file,
+            file_size,
+            max_in_flight_parts=max_in_flight_parts,
+            max_part_retries=max_part_retries,
+        )
+
+    def upload_big_file_version(
+        self,
+        file: ByteStream,
+        file_id: str,
+        file_size: int,
+        *,
+        file_name: Optional[str] = None,
+        max_in_flight_parts: int = 1,
+        max_part_retries: int = 2
+    ) -> FileFull:
+        """
+        Chunk uploads a new version of an existing file, like `upload_big_file`. Should return a File object representing the updated file.
+        :param file: The stream of the new file content.
+        :type file: ByteStream
+        :param file_id: The ID of the file to upload a new version of.
+        :type file_id: str
+        :param file_size: The total size of the file for the chunked upload in bytes.
+        :type file_size: int
+        :param file_name: New name of the file, defaults to keeping its current name
+        :type file_name: Optional[str], optional
+        :param max_in_flight_parts: Maximum number of parts uploaded concurrently. Only this many parts are kept in memory at once, defaults to 1
+        :type max_in_flight_parts: int, optional
+        :param max_part_retries: Number of times a part failing with a network or server error is uploaded again before the upload is aborted, defaults to 2
+        :type max_part_retries: int, optional
+        """
+        if max_in_flight_parts < 1:
+            raise ValueError('max_in_flight_parts must be a positive number')
+        upload_session: UploadSession = (
+            self.create_file_upload_session_for_existing_file(
+                file_id, file_size, file_name=file_name
+            )
+        )
+        return self._upload_to_session(
+            upload_session,
+            file,
+            file_size,
+            max_in_flight_parts=max_in_flight_parts,
+            max_part_retries=max_part_retries,
+        )
+
+    def _upload_to_session(
+        self,
+        upload_session: UploadSession,
+        file: ByteStream,
+        file_size: int,
+        *,
+        max_in_flight_parts: int,
+        max_part_retries: int
+    ) -> FileFull:
         upload_part_url: str = upload_session.session_endpoints.upload_part
-        commit_url: str = upload_session.session_endpoints.commit
-        list_parts_url: str = upload_session.session_endpoints.list_parts
         part_size: int = upload_session.part_size
         total_parts: int = upload_session.total_parts
         assert part_size * total_parts >= file_size
         assert upload_session.num_parts_processed == 0
         file_hash: Hash = Hash(algorithm=HashName.SHA1)
         chunks_iterator: Iterator = iterate_chunks(file, part_size, file_size)
-        results: _PartAccumulator = reduce_iterator(
-            chunks_iterator,
-            self._reducer,
-            _PartAccumulator(
-                last_index=-1,
-                parts=[],
-                file_size=file_size,
-                upload_part_url=upload_part_url,
-                file_hash=file_hash,
-            ),
-        )
-        parts: List[UploadPart] = results.parts
+        if max_in_flight_parts == 1:
+            results: _PartAccumulator = reduce_iterator(
+                chunks_iterator,
+                self._reducer,
+                _PartAccumulator(
+                    last_index=-1,
+                    parts=[],
+                    file_size=file_size,
+                    upload_part_url=upload_part_url,
+                    file_hash=file_hash,
+                    max_part_retries=max_part_retries,
+                ),
+            )
+            parts: List[UploadPart] = results.parts
+        else:
+            parts: List[UploadPart] = self._upload_parts_concurrently(
+                chunks_iterator,
+                upload_part_url,
+                file_size,
+                file_hash,
+                max_in_flight_parts=max_in_flight_parts,
+                max_part_retries=max_part_retries,
+            )
+        return self._commit_upload_session(upload_session, parts, file_hash)
+
+    def _commit_upload_session(
+        self, upload_session: UploadSession, parts: List[UploadPart], file_hash: Hash
+    ) -> FileFull:
         processed_session_parts: UploadParts = (
-            self.get_file_upload_session_parts_by_url(list_parts_url)
+            self.get_file_upload_session_parts_by_url(
+                upload_session.session_endpoints.list_parts
+            )
         )
-        assert processed_session_parts.total_count == total_parts
+        assert processed_session_parts.total_count == upload_session.total_parts
         sha_1: str = file_hash.digest_hash('base64')
         digest: str = ''.join(['sha=', sha_1])
         committed_session: Optional[Files] = (
-            self.create_file_upload_session_commit_by_url(commit_url, parts, digest)
+            self.create_file_upload_session_commit_by_url(
+                upload_session.session_endpoints.commit, parts, digest
+            )
         )
         return committed_session.entries[0]
+
+    def upload_big_file_resumable(
+        self,
+        file: ByteStream,
+        file_name: str,
+        file_size: int,
+        parent_folder_id: str,
+        upload_session_storage: UploadSessionStorage,
+        *,
+        upload_key: Optional[str] = None,
+        max_in_flight_parts: int = 1,
+        max_part_retries: int = 2
+    ) -> FileFull:
+        """
+        Chunk uploads a big file like `upload_big_file`, saving the upload session to `upload_session_storage`.
+        When an upload is interrupted, calling this method again with the same `upload_key` and a stream
+        of the same content resumes the saved upload session. The whole stream is read again to compute
+        the SHA-1 of the file, but only the parts which the server does not list as uploaded are uploaded.
+        :param file: The stream of the file to upload, positioned at the start of the file.
+        :type file: ByteStream
+        :param file_name: The name of the file, which will be used for storage in Box.
+        :type file_name: str
+        :param file_size: The total size of the file for the chunked upload in bytes.
+        :type file_size: int
+        :param parent_folder_id: The ID of the folder where the file should be uploaded.
+        :type parent_folder_id: str
+        :param upload_session_storage: Storage used to save the progress of the upload.
+        :type upload_session_storage: UploadSessionStorage
+        :param upload_key: Key under which the progress is saved, defaults to the parent folder ID, file name and file size
+        :type upload_key: Optional[str], optional
+        :param max_in_flight_parts: Maximum number of parts uploaded concurrently, defaults to 1
+        :type max_in_flight_parts: int, optional
+        :param max_part_retries: Number of times a part failing with a network or server error is uploaded again before the upload is aborted, defaults to 2
+        :type max_part_retries: int, optional
+        """
+        if max_in_flight_parts < 1:
+            raise ValueError('max_in_flight_parts must be a positive number')
+        if upload_key is None:
+            upload_key = '/'.join([parent_folder_id, file_name, to_string(file_size)])
+        upload_session: Optional[UploadSession] = None
+        uploaded_parts: Dict[int, UploadPart] = {}
+        saved_upload_session: Optional[UploadSession] = upload_session_storage.get(
+            upload_key
+        )
+        if saved_upload_session is not None:
+            try:
+                uploaded_parts = {
+                    part.offset: part
+                    for part in self._get_all_upload_session_parts(
+                        saved_upload_session.session_endpoints.list_parts
+                    )
+                }
+                upload_session = saved_upload_session
+            except BoxAPIError as error:
+                if error.response_info.status_code != 404:
+                    raise
+                # The upload session has expired or was aborted
+                upload_session_storage.clear(upload_key)
+        if upload_session is None:
+            upload_session = self.create_file_upload_session(
+                parent_folder_id, file_size, file_name
+            )
+            upload_session_storage.store(upload_key, upload_session)
+        part_size: int = upload_session.part_size
+        assert part_size * upload_session.total_parts >= file_size
+        file_hash: Hash = Hash(algorithm=HashName.SHA1)
+        parts: List[UploadPart] = self._upload_parts_concurrently(
+            iterate_chunks(file, part_size, file_size),
+            upload_session.session_endpoints.upload_part,
+            file_size,
+            file_hash,
+            max_in_flight_parts=max_in_flight_parts,
+            max_part_retries=max_part_retries,
+            uploaded_parts=uploaded_parts,
+        )
+        uploaded_file: FileFull = self._commit_upload_session(
+            upload_session, parts, file_hash
+        )
+        upload_session_storage.clear(upload_key)
+        return uploaded_file
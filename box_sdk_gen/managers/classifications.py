@@ -28,6 +28,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -490,6 +492,7 @@ class ClassificationsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_classification_template(
         self, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
     ) -> ClassificationTemplate:
@@ -513,23 +516,22 @@ class ClassificationsManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_templates/enterprise/securityClassification-6VMVochwUWo/schema',
-                    ]
-                ),
-                method='GET',
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_templates/enterprise/securityClassification-6VMVochwUWo/schema',
+                ]
+            ),
+            method='GET',
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, ClassificationTemplate)
 
+    @single_request
     def add_classification(
         self,
         request_body: List[AddClassificationRequestBody],
@@ -558,25 +560,24 @@ class ClassificationsManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_templates/enterprise/securityClassification-6VMVochwUWo/schema#add',
-                    ]
-                ),
-                method='PUT',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_templates/enterprise/securityClassification-6VMVochwUWo/schema#add',
+                ]
+            ),
+            method='PUT',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, ClassificationTemplate)
 
+    @single_request
     def update_classification(
         self,
         request_body: List[UpdateClassificationRequestBody],
@@ -605,25 +606,24 @@ class ClassificationsManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_templates/enterprise/securityClassification-6VMVochwUWo/schema#update',
-                    ]
-                ),
-                method='PUT',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json-patch+json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_templates/enterprise/securityClassification-6VMVochwUWo/schema#update',
+                ]
+            ),
+            method='PUT',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json-patch+json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, ClassificationTemplate)
 
+    @single_request
     def create_classification_template(
         self,
         fields: List[CreateClassificationTemplateFields],
@@ -687,21 +687,19 @@ class ClassificationsManager:
             'fields': fields,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_templates/schema#classifications',
-                    ]
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_templates/schema#classifications',
+                ]
+            ),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, ClassificationTemplate)
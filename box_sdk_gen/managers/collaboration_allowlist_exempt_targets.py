@@ -32,6 +32,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -65,6 +67,7 @@ class CollaborationAllowlistExemptTargetsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_collaboration_whitelist_exempt_targets(
         self,
         *,
@@ -93,24 +96,23 @@ class CollaborationAllowlistExemptTargetsManager:
             {'marker': to_string(marker), 'limit': to_string(limit)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/collaboration_whitelist_exempt_targets',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/collaboration_whitelist_exempt_targets',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, CollaborationAllowlistExemptTargets)
 
+    @single_request
     def create_collaboration_whitelist_exempt_target(
         self,
         user: CreateCollaborationWhitelistExemptTargetUser,
@@ -131,25 +133,24 @@ class CollaborationAllowlistExemptTargetsManager:
             extra_headers = {}
         request_body: Dict = {'user': user}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/collaboration_whitelist_exempt_targets',
-                    ]
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/collaboration_whitelist_exempt_targets',
+                ]
+            ),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, CollaborationAllowlistExemptTarget)
 
+    @single_request
     def get_collaboration_whitelist_exempt_target_by_id(
         self,
         collaboration_whitelist_exempt_target_id: str,
@@ -170,24 +171,23 @@ class CollaborationAllowlistExemptTargetsManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/collaboration_whitelist_exempt_targets/',
-                        to_string(collaboration_whitelist_exempt_target_id),
-                    ]
-                ),
-                method='GET',
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/collaboration_whitelist_exempt_targets/',
+                    to_string(collaboration_whitelist_exempt_target_id),
+                ]
+            ),
+            method='GET',
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, CollaborationAllowlistExemptTarget)
 
+    @single_request
     def delete_collaboration_whitelist_exempt_target_by_id(
         self,
         collaboration_whitelist_exempt_target_id: str,
@@ -208,20 +208,18 @@ class CollaborationAllowlistExemptTargetsManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/collaboration_whitelist_exempt_targets/',
-                        to_string(collaboration_whitelist_exempt_target_id),
-                    ]
-                ),
-                method='DELETE',
-                headers=headers_map,
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/collaboration_whitelist_exempt_targets/',
+                    to_string(collaboration_whitelist_exempt_target_id),
+                ]
+            ),
+            method='DELETE',
+            headers=headers_map,
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
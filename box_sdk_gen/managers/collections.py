@@ -28,6 +28,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -38,6 +40,10 @@ from box_sdk_gen.serialization.json import sd_to_json
 
 from box_sdk_gen.serialization.json import SerializedData
 
+import functools
+
+from box_sdk_gen.box.pagination import OffsetPaginator
+
 
 class CollectionsManager:
     def __init__(
@@ -51,6 +57,7 @@ class CollectionsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_collections(
         self,
         *,
@@ -98,21 +105,18 @@ class CollectionsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [self.network_session.base_urls.base_url, '/2.0/collections']
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/collections']),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, Collections)
 
+    @single_request
     def get_collection_items(
         self,
         collection_id: str,
@@ -161,26 +165,25 @@ class CollectionsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/collections/',
-                        to_string(collection_id),
-                        '/items',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/collections/',
+                    to_string(collection_id),
+                    '/items',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, ItemsOffsetPaginated)
 
+    @single_request
     def get_collection_by_id(
         self,
         collection_id: str,
@@ -198,20 +201,83 @@ class CollectionsManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/collections/',
-                        to_string(collection_id),
-                    ]
-                ),
-                method='GET',
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/collections/',
+                    to_string(collection_id),
+                ]
+            ),
+            method='GET',
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, Collection)
+
+    def iterate_collections(
+        self,
+        *,
+        fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> OffsetPaginator:
+        """
+        Iterates over all collections of the user, fetching the pages with offset-based pagination.
+        Accepts the same arguments as `get_collections`, except the pagination ones.
+        :param page_size: Maximum number of entries fetched per page, defaults to None
+        :type page_size: Optional[int], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        :param max_concurrency: Maximum number of pages fetched concurrently once the first page returned `total_count`, defaults to None
+        :type max_concurrency: Optional[int], optional
+        :param ordered: Yield the concurrently fetched entries in order, defaults to True
+        :type ordered: bool, optional
+        """
+        return OffsetPaginator(
+            functools.partial(self.get_collections, extra_headers=extra_headers),
+            page_size=page_size,
+            fields=fields,
+            prefetch=prefetch,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
+
+    def iterate_collection_items(
+        self,
+        collection_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> OffsetPaginator:
+        """
+        Iterates over all items in a collection, fetching the pages with offset-based pagination.
+        Accepts the same arguments as `get_collection_items`, except the pagination ones.
+        :param page_size: Maximum number of entries fetched per page, defaults to None
+        :type page_size: Optional[int], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        :param max_concurrency: Maximum number of pages fetched concurrently once the first page returned `total_count`, defaults to None
+        :type max_concurrency: Optional[int], optional
+        :param ordered: Yield the concurrently fetched entries in order, defaults to True
+        :type ordered: bool, optional
+        """
+        return OffsetPaginator(
+            functools.partial(
+                self.get_collection_items, collection_id, extra_headers=extra_headers
+            ),
+            page_size=page_size,
+            fields=fields,
+            prefetch=prefetch,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
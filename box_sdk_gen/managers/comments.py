@@ -32,6 +32,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -42,6 +44,10 @@ from box_sdk_gen.serialization.json import sd_to_json
 
 from box_sdk_gen.serialization.json import SerializedData
 
+import functools
+
+from box_sdk_gen.box.pagination import OffsetPaginator
+
 
 class CreateCommentItemTypeField(str, Enum):
     FILE = 'file'
@@ -75,6 +81,7 @@ class CommentsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_file_comments(
         self,
         file_id: str,
@@ -126,26 +133,25 @@ class CommentsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/files/',
-                        to_string(file_id),
-                        '/comments',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/files/',
+                    to_string(file_id),
+                    '/comments',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, Comments)
 
+    @single_request
     def get_comment_by_id(
         self,
         comment_id: str,
@@ -178,25 +184,24 @@ class CommentsManager:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/comments/',
-                        to_string(comment_id),
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/comments/',
+                    to_string(comment_id),
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, CommentFull)
 
+    @single_request
     def update_comment_by_id(
         self,
         comment_id: str,
@@ -230,27 +235,26 @@ class CommentsManager:
         request_body: Dict = {'message': message}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/comments/',
-                        to_string(comment_id),
-                    ]
-                ),
-                method='PUT',
-                params=query_params_map,
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/comments/',
+                    to_string(comment_id),
+                ]
+            ),
+            method='PUT',
+            params=query_params_map,
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, CommentFull)
 
+    @single_request
     def delete_comment_by_id(
         self,
         comment_id: str,
@@ -268,24 +272,23 @@ class CommentsManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/comments/',
-                        to_string(comment_id),
-                    ]
-                ),
-                method='DELETE',
-                headers=headers_map,
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/comments/',
+                    to_string(comment_id),
+                ]
+            ),
+            method='DELETE',
+            headers=headers_map,
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
 
+    @single_request
     def create_comment(
         self,
         message: str,
@@ -341,17 +344,49 @@ class CommentsManager:
         }
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join([self.network_session.base_urls.base_url, '/2.0/comments']),
-                method='POST',
-                params=query_params_map,
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/comments']),
+            method='POST',
+            params=query_params_map,
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, CommentFull)
+
+    def iterate_file_comments(
+        self,
+        file_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> OffsetPaginator:
+        """
+        Iterates over all comments on a file, fetching the pages with offset-based pagination.
+        Accepts the same arguments as `get_file_comments`, except the pagination ones.
+        :param page_size: Maximum number of entries fetched per page, defaults to None
+        :type page_size: Optional[int], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        :param max_concurrency: Maximum number of pages fetched concurrently once the first page returned `total_count`, defaults to None
+        :type max_concurrency: Optional[int], optional
+        :param ordered: Yield the concurrently fetched entries in order, defaults to True
+        :type ordered: bool, optional
+        """
+        return OffsetPaginator(
+            functools.partial(
+                self.get_file_comments, file_id, extra_headers=extra_headers
+            ),
+            page_size=page_size,
+            fields=fields,
+            prefetch=prefetch,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
@@ -58,6 +58,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -106,6 +108,7 @@ class DocgenManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_docgen_job_by_id_v2025_r0(
         self,
         job_id: str,
@@ -128,24 +131,23 @@ class DocgenManager:
         headers_map: Dict[str, str] = prepare_params(
             {'box-version': to_string(box_version), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/docgen_jobs/',
-                        to_string(job_id),
-                    ]
-                ),
-                method='GET',
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/docgen_jobs/',
+                    to_string(job_id),
+                ]
+            ),
+            method='GET',
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, DocGenJobV2025R0)
 
+    @single_request
     def get_docgen_jobs_v2025_r0(
         self,
         *,
@@ -176,21 +178,18 @@ class DocgenManager:
         headers_map: Dict[str, str] = prepare_params(
             {'box-version': to_string(box_version), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [self.network_session.base_urls.base_url, '/2.0/docgen_jobs']
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/docgen_jobs']),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, DocGenJobsFullV2025R0)
 
+    @single_request
     def get_docgen_batch_job_by_id_v2025_r0(
         self,
         batch_id: str,
@@ -225,25 +224,24 @@ class DocgenManager:
         headers_map: Dict[str, str] = prepare_params(
             {'box-version': to_string(box_version), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/docgen_batch_jobs/',
-                        to_string(batch_id),
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/docgen_batch_jobs/',
+                    to_string(batch_id),
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, DocGenJobsV2025R0)
 
+    @single_request
     def create_docgen_batch_v2025_r0(
         self,
         file: FileReferenceV2025R0,
@@ -280,18 +278,16 @@ class DocgenManager:
         headers_map: Dict[str, str] = prepare_params(
             {'box-version': to_string(box_version), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [self.network_session.base_urls.base_url, '/2.0/docgen_batches']
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [self.network_session.base_urls.base_url, '/2.0/docgen_batches']
+            ),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, DocGenBatchBaseV2025R0)
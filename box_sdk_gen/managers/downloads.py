@@ -2,6 +2,20 @@ from typing import Optional
 
 from typing import Dict
 
+from typing import List
+
+from typing import Tuple
+
+import hashlib
+
+import os
+
+import threading
+
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
 from box_sdk_gen.internal.utils import to_string
 
 from box_sdk_gen.networking.fetch_options import ResponseFormat
@@ -10,6 +24,8 @@ from box_sdk_gen.schemas.client_error import ClientError
 
 from box_sdk_gen.box.errors import BoxSDKError
 
+from box_sdk_gen.box.errors import BoxAPIError
+
 from box_sdk_gen.networking.auth import Authentication
 
 from box_sdk_gen.networking.network import NetworkSession
@@ -18,6 +34,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -30,6 +48,12 @@ from box_sdk_gen.internal.utils import write_input_stream_to_output_stream
 
 from box_sdk_gen.internal.utils import OutputStream
 
+from box_sdk_gen.internal.utils import COPY_BUFFER_SIZE
+
+from box_sdk_gen.managers.files import FilesManager
+
+from box_sdk_gen.managers.file_versions import FileVersionsManager
+
 
 class DownloadsManager:
     def __init__(
@@ -43,6 +67,7 @@ class DownloadsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_download_file_url(
         self,
         file_id: str,
@@ -96,24 +121,22 @@ class DownloadsManager:
         headers_map: Dict[str, str] = prepare_params(
             {'range': to_string(range), 'boxapi': to_string(boxapi), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/files/',
-                        to_string(file_id),
-                        '/content',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-                follow_redirects=False,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/files/',
+                    to_string(file_id),
+                    '/content',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
+            follow_redirects=False,
         )
         if 'location' in response.headers:
             return response.headers.get('location')
@@ -121,6 +144,7 @@ class DownloadsManager:
             return response.headers.get('Location')
         raise BoxSDKError(message='No location header in response')
 
+    @single_request
     def download_file(
         self,
         file_id: str,
@@ -174,23 +198,21 @@ class DownloadsManager:
         headers_map: Dict[str, str] = prepare_params(
             {'range': to_string(range), 'boxapi': to_string(boxapi), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/files/',
-                        to_string(file_id),
-                        '/content',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.BINARY,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/files/',
+                    to_string(file_id),
+                    '/content',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.BINARY,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         if to_string(response.status) == '202':
             return None
@@ -254,3 +276,411 @@ class DownloadsManager:
             extra_headers=extra_headers,
         )
         write_input_stream_to_output_stream(download_stream, output_stream)
+
+    def download_file_parallel(
+        self,
+        file_id: str,
+        output_stream: OutputStream,
+        *,
+        parts: int = 4,
+        part_size: int = 8 * 1024 * 1024,
+        version: Optional[str] = None,
+        max_range_retries: int = 2,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> None:
+        """
+        Downloads a file to a given output stream, fetching byte ranges of the file over `parts` concurrent requests.
+        All ranges are downloaded from the same file version, and the SHA-1 of the written content is
+        verified against the SHA-1 of that version.
+
+        Ranges are written at their position with `os.pwrite` when the output stream is a file,
+        other seekable output streams are written under a lock. The output stream must be readable,
+        or be a file which can be opened again by its name, to verify the content.
+        Non-seekable output streams are downloaded in order with a single request, resumed after failures.
+        Ranges failed with a client error are not requested again. The content is not verified
+        when the file version has no SHA-1.
+        :param file_id: The unique identifier that represents a file.
+        :type file_id: str
+        :param output_stream: Download file to a given output stream, starting at its current position
+        :type output_stream: OutputStream
+        :param parts: Number of ranges downloaded concurrently, defaults to 4
+        :type parts: int, optional
+        :param part_size: Size of a single range in bytes, defaults to 8 MiB
+        :type part_size: int, optional
+        :param version: The file version to download. Defaults to the current version of the file, defaults to None
+        :type version: Optional[str], optional
+        :param max_range_retries: Number of times a failed range is requested again, from the first byte not yet written, defaults to 2
+        :type max_range_retries: int, optional
+        :param extra_headers: Extra headers that will be included in the HTTP requests., defaults to None
+        :type extra_headers: Optional[Dict[str, Optional[str]]], optional
+        """
+        if parts < 1 or part_size < 1:
+            raise ValueError('parts and part_size must be positive numbers')
+        if extra_headers is None:
+            extra_headers = {}
+        version, file_size, sha_1 = self._get_file_version_details(
+            file_id, version, extra_headers
+        )
+
+        if not output_stream.seekable():
+            self._download_version_resumable(
+                file_id,
+                output_stream,
+                version,
+                file_size,
+                sha_1,
+                max_range_retries,
+                extra_headers,
+            )
+            return
+
+        output_stream.flush()
+        start: int = output_stream.tell()
+        write_at = self._get_positional_writer(output_stream, start + file_size)
+        ranges: List[Tuple[int, int]] = [
+            (range_start, min(range_start + part_size, file_size) - 1)
+            for range_start in range(0, file_size, part_size)
+        ]
+        with ThreadPoolExecutor(max_workers=parts) as executor:
+            futures = [
+                executor.submit(
+                    self._download_range,
+                    file_id,
+                    version,
+                    range_start,
+                    range_end,
+                    lambda offset, data: write_at(start + offset, data),
+                    max_retries=max_range_retries,
+                    extra_headers=extra_headers,
+                )
+                for range_start, range_end in ranges
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        output_stream.seek(start + file_size)
+        output_stream.flush()
+
+        if sha_1 is not None:
+            self._verify_sha_1(
+                file_id,
+                version,
+                sha_1,
+                self._hash_written_content(output_stream, start, file_size),
+            )
+
+    def download_file_resumable(
+        self,
+        file_id: str,
+        output_stream: OutputStream,
+        *,
+        version: Optional[str] = None,
+        max_resume_attempts: int = 5,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> None:
+        """
+        Downloads a file to a given output stream, resuming the download when the connection drops
+        or the server keeps failing. The download is resumed with a request for the range starting
+        at the first byte not yet written, after the delay of the retry strategy of the network session.
+        All requests download the same file version, and the SHA-1 of the written content is verified
+        against the SHA-1 of that version, when the version has one.
+        :param file_id: The unique identifier that represents a file.
+        :type file_id: str
+        :param output_stream: Download file to a given output stream
+        :type output_stream: OutputStream
+        :param version: The file version to download. Defaults to the current version of the file, defaults to None
+        :type version: Optional[str], optional
+        :param max_resume_attempts: Number of times the download is resumed without receiving any new content before giving up, defaults to 5
+        :type max_resume_attempts: int, optional
+        :param extra_headers: Extra headers that will be included in the HTTP requests., defaults to None
+        :type extra_headers: Optional[Dict[str, Optional[str]]], optional
+        """
+        if extra_headers is None:
+            extra_headers = {}
+        version, file_size, sha_1 = self._get_file_version_details(
+            file_id, version, extra_headers
+        )
+        self._download_version_resumable(
+            file_id,
+            output_stream,
+            version,
+            file_size,
+            sha_1,
+            max_resume_attempts,
+            extra_headers,
+        )
+
+    def _download_version_resumable(
+        self,
+        file_id: str,
+        output_stream: OutputStream,
+        version: str,
+        file_size: int,
+        sha_1: Optional[str],
+        max_resume_attempts: int,
+        extra_headers: Dict[str, Optional[str]]
+    ) -> None:
+        """
+        Writes the content of the file version to the output stream in order, resuming the download
+        from the first byte not yet written, and verifies its SHA-1
+        """
+        hash = hashlib.sha1()
+        buffer = bytearray(COPY_BUFFER_SIZE)
+        view = memoryview(buffer)
+        written: int = 0
+        attempt: int = 0
+        while written < file_size:
+            written_before_attempt: int = written
+            content: Optional[ByteStream] = None
+            try:
+                content = self._download_content(
+                    file_id,
+                    version,
+                    (
+                        ''.join(['bytes=', to_string(written), '-'])
+                        if written > 0
+                        else None
+                    ),
+                    extra_headers,
+                )
+                while written < file_size:
+                    bytes_read = content.readinto(
+                        view[: min(len(buffer), file_size - written)]
+                    )
+                    if not bytes_read:
+                        raise BoxSDKError(
+                            message=''.join(
+                                [
+                                    'Response ended after ',
+                                    to_string(written),
+                                    ' of ',
+                                    to_string(file_size),
+                                    ' bytes',
+                                ]
+                            )
+                        )
+                    output_stream.write(view[:bytes_read])
+                    hash.update(view[:bytes_read])
+                    written += bytes_read
+            except (BoxSDKError, OSError) as error:
+                if (
+                    isinstance(error, BoxAPIError) and
+                    error.response_info.status_code < 500
+                ):
+                    raise
+                attempt = 0 if written > written_before_attempt else attempt + 1
+                if attempt > max_resume_attempts:
+                    raise
+            finally:
+                if content is not None:
+                    content.close()
+            if written < file_size:
+                self._wait_before_retry(file_id, attempt)
+
+        self._verify_sha_1(file_id, version, sha_1, hash.hexdigest())
+
+    def _get_file_version_details(
+        self,
+        file_id: str,
+        version: Optional[str],
+        extra_headers: Dict[str, Optional[str]]
+    ) -> Tuple[str, int, Optional[str]]:
+        """
+        Returns the ID, size and SHA-1 of the given file version, or of the current version of the file
+        """
+        if version is None:
+            file = FilesManager(
+                auth=self.auth, network_session=self.network_session
+            ).get_file_by_id(
+                file_id,
+                fields=['size', 'sha1', 'file_version'],
+                extra_headers=extra_headers,
+            )
+            return file.file_version.id, file.size, file.sha_1
+        file_version = FileVersionsManager(
+            auth=self.auth, network_session=self.network_session
+        ).get_file_version_by_id(
+            file_id, version, fields=['size', 'sha1'], extra_headers=extra_headers
+        )
+        return version, file_version.size, file_version.sha_1
+
+    @staticmethod
+    def _verify_sha_1(
+        file_id: str, version: str, sha_1: Optional[str], actual_sha_1: str
+    ) -> None:
+        """
+        Raises `BoxSDKError` when the SHA-1 of the downloaded content does not match the SHA-1 of the file version.
+        The content is not verified when the file version has no SHA-1.
+        """
+        if sha_1 is None or actual_sha_1 == sha_1:
+            return
+        raise BoxSDKError(
+            message=''.join(
+                [
+                    'SHA-1 of the downloaded content does not match version ',
+                    to_string(version),
+                    ' of file ',
+                    to_string(file_id),
+                ]
+            )
+        )
+
+    def _download_range(
+        self,
+        file_id: str,
+        version: str,
+        range_start: int,
+        range_end: int,
+        write_at,
+        *,
+        max_retries: int = 0,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> None:
+        buffer = bytearray(min(COPY_BUFFER_SIZE, range_end - range_start + 1))
+        view = memoryview(buffer)
+        offset: int = range_start
+        attempt: int = 0
+        while offset <= range_end:
+            content: Optional[ByteStream] = None
+            try:
+                content = self._download_content(
+                    file_id,
+                    version,
+                    ''.join(['bytes=', to_string(offset), '-', to_string(range_end)]),
+                    extra_headers,
+                )
+                while offset <= range_end:
+                    bytes_read = content.readinto(
+                        view[: min(len(buffer), range_end - offset + 1)]
+                    )
+                    if not bytes_read:
+                        raise BoxSDKError(
+                            message=''.join(
+                                [
+                                    'Response ended before byte ',
+                                    to_string(range_end),
+                                    ' of the requested range',
+                                ]
+                            )
+                        )
+                    write_at(offset, view[:bytes_read])
+                    offset += bytes_read
+            except (BoxSDKError, OSError) as error:
+                if (
+                    isinstance(error, BoxAPIError) and
+                    error.response_info.status_code < 500
+                ):
+                    raise
+                if attempt >= max_retries:
+                    raise
+                attempt += 1
+            finally:
+                if content is not None:
+                    content.close()
+            if offset <= range_end:
+                self._wait_before_retry(file_id, attempt)
+
+    def _download_content(
+        self,
+        file_id: str,
+        version: str,
+        range: Optional[str],
+        extra_headers: Dict[str, Optional[str]]
+    ) -> ByteStream:
+        """
+        Returns the content of the file version, raising `BoxSDKError` when it is not ready to be downloaded yet
+        """
+        content: Optional[ByteStream] = self.download_file(
+            file_id, version=version, range=range, extra_headers=extra_headers
+        )
+        if content is None:
+            raise BoxSDKError(
+                message=''.join(
+                    ['File ', to_string(file_id), ' is not ready to be downloaded yet']
+                )
+            )
+        return content
+
+    def _wait_before_retry(self, file_id: str, attempt: int) -> None:
+        """
+        Waits before requesting the content again, as long as the retry strategy of the network session
+        waits before retrying a request failed with a network error
+        """
+        retry_strategy = self.network_session.retry_strategy
+        time.sleep(
+            retry_strategy.retry_after(
+                fetch_options=FetchOptions(
+                    url=''.join(
+                        [
+                            self.network_session.base_urls.base_url,
+                            '/2.0/files/',
+                            to_string(file_id),
+                            '/content',
+                        ]
+                    ),
+                    method='GET',
+                    response_format=ResponseFormat.BINARY,
+                    auth=self.auth,
+                    network_session=self.network_session,
+                ),
+                fetch_response=FetchResponse(status=0, headers={}),
+                attempt_number=max(attempt, 1),
+            )
+        )
+
+    @staticmethod
+    def _get_positional_writer(output_stream: OutputStream, size: int):
+        try:
+            fileno = output_stream.fileno()
+        except (AttributeError, OSError):
+            fileno = None
+        if fileno is not None and hasattr(os, 'pwrite'):
+            os.ftruncate(fileno, max(size, os.fstat(fileno).st_size))
+
+            def write_at(position: int, data: memoryview) -> None:
+                while data:
+                    written = os.pwrite(fileno, data, position)
+                    data = data[written:]
+                    position += written
+
+            return write_at
+
+        lock = threading.Lock()
+
+        def write_at(position: int, data: memoryview) -> None:
+            with lock:
+                output_stream.seek(position)
+                output_stream.write(data)
+
+        return write_at
+
+    @staticmethod
+    def _hash_written_content(
+        output_stream: OutputStream, start: int, size: int
+    ) -> str:
+        if output_stream.readable():
+            input_stream, close = output_stream, False
+        else:
+            input_stream, close = open(output_stream.name, 'rb'), True
+        try:
+            input_stream.seek(start)
+            hash = hashlib.sha1()
+            buffer = bytearray(COPY_BUFFER_SIZE)
+            view = memoryview(buffer)
+            remaining: int = size
+            while remaining > 0:
+                bytes_read = input_stream.readinto(view[: min(len(buffer), remaining)])
+                if not bytes_read:
+                    break
+                hash.update(view[:bytes_read])
+                remaining -= bytes_read
+            return hash.hexdigest()
+        finally:
+            if close:
+                input_stream.close()
+            else:
+                output_stream.seek(start + size)
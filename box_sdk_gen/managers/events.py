@@ -28,6 +28,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -42,6 +44,8 @@ from box_sdk_gen.serialization.json import sd_to_json
 
 from box_sdk_gen.box.event_stream import EventStream
 
+from box_sdk_gen.box.change_feed import StreamPositionStorage
+
 
 class GetEventsStreamType(str, Enum):
     ALL = 'all'
@@ -452,6 +456,7 @@ class EventsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_events_with_long_polling(
         self, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
     ) -> RealtimeServers:
@@ -535,18 +540,17 @@ class EventsManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join([self.network_session.base_urls.base_url, '/2.0/events']),
-                method='OPTIONS',
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/events']),
+            method='OPTIONS',
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, RealtimeServers)
 
+    @single_request
     def get_events(
         self,
         *,
@@ -644,16 +648,14 @@ class EventsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join([self.network_session.base_urls.base_url, '/2.0/events']),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/events']),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, Events)
 
@@ -661,7 +663,9 @@ class EventsManager:
         self,
         *,
         query_params: GetEventStreamQueryParams = None,
-        headers: GetEventStreamHeaders = None
+        headers: GetEventStreamHeaders = None,
+        deduplication_size: int = 1000,
+        position_storage: Optional[StreamPositionStorage] = None
     ) -> EventStream:
         """
         Get an event stream for the Box API
@@ -669,11 +673,19 @@ class EventsManager:
         :type query_params: GetEventStreamQueryParams, optional
         :param headers: Headers of getEvents method, defaults to None
         :type headers: GetEventStreamHeaders, optional
+        :param deduplication_size: Number of most recent event IDs remembered to drop duplicated events, defaults to 1000
+        :type deduplication_size: int, optional
+        :param position_storage: Storage keeping the stream position and the remembered event IDs, the stream resumes from the stored position if `query_params` has none, defaults to None
+        :type position_storage: Optional[StreamPositionStorage], optional
         """
         if query_params is None:
             query_params = GetEventStreamQueryParams()
         if headers is None:
             headers = GetEventStreamHeaders()
         return EventStream(
-            events_manager=self, query_params=query_params, headers_input=headers
+            events_manager=self,
+            query_params=query_params,
+            headers_input=headers,
+            deduplication_size=deduplication_size,
+            position_storage=position_storage,
         )
@@ -34,6 +34,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -44,6 +46,10 @@ from box_sdk_gen.serialization.json import sd_to_json
 
 from box_sdk_gen.serialization.json import SerializedData
 
+import functools
+
+from box_sdk_gen.box.pagination import OffsetPaginator
+
 
 class PromoteFileVersionType(str, Enum):
     FILE_VERSION = 'file_version'
@@ -61,6 +67,7 @@ class FileVersionsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_file_versions(
         self,
         file_id: str,
@@ -118,26 +125,25 @@ class FileVersionsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/files/',
-                        to_string(file_id),
-                        '/versions',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/files/',
+                    to_string(file_id),
+                    '/versions',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, FileVersions)
 
+    @single_request
     def get_file_version_by_id(
         self,
         file_id: str,
@@ -180,27 +186,26 @@ class FileVersionsManager:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/files/',
-                        to_string(file_id),
-                        '/versions/',
-                        to_string(file_version_id),
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/files/',
+                    to_string(file_id),
+                    '/versions/',
+                    to_string(file_version_id),
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, FileVersionFull)
 
+    @single_request
     def delete_file_version_by_id(
         self,
         file_id: str,
@@ -242,26 +247,25 @@ class FileVersionsManager:
         headers_map: Dict[str, str] = prepare_params(
             {'if-match': to_string(if_match), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/files/',
-                        to_string(file_id),
-                        '/versions/',
-                        to_string(file_version_id),
-                    ]
-                ),
-                method='DELETE',
-                headers=headers_map,
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/files/',
+                    to_string(file_id),
+                    '/versions/',
+                    to_string(file_version_id),
+                ]
+            ),
+            method='DELETE',
+            headers=headers_map,
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
 
+    @single_request
     def update_file_version_by_id(
         self,
         file_id: str,
@@ -303,28 +307,27 @@ class FileVersionsManager:
             extra_headers = {}
         request_body: Dict = {'trashed_at': trashed_at}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/files/',
-                        to_string(file_id),
-                        '/versions/',
-                        to_string(file_version_id),
-                    ]
-                ),
-                method='PUT',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/files/',
+                    to_string(file_id),
+                    '/versions/',
+                    to_string(file_version_id),
+                ]
+            ),
+            method='PUT',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, FileVersionFull)
 
+    @single_request
     def promote_file_version(
         self,
         file_id: str,
@@ -400,24 +403,56 @@ class FileVersionsManager:
         request_body: Dict = {'id': id, 'type': type}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/files/',
-                        to_string(file_id),
-                        '/versions/current',
-                    ]
-                ),
-                method='POST',
-                params=query_params_map,
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/files/',
+                    to_string(file_id),
+                    '/versions/current',
+                ]
+            ),
+            method='POST',
+            params=query_params_map,
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, FileVersionFull)
+
+    def iterate_file_versions(
+        self,
+        file_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> OffsetPaginator:
+        """
+        Iterates over all versions of a file, fetching the pages with offset-based pagination.
+        Accepts the same arguments as `get_file_versions`, except the pagination ones.
+        :param page_size: Maximum number of entries fetched per page, defaults to None
+        :type page_size: Optional[int], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        :param max_concurrency: Maximum number of pages fetched concurrently once the first page returned `total_count`, defaults to None
+        :type max_concurrency: Optional[int], optional
+        :param ordered: Yield the concurrently fetched entries in order, defaults to True
+        :type ordered: bool, optional
+        """
+        return OffsetPaginator(
+            functools.partial(
+                self.get_file_versions, file_id, extra_headers=extra_headers
+            ),
+            page_size=page_size,
+            fields=fields,
+            prefetch=prefetch,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
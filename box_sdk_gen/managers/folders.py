@@ -36,6 +36,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -48,6 +50,32 @@ from box_sdk_gen.serialization.json import SerializedData
 
 from box_sdk_gen.internal.utils import DateTime
 
+import functools
+
+from box_sdk_gen.box.pagination import Paginator
+
+from box_sdk_gen.box.pagination import MarkerPaginator
+
+from box_sdk_gen.box.pagination import OffsetPaginator
+
+from box_sdk_gen.box.pagination import MAX_OFFSET
+
+from typing import Callable
+
+from typing import Generator
+
+from typing import Tuple
+
+import contextvars
+
+from collections import deque
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from box_sdk_gen.schemas.folder_mini import FolderMini
+
+from box_sdk_gen.schemas.item import Item
+
 
 class GetFolderByIdSort(str, Enum):
     ID = 'id'
@@ -280,6 +308,7 @@ class FoldersManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_folder_by_id(
         self,
         folder_id: str,
@@ -423,25 +452,24 @@ class FoldersManager:
                 **extra_headers,
             }
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/folders/',
-                        to_string(folder_id),
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/folders/',
+                    to_string(folder_id),
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, FolderFull)
 
+    @single_request
     def update_folder_by_id(
         self,
         folder_id: str,
@@ -580,27 +608,26 @@ class FoldersManager:
         headers_map: Dict[str, str] = prepare_params(
             {'if-match': to_string(if_match), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/folders/',
-                        to_string(folder_id),
-                    ]
-                ),
-                method='PUT',
-                params=query_params_map,
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/folders/',
+                    to_string(folder_id),
+                ]
+            ),
+            method='PUT',
+            params=query_params_map,
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, FolderFull)
 
+    @single_request
     def delete_folder_by_id(
         self,
         folder_id: str,
@@ -648,25 +675,24 @@ class FoldersManager:
         headers_map: Dict[str, str] = prepare_params(
             {'if-match': to_string(if_match), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/folders/',
-                        to_string(folder_id),
-                    ]
-                ),
-                method='DELETE',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/folders/',
+                    to_string(folder_id),
+                ]
+            ),
+            method='DELETE',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
 
+    @single_request
     def get_folder_items(
         self,
         folder_id: str,
@@ -801,26 +827,25 @@ class FoldersManager:
         headers_map: Dict[str, str] = prepare_params(
             {'boxapi': to_string(boxapi), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/folders/',
-                        to_string(folder_id),
-                        '/items',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/folders/',
+                    to_string(folder_id),
+                    '/items',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, Items)
 
+    @single_request
     def create_folder(
         self,
         name: str,
@@ -873,21 +898,20 @@ class FoldersManager:
         }
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join([self.network_session.base_urls.base_url, '/2.0/folders']),
-                method='POST',
-                params=query_params_map,
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/folders']),
+            method='POST',
+            params=query_params_map,
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, FolderFull)
 
+    @single_request
     def copy_folder(
         self,
         folder_id: str,
@@ -943,24 +967,163 @@ class FoldersManager:
         request_body: Dict = {'name': name, 'parent': parent}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/folders/',
-                        to_string(folder_id),
-                        '/copy',
-                    ]
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/folders/',
+                    to_string(folder_id),
+                    '/copy',
+                ]
+            ),
+            method='POST',
+            params=query_params_map,
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
+        )
+        return deserialize(response.data, FolderFull)
+
+    def iterate_folder_items(
+        self,
+        folder_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        sort: Optional[GetFolderItemsSort] = None,
+        direction: Optional[GetFolderItemsDirection] = None,
+        boxapi: Optional[str] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Paginator:
+        """
+        Iterates over all items in a folder, fetching the pages with marker-based pagination,
+        or with offset-based pagination when `max_concurrency` is set. Folders with items past
+        the offset of 10000 are still iterated with marker-based pagination, offsets being unreliable there.
+        Accepts the same arguments as `get_folder_items`, except the pagination ones.
+        `sort` is not supported with marker-based pagination on the root folder.
+        :param page_size: Maximum number of entries fetched per page, defaults to None
+        :type page_size: Optional[int], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        :param max_concurrency: Maximum number of pages fetched concurrently once the first page returned `total_count`, defaults to None
+        :type max_concurrency: Optional[int], optional
+        :param ordered: Yield the concurrently fetched entries in order, defaults to True
+        :type ordered: bool, optional
+        """
+        marker_paginator: MarkerPaginator = MarkerPaginator(
+            functools.partial(
+                self.get_folder_items,
+                folder_id,
+                usemarker=True,
+                sort=sort,
+                direction=direction,
+                boxapi=boxapi,
+                extra_headers=extra_headers,
+            ),
+            page_size=page_size,
+            fields=fields,
+            prefetch=prefetch,
+        )
+        if max_concurrency is not None:
+            return OffsetPaginator(
+                functools.partial(
+                    self.get_folder_items,
+                    folder_id,
+                    sort=sort,
+                    direction=direction,
+                    boxapi=boxapi,
+                    extra_headers=extra_headers,
                 ),
-                method='POST',
-                params=query_params_map,
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
+                page_size=page_size,
+                fields=fields,
+                prefetch=prefetch,
+                max_concurrency=max_concurrency,
+                ordered=ordered,
+                max_offset=MAX_OFFSET,
+                fallback=marker_paginator,
             )
+        return marker_paginator
+
+    def walk(
+        self,
+        folder_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        max_depth: Optional[int] = None,
+        folder_filter: Optional[Callable[[FolderMini], bool]] = None,
+        max_concurrency: int = 4,
+        page_size: Optional[int] = 1000,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Generator[Tuple[str, List[FolderMini], List[Item]], None, None]:
+        """
+        Walks the folder tree breadth-first, like `os.walk`, yielding a `(path, folders, files)` tuple
+        for every folder, where `path` is made of the folder names separated by `/`, starting with the walked folder,
+        and `files` contains all items which are not folders.
+
+        Up to `max_concurrency` folders are listed concurrently, with marker-based pagination.
+        Subfolders are only scheduled once their parent was yielded, so removing entries from `folders`
+        skips walking them, and only the listings of the folders in flight are held in memory.
+        :param folder_id: The unique identifier of the folder to walk
+        :type folder_id: str
+        :param fields: Attributes to include in the returned items, in addition to the fields of their mini representation, defaults to None
+        :type fields: Optional[List[str]], optional
+        :param max_depth: Maximum depth of the walked folders, the walked folder being at depth 0, defaults to None
+        :type max_depth: Optional[int], optional
+        :param folder_filter: Function returning whether a subfolder should be walked, defaults to None
+        :type folder_filter: Optional[Callable[[FolderMini], bool]], optional
+        :param max_concurrency: Maximum number of folders listed concurrently, defaults to 4
+        :type max_concurrency: int, optional
+        :param page_size: Maximum number of items fetched per page, defaults to 1000
+        :type page_size: Optional[int], optional
+        :param extra_headers: Extra headers that will be included in the HTTP requests, defaults to None
+        :type extra_headers: Optional[Dict[str, Optional[str]]], optional
+        """
+
+        def list_folder(folder_id: str) -> Tuple[List[FolderMini], List[Item]]:
+            folders, files = [], []
+            for item in self.iterate_folder_items(
+                folder_id,
+                fields=fields,
+                page_size=page_size,
+                extra_headers=extra_headers,
+            ):
+                (folders if item.type == 'folder' else files).append(item)
+            return folders, files
+
+        root_folder: FolderFull = self.get_folder_by_id(
+            folder_id, fields=['name'], extra_headers=extra_headers
         )
-        return deserialize(response.data, FolderFull)
+        pending = deque([(root_folder.name, folder_id, 0)])
+        in_flight: Dict[Future, Tuple[str, int]] = {}
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < max_concurrency:
+                    path, folder_id, depth = pending.popleft()
+                    # Runs in the caller's context, e.g. with its `lazy_deserialization` setting
+                    listing = executor.submit(
+                        contextvars.copy_context().run, list_folder, folder_id
+                    )
+                    in_flight[listing] = (path, depth)
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for listing in done:
+                    path, depth = in_flight.pop(listing)
+                    folders, files = listing.result()
+                    yield path, folders, files
+                    if max_depth is not None and depth >= max_depth:
+                        continue
+                    for folder in folders:
+                        if folder_filter is None or folder_filter(folder):
+                            pending.append(
+                                (f'{path}/{folder.name}', folder.id, depth + 1)
+                            )
+        finally:
+            for listing in in_flight:
+                listing.cancel()
+            executor.shutdown(wait=False)
@@ -30,6 +30,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -40,6 +42,10 @@ from box_sdk_gen.serialization.json import sd_to_json
 
 from box_sdk_gen.serialization.json import SerializedData
 
+import functools
+
+from box_sdk_gen.box.pagination import OffsetPaginator
+
 
 class CreateGroupInvitabilityLevel(str, Enum):
     ADMINS_ONLY = 'admins_only'
@@ -77,6 +83,7 @@ class GroupsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_groups(
         self,
         *,
@@ -126,19 +133,18 @@ class GroupsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join([self.network_session.base_urls.base_url, '/2.0/groups']),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/groups']),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, Groups)
 
+    @single_request
     def create_group(
         self,
         name: str,
@@ -227,21 +233,20 @@ class GroupsManager:
         }
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join([self.network_session.base_urls.base_url, '/2.0/groups']),
-                method='POST',
-                params=query_params_map,
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/groups']),
+            method='POST',
+            params=query_params_map,
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, GroupFull)
 
+    @single_request
     def get_group_by_id(
         self,
         group_id: str,
@@ -277,25 +282,24 @@ class GroupsManager:
             extra_headers = {}
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/groups/',
-                        to_string(group_id),
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/groups/',
+                    to_string(group_id),
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, GroupFull)
 
+    @single_request
     def update_group_by_id(
         self,
         group_id: str,
@@ -393,27 +397,26 @@ class GroupsManager:
         }
         query_params_map: Dict[str, str] = prepare_params({'fields': to_string(fields)})
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/groups/',
-                        to_string(group_id),
-                    ]
-                ),
-                method='PUT',
-                params=query_params_map,
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/groups/',
+                    to_string(group_id),
+                ]
+            ),
+            method='PUT',
+            params=query_params_map,
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, GroupFull)
 
+    @single_request
     def delete_group_by_id(
         self, group_id: str, *, extra_headers: Optional[Dict[str, Optional[str]]] = None
     ) -> None:
@@ -431,20 +434,52 @@ class GroupsManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/groups/',
-                        to_string(group_id),
-                    ]
-                ),
-                method='DELETE',
-                headers=headers_map,
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/groups/',
+                    to_string(group_id),
+                ]
+            ),
+            method='DELETE',
+            headers=headers_map,
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
+
+    def iterate_groups(
+        self,
+        *,
+        filter_term: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> OffsetPaginator:
+        """
+        Iterates over all groups of the enterprise, fetching the pages with offset-based pagination.
+        Accepts the same arguments as `get_groups`, except the pagination ones.
+        :param page_size: Maximum number of entries fetched per page, defaults to None
+        :type page_size: Optional[int], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        :param max_concurrency: Maximum number of pages fetched concurrently once the first page returned `total_count`, defaults to None
+        :type max_concurrency: Optional[int], optional
+        :param ordered: Yield the concurrently fetched entries in order, defaults to True
+        :type ordered: bool, optional
+        """
+        return OffsetPaginator(
+            functools.partial(
+                self.get_groups, filter_term=filter_term, extra_headers=extra_headers
+            ),
+            page_size=page_size,
+            fields=fields,
+            prefetch=prefetch,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
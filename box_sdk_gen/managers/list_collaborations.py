@@ -30,6 +30,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -40,6 +42,12 @@ from box_sdk_gen.serialization.json import sd_to_json
 
 from box_sdk_gen.serialization.json import SerializedData
 
+import functools
+
+from box_sdk_gen.box.pagination import MarkerPaginator
+
+from box_sdk_gen.box.pagination import OffsetPaginator
+
 
 class GetCollaborationsStatus(str, Enum):
     PENDING = 'pending'
@@ -57,6 +65,7 @@ class ListCollaborationsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_file_collaborations(
         self,
         file_id: str,
@@ -113,26 +122,25 @@ class ListCollaborationsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/files/',
-                        to_string(file_id),
-                        '/collaborations',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/files/',
+                    to_string(file_id),
+                    '/collaborations',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, Collaborations)
 
+    @single_request
     def get_folder_collaborations(
         self,
         folder_id: str,
@@ -189,26 +197,25 @@ class ListCollaborationsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/folders/',
-                        to_string(folder_id),
-                        '/collaborations',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/folders/',
+                    to_string(folder_id),
+                    '/collaborations',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, Collaborations)
 
+    @single_request
     def get_collaborations(
         self,
         status: GetCollaborationsStatus,
@@ -254,21 +261,20 @@ class ListCollaborationsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [self.network_session.base_urls.base_url, '/2.0/collaborations']
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [self.network_session.base_urls.base_url, '/2.0/collaborations']
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, CollaborationsOffsetPaginated)
 
+    @single_request
     def get_group_collaborations(
         self,
         group_id: str,
@@ -308,22 +314,138 @@ class ListCollaborationsManager:
             {'limit': to_string(limit), 'offset': to_string(offset)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/groups/',
-                        to_string(group_id),
-                        '/collaborations',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/groups/',
+                    to_string(group_id),
+                    '/collaborations',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, CollaborationsOffsetPaginated)
+
+    def iterate_file_collaborations(
+        self,
+        file_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> MarkerPaginator:
+        """
+        Iterates over all collaborations on a file, fetching the pages with marker-based pagination.
+        Accepts the same arguments as `get_file_collaborations`, except the pagination ones.
+        :param page_size: Maximum number of entries fetched per page, defaults to None
+        :type page_size: Optional[int], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        """
+        return MarkerPaginator(
+            functools.partial(
+                self.get_file_collaborations, file_id, extra_headers=extra_headers
+            ),
+            page_size=page_size,
+            fields=fields,
+            prefetch=prefetch,
+        )
+
+    def iterate_folder_collaborations(
+        self,
+        folder_id: str,
+        *,
+        fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> MarkerPaginator:
+        """
+        Iterates over all collaborations on a folder, fetching the pages with marker-based pagination.
+        Accepts the same arguments as `get_folder_collaborations`, except the pagination ones.
+        :param page_size: Maximum number of entries fetched per page, defaults to None
+        :type page_size: Optional[int], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        """
+        return MarkerPaginator(
+            functools.partial(
+                self.get_folder_collaborations, folder_id, extra_headers=extra_headers
+            ),
+            page_size=page_size,
+            fields=fields,
+            prefetch=prefetch,
+        )
+
+    def iterate_collaborations(
+        self,
+        status: GetCollaborationsStatus,
+        *,
+        fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> OffsetPaginator:
+        """
+        Iterates over all collaborations with a given status, fetching the pages with offset-based pagination.
+        Accepts the same arguments as `get_collaborations`, except the pagination ones.
+        :param page_size: Maximum number of entries fetched per page, defaults to None
+        :type page_size: Optional[int], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        :param max_concurrency: Maximum number of pages fetched concurrently once the first page returned `total_count`, defaults to None
+        :type max_concurrency: Optional[int], optional
+        :param ordered: Yield the concurrently fetched entries in order, defaults to True
+        :type ordered: bool, optional
+        """
+        return OffsetPaginator(
+            functools.partial(
+                self.get_collaborations, status, extra_headers=extra_headers
+            ),
+            page_size=page_size,
+            fields=fields,
+            prefetch=prefetch,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
+
+    def iterate_group_collaborations(
+        self,
+        group_id: str,
+        *,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> OffsetPaginator:
+        """
+        Iterates over all collaborations of a group, fetching the pages with offset-based pagination.
+        Accepts the same arguments as `get_group_collaborations`, except the pagination ones.
+        :param page_size: Maximum number of entries fetched per page, defaults to None
+        :type page_size: Optional[int], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        :param max_concurrency: Maximum number of pages fetched concurrently once the first page returned `total_count`, defaults to None
+        :type max_concurrency: Optional[int], optional
+        :param ordered: Yield the concurrently fetched entries in order, defaults to True
+        :type ordered: bool, optional
+        """
+        return OffsetPaginator(
+            functools.partial(
+                self.get_group_collaborations, group_id, extra_headers=extra_headers
+            ),
+            page_size=page_size,
+            prefetch=prefetch,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
@@ -36,6 +36,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -59,6 +61,7 @@ class MetadataTaxonomiesManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def create_metadata_taxonomy(
         self,
         display_name: str,
@@ -92,25 +95,24 @@ class MetadataTaxonomiesManager:
             'namespace': namespace,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_taxonomies',
-                    ]
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_taxonomies',
+                ]
+            ),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, MetadataTaxonomy)
 
+    @single_request
     def get_metadata_taxonomies(
         self,
         namespace: str,
@@ -140,25 +142,24 @@ class MetadataTaxonomiesManager:
             {'marker': to_string(marker), 'limit': to_string(limit)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_taxonomies/',
-                        to_string(namespace),
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_taxonomies/',
+                    to_string(namespace),
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, MetadataTaxonomies)
 
+    @single_request
     def get_metadata_taxonomy_by_key(
         self,
         namespace: str,
@@ -180,26 +181,25 @@ class MetadataTaxonomiesManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_taxonomies/',
-                        to_string(namespace),
-                        '/',
-                        to_string(taxonomy_key),
-                    ]
-                ),
-                method='GET',
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_taxonomies/',
+                    to_string(namespace),
+                    '/',
+                    to_string(taxonomy_key),
+                ]
+            ),
+            method='GET',
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, MetadataTaxonomy)
 
+    @single_request
     def update_metadata_taxonomy(
         self,
         namespace: str,
@@ -225,28 +225,27 @@ class MetadataTaxonomiesManager:
             extra_headers = {}
         request_body: Dict = {'displayName': display_name}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_taxonomies/',
-                        to_string(namespace),
-                        '/',
-                        to_string(taxonomy_key),
-                    ]
-                ),
-                method='PATCH',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_taxonomies/',
+                    to_string(namespace),
+                    '/',
+                    to_string(taxonomy_key),
+                ]
+            ),
+            method='PATCH',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, MetadataTaxonomy)
 
+    @single_request
     def delete_metadata_taxonomy(
         self,
         namespace: str,
@@ -271,26 +270,25 @@ class MetadataTaxonomiesManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_taxonomies/',
-                        to_string(namespace),
-                        '/',
-                        to_string(taxonomy_key),
-                    ]
-                ),
-                method='DELETE',
-                headers=headers_map,
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_taxonomies/',
+                    to_string(namespace),
+                    '/',
+                    to_string(taxonomy_key),
+                ]
+            ),
+            method='DELETE',
+            headers=headers_map,
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
 
+    @single_request
     def create_metadata_taxonomy_level(
         self,
         namespace: str,
@@ -315,29 +313,28 @@ class MetadataTaxonomiesManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_taxonomies/',
-                        to_string(namespace),
-                        '/',
-                        to_string(taxonomy_key),
-                        '/levels',
-                    ]
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_taxonomies/',
+                    to_string(namespace),
+                    '/',
+                    to_string(taxonomy_key),
+                    '/levels',
+                ]
+            ),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, MetadataTaxonomyLevels)
 
+    @single_request
     def update_metadata_taxonomy_level_by_id(
         self,
         namespace: str,
@@ -370,30 +367,29 @@ class MetadataTaxonomiesManager:
             extra_headers = {}
         request_body: Dict = {'displayName': display_name, 'description': description}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_taxonomies/',
-                        to_string(namespace),
-                        '/',
-                        to_string(taxonomy_key),
-                        '/levels/',
-                        to_string(level_index),
-                    ]
-                ),
-                method='PATCH',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_taxonomies/',
+                    to_string(namespace),
+                    '/',
+                    to_string(taxonomy_key),
+                    '/levels/',
+                    to_string(level_index),
+                ]
+            ),
+            method='PATCH',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, MetadataTaxonomyLevel)
 
+    @single_request
     def add_metadata_taxonomy_level(
         self,
         namespace: str,
@@ -425,29 +421,28 @@ class MetadataTaxonomiesManager:
             extra_headers = {}
         request_body: Dict = {'displayName': display_name, 'description': description}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_taxonomies/',
-                        to_string(namespace),
-                        '/',
-                        to_string(taxonomy_key),
-                        '/levels:append',
-                    ]
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_taxonomies/',
+                    to_string(namespace),
+                    '/',
+                    to_string(taxonomy_key),
+                    '/levels:append',
+                ]
+            ),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, MetadataTaxonomyLevels)
 
+    @single_request
     def delete_metadata_taxonomy_level(
         self,
         namespace: str,
@@ -469,27 +464,26 @@ class MetadataTaxonomiesManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_taxonomies/',
-                        to_string(namespace),
-                        '/',
-                        to_string(taxonomy_key),
-                        '/levels:trim',
-                    ]
-                ),
-                method='POST',
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_taxonomies/',
+                    to_string(namespace),
+                    '/',
+                    to_string(taxonomy_key),
+                    '/levels:trim',
+                ]
+            ),
+            method='POST',
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, MetadataTaxonomyLevels)
 
+    @single_request
     def get_metadata_taxonomy_nodes(
         self,
         namespace: str,
@@ -556,28 +550,27 @@ class MetadataTaxonomiesManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_taxonomies/',
-                        to_string(namespace),
-                        '/',
-                        to_string(taxonomy_key),
-                        '/nodes',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_taxonomies/',
+                    to_string(namespace),
+                    '/',
+                    to_string(taxonomy_key),
+                    '/nodes',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, MetadataTaxonomyNodes)
 
+    @single_request
     def create_metadata_taxonomy_node(
         self,
         namespace: str,
@@ -614,29 +607,28 @@ class MetadataTaxonomiesManager:
             'parentId': parent_id,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_taxonomies/',
-                        to_string(namespace),
-                        '/',
-                        to_string(taxonomy_key),
-                        '/nodes',
-                    ]
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_taxonomies/',
+                    to_string(namespace),
+                    '/',
+                    to_string(taxonomy_key),
+                    '/nodes',
+                ]
+            ),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, MetadataTaxonomyNode)
 
+    @single_request
     def get_metadata_taxonomy_node_by_id(
         self,
         namespace: str,
@@ -662,28 +654,27 @@ class MetadataTaxonomiesManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_taxonomies/',
-                        to_string(namespace),
-                        '/',
-                        to_string(taxonomy_key),
-                        '/nodes/',
-                        to_string(node_id),
-                    ]
-                ),
-                method='GET',
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_taxonomies/',
+                    to_string(namespace),
+                    '/',
+                    to_string(taxonomy_key),
+                    '/nodes/',
+                    to_string(node_id),
+                ]
+            ),
+            method='GET',
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, MetadataTaxonomyNode)
 
+    @single_request
     def update_metadata_taxonomy_node(
         self,
         namespace: str,
@@ -713,30 +704,29 @@ class MetadataTaxonomiesManager:
             extra_headers = {}
         request_body: Dict = {'displayName': display_name}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_taxonomies/',
-                        to_string(namespace),
-                        '/',
-                        to_string(taxonomy_key),
-                        '/nodes/',
-                        to_string(node_id),
-                    ]
-                ),
-                method='PATCH',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_taxonomies/',
+                    to_string(namespace),
+                    '/',
+                    to_string(taxonomy_key),
+                    '/nodes/',
+                    to_string(node_id),
+                ]
+            ),
+            method='PATCH',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, MetadataTaxonomyNode)
 
+    @single_request
     def delete_metadata_taxonomy_node(
         self,
         namespace: str,
@@ -768,28 +758,27 @@ class MetadataTaxonomiesManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_taxonomies/',
-                        to_string(namespace),
-                        '/',
-                        to_string(taxonomy_key),
-                        '/nodes/',
-                        to_string(node_id),
-                    ]
-                ),
-                method='DELETE',
-                headers=headers_map,
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_taxonomies/',
+                    to_string(namespace),
+                    '/',
+                    to_string(taxonomy_key),
+                    '/nodes/',
+                    to_string(node_id),
+                ]
+            ),
+            method='DELETE',
+            headers=headers_map,
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
 
+    @single_request
     def get_metadata_template_field_options(
         self,
         namespace: str,
@@ -869,26 +858,24 @@ class MetadataTaxonomiesManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_templates/',
-                        to_string(namespace),
-                        '/',
-                        to_string(template_key),
-                        '/fields/',
-                        to_string(field_key),
-                        '/options',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_templates/',
+                    to_string(namespace),
+                    '/',
+                    to_string(template_key),
+                    '/fields/',
+                    to_string(field_key),
+                    '/options',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, MetadataTaxonomyNodes)
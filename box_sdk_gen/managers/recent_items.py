@@ -24,6 +24,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -34,6 +36,10 @@ from box_sdk_gen.serialization.json import sd_to_json
 
 from box_sdk_gen.serialization.json import SerializedData
 
+import functools
+
+from box_sdk_gen.box.pagination import MarkerPaginator
+
 
 class RecentItemsManager:
     def __init__(
@@ -47,6 +53,7 @@ class RecentItemsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_recent_items(
         self,
         *,
@@ -93,17 +100,36 @@ class RecentItemsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [self.network_session.base_urls.base_url, '/2.0/recent_items']
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/recent_items']),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, RecentItems)
+
+    def iterate_recent_items(
+        self,
+        *,
+        fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> MarkerPaginator:
+        """
+        Iterates over all items recently accessed by the user, fetching the pages with marker-based pagination.
+        Accepts the same arguments as `get_recent_items`, except the pagination ones.
+        :param page_size: Maximum number of entries fetched per page, defaults to None
+        :type page_size: Optional[int], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        """
+        return MarkerPaginator(
+            functools.partial(self.get_recent_items, extra_headers=extra_headers),
+            page_size=page_size,
+            fields=fields,
+            prefetch=prefetch,
+        )
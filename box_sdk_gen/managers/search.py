@@ -42,6 +42,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -52,6 +54,10 @@ from box_sdk_gen.serialization.json import SerializedData
 
 from box_sdk_gen.serialization.json import sd_to_json
 
+import functools
+
+from box_sdk_gen.box.pagination import MarkerPaginator
+
 
 class SearchByMetadataQueryOrderByDirectionField(str, Enum):
     ASC = 'ASC'
@@ -130,6 +136,7 @@ class SearchManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def search_by_metadata_query(
         self,
         from_: str,
@@ -225,25 +232,24 @@ class SearchManager:
             'fields': fields,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/metadata_queries/execute_read',
-                    ]
-                ),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/metadata_queries/execute_read',
+                ]
+            ),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, MetadataQueryResults)
 
+    @single_request
     def search_for_content(
         self,
         *,
@@ -544,15 +550,49 @@ class SearchManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join([self.network_session.base_urls.base_url, '/2.0/search']),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/search']),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, SearchResultsResponse)
+
+    def iterate_search_by_metadata_query(
+        self,
+        from_: str,
+        ancestor_folder_id: str,
+        *,
+        query: Optional[str] = None,
+        query_params: Optional[Dict] = None,
+        order_by: Optional[List[SearchByMetadataQueryOrderBy]] = None,
+        fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> MarkerPaginator:
+        """
+        Iterates over all items matching a metadata query, fetching the pages with marker-based pagination.
+        Accepts the same arguments as `search_by_metadata_query`, except the pagination ones.
+        :param page_size: Maximum number of entries fetched per page, defaults to None
+        :type page_size: Optional[int], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        """
+        return MarkerPaginator(
+            functools.partial(
+                self.search_by_metadata_query,
+                from_,
+                ancestor_folder_id,
+                query=query,
+                query_params=query_params,
+                order_by=order_by,
+                extra_headers=extra_headers,
+            ),
+            page_size=page_size,
+            fields=fields,
+            prefetch=prefetch,
+        )
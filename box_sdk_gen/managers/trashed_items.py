@@ -26,6 +26,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -36,6 +38,16 @@ from box_sdk_gen.serialization.json import sd_to_json
 
 from box_sdk_gen.serialization.json import SerializedData
 
+import functools
+
+from box_sdk_gen.box.pagination import Paginator
+
+from box_sdk_gen.box.pagination import MarkerPaginator
+
+from box_sdk_gen.box.pagination import OffsetPaginator
+
+from box_sdk_gen.box.pagination import MAX_OFFSET
+
 
 class GetTrashedItemsDirection(str, Enum):
     ASC = 'ASC'
@@ -60,6 +72,7 @@ class TrashedItemsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_trashed_items(
         self,
         *,
@@ -155,20 +168,74 @@ class TrashedItemsManager:
             }
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/folders/trash/items',
-                    ]
-                ),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/folders/trash/items',
+                ]
+            ),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, Items)
+
+    def iterate_trashed_items(
+        self,
+        *,
+        fields: Optional[List[str]] = None,
+        direction: Optional[GetTrashedItemsDirection] = None,
+        sort: Optional[GetTrashedItemsSort] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> Paginator:
+        """
+        Iterates over all items in the trash, fetching the pages with marker-based pagination,
+        or with offset-based pagination when `max_concurrency` is set. A trash with items past
+        the offset of 10000 is still iterated with marker-based pagination, higher offsets being rejected.
+        Accepts the same arguments as `get_trashed_items`, except the pagination ones.
+        :param page_size: Maximum number of entries fetched per page, defaults to None
+        :type page_size: Optional[int], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        :param max_concurrency: Maximum number of pages fetched concurrently once the first page returned `total_count`, defaults to None
+        :type max_concurrency: Optional[int], optional
+        :param ordered: Yield the concurrently fetched entries in order, defaults to True
+        :type ordered: bool, optional
+        """
+        marker_paginator: MarkerPaginator = MarkerPaginator(
+            functools.partial(
+                self.get_trashed_items,
+                usemarker=True,
+                direction=direction,
+                sort=sort,
+                extra_headers=extra_headers,
+            ),
+            page_size=page_size,
+            fields=fields,
+            prefetch=prefetch,
+        )
+        if max_concurrency is not None:
+            return OffsetPaginator(
+                functools.partial(
+                    self.get_trashed_items,
+                    direction=direction,
+                    sort=sort,
+                    extra_headers=extra_headers,
+                ),
+                page_size=page_size,
+                fields=fields,
+                prefetch=prefetch,
+                max_concurrency=max_concurrency,
+                ordered=ordered,
+                max_offset=MAX_OFFSET,
+                fallback=marker_paginator,
+            )
+        return marker_paginator
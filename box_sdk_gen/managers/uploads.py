@@ -32,6 +32,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -181,6 +183,7 @@ class UploadsManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def upload_file_version(
         self,
         file_id: str,
@@ -284,36 +287,35 @@ class UploadsManager:
                 **extra_headers,
             }
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.upload_url,
-                        '/2.0/files/',
-                        to_string(file_id),
-                        '/content',
-                    ]
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.upload_url,
+                    '/2.0/files/',
+                    to_string(file_id),
+                    '/content',
+                ]
+            ),
+            method='POST',
+            params=query_params_map,
+            headers=headers_map,
+            multipart_data=[
+                MultipartItem(part_name='attributes', data=serialize(attributes)),
+                MultipartItem(
+                    part_name='file',
+                    file_stream=file,
+                    file_name=file_file_name,
+                    content_type=file_content_type,
                 ),
-                method='POST',
-                params=query_params_map,
-                headers=headers_map,
-                multipart_data=[
-                    MultipartItem(part_name='attributes', data=serialize(attributes)),
-                    MultipartItem(
-                        part_name='file',
-                        file_stream=file,
-                        file_name=file_file_name,
-                        content_type=file_content_type,
-                    ),
-                ],
-                content_type='multipart/form-data',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+            ],
+            content_type='multipart/form-data',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, Files)
 
+    @single_request
     def preflight_file_upload_check(
         self,
         *,
@@ -338,22 +340,21 @@ class UploadsManager:
             extra_headers = {}
         request_body: Dict = {'name': name, 'size': size, 'parent': parent}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [self.network_session.base_urls.base_url, '/2.0/files/content']
-                ),
-                method='OPTIONS',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [self.network_session.base_urls.base_url, '/2.0/files/content']
+            ),
+            method='OPTIONS',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, UploadUrl)
 
+    @single_request
     def upload_file(
         self,
         attributes: UploadFileAttributes,
@@ -434,28 +435,26 @@ class UploadsManager:
         headers_map: Dict[str, str] = prepare_params(
             {'content-md5': to_string(content_md_5), **extra_headers}
         )
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [self.network_session.base_urls.upload_url, '/2.0/files/content']
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [self.network_session.base_urls.upload_url, '/2.0/files/content']
+            ),
+            method='POST',
+            params=query_params_map,
+            headers=headers_map,
+            multipart_data=[
+                MultipartItem(part_name='attributes', data=serialize(attributes)),
+                MultipartItem(
+                    part_name='file',
+                    file_stream=file,
+                    file_name=file_file_name,
+                    content_type=file_content_type,
                 ),
-                method='POST',
-                params=query_params_map,
-                headers=headers_map,
-                multipart_data=[
-                    MultipartItem(part_name='attributes', data=serialize(attributes)),
-                    MultipartItem(
-                        part_name='file',
-                        file_stream=file,
-                        file_name=file_file_name,
-                        content_type=file_content_type,
-                    ),
-                ],
-                content_type='multipart/form-data',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+            ],
+            content_type='multipart/form-data',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, Files)
 
@@ -34,6 +34,8 @@ from box_sdk_gen.networking.fetch_options import FetchOptions
 
 from box_sdk_gen.networking.fetch_response import FetchResponse
 
+from box_sdk_gen.networking.single_request import single_request
+
 from box_sdk_gen.internal.utils import prepare_params
 
 from box_sdk_gen.internal.utils import to_string
@@ -54,6 +56,10 @@ from box_sdk_gen.internal.utils import get_epoch_time_in_seconds
 
 from box_sdk_gen.internal.utils import date_time_to_epoch_seconds
 
+import functools
+
+from box_sdk_gen.box.pagination import MarkerPaginator
+
 
 class CreateWebhookTargetTypeField(str, Enum):
     FILE = 'file'
@@ -211,6 +217,7 @@ class WebhooksManager:
         self.auth = auth
         self.network_session = network_session
 
+    @single_request
     def get_webhooks(
         self,
         *,
@@ -248,19 +255,18 @@ class WebhooksManager:
             {'marker': to_string(marker), 'limit': to_string(limit)}
         )
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join([self.network_session.base_urls.base_url, '/2.0/webhooks']),
-                method='GET',
-                params=query_params_map,
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/webhooks']),
+            method='GET',
+            params=query_params_map,
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, Webhooks)
 
+    @single_request
     def create_webhook(
         self,
         target: CreateWebhookTarget,
@@ -289,20 +295,19 @@ class WebhooksManager:
             'triggers': triggers,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join([self.network_session.base_urls.base_url, '/2.0/webhooks']),
-                method='POST',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join([self.network_session.base_urls.base_url, '/2.0/webhooks']),
+            method='POST',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, Webhook)
 
+    @single_request
     def get_webhook_by_id(
         self,
         webhook_id: str,
@@ -320,24 +325,23 @@ class WebhooksManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/webhooks/',
-                        to_string(webhook_id),
-                    ]
-                ),
-                method='GET',
-                headers=headers_map,
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/webhooks/',
+                    to_string(webhook_id),
+                ]
+            ),
+            method='GET',
+            headers=headers_map,
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, Webhook)
 
+    @single_request
     def update_webhook_by_id(
         self,
         webhook_id: str,
@@ -370,26 +374,25 @@ class WebhooksManager:
             'triggers': triggers,
         }
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/webhooks/',
-                        to_string(webhook_id),
-                    ]
-                ),
-                method='PUT',
-                headers=headers_map,
-                data=serialize(request_body),
-                content_type='application/json',
-                response_format=ResponseFormat.JSON,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/webhooks/',
+                    to_string(webhook_id),
+                ]
+            ),
+            method='PUT',
+            headers=headers_map,
+            data=serialize(request_body),
+            content_type='application/json',
+            response_format=ResponseFormat.JSON,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return deserialize(response.data, Webhook)
 
+    @single_request
     def delete_webhook_by_id(
         self,
         webhook_id: str,
@@ -407,21 +410,19 @@ class WebhooksManager:
         if extra_headers is None:
             extra_headers = {}
         headers_map: Dict[str, str] = prepare_params({**extra_headers})
-        response: FetchResponse = self.network_session.network_client.fetch(
-            FetchOptions(
-                url=''.join(
-                    [
-                        self.network_session.base_urls.base_url,
-                        '/2.0/webhooks/',
-                        to_string(webhook_id),
-                    ]
-                ),
-                method='DELETE',
-                headers=headers_map,
-                response_format=ResponseFormat.NO_CONTENT,
-                auth=self.auth,
-                network_session=self.network_session,
-            )
+        response: FetchResponse = yield FetchOptions(
+            url=''.join(
+                [
+                    self.network_session.base_urls.base_url,
+                    '/2.0/webhooks/',
+                    to_string(webhook_id),
+                ]
+            ),
+            method='DELETE',
+            headers=headers_map,
+            response_format=ResponseFormat.NO_CONTENT,
+            auth=self.auth,
+            network_session=self.network_session,
         )
         return None
 
@@ -495,3 +496,24 @@ class WebhooksManager:
         ):
             return True
         return False
+
+    def iterate_webhooks(
+        self,
+        *,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        extra_headers: Optional[Dict[str, Optional[str]]] = None
+    ) -> MarkerPaginator:
+        """
+        Iterates over all webhooks of the application, fetching the pages with marker-based pagination.
+        Accepts the same arguments as `get_webhooks`, except the pagination ones.
+        :param page_size: Maximum number of entries fetched per page, defaults to None
+        :type page_size: Optional[int], optional
+        :param prefetch: Fetch the next page in a background thread while the current one is consumed, defaults to False
+        :type prefetch: bool, optional
+        """
+        return MarkerPaginator(
+            functools.partial(self.get_webhooks, extra_headers=extra_headers),
+            page_size=page_size,
+            prefetch=prefetch,
+        )
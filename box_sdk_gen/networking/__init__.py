@@ -1,7 +1,15 @@
 from box_sdk_gen.networking.box_network_client import *
 
+from box_sdk_gen.networking.async_network_client import *
+
+from box_sdk_gen.networking.async_box_network_client import *
+
 from box_sdk_gen.networking.timeout_config import *
 
+from box_sdk_gen.networking.pool_config import *
+
+from box_sdk_gen.networking.connection_pool import *
+
 from box_sdk_gen.networking.proxy_config import *
 
 from box_sdk_gen.networking.network import *
@@ -14,6 +22,8 @@ from box_sdk_gen.networking.fetch_response import *
 
 from box_sdk_gen.networking.network_client import *
 
+from box_sdk_gen.networking.single_request import *
+
 from box_sdk_gen.networking.retries import *
 
 from box_sdk_gen.networking.base_urls import *
@@ -0,0 +1,323 @@
+import asyncio
+import io
+from functools import partial
+from typing import AsyncIterator, Dict, Optional
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from ..internal.logging import DataSanitizer
+from .retries import BoxRetryStrategy
+from ..networking.fetch_options import FetchOptions, ResponseFormat
+from ..networking.fetch_response import FetchResponse
+from ..networking.async_network_client import AsyncNetworkClient
+from ..networking.box_network_client import (
+    APIRequest,
+    APIResponse,
+    BoxNetworkClient,
+)
+
+STREAM_READ_CHUNK_SIZE = 1024 * 1024
+
+
+class AsyncResponseByteStream:
+    """
+    Asynchronous counterpart of `ResponseByteStream`, reading the body of a streamed
+    `httpx` response. The underlying response is closed once the stream is exhausted
+    or `aclose` is called.
+
+    Example usage:
+        stream = await client.downloads.download_file(file_id)
+        async for chunk in stream:
+            output.write(chunk)
+    """
+
+    def __init__(self, response: 'httpx.Response', chunk_size: Optional[int] = None):
+        self._response = response
+        self._iterator = response.aiter_bytes(chunk_size)
+        self._buffer = bytearray()
+        self._position = 0
+        self._eos = False
+
+    def tell(self) -> int:
+        """
+        Returns the current position in the stream
+        :return:
+        """
+        return self._position
+
+    async def read(self, size: Optional[int] = -1) -> bytes:
+        """
+        Reads up to `size` bytes from the stream
+        :param size: Read up to `size` bytes from the stream. If None or negative read the entire stream.
+        :return: Bytes read from the stream
+        """
+        if size is None or size < 0:
+            chunks = [bytes(self._buffer)]
+            self._buffer.clear()
+            async for chunk in self._iterator:
+                chunks.append(chunk)
+            await self.aclose()
+            result = b''.join(chunks)
+        else:
+            while len(self._buffer) < size and not self._eos:
+                try:
+                    self._buffer += await self._iterator.__anext__()
+                except StopAsyncIteration:
+                    await self.aclose()
+            result = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        self._position += len(result)
+        return result
+
+    async def aclose(self) -> None:
+        """Release the underlying connection back to the pool."""
+        self._eos = True
+        await self._response.aclose()
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[bytes]:
+        if self._buffer:
+            chunk = bytes(self._buffer)
+            self._buffer.clear()
+            self._position += len(chunk)
+            yield chunk
+        async for chunk in self._iterator:
+            self._position += len(chunk)
+            yield chunk
+        await self.aclose()
+
+
+class AsyncBoxNetworkClient(AsyncNetworkClient):
+    """
+    Network client issuing requests on an `asyncio` event loop with `httpx`.
+
+    It shares request preparation, retry and error handling semantics with `BoxNetworkClient`,
+    backing off with `asyncio.sleep`. Access tokens are requested and refreshed with this client
+    through the asynchronous methods of the authentication and the retry strategy.
+    Upload streams are read in `executor` (the default executor of the running loop when not provided).
+    """
+
+    def __init__(
+        self,
+        async_client: Optional['httpx.AsyncClient'] = None,
+        *,
+        executor=None,
+    ):
+        super().__init__()
+        if httpx is None:
+            raise ImportError(
+                'Missing `httpx` dependency. `httpx` library is required to use AsyncBoxNetworkClient.'
+            )
+        self.async_client = async_client or httpx.AsyncClient()
+        self.executor = executor
+
+    async def aclose(self) -> None:
+        """Close all connections held by the underlying `httpx` client."""
+        await self.async_client.aclose()
+
+    async def fetch(self, options: FetchOptions) -> FetchResponse:
+        retry_strategy = (
+            options.network_session.retry_strategy
+            if options.network_session
+            else BoxRetryStrategy()
+        )
+        data_sanitizer = (
+            options.network_session.data_sanitizer
+            if options.network_session
+            else DataSanitizer()
+        )
+
+        attempt_nr = 1
+        number_of_retries_on_exception = 0
+        response = APIResponse()
+
+        options_stream_position = self._get_options_stream_position(options)
+        multipart_streams_positions = self._get_multipart_stream_positions(options)
+
+        while True:
+            request: APIRequest = await self._prepare_request_async(
+                options, reauthenticate=response.reauthentication_needed
+            )
+            response: APIResponse = await self._make_request(request=request)
+            network_response = response.network_response
+            if network_response is not None:
+                attempt_for_retry = attempt_nr
+                headers = self._read_headers(network_response)
+
+                if options.response_format == ResponseFormat.BINARY:
+                    fetch_response = FetchResponse(
+                        url=str(network_response.url),
+                        status=network_response.status_code,
+                        headers=headers,
+                        content=AsyncResponseByteStream(network_response),
+                    )
+                else:
+                    await network_response.aread()
+                    fetch_response = FetchResponse(
+                        url=str(network_response.url),
+                        status=network_response.status_code,
+                        headers=headers,
+                        data=self._read_json_body(network_response.content),
+                        raw_content=network_response.content,
+                    )
+            else:
+                number_of_retries_on_exception += 1
+                attempt_for_retry = number_of_retries_on_exception
+                fetch_response = FetchResponse(status=0, headers={})
+            fetch_response.access_token = self._get_access_token(request)
+
+            attempt_nr += 1
+            should_retry = await retry_strategy.should_retry_async(
+                options, fetch_response, attempt_for_retry, self
+            )
+
+            if should_retry:
+                if network_response is not None:
+                    await network_response.aclose()
+                self._reset_options_stream(
+                    options, options_stream_position, response.raised_exception
+                )
+                self._reset_multipart_streams(
+                    options, multipart_streams_positions, response.raised_exception
+                )
+                await asyncio.sleep(
+                    retry_strategy.retry_after(
+                        fetch_options=options,
+                        fetch_response=fetch_response,
+                        attempt_number=attempt_for_retry,
+                    )
+                )
+                continue
+
+            if 200 <= fetch_response.status < 400:
+                return fetch_response
+            break
+
+        if response.network_response is not None:
+            await response.network_response.aread()
+            await response.network_response.aclose()
+        self._raise_on_unsuccessful_request(
+            request=request, response=response, data_sanitizer=data_sanitizer
+        )
+
+    async def _prepare_request_async(
+        self, options: FetchOptions, reauthenticate: bool = False
+    ) -> APIRequest:
+        if options.auth is None:
+            return self._prepare_request(options=options)
+        if reauthenticate:
+            await options.auth.refresh_token_async(
+                self, network_session=options.network_session
+            )
+        authorization: str = await options.auth.retrieve_authorization_header_async(
+            self, network_session=options.network_session
+        )
+        return self._prepare_request(options=options, authorization=authorization)
+
+    async def _make_request(self, request: APIRequest) -> APIResponse:
+        raised_exception = None
+        reauthentication_needed = False
+        headers = dict(request.headers)
+        try:
+            http_request = self.async_client.build_request(
+                method=request.method,
+                url=request.url,
+                headers=headers,
+                params=request.params,
+                content=self._prepare_content(request.data, headers),
+                timeout=self._to_httpx_timeout(request.timeout),
+            )
+            network_response = await self.async_client.send(
+                http_request,
+                stream=True,
+                follow_redirects=request.allow_redirects,
+            )
+        except httpx.TransportError as request_exc:
+            raised_exception = request_exc
+            network_response = None
+
+            if 'EOF occurred in violation of protocol' in str(request_exc):
+                reauthentication_needed = True
+
+        return APIResponse(
+            network_response=network_response,
+            reauthentication_needed=reauthentication_needed,
+            raised_exception=raised_exception,
+        )
+
+    def _prepare_content(self, data, headers: Dict[str, str]):
+        if data is None:
+            return None
+        if isinstance(data, str):
+            return data.encode('utf-8')
+        if isinstance(data, (bytes, bytearray)):
+            return data
+        content_length = self._get_content_length(data)
+        if content_length is not None:
+            headers['Content-Length'] = str(content_length)
+        return self._iterate_stream(data)
+
+    @staticmethod
+    def _get_content_length(stream) -> Optional[int]:
+        if hasattr(stream, 'len'):
+            # `MultipartEncoder` exposes the total length of the encoded body
+            return stream.len
+        if hasattr(stream, 'seekable') and stream.seekable():
+            position = stream.tell()
+            end = stream.seek(0, io.SEEK_END)
+            stream.seek(position)
+            return end - position
+        return None
+
+    async def _iterate_stream(self, stream) -> AsyncIterator[bytes]:
+        while True:
+            chunk = await self._run_in_executor(stream.read, STREAM_READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+    @staticmethod
+    def _to_httpx_timeout(timeout) -> 'httpx.Timeout':
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            return httpx.Timeout(None, connect=connect_timeout, read=read_timeout)
+        return httpx.Timeout(timeout)
+
+    @staticmethod
+    def _read_headers(network_response: 'httpx.Response') -> Dict[str, str]:
+        # Keep the header names as sent by the server, as `BoxNetworkClient` does.
+        return {
+            name.decode('latin-1'): value.decode('latin-1')
+            for name, value in network_response.headers.raw
+        }
+
+    async def _run_in_executor(self, function, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, partial(function, *args, **kwargs)
+        )
+
+    _prepare_request = BoxNetworkClient._prepare_request
+    _get_request_timeout = staticmethod(BoxNetworkClient._get_request_timeout)
+    _prepare_headers = staticmethod(BoxNetworkClient._prepare_headers)
+    _get_access_token = staticmethod(BoxNetworkClient._get_access_token)
+    _prepare_body = staticmethod(BoxNetworkClient._prepare_body)
+    _raise_on_unsuccessful_request = staticmethod(
+        BoxNetworkClient._raise_on_unsuccessful_request
+    )
+    _get_multipart_stream_positions = staticmethod(
+        BoxNetworkClient._get_multipart_stream_positions
+    )
+    _get_options_stream_position = staticmethod(
+        BoxNetworkClient._get_options_stream_position
+    )
+    _validate_seekable = staticmethod(BoxNetworkClient._validate_seekable)
+    _read_json_body = staticmethod(BoxNetworkClient._read_json_body)
+    _reset_stream = BoxNetworkClient._reset_stream
+    _reset_options_stream = BoxNetworkClient._reset_options_stream
+    _reset_multipart_streams = BoxNetworkClient._reset_multipart_streams
@@ -0,0 +1,14 @@
+from abc import abstractmethod
+
+from box_sdk_gen.networking.fetch_options import FetchOptions
+
+from box_sdk_gen.networking.fetch_response import FetchResponse
+
+
+class AsyncNetworkClient:
+    def __init__(self):
+        pass
+
+    @abstractmethod
+    async def fetch(self, options: FetchOptions) -> FetchResponse:
+        pass
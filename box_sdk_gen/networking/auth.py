@@ -1,4 +1,8 @@
-from typing import Optional
+import asyncio
+
+import functools
+
+from typing import TYPE_CHECKING, Optional
 
 from abc import abstractmethod
 
@@ -8,6 +12,9 @@ from box_sdk_gen.schemas.access_token import AccessToken
 
 from box_sdk_gen.networking.network import NetworkSession
 
+if TYPE_CHECKING:
+    from box_sdk_gen.networking.async_network_client import AsyncNetworkClient
+
 
 class Authentication:
     def __init__(self):
@@ -25,12 +32,103 @@ class Authentication:
     ) -> AccessToken:
         pass
 
+    def refresh_rejected_token(
+        self,
+        rejected_access_token: Optional[str],
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Refreshes the access token after the API rejected `rejected_access_token`,
+        unless the stored token was already refreshed since.
+        """
+        return self.refresh_token(network_session=network_session)
+
     @abstractmethod
     def retrieve_authorization_header(
         self, *, network_session: Optional[NetworkSession] = None
     ) -> str:
         pass
 
+    def needs_token_request(self) -> bool:
+        """
+        Returns whether retrieving the authorization header may request a token from the API,
+        blocking the caller until it is received.
+        """
+        return True
+
+    async def retrieve_token_async(
+        self,
+        async_network_client: 'AsyncNetworkClient',
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Asynchronous counterpart of `retrieve_token`. Authentications requesting their tokens with
+        `async_network_client` override it, by default the token is retrieved in the default executor
+        of the running loop.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(self.retrieve_token, network_session=network_session),
+        )
+
+    async def retrieve_authorization_header_async(
+        self,
+        async_network_client: 'AsyncNetworkClient',
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> str:
+        """
+        Asynchronous counterpart of `retrieve_authorization_header`, used by `AsyncBoxNetworkClient`.
+        Authentications requesting their tokens with `async_network_client` override it, by default the header
+        is retrieved in the default executor of the running loop when it may request a token.
+        """
+        if not self.needs_token_request():
+            return self.retrieve_authorization_header(network_session=network_session)
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                self.retrieve_authorization_header, network_session=network_session
+            ),
+        )
+
+    async def refresh_token_async(
+        self,
+        async_network_client: 'AsyncNetworkClient',
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Asynchronous counterpart of `refresh_token`. Authentications requesting their tokens with
+        `async_network_client` override it, by default the token is refreshed in the default executor
+        of the running loop.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self.refresh_token, network_session=network_session)
+        )
+
+    async def refresh_rejected_token_async(
+        self,
+        rejected_access_token: Optional[str],
+        async_network_client: 'AsyncNetworkClient',
+        *,
+        network_session: Optional[NetworkSession] = None
+    ) -> AccessToken:
+        """
+        Asynchronous counterpart of `refresh_rejected_token`. Authentications requesting their tokens with
+        `async_network_client` override it, by default the token is refreshed in the default executor
+        of the running loop.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                self.refresh_rejected_token,
+                rejected_access_token,
+                network_session=network_session,
+            ),
+        )
+
     @abstractmethod
     def revoke_token(self, *, network_session: Optional[NetworkSession] = None) -> None:
         pass
@@ -1,5 +1,3 @@
-import io
-
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
@@ -15,11 +13,19 @@ from .retries import BoxRetryStrategy
 from ..networking.fetch_options import FetchOptions
 from ..networking.fetch_response import FetchResponse
 from ..box.errors import BoxAPIError, BoxSDKError, RequestInfo, ResponseInfo
-from ..internal.utils import ByteStream, ResponseByteStream
+from ..internal.utils import (
+    ByteStream,
+    DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    ResponseByteStream,
+)
 from ..networking.network_client import NetworkClient
 from ..networking.timeout_config import TimeoutConfig
+from ..networking.pool_config import PoolConfig
+from ..networking.connection_pool import PooledHTTPAdapter, PoolStats
+from ..networking.base_urls import BaseUrls
 from ..serialization.json import (
     sd_to_json,
+    sd_to_json_bytes,
     sd_to_url_params,
     json_to_serialized_data,
 )
@@ -61,9 +67,86 @@ class APIResponse:
 
 
 class BoxNetworkClient(NetworkClient):
-    def __init__(self, requests_session: Optional[Session] = None):
+    def __init__(
+        self,
+        requests_session: Optional[Session] = None,
+        *,
+        pool_config: Optional[PoolConfig] = None,
+        base_urls: Optional[BaseUrls] = None,
+        download_chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    ):
         super().__init__()
+        if download_chunk_size < 1:
+            raise ValueError('download_chunk_size must be a positive number')
         self.requests_session = requests_session or requests.Session()
+        self.download_chunk_size = download_chunk_size
+        self.pool_config: Optional[PoolConfig] = None
+        self._pool_adapters: Dict[str, PooledHTTPAdapter] = {}
+        self._mounted_pools: Dict[str, PooledHTTPAdapter] = {}
+        if pool_config is not None:
+            self.configure_pools(pool_config, base_urls or BaseUrls())
+
+    def configure_pools(self, pool_config: PoolConfig, base_urls: BaseUrls) -> None:
+        """
+        Mount a separate connection pool for each of the API, upload and OAuth 2.0 base urls,
+        and a default one for any other url, all configured with `pool_config`.
+
+        Network sessions sharing this client configure it with their own base urls: pools already
+        mounted for the same `pool_config` are kept with their connections and statistics, and only
+        the missing ones are mounted. A different `pool_config` replaces every pool mounted before,
+        and the replaced pools are closed.
+        :param pool_config: Connection pool configuration
+        :param base_urls: Base urls which get dedicated connection pools
+        """
+        prefixes = {
+            'default': 'https://',
+            'base_url': base_urls.base_url,
+            'upload_url': base_urls.upload_url,
+            'oauth_2_url': base_urls.oauth_2_url,
+        }
+        if pool_config is not self.pool_config:
+            # Pools mounted for the base urls of other sessions are replaced as well
+            mounted_prefixes = [
+                prefix
+                for prefix in self._mounted_pools
+                if prefix not in ('https://', 'http://')
+            ]
+            self.pool_config = pool_config
+            self._mounted_pools = {}
+            for prefix in mounted_prefixes:
+                self._mount_pool(prefix)
+        for name, prefix in prefixes.items():
+            self._pool_adapters[name] = self._mount_pool(prefix)
+        self._mount_pool('http://', self._pool_adapters['default'])
+
+    def _mount_pool(
+        self, prefix: str, adapter: Optional[PooledHTTPAdapter] = None
+    ) -> PooledHTTPAdapter:
+        """
+        Returns the connection pool mounted for `prefix` with the current `pool_config`, mounting `adapter`
+        or a new pool when there is none, and closing the adapter it replaces.
+        """
+        mounted_adapter = self._mounted_pools.get(prefix)
+        if mounted_adapter is not None:
+            return mounted_adapter
+        if adapter is None:
+            adapter = PooledHTTPAdapter(self.pool_config)
+        replaced_adapter = self.requests_session.adapters.get(prefix)
+        self.requests_session.mount(prefix, adapter)
+        self._mounted_pools[prefix] = adapter
+        if replaced_adapter is not None and replaced_adapter not in (
+            self.requests_session.adapters.values()
+        ):
+            replaced_adapter.close()
+        return adapter
+
+    def get_pool_stats(self) -> Dict[str, PoolStats]:
+        """
+        Returns the statistics of each connection pool configured with `configure_pools`,
+        keyed by `base_url`, `upload_url`, `oauth_2_url` and `default`, for the base urls
+        the client was last configured with.
+        """
+        return {name: adapter.stats for name, adapter in self._pool_adapters.items()}
 
     def fetch(self, options: 'FetchOptions') -> FetchResponse:
         retry_strategy = (
@@ -99,21 +182,27 @@ class BoxNetworkClient(NetworkClient):
                         status=network_response.status_code,
                         headers=dict(response.network_response.headers),
                         content=ResponseByteStream(
-                            response.network_response.iter_content(chunk_size=1024)
+                            response.network_response.iter_content(
+                                chunk_size=self.download_chunk_size
+                            ),
+                            close_response=response.network_response.close,
                         ),
                     )
                 else:
+                    # Decode the body straight from bytes, `content` stream is created only if requested
+                    raw_content = network_response.content
                     fetch_response = FetchResponse(
                         url=network_response.url,
                         status=network_response.status_code,
                         headers=dict(response.network_response.headers),
-                        data=(self._read_json_body(network_response.text)),
-                        content=io.BytesIO(network_response.content),
+                        data=self._read_json_body(raw_content),
+                        raw_content=raw_content,
                     )
             else:
                 number_of_retries_on_exception += 1
                 attempt_for_retry = number_of_retries_on_exception
                 fetch_response = FetchResponse(status=0, headers={})
+            fetch_response.access_token = self._get_access_token(request)
 
             attempt_nr += 1
             should_retry = retry_strategy.should_retry(
@@ -146,9 +235,12 @@ class BoxNetworkClient(NetworkClient):
         )
 
     def _prepare_request(
-        self, options: 'FetchOptions', reauthenticate: bool = False
+        self,
+        options: 'FetchOptions',
+        reauthenticate: bool = False,
+        authorization: Optional[str] = None,
     ) -> APIRequest:
-        headers = self._prepare_headers(options, reauthenticate)
+        headers = self._prepare_headers(options, reauthenticate, authorization)
         params = options.params or {}
         data = self._prepare_body(
             options.content_type, options.file_stream or options.data
@@ -218,21 +310,34 @@ class BoxNetworkClient(NetworkClient):
 
         return read_timeout_ms / 1000.0
 
+    @staticmethod
+    def _get_access_token(request: APIRequest) -> Optional[str]:
+        """Returns the access token the request is authorized with, so that a 401 refreshes only that token."""
+        authorization: Optional[str] = request.headers.get('Authorization', None)
+        if authorization is None or not authorization.startswith('Bearer '):
+            return None
+        return authorization[len('Bearer '):]
+
     @staticmethod
     def _prepare_headers(
-        options: 'FetchOptions', reauthenticate: bool = False
+        options: 'FetchOptions',
+        reauthenticate: bool = False,
+        authorization: Optional[str] = None,
     ) -> Dict[str, str]:
+        # `authorization` is the header already retrieved from `options.auth`, e.g. asynchronously
         headers = {}
         if options.network_session:
             headers.update(options.network_session.additional_headers)
         if options.headers:
             headers.update(options.headers)
         if options.auth:
-            if reauthenticate:
-                options.auth.refresh_token(network_session=options.network_session)
-            headers['Authorization'] = options.auth.retrieve_authorization_header(
-                network_session=options.network_session
-            )
+            if authorization is None:
+                if reauthenticate:
+                    options.auth.refresh_token(network_session=options.network_session)
+                authorization = options.auth.retrieve_authorization_header(
+                    network_session=options.network_session
+                )
+            headers['Authorization'] = authorization
 
         headers['User-Agent'] = USER_AGENT_HEADER
         headers['X-Box-UA'] = X_BOX_UA_HEADER
@@ -241,12 +346,12 @@ class BoxNetworkClient(NetworkClient):
     @staticmethod
     def _prepare_body(
         content_type: str, data: Union[dict, ByteStream]
-    ) -> Optional[Union[str, ByteStream]]:
+    ) -> Optional[Union[str, bytes, ByteStream]]:
         if (
             content_type == 'application/json'
             or content_type == 'application/json-patch+json'
         ):
-            return sd_to_json(data) if data else None
+            return sd_to_json_bytes(data) if data else None
         if content_type == 'application/x-www-form-urlencoded':
             return sd_to_url_params(data)
         if (
@@ -303,7 +408,11 @@ class BoxNetworkClient(NetworkClient):
                 url=request.url,
                 query_params=request.params,
                 headers=request.headers,
-                body=request.data,
+                body=(
+                    request.data.decode('utf-8')
+                    if isinstance(request.data, bytes)
+                    else request.data
+                ),
                 content_type=request.content_type,
             ),
             response_info=ResponseInfo(
@@ -346,7 +455,7 @@ class BoxNetworkClient(NetworkClient):
             )
 
     @staticmethod
-    def _read_json_body(response_body: str) -> dict:
+    def _read_json_body(response_body: Union[str, bytes]) -> dict:
         if not response_body:
             return {}
         try:
@@ -0,0 +1,159 @@
+import socket
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .pool_config import PoolConfig
+
+
+class PoolStats:
+    """
+    Counters describing how connections of a pool were used.
+
+    - `connections_opened` - number of new connections, including reconnections of dropped or expired ones
+    - `connections_reused` - number of requests sent over an already open connection
+    - `connections_discarded` - number of connections closed because the pool was full
+    - `requests_waited` - number of requests which had to wait for a free connection
+    - `wait_time_ms` - total time requests spent waiting for a free connection
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self.connections_discarded = 0
+        self.requests_waited = 0
+        self.wait_time_ms = 0.0
+
+    def _increment(self, name: str, value=1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + value)
+
+    def __repr__(self) -> str:
+        return (
+            f'PoolStats(connections_opened={self.connections_opened}, '
+            f'connections_reused={self.connections_reused}, '
+            f'connections_discarded={self.connections_discarded}, '
+            f'requests_waited={self.requests_waited}, '
+            f'wait_time_ms={self.wait_time_ms:.1f})'
+        )
+
+
+class _InstrumentedConnectionPoolMixin:
+    stats: PoolStats = None
+    idle_connection_ttl: Optional[float] = None
+
+    def _new_conn(self):
+        self.stats._increment('connections_opened')
+        return super()._new_conn()
+
+    def _get_conn(self, timeout=None):
+        must_wait = self.block and self.pool is not None and self.pool.empty()
+        started_at = time.monotonic()
+        conn = super()._get_conn(timeout)
+        if must_wait:
+            self.stats._increment('requests_waited')
+            self.stats._increment(
+                'wait_time_ms', (time.monotonic() - started_at) * 1000
+            )
+
+        released_at = getattr(conn, '_box_released_at', None)
+        if released_at is None:
+            # Freshly opened by `_new_conn`
+            return conn
+        if (
+            self.idle_connection_ttl is not None and
+            time.monotonic() - released_at > self.idle_connection_ttl
+        ):
+            conn.close()
+        if conn.sock is None:
+            # Dropped by the server or expired, it will reconnect on the next request
+            self.stats._increment('connections_opened')
+        else:
+            self.stats._increment('connections_reused')
+        return conn
+
+    def _put_conn(self, conn) -> None:
+        if conn is not None:
+            conn._box_released_at = time.monotonic()
+            if self.pool is not None and self.pool.full():
+                self.stats._increment('connections_discarded')
+        super()._put_conn(conn)
+
+
+class _InstrumentedHTTPConnectionPool(
+    _InstrumentedConnectionPoolMixin, HTTPConnectionPool
+):
+    pass
+
+
+class _InstrumentedHTTPSConnectionPool(
+    _InstrumentedConnectionPoolMixin, HTTPSConnectionPool
+):
+    pass
+
+
+def _keep_alive_socket_options(pool_config: PoolConfig) -> List[Tuple[int, int, int]]:
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    idle_option = getattr(socket, 'TCP_KEEPIDLE', None) or getattr(
+        socket, 'TCP_KEEPALIVE', None
+    )
+    for option, value_ms in (
+        (idle_option, pool_config.tcp_keep_alive_idle_ms),
+        (
+            getattr(socket, 'TCP_KEEPINTVL', None),
+            pool_config.tcp_keep_alive_interval_ms,
+        ),
+    ):
+        if option is not None and value_ms is not None:
+            options.append((socket.IPPROTO_TCP, option, max(1, value_ms // 1000)))
+    if hasattr(socket, 'TCP_KEEPCNT') and pool_config.tcp_keep_alive_count is not None:
+        options.append(
+            (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, pool_config.tcp_keep_alive_count)
+        )
+    return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    `requests` transport adapter applying a `PoolConfig` and recording `PoolStats`.
+    """
+
+    def __init__(self, pool_config: PoolConfig):
+        self.pool_config = pool_config
+        self.stats = PoolStats()
+        super().__init__(
+            pool_maxsize=pool_config.max_connections_per_host,
+            pool_block=pool_config.block_when_exhausted,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.pool_config.tcp_keep_alive:
+            pool_kwargs['socket_options'] = HTTPConnection.default_socket_options + (
+                _keep_alive_socket_options(self.pool_config)
+            )
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        pool_attributes = {
+            'stats': self.stats,
+            'idle_connection_ttl': (
+                self.pool_config.idle_connection_ttl_ms / 1000
+                if self.pool_config.idle_connection_ttl_ms is not None
+                else None
+            ),
+        }
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': type(
+                'HTTPConnectionPool',
+                (_InstrumentedHTTPConnectionPool,),
+                pool_attributes,
+            ),
+            'https': type(
+                'HTTPSConnectionPool',
+                (_InstrumentedHTTPSConnectionPool,),
+                pool_attributes,
+            ),
+        }
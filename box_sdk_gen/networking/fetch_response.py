@@ -1,3 +1,5 @@
+from io import BytesIO
+
 from typing import Optional
 
 from typing import Dict
@@ -15,7 +17,9 @@ class FetchResponse:
         *,
         url: Optional[str] = None,
         data: Optional[SerializedData] = None,
-        content: Optional[ByteStream] = None
+        content: Optional[ByteStream] = None,
+        raw_content: Optional[bytes] = None,
+        access_token: Optional[str] = None
     ):
         """
         :param status: HTTP status code of the response
@@ -28,9 +32,25 @@ class FetchResponse:
         :type data: Optional[SerializedData], optional
         :param content: Streamed content of the response, defaults to None
         :type content: Optional[ByteStream], optional
+        :param raw_content: Body of the response, from which `content` is created on first access when `content` is not provided, defaults to None
+        :type raw_content: Optional[bytes], optional
+        :param access_token: Access token the request was authorized with, defaults to None
+        :type access_token: Optional[str], optional
         """
         self.status = status
         self.headers = headers
         self.url = url
         self.data = data
         self.content = content
+        self._raw_content = raw_content
+        self.access_token = access_token
+
+    @property
+    def content(self) -> Optional[ByteStream]:
+        if self._content is None and self._raw_content is not None:
+            self._content = BytesIO(self._raw_content)
+        return self._content
+
+    @content.setter
+    def content(self, content: Optional[ByteStream]):
+        self._content = content
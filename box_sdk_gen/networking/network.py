@@ -7,6 +7,7 @@ from .proxy_config import ProxyConfig
 from .base_urls import BaseUrls
 from .retries import RetryStrategy, BoxRetryStrategy
 from .timeout_config import TimeoutConfig
+from .pool_config import PoolConfig
 
 
 class NetworkSession:
@@ -20,6 +21,7 @@ class NetworkSession:
         proxy_url: str = None,
         data_sanitizer: DataSanitizer = None,
         timeout_config: TimeoutConfig = None,
+        pool_config: PoolConfig = None,
     ):
         if additional_headers is None:
             additional_headers = {}
@@ -28,7 +30,11 @@ class NetworkSession:
         if retry_strategy is None:
             retry_strategy = BoxRetryStrategy()
         if network_client is None:
-            network_client = BoxNetworkClient()
+            network_client = BoxNetworkClient(
+                pool_config=pool_config, base_urls=base_urls
+            )
+        elif pool_config is not None and hasattr(network_client, 'configure_pools'):
+            network_client.configure_pools(pool_config, base_urls)
         if (
             proxy_url
             and hasattr(network_client, 'requests_session')
@@ -52,6 +58,7 @@ class NetworkSession:
         self.retry_strategy = retry_strategy
         self.data_sanitizer = data_sanitizer
         self.timeout_config = timeout_config
+        self.pool_config = pool_config
 
     def with_additional_headers(
         self, additional_headers: Dict[str, str] = None
@@ -70,6 +77,7 @@ class NetworkSession:
             retry_strategy=self.retry_strategy,
             data_sanitizer=self.data_sanitizer,
             timeout_config=self.timeout_config,
+            pool_config=self.pool_config,
         )
 
     def with_custom_base_urls(self, base_urls: BaseUrls) -> 'NetworkSession':
@@ -87,6 +95,7 @@ class NetworkSession:
             retry_strategy=self.retry_strategy,
             data_sanitizer=self.data_sanitizer,
             timeout_config=self.timeout_config,
+            pool_config=self.pool_config,
         )
 
     def with_proxy(self, config: ProxyConfig) -> 'NetworkSession':
@@ -114,6 +123,7 @@ class NetworkSession:
             retry_strategy=self.retry_strategy,
             data_sanitizer=self.data_sanitizer,
             timeout_config=self.timeout_config,
+            pool_config=self.pool_config,
         )
 
     def with_network_client(self, network_client: NetworkClient) -> 'NetworkSession':
@@ -131,6 +141,7 @@ class NetworkSession:
             retry_strategy=self.retry_strategy,
             data_sanitizer=self.data_sanitizer,
             timeout_config=self.timeout_config,
+            pool_config=self.pool_config,
         )
 
     def with_retry_strategy(self, retry_strategy: RetryStrategy) -> 'NetworkSession':
@@ -148,6 +159,7 @@ class NetworkSession:
             retry_strategy=retry_strategy,
             data_sanitizer=self.data_sanitizer,
             timeout_config=self.timeout_config,
+            pool_config=self.pool_config,
         )
 
     def with_data_sanitizer(self, data_sanitizer: DataSanitizer) -> 'NetworkSession':
@@ -165,6 +177,7 @@ class NetworkSession:
             retry_strategy=self.retry_strategy,
             data_sanitizer=data_sanitizer,
             timeout_config=self.timeout_config,
+            pool_config=self.pool_config,
         )
 
     def with_timeout_config(self, timeout_config: TimeoutConfig) -> 'NetworkSession':
@@ -182,4 +195,23 @@ class NetworkSession:
             retry_strategy=self.retry_strategy,
             data_sanitizer=self.data_sanitizer,
             timeout_config=timeout_config,
+            pool_config=self.pool_config,
+        )
+
+    def with_pool_config(self, pool_config: PoolConfig) -> 'NetworkSession':
+        """
+        Generate a fresh network session by duplicating the existing configuration and network parameters,
+        while also including connection pool config to be used for every API call.
+        :param pool_config: PoolConfig object, which contains the connection pool config
+        :return: a new instance of NetworkSession
+        """
+        return NetworkSession(
+            network_client=self.network_client,
+            additional_headers=self.additional_headers,
+            base_urls=self.base_urls,
+            proxy_url=self.proxy_url,
+            retry_strategy=self.retry_strategy,
+            data_sanitizer=self.data_sanitizer,
+            timeout_config=self.timeout_config,
+            pool_config=pool_config,
         )
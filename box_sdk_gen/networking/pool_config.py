@@ -0,0 +1,41 @@
+from typing import Optional
+
+
+class PoolConfig:
+    def __init__(
+        self,
+        *,
+        max_connections_per_host: int = 10,
+        block_when_exhausted: bool = False,
+        idle_connection_ttl_ms: Optional[int] = None,
+        tcp_keep_alive: bool = False,
+        tcp_keep_alive_idle_ms: Optional[int] = None,
+        tcp_keep_alive_interval_ms: Optional[int] = None,
+        tcp_keep_alive_count: Optional[int] = None
+    ):
+        """
+        :param max_connections_per_host: Maximum number of connections kept open to a single host, defaults to 10
+        :type max_connections_per_host: int, optional
+        :param block_when_exhausted: If True, a request waits for a free connection when all connections to a host are in use.
+        If False, an additional connection is opened and closed after the request, defaults to False
+        :type block_when_exhausted: bool, optional
+        :param idle_connection_ttl_ms: Connections idle for longer than this are closed instead of being reused. If None, idle connections are reused until the server closes them, defaults to None
+        :type idle_connection_ttl_ms: Optional[int], optional
+        :param tcp_keep_alive: Enable TCP keep-alive probes on opened connections, defaults to False
+        :type tcp_keep_alive: bool, optional
+        :param tcp_keep_alive_idle_ms: Idle time before the first keep-alive probe is sent. Uses the system default if None, defaults to None
+        :type tcp_keep_alive_idle_ms: Optional[int], optional
+        :param tcp_keep_alive_interval_ms: Interval between keep-alive probes. Uses the system default if None, defaults to None
+        :type tcp_keep_alive_interval_ms: Optional[int], optional
+        :param tcp_keep_alive_count: Number of unanswered probes after which the connection is dropped. Uses the system default if None, defaults to None
+        :type tcp_keep_alive_count: Optional[int], optional
+        """
+        if max_connections_per_host < 1:
+            raise ValueError('max_connections_per_host must be a positive number')
+        self.max_connections_per_host = max_connections_per_host
+        self.block_when_exhausted = block_when_exhausted
+        self.idle_connection_ttl_ms = idle_connection_ttl_ms
+        self.tcp_keep_alive = tcp_keep_alive
+        self.tcp_keep_alive_idle_ms = tcp_keep_alive_idle_ms
+        self.tcp_keep_alive_interval_ms = tcp_keep_alive_interval_ms
+        self.tcp_keep_alive_count = tcp_keep_alive_count
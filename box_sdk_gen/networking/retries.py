@@ -1,6 +1,10 @@
+import asyncio
+
+import functools
+
 from abc import abstractmethod
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from box_sdk_gen.networking.fetch_options import FetchOptions
 
@@ -8,6 +12,9 @@ from box_sdk_gen.networking.fetch_response import FetchResponse
 
 from box_sdk_gen.internal.utils import random
 
+if TYPE_CHECKING:
+    from box_sdk_gen.networking.async_network_client import AsyncNetworkClient
+
 
 class RetryStrategy:
     def __init__(self):
@@ -22,6 +29,25 @@ class RetryStrategy:
     ) -> bool:
         pass
 
+    async def should_retry_async(
+        self,
+        fetch_options: FetchOptions,
+        fetch_response: FetchResponse,
+        attempt_number: int,
+        async_network_client: 'AsyncNetworkClient',
+    ) -> bool:
+        """
+        Asynchronous counterpart of `should_retry`, used by `AsyncBoxNetworkClient`. Strategies refreshing
+        rejected tokens with `async_network_client` override it, by default `should_retry` is called
+        in the default executor of the running loop, as it may refresh the access token.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                self.should_retry, fetch_options, fetch_response, attempt_number
+            ),
+        )
+
     @abstractmethod
     def retry_after(
         self,
@@ -76,14 +102,39 @@ class BoxRetryStrategy(RetryStrategy):
         if fetch_response.status == 429:
             return True
         if fetch_response.status == 401 and not fetch_options.auth == None:
-            fetch_options.auth.refresh_token(
-                network_session=fetch_options.network_session
+            fetch_options.auth.refresh_rejected_token(
+                fetch_response.access_token,
+                network_session=fetch_options.network_session,
             )
             return True
         if is_successful:
             return False
         return False
 
+    async def should_retry_async(
+        self,
+        fetch_options: FetchOptions,
+        fetch_response: FetchResponse,
+        attempt_number: int,
+        async_network_client: 'AsyncNetworkClient',
+    ) -> bool:
+        """
+        Asynchronous counterpart of `should_retry`, refreshing a rejected token with `async_network_client`.
+        Other responses are decided by `should_retry`, which only refreshes tokens after a 401 response.
+        """
+        if (
+            fetch_response.status == 401 and
+            not fetch_options.auth == None and
+            attempt_number < self.max_attempts
+        ):
+            await fetch_options.auth.refresh_rejected_token_async(
+                fetch_response.access_token,
+                async_network_client,
+                network_session=fetch_options.network_session,
+            )
+            return True
+        return self.should_retry(fetch_options, fetch_response, attempt_number)
+
     def retry_after(
         self,
         fetch_options: FetchOptions,
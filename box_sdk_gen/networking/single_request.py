@@ -0,0 +1,61 @@
+import functools
+from typing import TYPE_CHECKING, Callable, Generator, TypeVar
+
+from ..box.errors import BoxSDKError
+from ..networking.fetch_options import FetchOptions
+from ..networking.fetch_response import FetchResponse
+
+if TYPE_CHECKING:
+    from ..networking.async_network_client import AsyncNetworkClient
+
+_Result = TypeVar('_Result')
+
+RequestGenerator = Generator[FetchOptions, FetchResponse, _Result]
+
+
+def single_request(method: Callable[..., RequestGenerator]) -> Callable:
+    """
+    Turns a manager method written as a generator, which yields the `FetchOptions` of its request
+    and returns the result built from the response it receives, into a method sending the request
+    with the network client of the manager.
+    The generator function stays available as `request_generator`, so that `AsyncManager`
+    builds the same request and awaits its response from an asynchronous network client.
+    """
+
+    @functools.wraps(method)
+    def send(self, *args, **kwargs):
+        return send_request(method(self, *args, **kwargs))
+
+    send.request_generator = method
+    return send
+
+
+def send_request(requests: RequestGenerator) -> _Result:
+    """
+    Sends the request yielded by `requests` with the network client of its network session,
+    and returns the result built from the response.
+    """
+    options: FetchOptions = next(requests)
+    return _get_result(requests, options.network_session.network_client.fetch(options))
+
+
+async def send_request_async(
+    requests: RequestGenerator, async_network_client: 'AsyncNetworkClient'
+) -> _Result:
+    """
+    Sends the request yielded by `requests` with `async_network_client`,
+    and returns the result built from the response.
+    """
+    options: FetchOptions = next(requests)
+    return _get_result(requests, await async_network_client.fetch(options))
+
+
+def _get_result(requests: RequestGenerator, response: FetchResponse) -> _Result:
+    try:
+        requests.send(response)
+    except StopIteration as stop:
+        return stop.value
+    requests.close()
+    raise BoxSDKError(
+        message='Methods decorated with `single_request` send one request'
+    )
@@ -1,607 +1,1483 @@
-from box_sdk_gen.schemas.ai_agent_info import *
+from typing import TYPE_CHECKING
+
+from box_sdk_gen.internal.lazy_imports import lazy_package_attributes
+
+_LAZY_ATTRIBUTES = {
+    'AiAgentInfoModelsField': 'ai_agent_info',
+    'AiAgentInfo': 'ai_agent_info',
+    'AiResponse': 'ai_response',
+    'AiAgentReferenceTypeField': 'ai_agent_reference',
+    'AiAgentReference': 'ai_agent_reference',
+    'AiCitationTypeField': 'ai_citation',
+    'AiCitation': 'ai_citation',
+    'AiResponseFull': 'ai_response_full',
+    'AiDialogueHistory': 'ai_dialogue_history',
+    'AiExtractFieldOption': 'ai_extract_field_option',
+    'AiExtractSubField': 'ai_extract_sub_field',
+    'AiExtractStructuredResponse': 'ai_extract_structured_response',
+    'AiItemBaseTypeField': 'ai_item_base',
+    'AiItemBase': 'ai_item_base',
+    'AiItemAskTypeField': 'ai_item_ask',
+    'AiItemAsk': 'ai_item_ask',
+    'AiLlmEndpointParamsAwsTypeField': 'ai_llm_endpoint_params_aws',
+    'AiLlmEndpointParamsAws': 'ai_llm_endpoint_params_aws',
+    'AiLlmEndpointParamsGoogleTypeField': 'ai_llm_endpoint_params_google',
+    'AiLlmEndpointParamsGoogle': 'ai_llm_endpoint_params_google',
+    'AiLlmEndpointParamsIbmTypeField': 'ai_llm_endpoint_params_ibm',
+    'AiLlmEndpointParamsIbm': 'ai_llm_endpoint_params_ibm',
+    'AiLlmEndpointParamsOpenAiTypeField': 'ai_llm_endpoint_params_open_ai',
+    'AiLlmEndpointParamsOpenAi': 'ai_llm_endpoint_params_open_ai',
+    'AiLlmEndpointParams': 'ai_llm_endpoint_params',
+    'AiAgentSpreadsheetTool': 'ai_agent_spreadsheet_tool',
+    'AiStudioAgentSpreadsheetTool': 'ai_studio_agent_spreadsheet_tool',
+    'AiStudioAgentSpreadsheetToolResponse': 'ai_studio_agent_spreadsheet_tool_response',
+    'AiAgentBasicTextToolBase': 'ai_agent_basic_text_tool_base',
+    'AiAgentBasicTextToolTextGen': 'ai_agent_basic_text_tool_text_gen',
+    'AiAgentLongTextToolTextGenEmbeddingsStrategyField': 'ai_agent_long_text_tool_text_gen',
+    'AiAgentLongTextToolTextGenEmbeddingsField': 'ai_agent_long_text_tool_text_gen',
+    'AiAgentLongTextToolTextGen': 'ai_agent_long_text_tool_text_gen',
+    'AiAgentBasicGenTool': 'ai_agent_basic_gen_tool',
+    'AiStudioAgentBasicGenTool': 'ai_studio_agent_basic_gen_tool',
+    'AiStudioAgentTextGenTypeField': 'ai_studio_agent_text_gen',
+    'AiStudioAgentTextGen': 'ai_studio_agent_text_gen',
+    'AiStudioAgentBasicGenToolResponse': 'ai_studio_agent_basic_gen_tool_response',
+    'AiStudioAgentTextGenResponseTypeField': 'ai_studio_agent_text_gen_response',
+    'AiStudioAgentTextGenResponse': 'ai_studio_agent_text_gen_response',
+    'AiAgentTextGenTypeField': 'ai_agent_text_gen',
+    'AiAgentTextGen': 'ai_agent_text_gen',
+    'AiTextGenAgent': 'ai_text_gen_agent',
+    'AiTextGenItemsTypeField': 'ai_text_gen',
+    'AiTextGenItemsField': 'ai_text_gen',
+    'AiTextGen': 'ai_text_gen',
+    'AiAgentBasicTextTool': 'ai_agent_basic_text_tool',
+    'AiStudioAgentBasicTextTool': 'ai_studio_agent_basic_text_tool',
+    'AiStudioAgentBasicTextToolResponse': 'ai_studio_agent_basic_text_tool_response',
+    'AiAgentLongTextToolEmbeddingsStrategyField': 'ai_agent_long_text_tool',
+    'AiAgentLongTextToolEmbeddingsField': 'ai_agent_long_text_tool',
+    'AiAgentLongTextTool': 'ai_agent_long_text_tool',
+    'AiStudioAgentLongTextTool': 'ai_studio_agent_long_text_tool',
+    'AiStudioAgentLongTextToolResponse': 'ai_studio_agent_long_text_tool_response',
+    'AiStudioAgentExtractResponseTypeField': 'ai_studio_agent_extract_response',
+    'AiStudioAgentExtractResponse': 'ai_studio_agent_extract_response',
+    'AiStudioAgentAskResponseTypeField': 'ai_studio_agent_ask_response',
+    'AiStudioAgentAskResponse': 'ai_studio_agent_ask_response',
+    'AiStudioAgentExtractTypeField': 'ai_studio_agent_extract',
+    'AiStudioAgentExtract': 'ai_studio_agent_extract',
+    'AiStudioAgentAskTypeField': 'ai_studio_agent_ask',
+    'AiStudioAgentAsk': 'ai_studio_agent_ask',
+    'AiAgentExtractStructuredTypeField': 'ai_agent_extract_structured',
+    'AiAgentExtractStructured': 'ai_agent_extract_structured',
+    'AiExtractStructuredAgent': 'ai_extract_structured_agent',
+    'AiAgentExtractTypeField': 'ai_agent_extract',
+    'AiAgentExtract': 'ai_agent_extract',
+    'AiExtractAgent': 'ai_extract_agent',
+    'AiExtract': 'ai_extract',
+    'AiAgentAskTypeField': 'ai_agent_ask',
+    'AiAgentAsk': 'ai_agent_ask',
+    'AiAskAgent': 'ai_ask_agent',
+    'AiAskModeField': 'ai_ask',
+    'AiAsk': 'ai_ask',
+    'AiAgent': 'ai_agent',
+    'AiOptionsRules': 'ai_options_rules',
+    'AiTaxonomyFileReferenceTypeField': 'ai_taxonomy_file_reference',
+    'AiTaxonomyFileReference': 'ai_taxonomy_file_reference',
+    'AiTaxonomyReferenceTypeField': 'ai_taxonomy_reference',
+    'AiTaxonomyReference': 'ai_taxonomy_reference',
+    'AiTaxonomySource': 'ai_taxonomy_source',
+    'AiExtractStructuredMetadataTemplateTypeField': 'ai_extract_structured',
+    'AiExtractStructuredMetadataTemplateField': 'ai_extract_structured',
+    'AiExtractStructuredFieldsOptionsField': 'ai_extract_structured',
+    'AiExtractStructuredFieldsField': 'ai_extract_structured',
+    'AiExtractStructured': 'ai_extract_structured',
+    'AppItemTypeField': 'app_item',
+    'AppItem': 'app_item',
+    'ClassificationTemplateField': 'classification',
+    'Classification': 'classification',
+    'ClassificationTemplateTypeField': 'classification_template',
+    'ClassificationTemplateTemplateKeyField': 'classification_template',
+    'ClassificationTemplateDisplayNameField': 'classification_template',
+    'ClassificationTemplateFieldsTypeField': 'classification_template',
+    'ClassificationTemplateFieldsKeyField': 'classification_template',
+    'ClassificationTemplateFieldsDisplayNameField': 'classification_template',
+    'ClassificationTemplateFieldsOptionsStaticConfigClassificationField': 'classification_template',
+    'ClassificationTemplateFieldsOptionsStaticConfigField': 'classification_template',
+    'ClassificationTemplateFieldsOptionsField': 'classification_template',
+    'ClassificationTemplateFieldsField': 'classification_template',
+    'ClassificationTemplate': 'classification_template',
+    'ClientErrorTypeField': 'client_error',
+    'ClientErrorCodeField': 'client_error',
+    'ClientError': 'client_error',
+    'CollaborationAllowlistEntryTypeField': 'collaboration_allowlist_entry',
+    'CollaborationAllowlistEntryDirectionField': 'collaboration_allowlist_entry',
+    'CollaborationAllowlistEntryEnterpriseTypeField': 'collaboration_allowlist_entry',
+    'CollaborationAllowlistEntryEnterpriseField': 'collaboration_allowlist_entry',
+    'CollaborationAllowlistEntry': 'collaboration_allowlist_entry',
+    'CollaborationAllowlistEntries': 'collaboration_allowlist_entries',
+    'CollaboratorVariableTypeField': 'collaborator_variable',
+    'CollaboratorVariableVariableTypeField': 'collaborator_variable',
+    'CollaboratorVariableVariableValueTypeField': 'collaborator_variable',
+    'CollaboratorVariableVariableValueField': 'collaborator_variable',
+    'CollaboratorVariable': 'collaborator_variable',
+    'CollectionTypeField': 'collection',
+    'CollectionNameField': 'collection',
+    'CollectionCollectionTypeField': 'collection',
+    'Collection': 'collection',
+    'CollectionsOrderDirectionField': 'collections',
+    'CollectionsOrderField': 'collections',
+    'Collections': 'collections',
+    'CommentBaseTypeField': 'comment_base',
+    'CommentBase': 'comment_base',
+    'CompletionRuleVariableTypeField': 'completion_rule_variable',
+    'CompletionRuleVariableVariableTypeField': 'completion_rule_variable',
+    'CompletionRuleVariableVariableValueField': 'completion_rule_variable',
+    'CompletionRuleVariable': 'completion_rule_variable',
+    'EmailAliasTypeField': 'email_alias',
+    'EmailAlias': 'email_alias',
+    'EmailAliases': 'email_aliases',
+    'EnterpriseBaseTypeField': 'enterprise_base',
+    'EnterpriseBase': 'enterprise_base',
+    'FileBaseTypeField': 'file_base',
+    'FileBase': 'file_base',
+    'FileRequestUpdateRequestStatusField': 'file_request_update_request',
+    'FileRequestUpdateRequest': 'file_request_update_request',
+    'FileRequestCopyRequestFolderTypeField': 'file_request_copy_request',
+    'FileRequestCopyRequestFolderField': 'file_request_copy_request',
+    'FileRequestCopyRequest': 'file_request_copy_request',
+    'FileVersionBaseTypeField': 'file_version_base',
+    'FileVersionBase': 'file_version_base',
+    'FileVersionMini': 'file_version_mini',
+    'FileMini': 'file_mini',
+    'FilesUnderRetention': 'files_under_retention',
+    'FilesOnHold': 'files_on_hold',
+    'FileConflict': 'file_conflict',
+    'ConflictErrorContextInfoField': 'conflict_error',
+    'ConflictError': 'conflict_error',
+    'FolderBaseTypeField': 'folder_base',
+    'FolderBase': 'folder_base',
+    'FolderMini': 'folder_mini',
+    'Resource': 'resource',
+    'ResourceScopeScopeField': 'resource_scope',
+    'ResourceScope': 'resource_scope',
+    'AccessTokenTokenTypeField': 'access_token',
+    'AccessTokenIssuedTokenTypeField': 'access_token',
+    'AccessToken': 'access_token',
+    'FolderReferenceTypeField': 'folder_reference',
+    'FolderReference': 'folder_reference',
+    'GroupBaseTypeField': 'group_base',
+    'GroupBase': 'group_base',
+    'GroupMiniGroupTypeField': 'group_mini',
+    'GroupMini': 'group_mini',
+    'Group': 'group',
+    'GroupFullInvitabilityLevelField': 'group_full',
+    'GroupFullMemberViewabilityLevelField': 'group_full',
+    'GroupFullPermissionsField': 'group_full',
+    'GroupFull': 'group_full',
+    'GroupsOrderDirectionField': 'groups',
+    'GroupsOrderField': 'groups',
+    'Groups': 'groups',
+    'IntegrationMappingBaseTypeField': 'integration_mapping_base',
+    'IntegrationMappingBase': 'integration_mapping_base',
+    'IntegrationMappingBoxItemSlackTypeField': 'integration_mapping_box_item_slack',
+    'IntegrationMappingBoxItemSlack': 'integration_mapping_box_item_slack',
+    'IntegrationMappingPartnerItemSlackTypeField': 'integration_mapping_partner_item_slack',
+    'IntegrationMappingPartnerItemSlack': 'integration_mapping_partner_item_slack',
+    'IntegrationMappingPartnerItemTeamsTypeField': 'integration_mapping_partner_item_teams',
+    'IntegrationMappingPartnerItemTeams': 'integration_mapping_partner_item_teams',
+    'IntegrationMappingTeamsIntegrationTypeField': 'integration_mapping_teams',
+    'IntegrationMappingTeams': 'integration_mapping_teams',
+    'IntegrationMappingsTeams': 'integration_mappings_teams',
+    'IntegrationMappingPartnerItemTeamsCreateRequestTypeField': 'integration_mapping_partner_item_teams_create_request',
+    'IntegrationMappingPartnerItemTeamsCreateRequest': 'integration_mapping_partner_item_teams_create_request',
+    'IntegrationMappingTeamsCreateRequest': 'integration_mapping_teams_create_request',
+    'IntegrationMappingSlackOptions': 'integration_mapping_slack_options',
+    'IntegrationMappingSlackCreateRequest': 'integration_mapping_slack_create_request',
+    'KeywordSkillCardTypeField': 'keyword_skill_card',
+    'KeywordSkillCardSkillCardTypeField': 'keyword_skill_card',
+    'KeywordSkillCardSkillCardTitleField': 'keyword_skill_card',
+    'KeywordSkillCardSkillTypeField': 'keyword_skill_card',
+    'KeywordSkillCardSkillField': 'keyword_skill_card',
+    'KeywordSkillCardInvocationTypeField': 'keyword_skill_card',
+    'KeywordSkillCardInvocationField': 'keyword_skill_card',
+    'KeywordSkillCardEntriesField': 'keyword_skill_card',
+    'KeywordSkillCard': 'keyword_skill_card',
+    'LegalHoldPolicyMiniTypeField': 'legal_hold_policy_mini',
+    'LegalHoldPolicyMini': 'legal_hold_policy_mini',
+    'LegalHoldPolicyAssignedItemTypeField': 'legal_hold_policy_assigned_item',
+    'LegalHoldPolicyAssignedItem': 'legal_hold_policy_assigned_item',
+    'LegalHoldPolicyAssignmentBaseTypeField': 'legal_hold_policy_assignment_base',
+    'LegalHoldPolicyAssignmentBase': 'legal_hold_policy_assignment_base',
+    'MetadataBase': 'metadata_base',
+    'Metadata': 'metadata',
+    'Metadatas': 'metadatas',
+    'MetadataFull': 'metadata_full',
+    'MetadataCascadePolicyTypeField': 'metadata_cascade_policy',
+    'MetadataCascadePolicyOwnerEnterpriseTypeField': 'metadata_cascade_policy',
+    'MetadataCascadePolicyOwnerEnterpriseField': 'metadata_cascade_policy',
+    'MetadataCascadePolicyParentTypeField': 'metadata_cascade_policy',
+    'MetadataCascadePolicyParentField': 'metadata_cascade_policy',
+    'MetadataCascadePolicy': 'metadata_cascade_policy',
+    'MetadataCascadePolicies': 'metadata_cascade_policies',
+    'MetadataError': 'metadata_error',
+    'MetadataFieldFilterDateRange': 'metadata_field_filter_date_range',
+    'MetadataFieldFilterFloatRange': 'metadata_field_filter_float_range',
+    'MetadataFilterValue': 'metadata_filter_value',
+    'MetadataFilterScopeField': 'metadata_filter',
+    'MetadataFilter': 'metadata_filter',
+    'MetadataInstanceValue': 'metadata_instance_value',
+    'MetadataQueryOrderByDirectionField': 'metadata_query',
+    'MetadataQueryOrderByField': 'metadata_query',
+    'MetadataQuery': 'metadata_query',
+    'MetadataTaxonomyAncestor': 'metadata_taxonomy_ancestor',
+    'MetadataTaxonomyNode': 'metadata_taxonomy_node',
+    'MetadataTaxonomyNodes': 'metadata_taxonomy_nodes',
+    'MetadataTaxonomyLevel': 'metadata_taxonomy_level',
+    'MetadataTaxonomyLevels': 'metadata_taxonomy_levels',
+    'MetadataTaxonomy': 'metadata_taxonomy',
+    'MetadataTaxonomies': 'metadata_taxonomies',
+    'MetadataTemplateTypeField': 'metadata_template',
+    'MetadataTemplateFieldsTypeField': 'metadata_template',
+    'MetadataTemplateFieldsOptionsField': 'metadata_template',
+    'MetadataTemplateFieldsOptionsRulesField': 'metadata_template',
+    'MetadataTemplateFieldsField': 'metadata_template',
+    'MetadataTemplate': 'metadata_template',
+    'MetadataTemplates': 'metadata_templates',
+    'OAuth2Error': 'o_auth_2_error',
+    'PostOAuth2Revoke': 'post_o_auth_2_revoke',
+    'PostOAuth2TokenGrantTypeField': 'post_o_auth_2_token',
+    'PostOAuth2TokenSubjectTokenTypeField': 'post_o_auth_2_token',
+    'PostOAuth2TokenActorTokenTypeField': 'post_o_auth_2_token',
+    'PostOAuth2TokenBoxSubjectTypeField': 'post_o_auth_2_token',
+    'PostOAuth2Token': 'post_o_auth_2_token',
+    'PostOAuth2TokenRefreshAccessTokenGrantTypeField': 'post_o_auth_2_token_refresh_access_token',
+    'PostOAuth2TokenRefreshAccessToken': 'post_o_auth_2_token_refresh_access_token',
+    'RealtimeServer': 'realtime_server',
+    'RealtimeServers': 'realtime_servers',
+    'RetentionPolicyBaseTypeField': 'retention_policy_base',
+    'RetentionPolicyBase': 'retention_policy_base',
+    'RetentionPolicyMaxExtensionLengthRequestEnum': 'retention_policy_max_extension_length_request',
+    'RetentionPolicyMaxExtensionLengthRequest': 'retention_policy_max_extension_length_request',
+    'RetentionPolicyMaxExtensionLengthResponseEnum': 'retention_policy_max_extension_length_response',
+    'RetentionPolicyMaxExtensionLengthResponse': 'retention_policy_max_extension_length_response',
+    'RetentionPolicyMiniDispositionActionField': 'retention_policy_mini',
+    'RetentionPolicyMini': 'retention_policy_mini',
+    'FileVersionRetentionTypeField': 'file_version_retention',
+    'FileVersionRetention': 'file_version_retention',
+    'FileVersionRetentions': 'file_version_retentions',
+    'RoleVariableTypeField': 'role_variable',
+    'RoleVariableVariableTypeField': 'role_variable',
+    'RoleVariableVariableValueField': 'role_variable',
+    'RoleVariable': 'role_variable',
+    'Outcome': 'outcome',
+    'SessionTerminationMessage': 'session_termination_message',
+    'ShieldInformationBarrierBaseTypeField': 'shield_information_barrier_base',
+    'ShieldInformationBarrierBase': 'shield_information_barrier_base',
+    'ShieldInformationBarrierReference': 'shield_information_barrier_reference',
+    'ShieldInformationBarrierReportBaseTypeField': 'shield_information_barrier_report_base',
+    'ShieldInformationBarrierReportBase': 'shield_information_barrier_report_base',
+    'ShieldInformationBarrierReportDetailsDetailsField': 'shield_information_barrier_report_details',
+    'ShieldInformationBarrierReportDetails': 'shield_information_barrier_report_details',
+    'ShieldInformationBarrierSegmentMemberBaseTypeField': 'shield_information_barrier_segment_member_base',
+    'ShieldInformationBarrierSegmentMemberBase': 'shield_information_barrier_segment_member_base',
+    'ShieldInformationBarrierSegmentRestrictionBaseTypeField': 'shield_information_barrier_segment_restriction_base',
+    'ShieldInformationBarrierSegmentRestrictionBase': 'shield_information_barrier_segment_restriction_base',
+    'ShieldInformationBarrierSegmentRestrictionMiniShieldInformationBarrierSegmentTypeField': 'shield_information_barrier_segment_restriction_mini',
+    'ShieldInformationBarrierSegmentRestrictionMiniShieldInformationBarrierSegmentField': 'shield_information_barrier_segment_restriction_mini',
+    'ShieldInformationBarrierSegmentRestrictionMiniRestrictedSegmentTypeField': 'shield_information_barrier_segment_restriction_mini',
+    'ShieldInformationBarrierSegmentRestrictionMiniRestrictedSegmentField': 'shield_information_barrier_segment_restriction_mini',
+    'ShieldInformationBarrierSegmentRestrictionMini': 'shield_information_barrier_segment_restriction_mini',
+    'SignRequestCancelRequest': 'sign_request_cancel_request',
+    'SignRequestCreateSignerRoleField': 'sign_request_create_signer',
+    'SignRequestCreateSigner': 'sign_request_create_signer',
+    'SignRequestPrefillTag': 'sign_request_prefill_tag',
+    'SignRequestBase': 'sign_request_base',
+    'SignRequestCreateRequestSignatureColorField': 'sign_request_create_request',
+    'SignRequestCreateRequest': 'sign_request_create_request',
+    'SignRequestSignerAttachment': 'sign_request_signer_attachment',
+    'SignRequestSignerInputCustomValidationValidationTypeField': 'sign_request_signer_input_custom_validation',
+    'SignRequestSignerInputCustomValidation': 'sign_request_signer_input_custom_validation',
+    'SignRequestSignerInputDateAsiaValidationValidationTypeField': 'sign_request_signer_input_date_asia_validation',
+    'SignRequestSignerInputDateAsiaValidation': 'sign_request_signer_input_date_asia_validation',
+    'SignRequestSignerInputDateEuValidationValidationTypeField': 'sign_request_signer_input_date_eu_validation',
+    'SignRequestSignerInputDateEuValidation': 'sign_request_signer_input_date_eu_validation',
+    'SignRequestSignerInputDateIsoValidationValidationTypeField': 'sign_request_signer_input_date_iso_validation',
+    'SignRequestSignerInputDateIsoValidation': 'sign_request_signer_input_date_iso_validation',
+    'SignRequestSignerInputDateUsValidationValidationTypeField': 'sign_request_signer_input_date_us_validation',
+    'SignRequestSignerInputDateUsValidation': 'sign_request_signer_input_date_us_validation',
+    'SignRequestSignerInputEmailValidationValidationTypeField': 'sign_request_signer_input_email_validation',
+    'SignRequestSignerInputEmailValidation': 'sign_request_signer_input_email_validation',
+    'SignRequestSignerInputNumberWithCommaValidationValidationTypeField': 'sign_request_signer_input_number_with_comma_validation',
+    'SignRequestSignerInputNumberWithCommaValidation': 'sign_request_signer_input_number_with_comma_validation',
+    'SignRequestSignerInputNumberWithPeriodValidationValidationTypeField': 'sign_request_signer_input_number_with_period_validation',
+    'SignRequestSignerInputNumberWithPeriodValidation': 'sign_request_signer_input_number_with_period_validation',
+    'SignRequestSignerInputSsnValidationValidationTypeField': 'sign_request_signer_input_ssn_validation',
+    'SignRequestSignerInputSsnValidation': 'sign_request_signer_input_ssn_validation',
+    'SignRequestSignerInputZip4ValidationValidationTypeField': 'sign_request_signer_input_zip_4_validation',
+    'SignRequestSignerInputZip4Validation': 'sign_request_signer_input_zip_4_validation',
+    'SignRequestSignerInputZipValidationValidationTypeField': 'sign_request_signer_input_zip_validation',
+    'SignRequestSignerInputZipValidation': 'sign_request_signer_input_zip_validation',
+    'SignRequestSignerInputValidation': 'sign_request_signer_input_validation',
+    'TemplateSignerInputTypeField': 'template_signer_input',
+    'TemplateSignerInputContentTypeField': 'template_signer_input',
+    'TemplateSignerInputCoordinatesField': 'template_signer_input',
+    'TemplateSignerInputDimensionsField': 'template_signer_input',
+    'TemplateSignerInput': 'template_signer_input',
+    'TemplateSignerRoleField': 'template_signer',
+    'TemplateSigner': 'template_signer',
+    'SignTemplateTypeField': 'sign_template',
+    'SignTemplateAdditionalInfoNonEditableField': 'sign_template',
+    'SignTemplateAdditionalInfoRequiredSignersField': 'sign_template',
+    'SignTemplateAdditionalInfoRequiredField': 'sign_template',
+    'SignTemplateAdditionalInfoField': 'sign_template',
+    'SignTemplateReadySignLinkField': 'sign_template',
+    'SignTemplateCustomBrandingField': 'sign_template',
+    'SignTemplate': 'sign_template',
+    'SignTemplates': 'sign_templates',
+    'SignRequestSignerInputTypeField': 'sign_request_signer_input',
+    'SignRequestSignerInputContentTypeField': 'sign_request_signer_input',
+    'SignRequestSignerInput': 'sign_request_signer_input',
+    'SignRequestSignerSignerDecisionTypeField': 'sign_request_signer',
+    'SignRequestSignerSignerDecisionField': 'sign_request_signer',
+    'SignRequestSigner': 'sign_request_signer',
+    'SignRequestTypeField': 'sign_request',
+    'SignRequestStatusField': 'sign_request',
+    'SignRequestSignFilesField': 'sign_request',
+    'SignRequest': 'sign_request',
+    'SignRequests': 'sign_requests',
+    'StatusSkillCardTypeField': 'status_skill_card',
+    'StatusSkillCardSkillCardTypeField': 'status_skill_card',
+    'StatusSkillCardSkillCardTitleField': 'status_skill_card',
+    'StatusSkillCardStatusCodeField': 'status_skill_card',
+    'StatusSkillCardStatusField': 'status_skill_card',
+    'StatusSkillCardSkillTypeField': 'status_skill_card',
+    'StatusSkillCardSkillField': 'status_skill_card',
+    'StatusSkillCardInvocationTypeField': 'status_skill_card',
+    'StatusSkillCardInvocationField': 'status_skill_card',
+    'StatusSkillCard': 'status_skill_card',
+    'StoragePolicyMiniTypeField': 'storage_policy_mini',
+    'StoragePolicyMini': 'storage_policy_mini',
+    'StoragePolicyAssignmentTypeField': 'storage_policy_assignment',
+    'StoragePolicyAssignmentAssignedToField': 'storage_policy_assignment',
+    'StoragePolicyAssignment': 'storage_policy_assignment',
+    'StoragePolicyAssignments': 'storage_policy_assignments',
+    'StoragePolicy': 'storage_policy',
+    'StoragePolicies': 'storage_policies',
+    'TermsOfServiceBaseTypeField': 'terms_of_service_base',
+    'TermsOfServiceBase': 'terms_of_service_base',
+    'TermsOfServiceStatusField': 'terms_of_service',
+    'TermsOfServiceEnterpriseTypeField': 'terms_of_service',
+    'TermsOfServiceEnterpriseField': 'terms_of_service',
+    'TermsOfServiceTosTypeField': 'terms_of_service',
+    'TermsOfService': 'terms_of_service',
+    'TermsOfServices': 'terms_of_services',
+    'TimelineSkillCardTypeField': 'timeline_skill_card',
+    'TimelineSkillCardSkillCardTypeField': 'timeline_skill_card',
+    'TimelineSkillCardSkillCardTitleField': 'timeline_skill_card',
+    'TimelineSkillCardSkillTypeField': 'timeline_skill_card',
+    'TimelineSkillCardSkillField': 'timeline_skill_card',
+    'TimelineSkillCardInvocationTypeField': 'timeline_skill_card',
+    'TimelineSkillCardInvocationField': 'timeline_skill_card',
+    'TimelineSkillCardEntriesAppearsField': 'timeline_skill_card',
+    'TimelineSkillCardEntriesField': 'timeline_skill_card',
+    'TimelineSkillCard': 'timeline_skill_card',
+    'TrackingCodeTypeField': 'tracking_code',
+    'TrackingCode': 'tracking_code',
+    'TranscriptSkillCardTypeField': 'transcript_skill_card',
+    'TranscriptSkillCardSkillCardTypeField': 'transcript_skill_card',
+    'TranscriptSkillCardSkillCardTitleField': 'transcript_skill_card',
+    'TranscriptSkillCardSkillTypeField': 'transcript_skill_card',
+    'TranscriptSkillCardSkillField': 'transcript_skill_card',
+    'TranscriptSkillCardInvocationTypeField': 'transcript_skill_card',
+    'TranscriptSkillCardInvocationField': 'transcript_skill_card',
+    'TranscriptSkillCardEntriesAppearsField': 'transcript_skill_card',
+    'TranscriptSkillCardEntriesField': 'transcript_skill_card',
+    'TranscriptSkillCard': 'transcript_skill_card',
+    'SkillCard': 'skill_card',
+    'SkillCardsMetadata': 'skill_cards_metadata',
+    'UploadPartMini': 'upload_part_mini',
+    'UploadPart': 'upload_part',
+    'UploadPartsOrderDirectionField': 'upload_parts',
+    'UploadPartsOrderField': 'upload_parts',
+    'UploadParts': 'upload_parts',
+    'UploadedPart': 'uploaded_part',
+    'UploadSessionTypeField': 'upload_session',
+    'UploadSessionSessionEndpointsField': 'upload_session',
+    'UploadSession': 'upload_session',
+    'UploadUrl': 'upload_url',
+    'UserBaseTypeField': 'user_base',
+    'UserBase': 'user_base',
+    'UserIntegrationMappings': 'user_integration_mappings',
+    'IntegrationMappingIntegrationTypeField': 'integration_mapping',
+    'IntegrationMapping': 'integration_mapping',
+    'IntegrationMappings': 'integration_mappings',
+    'UserMini': 'user_mini',
+    'UserStatusField': 'user',
+    'UserNotificationEmailField': 'user',
+    'User': 'user',
+    'UserFullRoleField': 'user_full',
+    'UserFullEnterpriseTypeField': 'user_full',
+    'UserFullEnterpriseField': 'user_full',
+    'UserFull': 'user_full',
+    'UsersOrderDirectionField': 'users',
+    'UsersOrderField': 'users',
+    'Users': 'users',
+    'TrashWebLinkRestoredTypeField': 'trash_web_link_restored',
+    'TrashWebLinkRestoredPathCollectionField': 'trash_web_link_restored',
+    'TrashWebLinkRestoredItemStatusField': 'trash_web_link_restored',
+    'TrashWebLinkRestored': 'trash_web_link_restored',
+    'TrashWebLinkTypeField': 'trash_web_link',
+    'TrashWebLinkPathCollectionEntriesTypeField': 'trash_web_link',
+    'TrashWebLinkPathCollectionEntriesField': 'trash_web_link',
+    'TrashWebLinkPathCollectionField': 'trash_web_link',
+    'TrashWebLinkItemStatusField': 'trash_web_link',
+    'TrashWebLink': 'trash_web_link',
+    'TrashFolderRestoredTypeField': 'trash_folder_restored',
+    'TrashFolderRestoredPathCollectionField': 'trash_folder_restored',
+    'TrashFolderRestoredItemStatusField': 'trash_folder_restored',
+    'TrashFolderRestored': 'trash_folder_restored',
+    'TrashFolderTypeField': 'trash_folder',
+    'TrashFolderPathCollectionEntriesTypeField': 'trash_folder',
+    'TrashFolderPathCollectionEntriesField': 'trash_folder',
+    'TrashFolderPathCollectionField': 'trash_folder',
+    'TrashFolderItemStatusField': 'trash_folder',
+    'TrashFolder': 'trash_folder',
+    'TrashFileRestoredTypeField': 'trash_file_restored',
+    'TrashFileRestoredPathCollectionField': 'trash_file_restored',
+    'TrashFileRestoredItemStatusField': 'trash_file_restored',
+    'TrashFileRestored': 'trash_file_restored',
+    'TrashFileTypeField': 'trash_file',
+    'TrashFilePathCollectionEntriesTypeField': 'trash_file',
+    'TrashFilePathCollectionEntriesField': 'trash_file',
+    'TrashFilePathCollectionField': 'trash_file',
+    'TrashFileItemStatusField': 'trash_file',
+    'TrashFile': 'trash_file',
+    'TermsOfServiceUserStatusTypeField': 'terms_of_service_user_status',
+    'TermsOfServiceUserStatus': 'terms_of_service_user_status',
+    'TermsOfServiceUserStatuses': 'terms_of_service_user_statuses',
+    'TaskAssignmentTypeField': 'task_assignment',
+    'TaskAssignmentResolutionStateField': 'task_assignment',
+    'TaskAssignment': 'task_assignment',
+    'TaskAssignments': 'task_assignments',
+    'TaskTypeField': 'task',
+    'TaskActionField': 'task',
+    'TaskCompletionRuleField': 'task',
+    'Task': 'task',
+    'Tasks': 'tasks',
+    'RetentionPolicyAssignmentTypeField': 'retention_policy_assignment',
+    'RetentionPolicyAssignmentAssignedToTypeField': 'retention_policy_assignment',
+    'RetentionPolicyAssignmentAssignedToField': 'retention_policy_assignment',
+    'RetentionPolicyAssignmentFilterFieldsField': 'retention_policy_assignment',
+    'RetentionPolicyAssignment': 'retention_policy_assignment',
+    'RetentionPolicyAssignments': 'retention_policy_assignments',
+    'RetentionPolicyPolicyTypeField': 'retention_policy',
+    'RetentionPolicyRetentionTypeField': 'retention_policy',
+    'RetentionPolicyStatusField': 'retention_policy',
+    'RetentionPolicyAssignmentCountsField': 'retention_policy',
+    'RetentionPolicy': 'retention_policy',
+    'RetentionPolicies': 'retention_policies',
+    'LegalHoldPolicyAssignment': 'legal_hold_policy_assignment',
+    'LegalHoldPolicyAssignments': 'legal_hold_policy_assignments',
+    'FileVersionLegalHoldTypeField': 'file_version_legal_hold',
+    'FileVersionLegalHold': 'file_version_legal_hold',
+    'FileVersionLegalHolds': 'file_version_legal_holds',
+    'LegalHoldPolicyStatusField': 'legal_hold_policy',
+    'LegalHoldPolicyAssignmentCountsField': 'legal_hold_policy',
+    'LegalHoldPolicy': 'legal_hold_policy',
+    'LegalHoldPolicies': 'legal_hold_policies',
+    'InviteTypeField': 'invite',
+    'InviteInvitedToTypeField': 'invite',
+    'InviteInvitedToField': 'invite',
+    'Invite': 'invite',
+    'GroupMembershipTypeField': 'group_membership',
+    'GroupMembershipRoleField': 'group_membership',
+    'GroupMembership': 'group_membership',
+    'GroupMembershipsOrderDirectionField': 'group_memberships',
+    'GroupMembershipsOrderField': 'group_memberships',
+    'GroupMemberships': 'group_memberships',
+    'FileVersion': 'file_version',
+    'FileVersionFull': 'file_version_full',
+    'FileVersionsOrderDirectionField': 'file_versions',
+    'FileVersionsOrderField': 'file_versions',
+    'FileVersions': 'file_versions',
+    'FileRequestTypeField': 'file_request',
+    'FileRequestStatusField': 'file_request',
+    'FileRequest': 'file_request',
+    'FilePathCollectionField': 'file',
+    'FileSharedLinkAccessField': 'file',
+    'FileSharedLinkEffectiveAccessField': 'file',
+    'FileSharedLinkEffectivePermissionField': 'file',
+    'FileSharedLinkPermissionsField': 'file',
+    'FileSharedLinkField': 'file',
+    'FileItemStatusField': 'file',
+    'File': 'file',
+    'FileFullPermissionsField': 'file_full',
+    'FileFullLockTypeField': 'file_full',
+    'FileFullLockAppTypeField': 'file_full',
+    'FileFullLockField': 'file_full',
+    'FileFullExpiringEmbedLinkTokenTypeField': 'file_full',
+    'FileFullExpiringEmbedLinkField': 'file_full',
+    'FileFullWatermarkInfoField': 'file_full',
+    'FileFullAllowedInviteeRolesField': 'file_full',
+    'FileFullMetadataField': 'file_full',
+    'FileFullRepresentationsEntriesContentField': 'file_full',
+    'FileFullRepresentationsEntriesInfoField': 'file_full',
+    'FileFullRepresentationsEntriesPropertiesField': 'file_full',
+    'FileFullRepresentationsEntriesStatusStateField': 'file_full',
+    'FileFullRepresentationsEntriesStatusField': 'file_full',
+    'FileFullRepresentationsEntriesField': 'file_full',
+    'FileFullRepresentationsField': 'file_full',
+    'FileFullClassificationField': 'file_full',
+    'FileFullSharedLinkPermissionOptionsField': 'file_full',
+    'FileFull': 'file_full',
+    'Files': 'files',
+    'EventSourceItemTypeField': 'event_source',
+    'EventSourceClassificationField': 'event_source',
+    'EventSource': 'event_source',
+    'DevicePinnerTypeField': 'device_pinner',
+    'DevicePinner': 'device_pinner',
+    'DevicePinnersOrderByField': 'device_pinners',
+    'DevicePinnersOrderDirectionField': 'device_pinners',
+    'DevicePinnersOrderField': 'device_pinners',
+    'DevicePinners': 'device_pinners',
+    'CommentItemField': 'comment',
+    'Comment': 'comment',
+    'CommentFull': 'comment_full',
+    'CommentsOrderDirectionField': 'comments',
+    'CommentsOrderField': 'comments',
+    'Comments': 'comments',
+    'CollaborationAllowlistExemptTargetTypeField': 'collaboration_allowlist_exempt_target',
+    'CollaborationAllowlistExemptTargetEnterpriseTypeField': 'collaboration_allowlist_exempt_target',
+    'CollaborationAllowlistExemptTargetEnterpriseField': 'collaboration_allowlist_exempt_target',
+    'CollaborationAllowlistExemptTarget': 'collaboration_allowlist_exempt_target',
+    'CollaborationAllowlistExemptTargets': 'collaboration_allowlist_exempt_targets',
+    'AppItemEventSourceTypeField': 'app_item_event_source',
+    'AppItemEventSource': 'app_item_event_source',
+    'UserCollaborations': 'user_collaborations',
+    'CollaborationAccessGrantee': 'collaboration_access_grantee',
+    'ShieldInformationBarrierSegmentRestriction': 'shield_information_barrier_segment_restriction',
+    'ShieldInformationBarrierSegmentRestrictions': 'shield_information_barrier_segment_restrictions',
+    'ShieldInformationBarrierSegmentMemberMini': 'shield_information_barrier_segment_member_mini',
+    'ShieldInformationBarrierSegmentMemberShieldInformationBarrierSegmentTypeField': 'shield_information_barrier_segment_member',
+    'ShieldInformationBarrierSegmentMemberShieldInformationBarrierSegmentField': 'shield_information_barrier_segment_member',
+    'ShieldInformationBarrierSegmentMember': 'shield_information_barrier_segment_member',
+    'ShieldInformationBarrierSegmentMembers': 'shield_information_barrier_segment_members',
+    'ShieldInformationBarrierSegmentTypeField': 'shield_information_barrier_segment',
+    'ShieldInformationBarrierSegment': 'shield_information_barrier_segment',
+    'ShieldInformationBarrierSegments': 'shield_information_barrier_segments',
+    'ShieldInformationBarrierReportStatusField': 'shield_information_barrier_report',
+    'ShieldInformationBarrierReport': 'shield_information_barrier_report',
+    'ShieldInformationBarrierReports': 'shield_information_barrier_reports',
+    'ShieldInformationBarrierTypeField': 'shield_information_barrier',
+    'ShieldInformationBarrierStatusField': 'shield_information_barrier',
+    'ShieldInformationBarrier': 'shield_information_barrier',
+    'ShieldInformationBarriers': 'shield_information_barriers',
+    'FolderLockLockedOperationsField': 'folder_lock',
+    'FolderLock': 'folder_lock',
+    'FolderLocks': 'folder_locks',
+    'AiAgentAllowedEntity': 'ai_agent_allowed_entity',
+    'CreateAiAgentTypeField': 'create_ai_agent',
+    'CreateAiAgent': 'create_ai_agent',
+    'AiSingleAgentResponseTypeField': 'ai_single_agent_response',
+    'AiSingleAgentResponse': 'ai_single_agent_response',
+    'AiSingleAgentResponseFull': 'ai_single_agent_response_full',
+    'AiMultipleAgentResponse': 'ai_multiple_agent_response',
+    'UserAvatarPicUrlsField': 'user_avatar',
+    'UserAvatar': 'user_avatar',
+    'WatermarkWatermarkField': 'watermark',
+    'Watermark': 'watermark',
+    'WebhookMiniTypeField': 'webhook_mini',
+    'WebhookMiniTargetTypeField': 'webhook_mini',
+    'WebhookMiniTargetField': 'webhook_mini',
+    'WebhookMini': 'webhook_mini',
+    'Webhooks': 'webhooks',
+    'WebhookTriggersField': 'webhook',
+    'Webhook': 'webhook',
+    'WebLinkBaseTypeField': 'web_link_base',
+    'WebLinkBase': 'web_link_base',
+    'WebLinkMini': 'web_link_mini',
+    'WebLinkPathCollectionField': 'web_link',
+    'WebLinkSharedLinkAccessField': 'web_link',
+    'WebLinkSharedLinkEffectiveAccessField': 'web_link',
+    'WebLinkSharedLinkEffectivePermissionField': 'web_link',
+    'WebLinkSharedLinkPermissionsField': 'web_link',
+    'WebLinkSharedLinkField': 'web_link',
+    'WebLinkItemStatusField': 'web_link',
+    'WebLink': 'web_link',
+    'Item': 'item',
+    'ItemsOffsetPaginatedOrderDirectionField': 'items_offset_paginated',
+    'ItemsOffsetPaginatedOrderField': 'items_offset_paginated',
+    'ItemsOffsetPaginated': 'items_offset_paginated',
+    'ItemsOrderDirectionField': 'items',
+    'ItemsOrderField': 'items',
+    'Items': 'items',
+    'FolderPathCollectionField': 'folder',
+    'FolderSharedLinkAccessField': 'folder',
+    'FolderSharedLinkEffectiveAccessField': 'folder',
+    'FolderSharedLinkEffectivePermissionField': 'folder',
+    'FolderSharedLinkPermissionsField': 'folder',
+    'FolderSharedLinkField': 'folder',
+    'FolderFolderUploadEmailAccessField': 'folder',
+    'FolderFolderUploadEmailField': 'folder',
+    'FolderItemStatusField': 'folder',
+    'Folder': 'folder',
+    'FolderFullSyncStateField': 'folder_full',
+    'FolderFullPermissionsField': 'folder_full',
+    'FolderFullMetadataField': 'folder_full',
+    'FolderFullAllowedSharedLinkAccessLevelsField': 'folder_full',
+    'FolderFullAllowedInviteeRolesField': 'folder_full',
+    'FolderFullWatermarkInfoField': 'folder_full',
+    'FolderFullClassificationField': 'folder_full',
+    'FolderFull': 'folder_full',
+    'SearchResultWithSharedLinkItem': 'search_result_with_shared_link_item',
+    'SearchResultWithSharedLink': 'search_result_with_shared_link',
+    'SearchResultsWithSharedLinksTypeField': 'search_results_with_shared_links',
+    'SearchResultsWithSharedLinks': 'search_results_with_shared_links',
+    'SearchResultItem': 'search_result_item',
+    'SearchResultsTypeField': 'search_results',
+    'SearchResults': 'search_results',
+    'SearchResultsResponse': 'search_results_response',
+    'RecentItemResource': 'recent_item_resource',
+    'RecentItemInteractionTypeField': 'recent_item',
+    'RecentItem': 'recent_item',
+    'RecentItems': 'recent_items',
+    'MetadataQueryResultItem': 'metadata_query_result_item',
+    'MetadataQueryResults': 'metadata_query_results',
+    'EventSourceResource': 'event_source_resource',
+    'EventEventTypeField': 'event',
+    'Event': 'event',
+    'Events': 'events',
+    'CollaborationItem': 'collaboration_item',
+    'CollaborationTypeField': 'collaboration',
+    'CollaborationRoleField': 'collaboration',
+    'CollaborationStatusField': 'collaboration',
+    'CollaborationAcceptanceRequirementsStatusTermsOfServiceRequirementField': 'collaboration',
+    'CollaborationAcceptanceRequirementsStatusStrongPasswordRequirementField': 'collaboration',
+    'CollaborationAcceptanceRequirementsStatusTwoFactorAuthenticationRequirementField': 'collaboration',
+    'CollaborationAcceptanceRequirementsStatusField': 'collaboration',
+    'Collaboration': 'collaboration',
+    'CollaborationsOffsetPaginated': 'collaborations_offset_paginated',
+    'Collaborations': 'collaborations',
+    'AppItemAssociatedItem': 'app_item_associated_item',
+    'AppItemAssociationTypeField': 'app_item_association',
+    'AppItemAssociation': 'app_item_association',
+    'AppItemAssociations': 'app_item_associations',
+    'WorkflowMiniTypeField': 'workflow_mini',
+    'WorkflowMini': 'workflow_mini',
+    'WorkflowFlowsTypeField': 'workflow',
+    'WorkflowFlowsTriggerTypeField': 'workflow',
+    'WorkflowFlowsTriggerTriggerTypeField': 'workflow',
+    'WorkflowFlowsTriggerScopeTypeField': 'workflow',
+    'WorkflowFlowsTriggerScopeObjectTypeField': 'workflow',
+    'WorkflowFlowsTriggerScopeObjectField': 'workflow',
+    'WorkflowFlowsTriggerScopeField': 'workflow',
+    'WorkflowFlowsTriggerField': 'workflow',
+    'WorkflowFlowsOutcomesTypeField': 'workflow',
+    'WorkflowFlowsOutcomesActionTypeField': 'workflow',
+    'WorkflowFlowsOutcomesIfRejectedTypeField': 'workflow',
+    'WorkflowFlowsOutcomesIfRejectedActionTypeField': 'workflow',
+    'WorkflowFlowsOutcomesIfRejectedField': 'workflow',
+    'WorkflowFlowsOutcomesField': 'workflow',
+    'WorkflowFlowsField': 'workflow',
+    'Workflow': 'workflow',
+    'Workflows': 'workflows',
+    'ZipDownloadNameConflictsTypeField': 'zip_download',
+    'ZipDownloadNameConflictsField': 'zip_download',
+    'ZipDownload': 'zip_download',
+    'ZipDownloadRequestItemsTypeField': 'zip_download_request',
+    'ZipDownloadRequestItemsField': 'zip_download_request',
+    'ZipDownloadRequest': 'zip_download_request',
+    'ZipDownloadStatusStateField': 'zip_download_status',
+    'ZipDownloadStatus': 'zip_download_status',
+    'ArchiveV2025R0TypeField': 'v2025_r0.archive_v2025_r0',
+    'ArchiveV2025R0OwnedByField': 'v2025_r0.archive_v2025_r0',
+    'ArchiveV2025R0': 'v2025_r0.archive_v2025_r0',
+    'ArchivesV2025R0': 'v2025_r0.archives_v2025_r0',
+    'ClientErrorV2025R0TypeField': 'v2025_r0.client_error_v2025_r0',
+    'ClientErrorV2025R0CodeField': 'v2025_r0.client_error_v2025_r0',
+    'ClientErrorV2025R0': 'v2025_r0.client_error_v2025_r0',
+    'CollaborationPermissionsV2025R0': 'v2025_r0.collaboration_permissions_v2025_r0',
+    'CustomSessionDurationGroupItemV2025R0': 'v2025_r0.custom_session_duration_group_item_v2025_r0',
+    'DocGenBatchBaseV2025R0TypeField': 'v2025_r0.doc_gen_batch_base_v2025_r0',
+    'DocGenBatchBaseV2025R0': 'v2025_r0.doc_gen_batch_base_v2025_r0',
+    'DocGenDocumentGenerationDataV2025R0': 'v2025_r0.doc_gen_document_generation_data_v2025_r0',
+    'DocGenJobBaseV2025R0TypeField': 'v2025_r0.doc_gen_job_base_v2025_r0',
+    'DocGenJobBaseV2025R0': 'v2025_r0.doc_gen_job_base_v2025_r0',
+    'DocGenTagV2025R0TagTypeField': 'v2025_r0.doc_gen_tag_v2025_r0',
+    'DocGenTagV2025R0': 'v2025_r0.doc_gen_tag_v2025_r0',
+    'DocGenTagsV2025R0': 'v2025_r0.doc_gen_tags_v2025_r0',
+    'DocGenTagsProcessingMessageV2025R0': 'v2025_r0.doc_gen_tags_processing_message_v2025_r0',
+    'EnterpriseConfigurationItemV2025R0': 'v2025_r0.enterprise_configuration_item_v2025_r0',
+    'EnterpriseConfigurationItemStringV2025R0': 'v2025_r0.enterprise_configuration_item_string_v2025_r0',
+    'EnterpriseConfigurationItemIntegerV2025R0': 'v2025_r0.enterprise_configuration_item_integer_v2025_r0',
+    'EnterpriseConfigurationItemBooleanV2025R0': 'v2025_r0.enterprise_configuration_item_boolean_v2025_r0',
+    'EnterpriseReferenceV2025R0TypeField': 'v2025_r0.enterprise_reference_v2025_r0',
+    'EnterpriseReferenceV2025R0': 'v2025_r0.enterprise_reference_v2025_r0',
+    'ExternalCollabSecuritySettingsV2025R0': 'v2025_r0.external_collab_security_settings_v2025_r0',
+    'ExternalUserDeletionResultV2025R0': 'v2025_r0.external_user_deletion_result_v2025_r0',
+    'ExternalUsersSubmitDeleteJobResponseV2025R0': 'v2025_r0.external_users_submit_delete_job_response_v2025_r0',
+    'FileReferenceV2025R0TypeField': 'v2025_r0.file_reference_v2025_r0',
+    'FileReferenceV2025R0': 'v2025_r0.file_reference_v2025_r0',
+    'DocGenTemplateCreateRequestV2025R0': 'v2025_r0.doc_gen_template_create_request_v2025_r0',
+    'DocGenTemplateBaseV2025R0': 'v2025_r0.doc_gen_template_base_v2025_r0',
+    'DocGenTemplateV2025R0': 'v2025_r0.doc_gen_template_v2025_r0',
+    'DocGenTemplatesV2025R0': 'v2025_r0.doc_gen_templates_v2025_r0',
+    'FileVersionBaseV2025R0TypeField': 'v2025_r0.file_version_base_v2025_r0',
+    'FileVersionBaseV2025R0': 'v2025_r0.file_version_base_v2025_r0',
+    'DocGenJobV2025R0StatusField': 'v2025_r0.doc_gen_job_v2025_r0',
+    'DocGenJobV2025R0FailuresField': 'v2025_r0.doc_gen_job_v2025_r0',
+    'DocGenJobV2025R0': 'v2025_r0.doc_gen_job_v2025_r0',
+    'DocGenJobsV2025R0': 'v2025_r0.doc_gen_jobs_v2025_r0',
+    'DocGenBatchCreateRequestV2025R0DestinationFolderTypeField': 'v2025_r0.doc_gen_batch_create_request_v2025_r0',
+    'DocGenBatchCreateRequestV2025R0DestinationFolderField': 'v2025_r0.doc_gen_batch_create_request_v2025_r0',
+    'DocGenBatchCreateRequestV2025R0': 'v2025_r0.doc_gen_batch_create_request_v2025_r0',
+    'FolderReferenceV2025R0TypeField': 'v2025_r0.folder_reference_v2025_r0',
+    'FolderReferenceV2025R0': 'v2025_r0.folder_reference_v2025_r0',
+    'GroupBaseV2025R0TypeField': 'v2025_r0.group_base_v2025_r0',
+    'GroupBaseV2025R0': 'v2025_r0.group_base_v2025_r0',
+    'GroupMiniV2025R0GroupTypeField': 'v2025_r0.group_mini_v2025_r0',
+    'GroupMiniV2025R0': 'v2025_r0.group_mini_v2025_r0',
+    'HubBaseV2025R0TypeField': 'v2025_r0.hub_base_v2025_r0',
+    'HubBaseV2025R0': 'v2025_r0.hub_base_v2025_r0',
+    'HubCollaborationCreateRequestV2025R0HubTypeField': 'v2025_r0.hub_collaboration_create_request_v2025_r0',
+    'HubCollaborationCreateRequestV2025R0HubField': 'v2025_r0.hub_collaboration_create_request_v2025_r0',
+    'HubCollaborationCreateRequestV2025R0AccessibleByField': 'v2025_r0.hub_collaboration_create_request_v2025_r0',
+    'HubCollaborationCreateRequestV2025R0': 'v2025_r0.hub_collaboration_create_request_v2025_r0',
+    'HubCollaborationUpdateRequestV2025R0': 'v2025_r0.hub_collaboration_update_request_v2025_r0',
+    'HubCopyRequestV2025R0': 'v2025_r0.hub_copy_request_v2025_r0',
+    'HubCreateRequestV2025R0': 'v2025_r0.hub_create_request_v2025_r0',
+    'HubDocumentBlockV2025R0': 'v2025_r0.hub_document_block_v2025_r0',
+    'HubSectionTitleTextBlockV2025R0TypeField': 'v2025_r0.hub_section_title_text_block_v2025_r0',
+    'HubSectionTitleTextBlockV2025R0': 'v2025_r0.hub_section_title_text_block_v2025_r0',
+    'HubParagraphTextBlockV2025R0TypeField': 'v2025_r0.hub_paragraph_text_block_v2025_r0',
+    'HubParagraphTextBlockV2025R0': 'v2025_r0.hub_paragraph_text_block_v2025_r0',
+    'HubItemListBlockV2025R0TypeField': 'v2025_r0.hub_item_list_block_v2025_r0',
+    'HubItemListBlockV2025R0': 'v2025_r0.hub_item_list_block_v2025_r0',
+    'HubDividerBlockV2025R0TypeField': 'v2025_r0.hub_divider_block_v2025_r0',
+    'HubDividerBlockV2025R0': 'v2025_r0.hub_divider_block_v2025_r0',
+    'HubCalloutBoxTextBlockV2025R0TypeField': 'v2025_r0.hub_callout_box_text_block_v2025_r0',
+    'HubCalloutBoxTextBlockV2025R0': 'v2025_r0.hub_callout_box_text_block_v2025_r0',
+    'HubDocumentBlockEntryV2025R0': 'v2025_r0.hub_document_block_entry_v2025_r0',
+    'HubDocumentBlocksV2025R0TypeField': 'v2025_r0.hub_document_blocks_v2025_r0',
+    'HubDocumentBlocksV2025R0': 'v2025_r0.hub_document_blocks_v2025_r0',
+    'HubDocumentPageV2025R0': 'v2025_r0.hub_document_page_v2025_r0',
+    'HubDocumentPagesV2025R0TypeField': 'v2025_r0.hub_document_pages_v2025_r0',
+    'HubDocumentPagesV2025R0': 'v2025_r0.hub_document_pages_v2025_r0',
+    'HubItemV2025R0TypeField': 'v2025_r0.hub_item_v2025_r0',
+    'HubItemV2025R0': 'v2025_r0.hub_item_v2025_r0',
+    'HubItemsV2025R0': 'v2025_r0.hub_items_v2025_r0',
+    'HubUpdateRequestV2025R0CopyHubAccessField': 'v2025_r0.hub_update_request_v2025_r0',
+    'HubUpdateRequestV2025R0': 'v2025_r0.hub_update_request_v2025_r0',
+    'KeysafeSettingsV2025R0': 'v2025_r0.keysafe_settings_v2025_r0',
+    'EnterpriseConfigurationSecurityV2025R0LastPasswordResetAtField': 'v2025_r0.enterprise_configuration_security_v2025_r0',
+    'EnterpriseConfigurationSecurityV2025R0ExternalCollabMultiFactorAuthSettingsField': 'v2025_r0.enterprise_configuration_security_v2025_r0',
+    'EnterpriseConfigurationSecurityV2025R0KeysafeField': 'v2025_r0.enterprise_configuration_security_v2025_r0',
+    'EnterpriseConfigurationSecurityV2025R0CustomSessionDurationGroupsField': 'v2025_r0.enterprise_configuration_security_v2025_r0',
+    'EnterpriseConfigurationSecurityV2025R0EnforcedMfaFrequencyFieldValueField': 'v2025_r0.enterprise_configuration_security_v2025_r0',
+    'EnterpriseConfigurationSecurityV2025R0EnforcedMfaFrequencyField': 'v2025_r0.enterprise_configuration_security_v2025_r0',
+    'EnterpriseConfigurationSecurityV2025R0': 'v2025_r0.enterprise_configuration_security_v2025_r0',
+    'ListUserV2025R0': 'v2025_r0.list_user_v2025_r0',
+    'SharedLinkPermissionsV2025R0': 'v2025_r0.shared_link_permissions_v2025_r0',
+    'ShieldListMiniV2025R0TypeField': 'v2025_r0.shield_list_mini_v2025_r0',
+    'ShieldListMiniV2025R0ContentField': 'v2025_r0.shield_list_mini_v2025_r0',
+    'ShieldListMiniV2025R0': 'v2025_r0.shield_list_mini_v2025_r0',
+    'ShieldListsV2025R0': 'v2025_r0.shield_lists_v2025_r0',
+    'ShieldListContentCountryV2025R0TypeField': 'v2025_r0.shield_list_content_country_v2025_r0',
+    'ShieldListContentCountryV2025R0': 'v2025_r0.shield_list_content_country_v2025_r0',
+    'ShieldListContentDomainV2025R0TypeField': 'v2025_r0.shield_list_content_domain_v2025_r0',
+    'ShieldListContentDomainV2025R0': 'v2025_r0.shield_list_content_domain_v2025_r0',
+    'ShieldListContentEmailV2025R0TypeField': 'v2025_r0.shield_list_content_email_v2025_r0',
+    'ShieldListContentEmailV2025R0': 'v2025_r0.shield_list_content_email_v2025_r0',
+    'ShieldListContentIntegrationV2025R0TypeField': 'v2025_r0.shield_list_content_integration_v2025_r0',
+    'ShieldListContentIntegrationV2025R0IntegrationsField': 'v2025_r0.shield_list_content_integration_v2025_r0',
+    'ShieldListContentIntegrationV2025R0': 'v2025_r0.shield_list_content_integration_v2025_r0',
+    'ShieldListContentIpV2025R0TypeField': 'v2025_r0.shield_list_content_ip_v2025_r0',
+    'ShieldListContentIpV2025R0': 'v2025_r0.shield_list_content_ip_v2025_r0',
+    'ShieldListContentRequestV2025R0': 'v2025_r0.shield_list_content_request_v2025_r0',
+    'ShieldListsUpdateV2025R0': 'v2025_r0.shield_lists_update_v2025_r0',
+    'ShieldListsCreateV2025R0': 'v2025_r0.shield_lists_create_v2025_r0',
+    'ShieldListContentV2025R0': 'v2025_r0.shield_list_content_v2025_r0',
+    'ShieldListV2025R0': 'v2025_r0.shield_list_v2025_r0',
+    'ShieldRuleItemV2025R0TypeField': 'v2025_r0.shield_rule_item_v2025_r0',
+    'ShieldRuleItemV2025R0PriorityField': 'v2025_r0.shield_rule_item_v2025_r0',
+    'ShieldRuleItemV2025R0': 'v2025_r0.shield_rule_item_v2025_r0',
+    'EnterpriseConfigurationShieldV2025R0': 'v2025_r0.enterprise_configuration_shield_v2025_r0',
+    'TermsOfServiceBaseV2025R0TypeField': 'v2025_r0.terms_of_service_base_v2025_r0',
+    'TermsOfServiceBaseV2025R0': 'v2025_r0.terms_of_service_base_v2025_r0',
+    'UserBaseV2025R0TypeField': 'v2025_r0.user_base_v2025_r0',
+    'UserBaseV2025R0': 'v2025_r0.user_base_v2025_r0',
+    'UserMiniV2025R0': 'v2025_r0.user_mini_v2025_r0',
+    'HubV2025R0CopyHubAccessField': 'v2025_r0.hub_v2025_r0',
+    'HubV2025R0': 'v2025_r0.hub_v2025_r0',
+    'HubsV2025R0': 'v2025_r0.hubs_v2025_r0',
+    'HubCollaborationUserV2025R0': 'v2025_r0.hub_collaboration_user_v2025_r0',
+    'HubAccessGranteeV2025R0': 'v2025_r0.hub_access_grantee_v2025_r0',
+    'HubCollaborationV2025R0TypeField': 'v2025_r0.hub_collaboration_v2025_r0',
+    'HubCollaborationV2025R0StatusField': 'v2025_r0.hub_collaboration_v2025_r0',
+    'HubCollaborationV2025R0AcceptanceRequirementsStatusTermsOfServiceRequirementField': 'v2025_r0.hub_collaboration_v2025_r0',
+    'HubCollaborationV2025R0AcceptanceRequirementsStatusStrongPasswordRequirementField': 'v2025_r0.hub_collaboration_v2025_r0',
+    'HubCollaborationV2025R0AcceptanceRequirementsStatusTwoFactorAuthenticationRequirementField': 'v2025_r0.hub_collaboration_v2025_r0',
+    'HubCollaborationV2025R0AcceptanceRequirementsStatusField': 'v2025_r0.hub_collaboration_v2025_r0',
+    'HubCollaborationV2025R0': 'v2025_r0.hub_collaboration_v2025_r0',
+    'HubCollaborationsV2025R0': 'v2025_r0.hub_collaborations_v2025_r0',
+    'DocGenJobFullV2025R0': 'v2025_r0.doc_gen_job_full_v2025_r0',
+    'DocGenJobsFullV2025R0': 'v2025_r0.doc_gen_jobs_full_v2025_r0',
+    'UserOrGroupReferenceV2025R0TypeField': 'v2025_r0.user_or_group_reference_v2025_r0',
+    'UserOrGroupReferenceV2025R0': 'v2025_r0.user_or_group_reference_v2025_r0',
+    'EnterpriseFeatureSettingV2025R0FeatureField': 'v2025_r0.enterprise_feature_setting_v2025_r0',
+    'EnterpriseFeatureSettingV2025R0': 'v2025_r0.enterprise_feature_setting_v2025_r0',
+    'EnterpriseFeatureSettingsItemV2025R0': 'v2025_r0.enterprise_feature_settings_item_v2025_r0',
+    'EnterpriseConfigurationContentAndSharingV2025R0SharedLinkDefaultPermissionsSelectedField': 'v2025_r0.enterprise_configuration_content_and_sharing_v2025_r0',
+    'EnterpriseConfigurationContentAndSharingV2025R0CollaborationPermissionsField': 'v2025_r0.enterprise_configuration_content_and_sharing_v2025_r0',
+    'EnterpriseConfigurationContentAndSharingV2025R0CollaborationRestrictionsField': 'v2025_r0.enterprise_configuration_content_and_sharing_v2025_r0',
+    'EnterpriseConfigurationContentAndSharingV2025R0ExternalCollaborationStatusField': 'v2025_r0.enterprise_configuration_content_and_sharing_v2025_r0',
+    'EnterpriseConfigurationContentAndSharingV2025R0ExternalCollaborationAllowlistUsersField': 'v2025_r0.enterprise_configuration_content_and_sharing_v2025_r0',
+    'EnterpriseConfigurationContentAndSharingV2025R0PermanentDeletionAllowlistUsersField': 'v2025_r0.enterprise_configuration_content_and_sharing_v2025_r0',
+    'EnterpriseConfigurationContentAndSharingV2025R0': 'v2025_r0.enterprise_configuration_content_and_sharing_v2025_r0',
+    'UserReferenceV2025R0TypeField': 'v2025_r0.user_reference_v2025_r0',
+    'UserReferenceV2025R0': 'v2025_r0.user_reference_v2025_r0',
+    'ExternalUsersSubmitDeleteJobRequestV2025R0': 'v2025_r0.external_users_submit_delete_job_request_v2025_r0',
+    'UserTrackingCodeV2025R0': 'v2025_r0.user_tracking_code_v2025_r0',
+    'EnterpriseConfigurationUserSettingsV2025R0UserTrackingCodesField': 'v2025_r0.enterprise_configuration_user_settings_v2025_r0',
+    'EnterpriseConfigurationUserSettingsV2025R0': 'v2025_r0.enterprise_configuration_user_settings_v2025_r0',
+    'EnterpriseConfigurationV2025R0TypeField': 'v2025_r0.enterprise_configuration_v2025_r0',
+    'EnterpriseConfigurationV2025R0': 'v2025_r0.enterprise_configuration_v2025_r0',
+    'WeblinkReferenceV2025R0TypeField': 'v2025_r0.weblink_reference_v2025_r0',
+    'WeblinkReferenceV2025R0': 'v2025_r0.weblink_reference_v2025_r0',
+    'HubItemReferenceV2025R0': 'v2025_r0.hub_item_reference_v2025_r0',
+    'HubItemOperationResultV2025R0': 'v2025_r0.hub_item_operation_result_v2025_r0',
+    'HubItemsManageResponseV2025R0': 'v2025_r0.hub_items_manage_response_v2025_r0',
+    'HubItemOperationV2025R0ActionField': 'v2025_r0.hub_item_operation_v2025_r0',
+    'HubItemOperationV2025R0': 'v2025_r0.hub_item_operation_v2025_r0',
+    'HubItemsManageRequestV2025R0': 'v2025_r0.hub_items_manage_request_v2025_r0',
+    'AutomateWorkflowReferenceV2026R0TypeField': 'v2026_r0.automate_workflow_reference_v2026_r0',
+    'AutomateWorkflowReferenceV2026R0': 'v2026_r0.automate_workflow_reference_v2026_r0',
+    'AutomateWorkflowStartRequestV2026R0': 'v2026_r0.automate_workflow_start_request_v2026_r0',
+    'ClientErrorV2026R0TypeField': 'v2026_r0.client_error_v2026_r0',
+    'ClientErrorV2026R0CodeField': 'v2026_r0.client_error_v2026_r0',
+    'ClientErrorV2026R0': 'v2026_r0.client_error_v2026_r0',
+    'FolderReferenceV2026R0TypeField': 'v2026_r0.folder_reference_v2026_r0',
+    'FolderReferenceV2026R0': 'v2026_r0.folder_reference_v2026_r0',
+    'NotesConvertRequestBodyV2026R0ContentFormatField': 'v2026_r0.notes_convert_request_body_v2026_r0',
+    'NotesConvertRequestBodyV2026R0': 'v2026_r0.notes_convert_request_body_v2026_r0',
+    'NotesConvertResponseV2026R0TypeField': 'v2026_r0.notes_convert_response_v2026_r0',
+    'NotesConvertResponseV2026R0': 'v2026_r0.notes_convert_response_v2026_r0',
+    'UserBaseV2026R0TypeField': 'v2026_r0.user_base_v2026_r0',
+    'UserBaseV2026R0': 'v2026_r0.user_base_v2026_r0',
+    'UserMiniV2026R0': 'v2026_r0.user_mini_v2026_r0',
+    'AutomateWorkflowActionV2026R0TypeField': 'v2026_r0.automate_workflow_action_v2026_r0',
+    'AutomateWorkflowActionV2026R0ActionTypeField': 'v2026_r0.automate_workflow_action_v2026_r0',
+    'AutomateWorkflowActionV2026R0': 'v2026_r0.automate_workflow_action_v2026_r0',
+    'AutomateWorkflowsV2026R0': 'v2026_r0.automate_workflows_v2026_r0',
+}
 
-from box_sdk_gen.schemas.ai_response import *
+__all__ = list(_LAZY_ATTRIBUTES)
 
-from box_sdk_gen.schemas.ai_agent_reference import *
+__getattr__, __dir__ = lazy_package_attributes(__name__, _LAZY_ATTRIBUTES)
 
-from box_sdk_gen.schemas.ai_citation import *
+if TYPE_CHECKING:
+    from box_sdk_gen.schemas.ai_agent_info import *
 
-from box_sdk_gen.schemas.ai_response_full import *
+    from box_sdk_gen.schemas.ai_response import *
 
-from box_sdk_gen.schemas.ai_dialogue_history import *
+    from box_sdk_gen.schemas.ai_agent_reference import *
 
-from box_sdk_gen.schemas.ai_extract_field_option import *
+    from box_sdk_gen.schemas.ai_citation import *
 
-from box_sdk_gen.schemas.ai_extract_sub_field import *
+    from box_sdk_gen.schemas.ai_response_full import *
 
-from box_sdk_gen.schemas.ai_extract_structured_response import *
+    from box_sdk_gen.schemas.ai_dialogue_history import *
 
-from box_sdk_gen.schemas.ai_item_base import *
+    from box_sdk_gen.schemas.ai_extract_field_option import *
 
-from box_sdk_gen.schemas.ai_item_ask import *
+    from box_sdk_gen.schemas.ai_extract_sub_field import *
 
-from box_sdk_gen.schemas.ai_llm_endpoint_params_aws import *
+    from box_sdk_gen.schemas.ai_extract_structured_response import *
 
-from box_sdk_gen.schemas.ai_llm_endpoint_params_google import *
+    from box_sdk_gen.schemas.ai_item_base import *
 
-from box_sdk_gen.schemas.ai_llm_endpoint_params_ibm import *
+    from box_sdk_gen.schemas.ai_item_ask import *
 
-from box_sdk_gen.schemas.ai_llm_endpoint_params_open_ai import *
+    from box_sdk_gen.schemas.ai_llm_endpoint_params_aws import *
 
-from box_sdk_gen.schemas.ai_llm_endpoint_params import *
+    from box_sdk_gen.schemas.ai_llm_endpoint_params_google import *
 
-from box_sdk_gen.schemas.ai_agent_spreadsheet_tool import *
+    from box_sdk_gen.schemas.ai_llm_endpoint_params_ibm import *
 
-from box_sdk_gen.schemas.ai_studio_agent_spreadsheet_tool import *
+    from box_sdk_gen.schemas.ai_llm_endpoint_params_open_ai import *
 
-from box_sdk_gen.schemas.ai_studio_agent_spreadsheet_tool_response import *
+    from box_sdk_gen.schemas.ai_llm_endpoint_params import *
 
-from box_sdk_gen.schemas.ai_agent_basic_text_tool_base import *
+    from box_sdk_gen.schemas.ai_agent_spreadsheet_tool import *
 
-from box_sdk_gen.schemas.ai_agent_basic_text_tool_text_gen import *
+    from box_sdk_gen.schemas.ai_studio_agent_spreadsheet_tool import *
 
-from box_sdk_gen.schemas.ai_agent_long_text_tool_text_gen import *
+    from box_sdk_gen.schemas.ai_studio_agent_spreadsheet_tool_response import *
 
-from box_sdk_gen.schemas.ai_agent_basic_gen_tool import *
+    from box_sdk_gen.schemas.ai_agent_basic_text_tool_base import *
 
-from box_sdk_gen.schemas.ai_studio_agent_basic_gen_tool import *
+    from box_sdk_gen.schemas.ai_agent_basic_text_tool_text_gen import *
 
-from box_sdk_gen.schemas.ai_studio_agent_text_gen import *
+    from box_sdk_gen.schemas.ai_agent_long_text_tool_text_gen import *
 
-from box_sdk_gen.schemas.ai_studio_agent_basic_gen_tool_response import *
+    from box_sdk_gen.schemas.ai_agent_basic_gen_tool import *
 
-from box_sdk_gen.schemas.ai_studio_agent_text_gen_response import *
+    from box_sdk_gen.schemas.ai_studio_agent_basic_gen_tool import *
 
-from box_sdk_gen.schemas.ai_agent_text_gen import *
+    from box_sdk_gen.schemas.ai_studio_agent_text_gen import *
 
-from box_sdk_gen.schemas.ai_text_gen_agent import *
+    from box_sdk_gen.schemas.ai_studio_agent_basic_gen_tool_response import *
 
-from box_sdk_gen.schemas.ai_text_gen import *
+    from box_sdk_gen.schemas.ai_studio_agent_text_gen_response import *
 
-from box_sdk_gen.schemas.ai_agent_basic_text_tool import *
+    from box_sdk_gen.schemas.ai_agent_text_gen import *
 
-from box_sdk_gen.schemas.ai_studio_agent_basic_text_tool import *
+    from box_sdk_gen.schemas.ai_text_gen_agent import *
 
-from box_sdk_gen.schemas.ai_studio_agent_basic_text_tool_response import *
+    from box_sdk_gen.schemas.ai_text_gen import *
 
-from box_sdk_gen.schemas.ai_agent_long_text_tool import *
+    from box_sdk_gen.schemas.ai_agent_basic_text_tool import *
 
-from box_sdk_gen.schemas.ai_studio_agent_long_text_tool import *
+    from box_sdk_gen.schemas.ai_studio_agent_basic_text_tool import *
 
-from box_sdk_gen.schemas.ai_studio_agent_long_text_tool_response import *
+    from box_sdk_gen.schemas.ai_studio_agent_basic_text_tool_response import *
 
-from box_sdk_gen.schemas.ai_studio_agent_extract_response import *
+    from box_sdk_gen.schemas.ai_agent_long_text_tool import *
 
-from box_sdk_gen.schemas.ai_studio_agent_ask_response import *
+    from box_sdk_gen.schemas.ai_studio_agent_long_text_tool import *
 
-from box_sdk_gen.schemas.ai_studio_agent_extract import *
+    from box_sdk_gen.schemas.ai_studio_agent_long_text_tool_response import *
 
-from box_sdk_gen.schemas.ai_studio_agent_ask import *
+    from box_sdk_gen.schemas.ai_studio_agent_extract_response import *
 
-from box_sdk_gen.schemas.ai_agent_extract_structured import *
+    from box_sdk_gen.schemas.ai_studio_agent_ask_response import *
 
-from box_sdk_gen.schemas.ai_extract_structured_agent import *
+    from box_sdk_gen.schemas.ai_studio_agent_extract import *
 
-from box_sdk_gen.schemas.ai_agent_extract import *
+    from box_sdk_gen.schemas.ai_studio_agent_ask import *
 
-from box_sdk_gen.schemas.ai_extract_agent import *
+    from box_sdk_gen.schemas.ai_agent_extract_structured import *
 
-from box_sdk_gen.schemas.ai_extract import *
+    from box_sdk_gen.schemas.ai_extract_structured_agent import *
 
-from box_sdk_gen.schemas.ai_agent_ask import *
+    from box_sdk_gen.schemas.ai_agent_extract import *
 
-from box_sdk_gen.schemas.ai_ask_agent import *
+    from box_sdk_gen.schemas.ai_extract_agent import *
 
-from box_sdk_gen.schemas.ai_ask import *
+    from box_sdk_gen.schemas.ai_extract import *
 
-from box_sdk_gen.schemas.ai_agent import *
+    from box_sdk_gen.schemas.ai_agent_ask import *
 
-from box_sdk_gen.schemas.ai_options_rules import *
+    from box_sdk_gen.schemas.ai_ask_agent import *
 
-from box_sdk_gen.schemas.ai_taxonomy_file_reference import *
+    from box_sdk_gen.schemas.ai_ask import *
 
-from box_sdk_gen.schemas.ai_taxonomy_reference import *
+    from box_sdk_gen.schemas.ai_agent import *
 
-from box_sdk_gen.schemas.ai_taxonomy_source import *
+    from box_sdk_gen.schemas.ai_options_rules import *
 
-from box_sdk_gen.schemas.ai_extract_structured import *
+    from box_sdk_gen.schemas.ai_taxonomy_file_reference import *
 
-from box_sdk_gen.schemas.app_item import *
+    from box_sdk_gen.schemas.ai_taxonomy_reference import *
 
-from box_sdk_gen.schemas.classification import *
+    from box_sdk_gen.schemas.ai_taxonomy_source import *
 
-from box_sdk_gen.schemas.classification_template import *
+    from box_sdk_gen.schemas.ai_extract_structured import *
 
-from box_sdk_gen.schemas.client_error import *
+    from box_sdk_gen.schemas.app_item import *
 
-from box_sdk_gen.schemas.collaboration_allowlist_entry import *
+    from box_sdk_gen.schemas.classification import *
 
-from box_sdk_gen.schemas.collaboration_allowlist_entries import *
+    from box_sdk_gen.schemas.classification_template import *
 
-from box_sdk_gen.schemas.collaborator_variable import *
+    from box_sdk_gen.schemas.client_error import *
 
-from box_sdk_gen.schemas.collection import *
+    from box_sdk_gen.schemas.collaboration_allowlist_entry import *
 
-from box_sdk_gen.schemas.collections import *
+    from box_sdk_gen.schemas.collaboration_allowlist_entries import *
 
-from box_sdk_gen.schemas.comment_base import *
+    from box_sdk_gen.schemas.collaborator_variable import *
 
-from box_sdk_gen.schemas.completion_rule_variable import *
+    from box_sdk_gen.schemas.collection import *
 
-from box_sdk_gen.schemas.email_alias import *
+    from box_sdk_gen.schemas.collections import *
 
-from box_sdk_gen.schemas.email_aliases import *
+    from box_sdk_gen.schemas.comment_base import *
 
-from box_sdk_gen.schemas.enterprise_base import *
+    from box_sdk_gen.schemas.completion_rule_variable import *
 
-from box_sdk_gen.schemas.file_base import *
+    from box_sdk_gen.schemas.email_alias import *
 
-from box_sdk_gen.schemas.file_request_update_request import *
+    from box_sdk_gen.schemas.email_aliases import *
 
-from box_sdk_gen.schemas.file_request_copy_request import *
+    from box_sdk_gen.schemas.enterprise_base import *
 
-from box_sdk_gen.schemas.file_version_base import *
+    from box_sdk_gen.schemas.file_base import *
 
-from box_sdk_gen.schemas.file_version_mini import *
+    from box_sdk_gen.schemas.file_request_update_request import *
 
-from box_sdk_gen.schemas.file_mini import *
+    from box_sdk_gen.schemas.file_request_copy_request import *
 
-from box_sdk_gen.schemas.files_under_retention import *
+    from box_sdk_gen.schemas.file_version_base import *
 
-from box_sdk_gen.schemas.files_on_hold import *
+    from box_sdk_gen.schemas.file_version_mini import *
 
-from box_sdk_gen.schemas.file_conflict import *
+    from box_sdk_gen.schemas.file_mini import *
 
-from box_sdk_gen.schemas.conflict_error import *
+    from box_sdk_gen.schemas.files_under_retention import *
 
-from box_sdk_gen.schemas.folder_base import *
+    from box_sdk_gen.schemas.files_on_hold import *
 
-from box_sdk_gen.schemas.folder_mini import *
+    from box_sdk_gen.schemas.file_conflict import *
 
-from box_sdk_gen.schemas.resource import *
+    from box_sdk_gen.schemas.conflict_error import *
 
-from box_sdk_gen.schemas.resource_scope import *
+    from box_sdk_gen.schemas.folder_base import *
 
-from box_sdk_gen.schemas.access_token import *
+    from box_sdk_gen.schemas.folder_mini import *
 
-from box_sdk_gen.schemas.folder_reference import *
+    from box_sdk_gen.schemas.resource import *
 
-from box_sdk_gen.schemas.group_base import *
+    from box_sdk_gen.schemas.resource_scope import *
 
-from box_sdk_gen.schemas.group_mini import *
+    from box_sdk_gen.schemas.access_token import *
 
-from box_sdk_gen.schemas.group import *
+    from box_sdk_gen.schemas.folder_reference import *
 
-from box_sdk_gen.schemas.group_full import *
+    from box_sdk_gen.schemas.group_base import *
 
-from box_sdk_gen.schemas.groups import *
+    from box_sdk_gen.schemas.group_mini import *
 
-from box_sdk_gen.schemas.integration_mapping_base import *
+    from box_sdk_gen.schemas.group import *
 
-from box_sdk_gen.schemas.integration_mapping_box_item_slack import *
+    from box_sdk_gen.schemas.group_full import *
 
-from box_sdk_gen.schemas.integration_mapping_partner_item_slack import *
+    from box_sdk_gen.schemas.groups import *
 
-from box_sdk_gen.schemas.integration_mapping_partner_item_teams import *
+    from box_sdk_gen.schemas.integration_mapping_base import *
 
-from box_sdk_gen.schemas.integration_mapping_teams import *
+    from box_sdk_gen.schemas.integration_mapping_box_item_slack import *
 
-from box_sdk_gen.schemas.integration_mappings_teams import *
+    from box_sdk_gen.schemas.integration_mapping_partner_item_slack import *
 
-from box_sdk_gen.schemas.integration_mapping_partner_item_teams_create_request import *
+    from box_sdk_gen.schemas.integration_mapping_partner_item_teams import *
 
-from box_sdk_gen.schemas.integration_mapping_teams_create_request import *
+    from box_sdk_gen.schemas.integration_mapping_teams import *
 
-from box_sdk_gen.schemas.integration_mapping_slack_options import *
+    from box_sdk_gen.schemas.integration_mappings_teams import *
 
-from box_sdk_gen.schemas.integration_mapping_slack_create_request import *
+    from box_sdk_gen.schemas.integration_mapping_partner_item_teams_create_request import *
 
-from box_sdk_gen.schemas.keyword_skill_card import *
+    from box_sdk_gen.schemas.integration_mapping_teams_create_request import *
 
-from box_sdk_gen.schemas.legal_hold_policy_mini import *
+    from box_sdk_gen.schemas.integration_mapping_slack_options import *
 
-from box_sdk_gen.schemas.legal_hold_policy_assigned_item import *
+    from box_sdk_gen.schemas.integration_mapping_slack_create_request import *
 
-from box_sdk_gen.schemas.legal_hold_policy_assignment_base import *
+    from box_sdk_gen.schemas.keyword_skill_card import *
 
-from box_sdk_gen.schemas.metadata_base import *
+    from box_sdk_gen.schemas.legal_hold_policy_mini import *
 
-from box_sdk_gen.schemas.metadata import *
+    from box_sdk_gen.schemas.legal_hold_policy_assigned_item import *
 
-from box_sdk_gen.schemas.metadatas import *
+    from box_sdk_gen.schemas.legal_hold_policy_assignment_base import *
 
-from box_sdk_gen.schemas.metadata_full import *
+    from box_sdk_gen.schemas.metadata_base import *
 
-from box_sdk_gen.schemas.metadata_cascade_policy import *
+    from box_sdk_gen.schemas.metadata import *
 
-from box_sdk_gen.schemas.metadata_cascade_policies import *
+    from box_sdk_gen.schemas.metadatas import *
 
-from box_sdk_gen.schemas.metadata_error import *
+    from box_sdk_gen.schemas.metadata_full import *
 
-from box_sdk_gen.schemas.metadata_field_filter_date_range import *
+    from box_sdk_gen.schemas.metadata_cascade_policy import *
 
-from box_sdk_gen.schemas.metadata_field_filter_float_range import *
+    from box_sdk_gen.schemas.metadata_cascade_policies import *
 
-from box_sdk_gen.schemas.metadata_filter_value import *
+    from box_sdk_gen.schemas.metadata_error import *
 
-from box_sdk_gen.schemas.metadata_filter import *
+    from box_sdk_gen.schemas.metadata_field_filter_date_range import *
 
-from box_sdk_gen.schemas.metadata_instance_value import *
+    from box_sdk_gen.schemas.metadata_field_filter_float_range import *
 
-from box_sdk_gen.schemas.metadata_query import *
+    from box_sdk_gen.schemas.metadata_filter_value import *
 
-from box_sdk_gen.schemas.metadata_taxonomy_ancestor import *
+    from box_sdk_gen.schemas.metadata_filter import *
 
-from box_sdk_gen.schemas.metadata_taxonomy_node import *
+    from box_sdk_gen.schemas.metadata_instance_value import *
 
-from box_sdk_gen.schemas.metadata_taxonomy_nodes import *
+    from box_sdk_gen.schemas.metadata_query import *
 
-from box_sdk_gen.schemas.metadata_taxonomy_level import *
+    from box_sdk_gen.schemas.metadata_taxonomy_ancestor import *
 
-from box_sdk_gen.schemas.metadata_taxonomy_levels import *
+    from box_sdk_gen.schemas.metadata_taxonomy_node import *
 
-from box_sdk_gen.schemas.metadata_taxonomy import *
+    from box_sdk_gen.schemas.metadata_taxonomy_nodes import *
 
-from box_sdk_gen.schemas.metadata_taxonomies import *
+    from box_sdk_gen.schemas.metadata_taxonomy_level import *
 
-from box_sdk_gen.schemas.metadata_template import *
+    from box_sdk_gen.schemas.metadata_taxonomy_levels import *
 
-from box_sdk_gen.schemas.metadata_templates import *
+    from box_sdk_gen.schemas.metadata_taxonomy import *
 
-from box_sdk_gen.schemas.o_auth_2_error import *
+    from box_sdk_gen.schemas.metadata_taxonomies import *
 
-from box_sdk_gen.schemas.post_o_auth_2_revoke import *
+    from box_sdk_gen.schemas.metadata_template import *
 
-from box_sdk_gen.schemas.post_o_auth_2_token import *
+    from box_sdk_gen.schemas.metadata_templates import *
 
-from box_sdk_gen.schemas.post_o_auth_2_token_refresh_access_token import *
+    from box_sdk_gen.schemas.o_auth_2_error import *
 
-from box_sdk_gen.schemas.realtime_server import *
+    from box_sdk_gen.schemas.post_o_auth_2_revoke import *
 
-from box_sdk_gen.schemas.realtime_servers import *
+    from box_sdk_gen.schemas.post_o_auth_2_token import *
 
-from box_sdk_gen.schemas.retention_policy_base import *
+    from box_sdk_gen.schemas.post_o_auth_2_token_refresh_access_token import *
 
-from box_sdk_gen.schemas.retention_policy_max_extension_length_request import *
+    from box_sdk_gen.schemas.realtime_server import *
 
-from box_sdk_gen.schemas.retention_policy_max_extension_length_response import *
+    from box_sdk_gen.schemas.realtime_servers import *
 
-from box_sdk_gen.schemas.retention_policy_mini import *
+    from box_sdk_gen.schemas.retention_policy_base import *
 
-from box_sdk_gen.schemas.file_version_retention import *
+    from box_sdk_gen.schemas.retention_policy_max_extension_length_request import *
 
-from box_sdk_gen.schemas.file_version_retentions import *
+    from box_sdk_gen.schemas.retention_policy_max_extension_length_response import *
 
-from box_sdk_gen.schemas.role_variable import *
+    from box_sdk_gen.schemas.retention_policy_mini import *
 
-from box_sdk_gen.schemas.outcome import *
+    from box_sdk_gen.schemas.file_version_retention import *
 
-from box_sdk_gen.schemas.session_termination_message import *
+    from box_sdk_gen.schemas.file_version_retentions import *
 
-from box_sdk_gen.schemas.shield_information_barrier_base import *
+    from box_sdk_gen.schemas.role_variable import *
 
-from box_sdk_gen.schemas.shield_information_barrier_reference import *
+    from box_sdk_gen.schemas.outcome import *
 
-from box_sdk_gen.schemas.shield_information_barrier_report_base import *
+    from box_sdk_gen.schemas.session_termination_message import *
 
-from box_sdk_gen.schemas.shield_information_barrier_report_details import *
+    from box_sdk_gen.schemas.shield_information_barrier_base import *
 
-from box_sdk_gen.schemas.shield_information_barrier_segment_member_base import *
+    from box_sdk_gen.schemas.shield_information_barrier_reference import *
 
-from box_sdk_gen.schemas.shield_information_barrier_segment_restriction_base import *
+    from box_sdk_gen.schemas.shield_information_barrier_report_base import *
 
-from box_sdk_gen.schemas.shield_information_barrier_segment_restriction_mini import *
+    from box_sdk_gen.schemas.shield_information_barrier_report_details import *
 
-from box_sdk_gen.schemas.sign_request_cancel_request import *
+    from box_sdk_gen.schemas.shield_information_barrier_segment_member_base import *
 
-from box_sdk_gen.schemas.sign_request_create_signer import *
+    from box_sdk_gen.schemas.shield_information_barrier_segment_restriction_base import *
 
-from box_sdk_gen.schemas.sign_request_prefill_tag import *
+    from box_sdk_gen.schemas.shield_information_barrier_segment_restriction_mini import *
 
-from box_sdk_gen.schemas.sign_request_base import *
+    from box_sdk_gen.schemas.sign_request_cancel_request import *
 
-from box_sdk_gen.schemas.sign_request_create_request import *
+    from box_sdk_gen.schemas.sign_request_create_signer import *
 
-from box_sdk_gen.schemas.sign_request_signer_attachment import *
+    from box_sdk_gen.schemas.sign_request_prefill_tag import *
 
-from box_sdk_gen.schemas.sign_request_signer_input_custom_validation import *
+    from box_sdk_gen.schemas.sign_request_base import *
 
-from box_sdk_gen.schemas.sign_request_signer_input_date_asia_validation import *
+    from box_sdk_gen.schemas.sign_request_create_request import *
 
-from box_sdk_gen.schemas.sign_request_signer_input_date_eu_validation import *
+    from box_sdk_gen.schemas.sign_request_signer_attachment import *
 
-from box_sdk_gen.schemas.sign_request_signer_input_date_iso_validation import *
+    from box_sdk_gen.schemas.sign_request_signer_input_custom_validation import *
 
-from box_sdk_gen.schemas.sign_request_signer_input_date_us_validation import *
+    from box_sdk_gen.schemas.sign_request_signer_input_date_asia_validation import *
 
-from box_sdk_gen.schemas.sign_request_signer_input_email_validation import *
+    from box_sdk_gen.schemas.sign_request_signer_input_date_eu_validation import *
 
-from box_sdk_gen.schemas.sign_request_signer_input_number_with_comma_validation import *
+    from box_sdk_gen.schemas.sign_request_signer_input_date_iso_validation import *
 
-from box_sdk_gen.schemas.sign_request_signer_input_number_with_period_validation import *
+    from box_sdk_gen.schemas.sign_request_signer_input_date_us_validation import *
 
-from box_sdk_gen.schemas.sign_request_signer_input_ssn_validation import *
+    from box_sdk_gen.schemas.sign_request_signer_input_email_validation import *
 
-from box_sdk_gen.schemas.sign_request_signer_input_zip_4_validation import *
+    from box_sdk_gen.schemas.sign_request_signer_input_number_with_comma_validation import *
 
-from box_sdk_gen.schemas.sign_request_signer_input_zip_validation import *
+    from box_sdk_gen.schemas.sign_request_signer_input_number_with_period_validation import *
 
-from box_sdk_gen.schemas.sign_request_signer_input_validation import *
+    from box_sdk_gen.schemas.sign_request_signer_input_ssn_validation import *
 
-from box_sdk_gen.schemas.template_signer_input import *
+    from box_sdk_gen.schemas.sign_request_signer_input_zip_4_validation import *
 
-from box_sdk_gen.schemas.template_signer import *
+    from box_sdk_gen.schemas.sign_request_signer_input_zip_validation import *
 
-from box_sdk_gen.schemas.sign_template import *
+    from box_sdk_gen.schemas.sign_request_signer_input_validation import *
 
-from box_sdk_gen.schemas.sign_templates import *
+    from box_sdk_gen.schemas.template_signer_input import *
 
-from box_sdk_gen.schemas.sign_request_signer_input import *
+    from box_sdk_gen.schemas.template_signer import *
 
-from box_sdk_gen.schemas.sign_request_signer import *
+    from box_sdk_gen.schemas.sign_template import *
 
-from box_sdk_gen.schemas.sign_request import *
+    from box_sdk_gen.schemas.sign_templates import *
 
-from box_sdk_gen.schemas.sign_requests import *
+    from box_sdk_gen.schemas.sign_request_signer_input import *
 
-from box_sdk_gen.schemas.status_skill_card import *
+    from box_sdk_gen.schemas.sign_request_signer import *
 
-from box_sdk_gen.schemas.storage_policy_mini import *
+    from box_sdk_gen.schemas.sign_request import *
 
-from box_sdk_gen.schemas.storage_policy_assignment import *
+    from box_sdk_gen.schemas.sign_requests import *
 
-from box_sdk_gen.schemas.storage_policy_assignments import *
+    from box_sdk_gen.schemas.status_skill_card import *
 
-from box_sdk_gen.schemas.storage_policy import *
+    from box_sdk_gen.schemas.storage_policy_mini import *
 
-from box_sdk_gen.schemas.storage_policies import *
+    from box_sdk_gen.schemas.storage_policy_assignment import *
 
-from box_sdk_gen.schemas.terms_of_service_base import *
+    from box_sdk_gen.schemas.storage_policy_assignments import *
 
-from box_sdk_gen.schemas.terms_of_service import *
+    from box_sdk_gen.schemas.storage_policy import *
 
-from box_sdk_gen.schemas.terms_of_services import *
+    from box_sdk_gen.schemas.storage_policies import *
 
-from box_sdk_gen.schemas.timeline_skill_card import *
+    from box_sdk_gen.schemas.terms_of_service_base import *
 
-from box_sdk_gen.schemas.tracking_code import *
+    from box_sdk_gen.schemas.terms_of_service import *
 
-from box_sdk_gen.schemas.transcript_skill_card import *
+    from box_sdk_gen.schemas.terms_of_services import *
 
-from box_sdk_gen.schemas.skill_card import *
+    from box_sdk_gen.schemas.timeline_skill_card import *
 
-from box_sdk_gen.schemas.skill_cards_metadata import *
+    from box_sdk_gen.schemas.tracking_code import *
 
-from box_sdk_gen.schemas.upload_part_mini import *
+    from box_sdk_gen.schemas.transcript_skill_card import *
 
-from box_sdk_gen.schemas.upload_part import *
+    from box_sdk_gen.schemas.skill_card import *
 
-from box_sdk_gen.schemas.upload_parts import *
+    from box_sdk_gen.schemas.skill_cards_metadata import *
 
-from box_sdk_gen.schemas.uploaded_part import *
+    from box_sdk_gen.schemas.upload_part_mini import *
 
-from box_sdk_gen.schemas.upload_session import *
+    from box_sdk_gen.schemas.upload_part import *
 
-from box_sdk_gen.schemas.upload_url import *
+    from box_sdk_gen.schemas.upload_parts import *
 
-from box_sdk_gen.schemas.user_base import *
+    from box_sdk_gen.schemas.uploaded_part import *
 
-from box_sdk_gen.schemas.user_integration_mappings import *
+    from box_sdk_gen.schemas.upload_session import *
 
-from box_sdk_gen.schemas.integration_mapping import *
+    from box_sdk_gen.schemas.upload_url import *
 
-from box_sdk_gen.schemas.integration_mappings import *
+    from box_sdk_gen.schemas.user_base import *
 
-from box_sdk_gen.schemas.user_mini import *
+    from box_sdk_gen.schemas.user_integration_mappings import *
 
-from box_sdk_gen.schemas.user import *
+    from box_sdk_gen.schemas.integration_mapping import *
 
-from box_sdk_gen.schemas.user_full import *
+    from box_sdk_gen.schemas.integration_mappings import *
 
-from box_sdk_gen.schemas.users import *
+    from box_sdk_gen.schemas.user_mini import *
 
-from box_sdk_gen.schemas.trash_web_link_restored import *
+    from box_sdk_gen.schemas.user import *
 
-from box_sdk_gen.schemas.trash_web_link import *
+    from box_sdk_gen.schemas.user_full import *
 
-from box_sdk_gen.schemas.trash_folder_restored import *
+    from box_sdk_gen.schemas.users import *
 
-from box_sdk_gen.schemas.trash_folder import *
+    from box_sdk_gen.schemas.trash_web_link_restored import *
 
-from box_sdk_gen.schemas.trash_file_restored import *
+    from box_sdk_gen.schemas.trash_web_link import *
 
-from box_sdk_gen.schemas.trash_file import *
+    from box_sdk_gen.schemas.trash_folder_restored import *
 
-from box_sdk_gen.schemas.terms_of_service_user_status import *
+    from box_sdk_gen.schemas.trash_folder import *
 
-from box_sdk_gen.schemas.terms_of_service_user_statuses import *
+    from box_sdk_gen.schemas.trash_file_restored import *
 
-from box_sdk_gen.schemas.task_assignment import *
+    from box_sdk_gen.schemas.trash_file import *
 
-from box_sdk_gen.schemas.task_assignments import *
+    from box_sdk_gen.schemas.terms_of_service_user_status import *
 
-from box_sdk_gen.schemas.task import *
+    from box_sdk_gen.schemas.terms_of_service_user_statuses import *
 
-from box_sdk_gen.schemas.tasks import *
+    from box_sdk_gen.schemas.task_assignment import *
 
-from box_sdk_gen.schemas.retention_policy_assignment import *
+    from box_sdk_gen.schemas.task_assignments import *
 
-from box_sdk_gen.schemas.retention_policy_assignments import *
+    from box_sdk_gen.schemas.task import *
 
-from box_sdk_gen.schemas.retention_policy import *
+    from box_sdk_gen.schemas.tasks import *
 
-from box_sdk_gen.schemas.retention_policies import *
+    from box_sdk_gen.schemas.retention_policy_assignment import *
 
-from box_sdk_gen.schemas.legal_hold_policy_assignment import *
+    from box_sdk_gen.schemas.retention_policy_assignments import *
 
-from box_sdk_gen.schemas.legal_hold_policy_assignments import *
+    from box_sdk_gen.schemas.retention_policy import *
 
-from box_sdk_gen.schemas.file_version_legal_hold import *
+    from box_sdk_gen.schemas.retention_policies import *
 
-from box_sdk_gen.schemas.file_version_legal_holds import *
+    from box_sdk_gen.schemas.legal_hold_policy_assignment import *
 
-from box_sdk_gen.schemas.legal_hold_policy import *
+    from box_sdk_gen.schemas.legal_hold_policy_assignments import *
 
-from box_sdk_gen.schemas.legal_hold_policies import *
+    from box_sdk_gen.schemas.file_version_legal_hold import *
 
-from box_sdk_gen.schemas.invite import *
+    from box_sdk_gen.schemas.file_version_legal_holds import *
 
-from box_sdk_gen.schemas.group_membership import *
+    from box_sdk_gen.schemas.legal_hold_policy import *
 
-from box_sdk_gen.schemas.group_memberships import *
+    from box_sdk_gen.schemas.legal_hold_policies import *
 
-from box_sdk_gen.schemas.file_version import *
+    from box_sdk_gen.schemas.invite import *
 
-from box_sdk_gen.schemas.file_version_full import *
+    from box_sdk_gen.schemas.group_membership import *
 
-from box_sdk_gen.schemas.file_versions import *
+    from box_sdk_gen.schemas.group_memberships import *
 
-from box_sdk_gen.schemas.file_request import *
+    from box_sdk_gen.schemas.file_version import *
 
-from box_sdk_gen.schemas.file import *
+    from box_sdk_gen.schemas.file_version_full import *
 
-from box_sdk_gen.schemas.file_full import *
+    from box_sdk_gen.schemas.file_versions import *
 
-from box_sdk_gen.schemas.files import *
+    from box_sdk_gen.schemas.file_request import *
 
-from box_sdk_gen.schemas.event_source import *
+    from box_sdk_gen.schemas.file import *
 
-from box_sdk_gen.schemas.device_pinner import *
+    from box_sdk_gen.schemas.file_full import *
 
-from box_sdk_gen.schemas.device_pinners import *
+    from box_sdk_gen.schemas.files import *
 
-from box_sdk_gen.schemas.comment import *
+    from box_sdk_gen.schemas.event_source import *
 
-from box_sdk_gen.schemas.comment_full import *
+    from box_sdk_gen.schemas.device_pinner import *
 
-from box_sdk_gen.schemas.comments import *
+    from box_sdk_gen.schemas.device_pinners import *
 
-from box_sdk_gen.schemas.collaboration_allowlist_exempt_target import *
+    from box_sdk_gen.schemas.comment import *
 
-from box_sdk_gen.schemas.collaboration_allowlist_exempt_targets import *
+    from box_sdk_gen.schemas.comment_full import *
 
-from box_sdk_gen.schemas.app_item_event_source import *
+    from box_sdk_gen.schemas.comments import *
 
-from box_sdk_gen.schemas.user_collaborations import *
+    from box_sdk_gen.schemas.collaboration_allowlist_exempt_target import *
 
-from box_sdk_gen.schemas.collaboration_access_grantee import *
+    from box_sdk_gen.schemas.collaboration_allowlist_exempt_targets import *
 
-from box_sdk_gen.schemas.shield_information_barrier_segment_restriction import *
+    from box_sdk_gen.schemas.app_item_event_source import *
 
-from box_sdk_gen.schemas.shield_information_barrier_segment_restrictions import *
+    from box_sdk_gen.schemas.user_collaborations import *
 
-from box_sdk_gen.schemas.shield_information_barrier_segment_member_mini import *
+    from box_sdk_gen.schemas.collaboration_access_grantee import *
 
-from box_sdk_gen.schemas.shield_information_barrier_segment_member import *
+    from box_sdk_gen.schemas.shield_information_barrier_segment_restriction import *
 
-from box_sdk_gen.schemas.shield_information_barrier_segment_members import *
+    from box_sdk_gen.schemas.shield_information_barrier_segment_restrictions import *
 
-from box_sdk_gen.schemas.shield_information_barrier_segment import *
+    from box_sdk_gen.schemas.shield_information_barrier_segment_member_mini import *
 
-from box_sdk_gen.schemas.shield_information_barrier_segments import *
+    from box_sdk_gen.schemas.shield_information_barrier_segment_member import *
 
-from box_sdk_gen.schemas.shield_information_barrier_report import *
+    from box_sdk_gen.schemas.shield_information_barrier_segment_members import *
 
-from box_sdk_gen.schemas.shield_information_barrier_reports import *
+    from box_sdk_gen.schemas.shield_information_barrier_segment import *
 
-from box_sdk_gen.schemas.shield_information_barrier import *
+    from box_sdk_gen.schemas.shield_information_barrier_segments import *
 
-from box_sdk_gen.schemas.shield_information_barriers import *
+    from box_sdk_gen.schemas.shield_information_barrier_report import *
 
-from box_sdk_gen.schemas.folder_lock import *
+    from box_sdk_gen.schemas.shield_information_barrier_reports import *
 
-from box_sdk_gen.schemas.folder_locks import *
+    from box_sdk_gen.schemas.shield_information_barrier import *
 
-from box_sdk_gen.schemas.ai_agent_allowed_entity import *
+    from box_sdk_gen.schemas.shield_information_barriers import *
 
-from box_sdk_gen.schemas.create_ai_agent import *
+    from box_sdk_gen.schemas.folder_lock import *
 
-from box_sdk_gen.schemas.ai_single_agent_response import *
+    from box_sdk_gen.schemas.folder_locks import *
 
-from box_sdk_gen.schemas.ai_single_agent_response_full import *
+    from box_sdk_gen.schemas.ai_agent_allowed_entity import *
 
-from box_sdk_gen.schemas.ai_multiple_agent_response import *
+    from box_sdk_gen.schemas.create_ai_agent import *
 
-from box_sdk_gen.schemas.user_avatar import *
+    from box_sdk_gen.schemas.ai_single_agent_response import *
 
-from box_sdk_gen.schemas.watermark import *
+    from box_sdk_gen.schemas.ai_single_agent_response_full import *
 
-from box_sdk_gen.schemas.webhook_mini import *
+    from box_sdk_gen.schemas.ai_multiple_agent_response import *
 
-from box_sdk_gen.schemas.webhooks import *
+    from box_sdk_gen.schemas.user_avatar import *
 
-from box_sdk_gen.schemas.webhook import *
+    from box_sdk_gen.schemas.watermark import *
 
-from box_sdk_gen.schemas.web_link_base import *
+    from box_sdk_gen.schemas.webhook_mini import *
 
-from box_sdk_gen.schemas.web_link_mini import *
+    from box_sdk_gen.schemas.webhooks import *
 
-from box_sdk_gen.schemas.web_link import *
+    from box_sdk_gen.schemas.webhook import *
 
-from box_sdk_gen.schemas.item import *
+    from box_sdk_gen.schemas.web_link_base import *
 
-from box_sdk_gen.schemas.items_offset_paginated import *
+    from box_sdk_gen.schemas.web_link_mini import *
 
-from box_sdk_gen.schemas.items import *
+    from box_sdk_gen.schemas.web_link import *
 
-from box_sdk_gen.schemas.folder import *
+    from box_sdk_gen.schemas.item import *
 
-from box_sdk_gen.schemas.folder_full import *
+    from box_sdk_gen.schemas.items_offset_paginated import *
 
-from box_sdk_gen.schemas.search_result_with_shared_link_item import *
+    from box_sdk_gen.schemas.items import *
 
-from box_sdk_gen.schemas.search_result_with_shared_link import *
+    from box_sdk_gen.schemas.folder import *
 
-from box_sdk_gen.schemas.search_results_with_shared_links import *
+    from box_sdk_gen.schemas.folder_full import *
 
-from box_sdk_gen.schemas.search_result_item import *
+    from box_sdk_gen.schemas.search_result_with_shared_link_item import *
 
-from box_sdk_gen.schemas.search_results import *
+    from box_sdk_gen.schemas.search_result_with_shared_link import *
 
-from box_sdk_gen.schemas.search_results_response import *
+    from box_sdk_gen.schemas.search_results_with_shared_links import *
 
-from box_sdk_gen.schemas.recent_item_resource import *
+    from box_sdk_gen.schemas.search_result_item import *
 
-from box_sdk_gen.schemas.recent_item import *
+    from box_sdk_gen.schemas.search_results import *
 
-from box_sdk_gen.schemas.recent_items import *
+    from box_sdk_gen.schemas.search_results_response import *
 
-from box_sdk_gen.schemas.metadata_query_result_item import *
+    from box_sdk_gen.schemas.recent_item_resource import *
 
-from box_sdk_gen.schemas.metadata_query_results import *
+    from box_sdk_gen.schemas.recent_item import *
 
-from box_sdk_gen.schemas.event_source_resource import *
+    from box_sdk_gen.schemas.recent_items import *
 
-from box_sdk_gen.schemas.event import *
+    from box_sdk_gen.schemas.metadata_query_result_item import *
 
-from box_sdk_gen.schemas.events import *
+    from box_sdk_gen.schemas.metadata_query_results import *
 
-from box_sdk_gen.schemas.collaboration_item import *
+    from box_sdk_gen.schemas.event_source_resource import *
 
-from box_sdk_gen.schemas.collaboration import *
+    from box_sdk_gen.schemas.event import *
 
-from box_sdk_gen.schemas.collaborations_offset_paginated import *
+    from box_sdk_gen.schemas.events import *
 
-from box_sdk_gen.schemas.collaborations import *
+    from box_sdk_gen.schemas.collaboration_item import *
 
-from box_sdk_gen.schemas.app_item_associated_item import *
+    from box_sdk_gen.schemas.collaboration import *
 
-from box_sdk_gen.schemas.app_item_association import *
+    from box_sdk_gen.schemas.collaborations_offset_paginated import *
 
-from box_sdk_gen.schemas.app_item_associations import *
+    from box_sdk_gen.schemas.collaborations import *
 
-from box_sdk_gen.schemas.workflow_mini import *
+    from box_sdk_gen.schemas.app_item_associated_item import *
 
-from box_sdk_gen.schemas.workflow import *
+    from box_sdk_gen.schemas.app_item_association import *
 
-from box_sdk_gen.schemas.workflows import *
+    from box_sdk_gen.schemas.app_item_associations import *
 
-from box_sdk_gen.schemas.zip_download import *
+    from box_sdk_gen.schemas.workflow_mini import *
 
-from box_sdk_gen.schemas.zip_download_request import *
+    from box_sdk_gen.schemas.workflow import *
 
-from box_sdk_gen.schemas.zip_download_status import *
+    from box_sdk_gen.schemas.workflows import *
 
-from box_sdk_gen.schemas.v2025_r0 import *
+    from box_sdk_gen.schemas.zip_download import *
 
-from box_sdk_gen.schemas.v2026_r0 import *
+    from box_sdk_gen.schemas.zip_download_request import *
+
+    from box_sdk_gen.schemas.zip_download_status import *
+
+    from box_sdk_gen.schemas.v2025_r0 import *
+
+    from box_sdk_gen.schemas.v2026_r0 import *
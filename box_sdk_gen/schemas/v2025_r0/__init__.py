@@ -1,185 +1,358 @@
-from box_sdk_gen.schemas.v2025_r0.archive_v2025_r0 import *
+from typing import TYPE_CHECKING
+
+from box_sdk_gen.internal.lazy_imports import lazy_package_attributes
+
+_LAZY_ATTRIBUTES = {
+    'ArchiveV2025R0TypeField': 'archive_v2025_r0',
+    'ArchiveV2025R0OwnedByField': 'archive_v2025_r0',
+    'ArchiveV2025R0': 'archive_v2025_r0',
+    'ArchivesV2025R0': 'archives_v2025_r0',
+    'ClientErrorV2025R0TypeField': 'client_error_v2025_r0',
+    'ClientErrorV2025R0CodeField': 'client_error_v2025_r0',
+    'ClientErrorV2025R0': 'client_error_v2025_r0',
+    'CollaborationPermissionsV2025R0': 'collaboration_permissions_v2025_r0',
+    'CustomSessionDurationGroupItemV2025R0': 'custom_session_duration_group_item_v2025_r0',
+    'DocGenBatchBaseV2025R0TypeField': 'doc_gen_batch_base_v2025_r0',
+    'DocGenBatchBaseV2025R0': 'doc_gen_batch_base_v2025_r0',
+    'DocGenDocumentGenerationDataV2025R0': 'doc_gen_document_generation_data_v2025_r0',
+    'DocGenJobBaseV2025R0TypeField': 'doc_gen_job_base_v2025_r0',
+    'DocGenJobBaseV2025R0': 'doc_gen_job_base_v2025_r0',
+    'DocGenTagV2025R0TagTypeField': 'doc_gen_tag_v2025_r0',
+    'DocGenTagV2025R0': 'doc_gen_tag_v2025_r0',
+    'DocGenTagsV2025R0': 'doc_gen_tags_v2025_r0',
+    'DocGenTagsProcessingMessageV2025R0': 'doc_gen_tags_processing_message_v2025_r0',
+    'EnterpriseConfigurationItemV2025R0': 'enterprise_configuration_item_v2025_r0',
+    'EnterpriseConfigurationItemStringV2025R0': 'enterprise_configuration_item_string_v2025_r0',
+    'EnterpriseConfigurationItemIntegerV2025R0': 'enterprise_configuration_item_integer_v2025_r0',
+    'EnterpriseConfigurationItemBooleanV2025R0': 'enterprise_configuration_item_boolean_v2025_r0',
+    'EnterpriseReferenceV2025R0TypeField': 'enterprise_reference_v2025_r0',
+    'EnterpriseReferenceV2025R0': 'enterprise_reference_v2025_r0',
+    'ExternalCollabSecuritySettingsV2025R0': 'external_collab_security_settings_v2025_r0',
+    'ExternalUserDeletionResultV2025R0': 'external_user_deletion_result_v2025_r0',
+    'ExternalUsersSubmitDeleteJobResponseV2025R0': 'external_users_submit_delete_job_response_v2025_r0',
+    'FileReferenceV2025R0TypeField': 'file_reference_v2025_r0',
+    'FileReferenceV2025R0': 'file_reference_v2025_r0',
+    'DocGenTemplateCreateRequestV2025R0': 'doc_gen_template_create_request_v2025_r0',
+    'DocGenTemplateBaseV2025R0': 'doc_gen_template_base_v2025_r0',
+    'DocGenTemplateV2025R0': 'doc_gen_template_v2025_r0',
+    'DocGenTemplatesV2025R0': 'doc_gen_templates_v2025_r0',
+    'FileVersionBaseV2025R0TypeField': 'file_version_base_v2025_r0',
+    'FileVersionBaseV2025R0': 'file_version_base_v2025_r0',
+    'DocGenJobV2025R0StatusField': 'doc_gen_job_v2025_r0',
+    'DocGenJobV2025R0FailuresField': 'doc_gen_job_v2025_r0',
+    'DocGenJobV2025R0': 'doc_gen_job_v2025_r0',
+    'DocGenJobsV2025R0': 'doc_gen_jobs_v2025_r0',
+    'DocGenBatchCreateRequestV2025R0DestinationFolderTypeField': 'doc_gen_batch_create_request_v2025_r0',
+    'DocGenBatchCreateRequestV2025R0DestinationFolderField': 'doc_gen_batch_create_request_v2025_r0',
+    'DocGenBatchCreateRequestV2025R0': 'doc_gen_batch_create_request_v2025_r0',
+    'FolderReferenceV2025R0TypeField': 'folder_reference_v2025_r0',
+    'FolderReferenceV2025R0': 'folder_reference_v2025_r0',
+    'GroupBaseV2025R0TypeField': 'group_base_v2025_r0',
+    'GroupBaseV2025R0': 'group_base_v2025_r0',
+    'GroupMiniV2025R0GroupTypeField': 'group_mini_v2025_r0',
+    'GroupMiniV2025R0': 'group_mini_v2025_r0',
+    'HubBaseV2025R0TypeField': 'hub_base_v2025_r0',
+    'HubBaseV2025R0': 'hub_base_v2025_r0',
+    'HubCollaborationCreateRequestV2025R0HubTypeField': 'hub_collaboration_create_request_v2025_r0',
+    'HubCollaborationCreateRequestV2025R0HubField': 'hub_collaboration_create_request_v2025_r0',
+    'HubCollaborationCreateRequestV2025R0AccessibleByField': 'hub_collaboration_create_request_v2025_r0',
+    'HubCollaborationCreateRequestV2025R0': 'hub_collaboration_create_request_v2025_r0',
+    'HubCollaborationUpdateRequestV2025R0': 'hub_collaboration_update_request_v2025_r0',
+    'HubCopyRequestV2025R0': 'hub_copy_request_v2025_r0',
+    'HubCreateRequestV2025R0': 'hub_create_request_v2025_r0',
+    'HubDocumentBlockV2025R0': 'hub_document_block_v2025_r0',
+    'HubSectionTitleTextBlockV2025R0TypeField': 'hub_section_title_text_block_v2025_r0',
+    'HubSectionTitleTextBlockV2025R0': 'hub_section_title_text_block_v2025_r0',
+    'HubParagraphTextBlockV2025R0TypeField': 'hub_paragraph_text_block_v2025_r0',
+    'HubParagraphTextBlockV2025R0': 'hub_paragraph_text_block_v2025_r0',
+    'HubItemListBlockV2025R0TypeField': 'hub_item_list_block_v2025_r0',
+    'HubItemListBlockV2025R0': 'hub_item_list_block_v2025_r0',
+    'HubDividerBlockV2025R0TypeField': 'hub_divider_block_v2025_r0',
+    'HubDividerBlockV2025R0': 'hub_divider_block_v2025_r0',
+    'HubCalloutBoxTextBlockV2025R0TypeField': 'hub_callout_box_text_block_v2025_r0',
+    'HubCalloutBoxTextBlockV2025R0': 'hub_callout_box_text_block_v2025_r0',
+    'HubDocumentBlockEntryV2025R0': 'hub_document_block_entry_v2025_r0',
+    'HubDocumentBlocksV2025R0TypeField': 'hub_document_blocks_v2025_r0',
+    'HubDocumentBlocksV2025R0': 'hub_document_blocks_v2025_r0',
+    'HubDocumentPageV2025R0': 'hub_document_page_v2025_r0',
+    'HubDocumentPagesV2025R0TypeField': 'hub_document_pages_v2025_r0',
+    'HubDocumentPagesV2025R0': 'hub_document_pages_v2025_r0',
+    'HubItemV2025R0TypeField': 'hub_item_v2025_r0',
+    'HubItemV2025R0': 'hub_item_v2025_r0',
+    'HubItemsV2025R0': 'hub_items_v2025_r0',
+    'HubUpdateRequestV2025R0CopyHubAccessField': 'hub_update_request_v2025_r0',
+    'HubUpdateRequestV2025R0': 'hub_update_request_v2025_r0',
+    'KeysafeSettingsV2025R0': 'keysafe_settings_v2025_r0',
+    'EnterpriseConfigurationSecurityV2025R0LastPasswordResetAtField': 'enterprise_configuration_security_v2025_r0',
+    'EnterpriseConfigurationSecurityV2025R0ExternalCollabMultiFactorAuthSettingsField': 'enterprise_configuration_security_v2025_r0',
+    'EnterpriseConfigurationSecurityV2025R0KeysafeField': 'enterprise_configuration_security_v2025_r0',
+    'EnterpriseConfigurationSecurityV2025R0CustomSessionDurationGroupsField': 'enterprise_configuration_security_v2025_r0',
+    'EnterpriseConfigurationSecurityV2025R0EnforcedMfaFrequencyFieldValueField': 'enterprise_configuration_security_v2025_r0',
+    'EnterpriseConfigurationSecurityV2025R0EnforcedMfaFrequencyField': 'enterprise_configuration_security_v2025_r0',
+    'EnterpriseConfigurationSecurityV2025R0': 'enterprise_configuration_security_v2025_r0',
+    'ListUserV2025R0': 'list_user_v2025_r0',
+    'SharedLinkPermissionsV2025R0': 'shared_link_permissions_v2025_r0',
+    'ShieldListMiniV2025R0TypeField': 'shield_list_mini_v2025_r0',
+    'ShieldListMiniV2025R0ContentField': 'shield_list_mini_v2025_r0',
+    'ShieldListMiniV2025R0': 'shield_list_mini_v2025_r0',
+    'ShieldListsV2025R0': 'shield_lists_v2025_r0',
+    'ShieldListContentCountryV2025R0TypeField': 'shield_list_content_country_v2025_r0',
+    'ShieldListContentCountryV2025R0': 'shield_list_content_country_v2025_r0',
+    'ShieldListContentDomainV2025R0TypeField': 'shield_list_content_domain_v2025_r0',
+    'ShieldListContentDomainV2025R0': 'shield_list_content_domain_v2025_r0',
+    'ShieldListContentEmailV2025R0TypeField': 'shield_list_content_email_v2025_r0',
+    'ShieldListContentEmailV2025R0': 'shield_list_content_email_v2025_r0',
+    'ShieldListContentIntegrationV2025R0TypeField': 'shield_list_content_integration_v2025_r0',
+    'ShieldListContentIntegrationV2025R0IntegrationsField': 'shield_list_content_integration_v2025_r0',
+    'ShieldListContentIntegrationV2025R0': 'shield_list_content_integration_v2025_r0',
+    'ShieldListContentIpV2025R0TypeField': 'shield_list_content_ip_v2025_r0',
+    'ShieldListContentIpV2025R0': 'shield_list_content_ip_v2025_r0',
+    'ShieldListContentRequestV2025R0': 'shield_list_content_request_v2025_r0',
+    'ShieldListsUpdateV2025R0': 'shield_lists_update_v2025_r0',
+    'ShieldListsCreateV2025R0': 'shield_lists_create_v2025_r0',
+    'ShieldListContentV2025R0': 'shield_list_content_v2025_r0',
+    'ShieldListV2025R0': 'shield_list_v2025_r0',
+    'ShieldRuleItemV2025R0TypeField': 'shield_rule_item_v2025_r0',
+    'ShieldRuleItemV2025R0PriorityField': 'shield_rule_item_v2025_r0',
+    'ShieldRuleItemV2025R0': 'shield_rule_item_v2025_r0',
+    'EnterpriseConfigurationShieldV2025R0': 'enterprise_configuration_shield_v2025_r0',
+    'TermsOfServiceBaseV2025R0TypeField': 'terms_of_service_base_v2025_r0',
+    'TermsOfServiceBaseV2025R0': 'terms_of_service_base_v2025_r0',
+    'UserBaseV2025R0TypeField': 'user_base_v2025_r0',
+    'UserBaseV2025R0': 'user_base_v2025_r0',
+    'UserMiniV2025R0': 'user_mini_v2025_r0',
+    'HubV2025R0CopyHubAccessField': 'hub_v2025_r0',
+    'HubV2025R0': 'hub_v2025_r0',
+    'HubsV2025R0': 'hubs_v2025_r0',
+    'HubCollaborationUserV2025R0': 'hub_collaboration_user_v2025_r0',
+    'HubAccessGranteeV2025R0': 'hub_access_grantee_v2025_r0',
+    'HubCollaborationV2025R0TypeField': 'hub_collaboration_v2025_r0',
+    'HubCollaborationV2025R0StatusField': 'hub_collaboration_v2025_r0',
+    'HubCollaborationV2025R0AcceptanceRequirementsStatusTermsOfServiceRequirementField': 'hub_collaboration_v2025_r0',
+    'HubCollaborationV2025R0AcceptanceRequirementsStatusStrongPasswordRequirementField': 'hub_collaboration_v2025_r0',
+    'HubCollaborationV2025R0AcceptanceRequirementsStatusTwoFactorAuthenticationRequirementField': 'hub_collaboration_v2025_r0',
+    'HubCollaborationV2025R0AcceptanceRequirementsStatusField': 'hub_collaboration_v2025_r0',
+    'HubCollaborationV2025R0': 'hub_collaboration_v2025_r0',
+    'HubCollaborationsV2025R0': 'hub_collaborations_v2025_r0',
+    'DocGenJobFullV2025R0': 'doc_gen_job_full_v2025_r0',
+    'DocGenJobsFullV2025R0': 'doc_gen_jobs_full_v2025_r0',
+    'UserOrGroupReferenceV2025R0TypeField': 'user_or_group_reference_v2025_r0',
+    'UserOrGroupReferenceV2025R0': 'user_or_group_reference_v2025_r0',
+    'EnterpriseFeatureSettingV2025R0FeatureField': 'enterprise_feature_setting_v2025_r0',
+    'EnterpriseFeatureSettingV2025R0': 'enterprise_feature_setting_v2025_r0',
+    'EnterpriseFeatureSettingsItemV2025R0': 'enterprise_feature_settings_item_v2025_r0',
+    'EnterpriseConfigurationContentAndSharingV2025R0SharedLinkDefaultPermissionsSelectedField': 'enterprise_configuration_content_and_sharing_v2025_r0',
+    'EnterpriseConfigurationContentAndSharingV2025R0CollaborationPermissionsField': 'enterprise_configuration_content_and_sharing_v2025_r0',
+    'EnterpriseConfigurationContentAndSharingV2025R0CollaborationRestrictionsField': 'enterprise_configuration_content_and_sharing_v2025_r0',
+    'EnterpriseConfigurationContentAndSharingV2025R0ExternalCollaborationStatusField': 'enterprise_configuration_content_and_sharing_v2025_r0',
+    'EnterpriseConfigurationContentAndSharingV2025R0ExternalCollaborationAllowlistUsersField': 'enterprise_configuration_content_and_sharing_v2025_r0',
+    'EnterpriseConfigurationContentAndSharingV2025R0PermanentDeletionAllowlistUsersField': 'enterprise_configuration_content_and_sharing_v2025_r0',
+    'EnterpriseConfigurationContentAndSharingV2025R0': 'enterprise_configuration_content_and_sharing_v2025_r0',
+    'UserReferenceV2025R0TypeField': 'user_reference_v2025_r0',
+    'UserReferenceV2025R0': 'user_reference_v2025_r0',
+    'ExternalUsersSubmitDeleteJobRequestV2025R0': 'external_users_submit_delete_job_request_v2025_r0',
+    'UserTrackingCodeV2025R0': 'user_tracking_code_v2025_r0',
+    'EnterpriseConfigurationUserSettingsV2025R0UserTrackingCodesField': 'enterprise_configuration_user_settings_v2025_r0',
+    'EnterpriseConfigurationUserSettingsV2025R0': 'enterprise_configuration_user_settings_v2025_r0',
+    'EnterpriseConfigurationV2025R0TypeField': 'enterprise_configuration_v2025_r0',
+    'EnterpriseConfigurationV2025R0': 'enterprise_configuration_v2025_r0',
+    'WeblinkReferenceV2025R0TypeField': 'weblink_reference_v2025_r0',
+    'WeblinkReferenceV2025R0': 'weblink_reference_v2025_r0',
+    'HubItemReferenceV2025R0': 'hub_item_reference_v2025_r0',
+    'HubItemOperationResultV2025R0': 'hub_item_operation_result_v2025_r0',
+    'HubItemsManageResponseV2025R0': 'hub_items_manage_response_v2025_r0',
+    'HubItemOperationV2025R0ActionField': 'hub_item_operation_v2025_r0',
+    'HubItemOperationV2025R0': 'hub_item_operation_v2025_r0',
+    'HubItemsManageRequestV2025R0': 'hub_items_manage_request_v2025_r0',
+}
 
-from box_sdk_gen.schemas.v2025_r0.archives_v2025_r0 import *
+__all__ = list(_LAZY_ATTRIBUTES)
 
-from box_sdk_gen.schemas.v2025_r0.client_error_v2025_r0 import *
+__getattr__, __dir__ = lazy_package_attributes(__name__, _LAZY_ATTRIBUTES)
 
-from box_sdk_gen.schemas.v2025_r0.collaboration_permissions_v2025_r0 import *
+if TYPE_CHECKING:
+    from box_sdk_gen.schemas.v2025_r0.archive_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.custom_session_duration_group_item_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.archives_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.doc_gen_batch_base_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.client_error_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.doc_gen_document_generation_data_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.collaboration_permissions_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.doc_gen_job_base_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.custom_session_duration_group_item_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.doc_gen_tag_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.doc_gen_batch_base_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.doc_gen_tags_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.doc_gen_document_generation_data_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.doc_gen_tags_processing_message_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.doc_gen_job_base_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_item_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.doc_gen_tag_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_item_string_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.doc_gen_tags_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_item_integer_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.doc_gen_tags_processing_message_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_item_boolean_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_item_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.enterprise_reference_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_item_string_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.external_collab_security_settings_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_item_integer_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.external_user_deletion_result_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_item_boolean_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.external_users_submit_delete_job_response_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.enterprise_reference_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.file_reference_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.external_collab_security_settings_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.doc_gen_template_create_request_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.external_user_deletion_result_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.doc_gen_template_base_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.external_users_submit_delete_job_response_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.doc_gen_template_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.file_reference_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.doc_gen_templates_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.doc_gen_template_create_request_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.file_version_base_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.doc_gen_template_base_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.doc_gen_job_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.doc_gen_template_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.doc_gen_jobs_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.doc_gen_templates_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.doc_gen_batch_create_request_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.file_version_base_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.folder_reference_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.doc_gen_job_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.group_base_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.doc_gen_jobs_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.group_mini_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.doc_gen_batch_create_request_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_base_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.folder_reference_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_collaboration_create_request_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.group_base_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_collaboration_update_request_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.group_mini_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_copy_request_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_base_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_create_request_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_collaboration_create_request_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_document_block_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_collaboration_update_request_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_section_title_text_block_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_copy_request_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_paragraph_text_block_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_create_request_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_item_list_block_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_document_block_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_divider_block_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_section_title_text_block_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_callout_box_text_block_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_paragraph_text_block_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_document_block_entry_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_item_list_block_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_document_blocks_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_divider_block_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_document_page_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_callout_box_text_block_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_document_pages_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_document_block_entry_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_item_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_document_blocks_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_items_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_document_page_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_update_request_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_document_pages_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.keysafe_settings_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_item_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_security_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_items_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.list_user_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_update_request_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.shared_link_permissions_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.keysafe_settings_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.shield_list_mini_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_security_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.shield_lists_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.list_user_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.shield_list_content_country_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.shared_link_permissions_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.shield_list_content_domain_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.shield_list_mini_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.shield_list_content_email_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.shield_lists_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.shield_list_content_integration_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.shield_list_content_country_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.shield_list_content_ip_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.shield_list_content_domain_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.shield_list_content_request_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.shield_list_content_email_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.shield_lists_update_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.shield_list_content_integration_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.shield_lists_create_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.shield_list_content_ip_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.shield_list_content_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.shield_list_content_request_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.shield_list_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.shield_lists_update_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.shield_rule_item_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.shield_lists_create_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_shield_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.shield_list_content_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.terms_of_service_base_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.shield_list_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.user_base_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.shield_rule_item_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.user_mini_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_shield_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.terms_of_service_base_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hubs_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.user_base_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_collaboration_user_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.user_mini_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_access_grantee_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_collaboration_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hubs_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_collaborations_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_collaboration_user_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.doc_gen_job_full_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_access_grantee_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.doc_gen_jobs_full_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_collaboration_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.user_or_group_reference_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_collaborations_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.enterprise_feature_setting_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.doc_gen_job_full_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.enterprise_feature_settings_item_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.doc_gen_jobs_full_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_content_and_sharing_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.user_or_group_reference_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.user_reference_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.enterprise_feature_setting_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.external_users_submit_delete_job_request_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.enterprise_feature_settings_item_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.user_tracking_code_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_content_and_sharing_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_user_settings_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.user_reference_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.external_users_submit_delete_job_request_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.weblink_reference_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.user_tracking_code_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_item_reference_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_user_settings_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_item_operation_result_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.enterprise_configuration_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_items_manage_response_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.weblink_reference_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_item_operation_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_item_reference_v2025_r0 import *
 
-from box_sdk_gen.schemas.v2025_r0.hub_items_manage_request_v2025_r0 import *
+    from box_sdk_gen.schemas.v2025_r0.hub_item_operation_result_v2025_r0 import *
+
+    from box_sdk_gen.schemas.v2025_r0.hub_items_manage_response_v2025_r0 import *
+
+    from box_sdk_gen.schemas.v2025_r0.hub_item_operation_v2025_r0 import *
+
+    from box_sdk_gen.schemas.v2025_r0.hub_items_manage_request_v2025_r0 import *
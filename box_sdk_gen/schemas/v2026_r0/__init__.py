@@ -1,19 +1,50 @@
-from box_sdk_gen.schemas.v2026_r0.automate_workflow_reference_v2026_r0 import *
+from typing import TYPE_CHECKING
 
-from box_sdk_gen.schemas.v2026_r0.automate_workflow_start_request_v2026_r0 import *
+from box_sdk_gen.internal.lazy_imports import lazy_package_attributes
 
-from box_sdk_gen.schemas.v2026_r0.client_error_v2026_r0 import *
+_LAZY_ATTRIBUTES = {
+    'AutomateWorkflowReferenceV2026R0TypeField': 'automate_workflow_reference_v2026_r0',
+    'AutomateWorkflowReferenceV2026R0': 'automate_workflow_reference_v2026_r0',
+    'AutomateWorkflowStartRequestV2026R0': 'automate_workflow_start_request_v2026_r0',
+    'ClientErrorV2026R0TypeField': 'client_error_v2026_r0',
+    'ClientErrorV2026R0CodeField': 'client_error_v2026_r0',
+    'ClientErrorV2026R0': 'client_error_v2026_r0',
+    'FolderReferenceV2026R0TypeField': 'folder_reference_v2026_r0',
+    'FolderReferenceV2026R0': 'folder_reference_v2026_r0',
+    'NotesConvertRequestBodyV2026R0ContentFormatField': 'notes_convert_request_body_v2026_r0',
+    'NotesConvertRequestBodyV2026R0': 'notes_convert_request_body_v2026_r0',
+    'NotesConvertResponseV2026R0TypeField': 'notes_convert_response_v2026_r0',
+    'NotesConvertResponseV2026R0': 'notes_convert_response_v2026_r0',
+    'UserBaseV2026R0TypeField': 'user_base_v2026_r0',
+    'UserBaseV2026R0': 'user_base_v2026_r0',
+    'UserMiniV2026R0': 'user_mini_v2026_r0',
+    'AutomateWorkflowActionV2026R0TypeField': 'automate_workflow_action_v2026_r0',
+    'AutomateWorkflowActionV2026R0ActionTypeField': 'automate_workflow_action_v2026_r0',
+    'AutomateWorkflowActionV2026R0': 'automate_workflow_action_v2026_r0',
+    'AutomateWorkflowsV2026R0': 'automate_workflows_v2026_r0',
+}
 
-from box_sdk_gen.schemas.v2026_r0.folder_reference_v2026_r0 import *
+__all__ = list(_LAZY_ATTRIBUTES)
 
-from box_sdk_gen.schemas.v2026_r0.notes_convert_request_body_v2026_r0 import *
+__getattr__, __dir__ = lazy_package_attributes(__name__, _LAZY_ATTRIBUTES)
 
-from box_sdk_gen.schemas.v2026_r0.notes_convert_response_v2026_r0 import *
+if TYPE_CHECKING:
+    from box_sdk_gen.schemas.v2026_r0.automate_workflow_reference_v2026_r0 import *
 
-from box_sdk_gen.schemas.v2026_r0.user_base_v2026_r0 import *
+    from box_sdk_gen.schemas.v2026_r0.automate_workflow_start_request_v2026_r0 import *
 
-from box_sdk_gen.schemas.v2026_r0.user_mini_v2026_r0 import *
+    from box_sdk_gen.schemas.v2026_r0.client_error_v2026_r0 import *
 
-from box_sdk_gen.schemas.v2026_r0.automate_workflow_action_v2026_r0 import *
+    from box_sdk_gen.schemas.v2026_r0.folder_reference_v2026_r0 import *
 
-from box_sdk_gen.schemas.v2026_r0.automate_workflows_v2026_r0 import *
+    from box_sdk_gen.schemas.v2026_r0.notes_convert_request_body_v2026_r0 import *
+
+    from box_sdk_gen.schemas.v2026_r0.notes_convert_response_v2026_r0 import *
+
+    from box_sdk_gen.schemas.v2026_r0.user_base_v2026_r0 import *
+
+    from box_sdk_gen.schemas.v2026_r0.user_mini_v2026_r0 import *
+
+    from box_sdk_gen.schemas.v2026_r0.automate_workflow_action_v2026_r0 import *
+
+    from box_sdk_gen.schemas.v2026_r0.automate_workflows_v2026_r0 import *
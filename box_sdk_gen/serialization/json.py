@@ -1,18 +1,123 @@
 import json
-from typing import Dict, get_origin, Union, Type
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, get_origin, Optional, Union, Type
 from urllib.parse import urlencode
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 from ..internal.base_object import BaseObject
 
 SerializedData = Dict
 
 
-def json_to_serialized_data(data: str) -> SerializedData:
-    return json.loads(data)
+class JsonBackend:
+    """
+    Library used to encode and decode JSON bodies.
+    `loads` accepts both `str` and UTF-8 encoded `bytes`, `dumps` returns `str`
+    and `dumps_bytes` returns UTF-8 encoded `bytes`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Union[str, bytes]], SerializedData],
+        dumps: Callable[[SerializedData], str],
+        dumps_bytes: Optional[Callable[[SerializedData], bytes]] = None,
+    ):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+        self.dumps_bytes = (
+            dumps_bytes
+            if dumps_bytes is not None
+            else lambda data: dumps(data).encode('utf-8')
+        )
+
+
+def _orjson_loads(data: Union[str, bytes]) -> SerializedData:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # e.g. integers exceeding 64 bits, which the standard library supports
+        return json.loads(data)
+
+
+def _orjson_dumps(data: SerializedData) -> str:
+    try:
+        return orjson.dumps(data).decode('utf-8')
+    except TypeError:
+        return json.dumps(data)
+
+
+def _orjson_dumps_bytes(data: SerializedData) -> bytes:
+    try:
+        return orjson.dumps(data)
+    except TypeError:
+        return json.dumps(data).encode('utf-8')
+
+
+def _ujson_dumps(data: SerializedData) -> str:
+    return ujson.dumps(data, escape_forward_slashes=False)
+
+
+def _available_json_backends() -> Dict[str, JsonBackend]:
+    backends = {'json': JsonBackend('json', json.loads, json.dumps)}
+    if orjson is not None:
+        backends['orjson'] = JsonBackend(
+            'orjson', _orjson_loads, _orjson_dumps, _orjson_dumps_bytes
+        )
+    if ujson is not None:
+        backends['ujson'] = JsonBackend('ujson', ujson.loads, _ujson_dumps)
+    return backends
+
+
+_json_backend: JsonBackend = _available_json_backends()['json']
+
+
+def set_json_backend(name: str) -> JsonBackend:
+    """
+    Select the library used to encode request bodies and decode response bodies.
+    :param name: One of `json` (the standard library, used by default), `orjson`, `ujson`
+        or `auto` to pick the fastest installed one.
+    :return: The selected backend
+    """
+    backends = _available_json_backends()
+    if name == 'auto':
+        name = next(
+            backend for backend in ('orjson', 'ujson', 'json') if backend in backends
+        )
+    if name not in backends:
+        raise ValueError(
+            f'JSON backend `{name}` is not installed. Available backends: {", ".join(backends)}'
+        )
+    global _json_backend
+    _json_backend = backends[name]
+    return _json_backend
+
+
+def get_json_backend() -> JsonBackend:
+    return _json_backend
+
+
+def json_to_serialized_data(data: Union[str, bytes]) -> SerializedData:
+    return _json_backend.loads(data)
 
 
 def sd_to_json(data: SerializedData) -> str:
-    return json.dumps(data)
+    return _json_backend.dumps(data)
+
+
+def sd_to_json_bytes(data: SerializedData) -> bytes:
+    return _json_backend.dumps_bytes(data)
 
 
 def sd_to_url_params(data: SerializedData) -> str:
@@ -25,7 +130,7 @@ def get_sd_value_by_key(data: SerializedData, key: str):
 
 def serialize(obj: Union[BaseObject, dict, list]) -> SerializedData:
     if isinstance(obj, dict):
-        obj = BaseObject(**obj).to_dict()
+        obj = BaseObject._serialize_fields(obj)
     if isinstance(obj, BaseObject):
         obj = obj.to_dict()
     if isinstance(obj, list):
@@ -36,11 +141,95 @@ def serialize(obj: Union[BaseObject, dict, list]) -> SerializedData:
     return obj
 
 
+class DeserializationOptions:
+    """
+    Options of deserialization of response bodies into objects:
+
+    - `lazy` - deserialize each field, nested object and list entry on its first access
+    - `retain_raw_data` - keep the response body in `raw_data` of the returned object.
+      Lazily deserialized objects always keep it, as their fields are deserialized from it
+    """
+
+    def __init__(
+        self,
+        *,
+        lazy: bool = False,
+        retain_raw_data: bool = True,
+    ):
+        self.lazy = lazy
+        self.retain_raw_data = retain_raw_data
+
+    def replace(self, **options) -> 'DeserializationOptions':
+        return DeserializationOptions(
+            **{
+                'lazy': self.lazy,
+                'retain_raw_data': self.retain_raw_data,
+                **options,
+            }
+        )
+
+
+_default_deserialization_options = DeserializationOptions()
+
+_deserialization_options: ContextVar[Optional[DeserializationOptions]] = ContextVar(
+    'deserialization_options', default=None
+)
+
+
+def set_deserialization_options(options: DeserializationOptions) -> None:
+    """
+    Set the options of deserialization of responses process-wide.
+    """
+    global _default_deserialization_options
+    _default_deserialization_options = options
+
+
+def get_deserialization_options() -> DeserializationOptions:
+    options = _deserialization_options.get()
+    return options if options is not None else _default_deserialization_options
+
+
+@contextmanager
+def deserialization_options(**options):
+    """
+    Change options of deserialization of responses received in the current context.
+    :param options: Options of `DeserializationOptions` to change
+    """
+    token = _deserialization_options.set(
+        get_deserialization_options().replace(**options)
+    )
+    try:
+        yield
+    finally:
+        _deserialization_options.reset(token)
+
+
+def set_lazy_deserialization(enabled: bool) -> None:
+    """
+    Enable or disable lazy deserialization of responses process-wide.
+    Lazily deserialized objects keep the response data and deserialize each field,
+    nested object and list entry on its first access.
+    :param enabled: True to deserialize responses lazily
+    """
+    set_deserialization_options(_default_deserialization_options.replace(lazy=enabled))
+
+
+def lazy_deserialization(enabled: bool = True):
+    """
+    Enable or disable lazy deserialization of responses received in the current context.
+    :param enabled: True to deserialize responses lazily, defaults to True
+    """
+    return deserialization_options(lazy=enabled)
+
+
 def deserialize(value: SerializedData, type: Type[BaseObject]):
+    options = get_deserialization_options()
     if get_origin(type) == Union:
-        type = BaseObject._deserialize_union('', value, type)
-    obj = type.from_dict(value)
-    obj._raw_data = value
+        obj = BaseObject._deserialize('', value, type, options.lazy)
+    else:
+        obj = type._from_dict_lazy(value) if options.lazy else type.from_dict(value)
+    if options.retain_raw_data or options.lazy:
+        obj._raw_data = value
     return obj
 
 
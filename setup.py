@@ -16,14 +16,16 @@ def main():
     ]
     dev_requires = ['tox']
     jwt_requires = ['pyjwt>=1.7.0', 'cryptography>=3']
+    async_requires = ['httpx']
     version_file = open(join(dirname(__file__), 'box_sdk_gen/networking/version.py'))
     version_regex = re.compile('.*__version__ = \'(.*?)\'', re.S)
     version_string_grouped = version_regex.match(version_file.read())
     __version__ = version_string_grouped.group(1)
     extras_require = {
-        'test': tests_require + jwt_requires,
+        'test': tests_require + jwt_requires + async_requires,
         'dev': dev_requires,
         'jwt': jwt_requires,
+        'async': async_requires,
     }
     setup(
         name='boxsdk',
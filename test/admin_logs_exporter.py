@@ -0,0 +1,78 @@
+import pytest
+import datetime
+import json
+from unittest.mock import Mock
+
+from box_sdk_gen import (
+    AdminLogsExporter,
+    Events,
+)
+from box_sdk_gen.serialization.json import (
+    deserialize,
+)
+
+
+def test_admin_logs_exporter_deduplicates_and_resumes(tmp_path):
+    def page(next_stream_position, *events):
+        return deserialize(
+            {
+                'chunk_size': len(events),
+                'next_stream_position': next_stream_position,
+                'entries': [
+                    {'type': 'event', 'event_id': event_id, 'created_at': created_at}
+                    for event_id, created_at in events
+                ],
+            },
+            Events,
+        )
+
+    pages = {
+        ('2024-01-01T00:00:00Z', None): page(
+            '1', ('a', '2024-01-01T00:10:00Z'), ('b', '2024-01-01T00:59:59Z')
+        ),
+        ('2024-01-01T00:00:00Z', '1'): page('2', ('b', '2024-01-01T00:59:59Z')),
+        ('2024-01-01T00:00:00Z', '2'): page('2'),
+        ('2024-01-01T01:00:00Z', None): page(
+            '3', ('b', '2024-01-01T00:59:59Z'), ('c', '2024-01-01T01:30:00Z')
+        ),
+        ('2024-01-01T01:00:00Z', '3'): page('3'),
+        ('2024-01-01T02:00:00Z', None): page('4', ('d', '2024-01-01T02:30:00Z')),
+        ('2024-01-01T02:00:00Z', '4'): page('4'),
+    }
+    failing_windows = {'2024-01-01T02:00:00Z'}
+
+    def get_events(created_after, stream_position, **kwargs):
+        created_after = created_after.isoformat().replace('+00:00', 'Z')
+        if created_after in failing_windows:
+            raise RuntimeError('Connection reset')
+        return pages[(created_after, stream_position)]
+
+    client = Mock()
+    client.events.get_events.side_effect = get_events
+    exporter = AdminLogsExporter(client, max_workers=1)
+    output_path = str(tmp_path / 'events.ndjson')
+    created_after = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    created_before = created_after + datetime.timedelta(hours=3)
+
+    with pytest.raises(RuntimeError):
+        exporter.export(output_path, created_after, created_before)
+    failing_windows.clear()
+    report = exporter.export(output_path, created_after, created_before)
+
+    with open(output_path, 'rb') as file:
+        exported_ids = [json.loads(line)['event_id'] for line in file]
+    assert exported_ids == ['a', 'b', 'c', 'd']
+    assert report.event_count == 4
+    assert report.duplicate_count == 2
+    assert report.resumed_from == created_after + datetime.timedelta(hours=2)
+
+
+def test_admin_logs_exporter_rejects_naive_datetimes(tmp_path):
+    exporter = AdminLogsExporter(Mock())
+
+    with pytest.raises(ValueError, match='created_after'):
+        exporter.export(
+            str(tmp_path / 'events.ndjson'),
+            datetime.datetime(2024, 1, 1),
+            datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc),
+        )
@@ -0,0 +1,326 @@
+import asyncio
+import threading
+from io import BytesIO
+from unittest.mock import Mock
+
+import pytest
+
+from box_sdk_gen import (
+    AsyncBoxClient,
+    AsyncBoxNetworkClient,
+    Authentication,
+    BoxAPIError,
+    BoxCCGAuth,
+    BoxRetryStrategy,
+    CCGConfig,
+    FetchOptions,
+    FetchResponse,
+    NetworkSession,
+    ResponseFormat,
+)
+from box_sdk_gen.async_client import AsyncManager
+from box_sdk_gen.networking.single_request import single_request
+
+httpx = pytest.importorskip('httpx')
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.fixture
+def auth_mock():
+    auth = Mock(Authentication)
+    auth.retrieve_authorization_header.return_value = 'Bearer token123'
+    auth.retrieve_authorization_header_async.return_value = 'Bearer token123'
+    return auth
+
+
+@pytest.fixture
+def network_session():
+    return NetworkSession(retry_strategy=BoxRetryStrategy(retry_base_interval=0))
+
+
+def make_network_client(handler):
+    return AsyncBoxNetworkClient(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+
+def test_fetch_json_response(auth_mock, network_session):
+    def handler(request):
+        assert request.headers['Authorization'] == 'Bearer token123'
+        assert request.url.params['fields'] == 'name'
+        return httpx.Response(200, json={'id': '0', 'name': 'All Files'})
+
+    async def fetch():
+        return await make_network_client(handler).fetch(
+            FetchOptions(
+                url='https://api.box.com/2.0/folders/0',
+                method='GET',
+                params={'fields': 'name'},
+                auth=auth_mock,
+                network_session=network_session,
+            )
+        )
+
+    response = run(fetch())
+
+    assert response.status == 200
+    assert response.data == {'id': '0', 'name': 'All Files'}
+
+
+def test_fetch_retries_server_errors(network_session):
+    statuses = [500, 503, 200]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), headers={'Retry-After': '0'}, json={})
+
+    async def fetch():
+        return await make_network_client(handler).fetch(
+            FetchOptions(
+                url='https://api.box.com/2.0/users/me',
+                method='GET',
+                network_session=network_session,
+            )
+        )
+
+    assert run(fetch()).status == 200
+    assert statuses == []
+
+
+def test_fetch_raises_box_api_error(network_session):
+    def handler(request):
+        return httpx.Response(
+            404, json={'message': 'Not Found', 'request_id': 'abc', 'code': 'not_found'}
+        )
+
+    async def fetch():
+        return await make_network_client(handler).fetch(
+            FetchOptions(
+                url='https://api.box.com/2.0/files/1',
+                method='GET',
+                network_session=network_session,
+            )
+        )
+
+    with pytest.raises(BoxAPIError) as error:
+        run(fetch())
+
+    assert error.value.response_info.status_code == 404
+    assert error.value.response_info.code == 'not_found'
+
+
+def test_fetch_refreshes_token_on_unauthorized(auth_mock, network_session):
+    async def refresh_rejected_token_async(
+        rejected_access_token, async_network_client, network_session=None
+    ):
+        assert rejected_access_token == 'token123'
+        auth_mock.retrieve_authorization_header_async.return_value = 'Bearer new_token'
+
+    auth_mock.refresh_rejected_token_async.side_effect = refresh_rejected_token_async
+
+    def handler(request):
+        if request.headers['Authorization'] == 'Bearer new_token':
+            return httpx.Response(200, json={})
+        return httpx.Response(401, json={})
+
+    async def fetch():
+        return await make_network_client(handler).fetch(
+            FetchOptions(
+                url='https://api.box.com/2.0/users/me',
+                method='GET',
+                auth=auth_mock,
+                network_session=network_session,
+            )
+        )
+
+    assert run(fetch()).status == 200
+    auth_mock.refresh_rejected_token_async.assert_called_once()
+    auth_mock.refresh_rejected_token.assert_not_called()
+
+
+def test_fetch_uploads_stream_and_streams_binary_response(network_session):
+    def handler(request):
+        assert request.headers['Content-Length'] == '7'
+        return httpx.Response(200, content=request.read()[::-1])
+
+    async def fetch():
+        response = await make_network_client(handler).fetch(
+            FetchOptions(
+                url='https://upload.box.com/api/2.0/files/content',
+                method='POST',
+                file_stream=BytesIO(b'content'),
+                content_type='application/octet-stream',
+                response_format=ResponseFormat.BINARY,
+                network_session=network_session,
+            )
+        )
+        return await response.content.read(3) + await response.content.read()
+
+    assert run(fetch()) == b'tnetnoc'
+
+
+def test_async_client_sends_single_request_methods_natively(auth_mock):
+    network_client_mock = Mock()
+    network_session = NetworkSession(network_client=network_client_mock)
+    requested_paths = []
+
+    def handler(request):
+        requested_paths.append(request.url.path)
+        if request.url.path == '/2.0/users/me':
+            assert request.url.params['fields'] == 'name'
+            return httpx.Response(200, json={'type': 'user', 'id': '123'})
+        return httpx.Response(200, content=b'file content')
+
+    async def call():
+        client = AsyncBoxClient(
+            auth=auth_mock,
+            network_session=network_session,
+            async_network_client=make_network_client(handler),
+        )
+        user = await client.users.get_user_me(fields=['name'])
+        output = BytesIO()
+        await client.downloads.download_file_to_output_stream('12345', output)
+        return user, output.getvalue()
+
+    user, content = run(call())
+
+    assert user.id == '123'
+    assert content == b'file content'
+    assert requested_paths == ['/2.0/users/me', '/2.0/files/12345/content']
+    network_client_mock.fetch.assert_not_called()
+
+
+def test_async_client_runs_composite_methods_in_executor(auth_mock):
+    network_client_mock = Mock()
+    network_client_mock.fetch.return_value = FetchResponse(
+        status=200,
+        headers={},
+        data={'entries': [{'type': 'user', 'id': '1'}], 'limit': 100},
+    )
+    network_session = NetworkSession(network_client=network_client_mock)
+
+    def handler(request):
+        raise AssertionError('Composite methods use the synchronous network client')
+
+    async def call():
+        client = AsyncBoxClient(
+            auth=auth_mock,
+            network_session=network_session,
+            async_network_client=make_network_client(handler),
+        )
+        return await client.users.iterate_users()
+
+    users = run(call())
+
+    assert [user.id for user in users] == ['1']
+    network_client_mock.fetch.assert_called_once()
+
+
+def test_fetch_prepares_request_on_event_loop_with_valid_token(network_session):
+    loop_thread_ids = []
+
+    class StoredTokenAuth(Authentication):
+        def needs_token_request(self):
+            return False
+
+        def retrieve_authorization_header(self, *, network_session=None):
+            loop_thread_ids.append(threading.get_ident())
+            return 'Bearer token123'
+
+    auth = StoredTokenAuth()
+
+    def handler(request):
+        assert request.headers['Authorization'] == 'Bearer token123'
+        return httpx.Response(200, json={})
+
+    async def fetch():
+        await make_network_client(handler).fetch(
+            FetchOptions(
+                url='https://api.box.com/2.0/users/me',
+                method='GET',
+                auth=auth,
+                network_session=network_session,
+            )
+        )
+        return threading.get_ident()
+
+    assert loop_thread_ids == [run(fetch())]
+
+
+def test_async_client_requests_and_refreshes_tokens_natively():
+    network_client_mock = Mock()
+    auth = BoxCCGAuth(
+        CCGConfig(client_id='client_id', client_secret='secret', user_id='123')
+    )
+    auth._request_access_token = Mock(
+        side_effect=AssertionError('Tokens are requested by the asynchronous client')
+    )
+    tokens = ['token1', 'token2']
+    authorizations = []
+
+    def handler(request):
+        if request.url.path == '/oauth2/token':
+            assert b'grant_type=client_credentials' in request.read()
+            return httpx.Response(
+                200,
+                json={
+                    'access_token': tokens.pop(0),
+                    'expires_in': 3600,
+                    'token_type': 'bearer',
+                },
+            )
+        authorizations.append(request.headers['Authorization'])
+        if request.headers['Authorization'] == 'Bearer token1':
+            return httpx.Response(401, json={})
+        return httpx.Response(200, json={'type': 'user', 'id': '123'})
+
+    async def call():
+        client = AsyncBoxClient(
+            auth=auth,
+            network_session=NetworkSession(
+                network_client=network_client_mock,
+                retry_strategy=BoxRetryStrategy(retry_base_interval=0),
+            ),
+            async_network_client=make_network_client(handler),
+        )
+        return await client.users.get_user_me()
+
+    assert run(call()).id == '123'
+    assert authorizations == ['Bearer token1', 'Bearer token2']
+    assert tokens == []
+    network_client_mock.fetch.assert_not_called()
+
+
+def test_async_manager_runs_single_request_methods_once(auth_mock, network_session):
+    class ItemsManager:
+        def __init__(self):
+            self.auth = auth_mock
+            self.network_session = network_session
+            self.calls = 0
+
+        @single_request
+        def get_item(self, item_id):
+            self.calls += 1
+            try:
+                response = yield FetchOptions(
+                    url='https://api.box.com/2.0/items/' + item_id,
+                    method='GET',
+                    auth=self.auth,
+                    network_session=self.network_session,
+                )
+            except Exception:
+                return None
+            return response.data['id']
+
+    def handler(request):
+        return httpx.Response(200, json={'id': request.url.path.split('/')[-1]})
+
+    manager = ItemsManager()
+    async_manager = AsyncManager(
+        manager, async_network_client=make_network_client(handler)
+    )
+
+    assert run(async_manager.get_item('42')) == '42'
+    assert manager.calls == 1
@@ -1,3 +1,9 @@
+import asyncio
+
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from box_sdk_gen.schemas.user_full import UserFull
@@ -52,6 +58,12 @@ from box_sdk_gen.box.jwt_auth import BoxJWTAuth
 
 from box_sdk_gen.box.jwt_auth import JWTConfig
 
+from box_sdk_gen.networking.fetch_options import FetchOptions
+
+from box_sdk_gen.networking.fetch_response import FetchResponse
+
+from box_sdk_gen.networking.retries import BoxRetryStrategy
+
 
 def test_jwt_auth():
     user_id: str = get_env_var('USER_ID')
@@ -363,3 +375,101 @@ def test_oauth_auth_downscope():
     with pytest.raises(Exception):
         downscoped_client.files.delete_file_by_id(file.id)
     parent_client.files.delete_file_by_id(file.id)
+
+
+def test_ccg_auth_concurrent_refreshes_share_one_token_request():
+    auth: BoxCCGAuth = BoxCCGAuth(
+        config=CCGConfig(client_id='client_id', client_secret='client_secret')
+    )
+    requested_tokens = []
+
+    def request_access_token(network_session):
+        time.sleep(0.1)
+        requested_tokens.append(AccessToken(access_token=get_uuid(), expires_in=3600))
+        return requested_tokens[-1]
+
+    auth._request_access_token = request_access_token
+    auth.token_storage.store(AccessToken(access_token='expired', expires_in=3600))
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        tokens = list(executor.map(lambda _: auth.refresh_token(), range(10)))
+
+    assert len(requested_tokens) == 1
+    assert {token.access_token for token in tokens} == {
+        requested_tokens[0].access_token
+    }
+
+
+def test_ccg_auth_concurrent_async_refreshes_share_one_token_request():
+    auth: BoxCCGAuth = BoxCCGAuth(
+        config=CCGConfig(client_id='client_id', client_secret='client_secret')
+    )
+    requested_tokens = []
+
+    async def request_access_token_async(async_network_client, network_session):
+        await asyncio.sleep(0.1)
+        requested_tokens.append(AccessToken(access_token=get_uuid(), expires_in=3600))
+        return requested_tokens[-1]
+
+    auth._request_access_token_async = request_access_token_async
+    auth.token_storage.store(AccessToken(access_token='expired', expires_in=3600))
+
+    async def refresh_tokens():
+        return await asyncio.gather(
+            *(auth.refresh_token_async(None) for _ in range(10))
+        )
+
+    tokens = asyncio.run(refresh_tokens())
+
+    assert len(requested_tokens) == 1
+    assert {token.access_token for token in tokens} == {
+        requested_tokens[0].access_token
+    }
+
+
+def test_ccg_auth_requests_one_token_for_requests_rejected_with_the_same_token():
+    auth: BoxCCGAuth = BoxCCGAuth(
+        config=CCGConfig(client_id='client_id', client_secret='client_secret')
+    )
+    requested_tokens = []
+
+    def request_access_token(network_session):
+        requested_tokens.append(AccessToken(access_token=get_uuid(), expires_in=3600))
+        return requested_tokens[-1]
+
+    auth._request_access_token = request_access_token
+    auth.token_storage.store(AccessToken(access_token='rejected', expires_in=3600))
+    retry_strategy: BoxRetryStrategy = BoxRetryStrategy()
+    fetch_options: FetchOptions = FetchOptions(url='url', method='GET', auth=auth)
+
+    # Requests in flight with the same token, each rejected with a 401 after the first refresh
+    for _ in range(3):
+        assert retry_strategy.should_retry(
+            fetch_options,
+            FetchResponse(status=401, headers={}, access_token='rejected'),
+            1,
+        )
+
+    assert len(requested_tokens) == 1
+    assert auth.retrieve_token().access_token == requested_tokens[0].access_token
+    auth.refresh_rejected_token(requested_tokens[0].access_token)
+    assert len(requested_tokens) == 2
+
+
+def test_ccg_auth_refreshes_token_after_configured_lifetime_ratio():
+    auth: BoxCCGAuth = BoxCCGAuth(
+        config=CCGConfig(
+            client_id='client_id',
+            client_secret='client_secret',
+            token_refresh_ratio=0.5,
+        )
+    )
+    auth._request_access_token = lambda network_session: AccessToken(
+        access_token=get_uuid(), expires_in=3600
+    )
+    first_token: AccessToken = auth.retrieve_token()
+    assert auth.retrieve_token().access_token == first_token.access_token
+
+    first_token._acquired_at -= 1801
+    auth.token_storage.store(first_token)
+
+    assert auth.retrieve_token().access_token != first_token.access_token
@@ -0,0 +1,624 @@
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from unittest.mock import Mock
+
+import pytest
+from requests import Response, Session
+from requests.structures import CaseInsensitiveDict
+
+from box_sdk_gen import (
+    Authentication,
+    BoxClient,
+    Event,
+    Events,
+    FileFull,
+    FolderMini,
+    Items,
+    MetadataQueryResults,
+    NetworkSession,
+    UploadPart,
+    UserMini,
+    WebhookSignatureValidator,
+    WebhooksManager,
+)
+from box_sdk_gen.internal.utils import (
+    compute_webhook_signature,
+    date_time_to_string,
+    epoch_seconds_to_date_time,
+    get_env_var,
+    get_epoch_time_in_seconds,
+)
+from box_sdk_gen.networking.box_network_client import BoxNetworkClient
+from box_sdk_gen.serialization.json import (
+    deserialization_options,
+    deserialize,
+    lazy_deserialization,
+    sd_to_json_bytes,
+    serialize,
+)
+
+pytestmark = pytest.mark.skipif(
+    not get_env_var('RUN_BENCHMARKS'),
+    reason='set RUN_BENCHMARKS=1 to run benchmarks',
+)
+
+DOWNLOAD_SIZE = 1024 * 1024 * 1024
+
+
+class InMemoryRawResponse:
+    """Stands in for the urllib3 response, returning a new bytes object on every read like a socket."""
+
+    def __init__(self, size: int):
+        self._source = memoryview(bytes(range(256)) * (64 * 1024 // 256) * 16)
+        self._remaining = size
+
+    def read(self, amt=None, decode_content=None):
+        size = min(amt or self._remaining, self._remaining, len(self._source))
+        self._remaining -= size
+        return self._source[:size].tobytes()
+
+
+class CountingOutputStream:
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data) -> int:
+        self.size += len(data)
+        return len(data)
+
+
+def make_client(download_size: int, **network_client_kwargs) -> BoxClient:
+    def request(*args, **kwargs):
+        response = Response()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict()
+        response.url = 'https://api.box.com/2.0/files/12345/content'
+        response.raw = InMemoryRawResponse(download_size)
+        return response
+
+    requests_session = Mock(Session)
+    requests_session.request.side_effect = request
+    auth = Mock(Authentication)
+    auth.retrieve_authorization_header.return_value = 'Bearer token'
+    return BoxClient(
+        auth=auth,
+        network_session=NetworkSession(
+            network_client=BoxNetworkClient(requests_session, **network_client_kwargs)
+        ),
+    )
+
+
+@pytest.mark.parametrize('download_chunk_size', [64 * 1024, 1024 * 1024])
+def test_download_file_to_output_stream_throughput(download_chunk_size):
+    client = make_client(DOWNLOAD_SIZE, download_chunk_size=download_chunk_size)
+    output_stream = CountingOutputStream()
+
+    started_at = time.perf_counter()
+    client.downloads.download_file_to_output_stream('12345', output_stream)
+    elapsed = time.perf_counter() - started_at
+
+    assert output_stream.size == DOWNLOAD_SIZE
+    print(
+        f'\ndownload_file_to_output_stream, chunk size {download_chunk_size // 1024} KiB: '
+        f'{DOWNLOAD_SIZE / elapsed / 1024 ** 3:.2f} GiB/s'
+    )
+
+
+UPLOAD_MEMORY_SCRIPT = '''
+import base64, io, os, re, resource, sys, tempfile, threading, time
+
+from box_sdk_gen import ChunkedUploadsManager, FetchResponse, NetworkSession
+
+source, file_size, part_size, max_in_flight_parts = (
+    sys.argv[1], int(sys.argv[2]), int(sys.argv[3]), int(sys.argv[4])
+)
+
+
+BLOCK = os.urandom(64 * 1024)
+
+
+class GeneratedStream(io.RawIOBase):
+    def __init__(self, size):
+        self.remaining = size
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self.remaining, len(BLOCK))
+        buffer[:size] = BLOCK[:size]
+        self.remaining -= size
+        return size
+
+
+def fetch(options):
+    if options.url.endswith('/upload_sessions'):
+        return FetchResponse(status=201, headers={}, data={
+            'id': '1', 'part_size': part_size, 'num_parts_processed': 0,
+            'total_parts': -(-file_size // part_size),
+            'session_endpoints': {'upload_part': 'upload', 'commit': 'commit', 'list_parts': 'list'},
+        })
+    if options.url == 'upload':
+        # Read the body the way http.client sends it
+        size = 0
+        while True:
+            block = options.file_stream.read(8192)
+            if not block:
+                break
+            size += len(block)
+        offset = int(re.match('bytes ([0-9]+)-', options.headers['content-range']).group(1))
+        return FetchResponse(status=200, headers={}, data={'part': {
+            'part_id': str(offset), 'offset': offset, 'size': size,
+            'sha1': base64.b64decode(options.headers['digest'][4:]).hex(),
+        }})
+    if options.url == 'list':
+        return FetchResponse(status=200, headers={}, data={'total_count': -(-file_size // part_size)})
+    return FetchResponse(status=201, headers={}, data={'entries': [{'id': '1', 'type': 'file'}]})
+
+
+class NetworkClient:
+    # Unlike Mock, does not keep references to the requests and their bodies
+    fetch = staticmethod(fetch)
+
+
+manager = ChunkedUploadsManager(network_session=NetworkSession(network_client=NetworkClient()))
+if source == 'file':
+    file = tempfile.TemporaryFile()
+    for _ in range(file_size // len(BLOCK)):
+        file.write(BLOCK)
+    file.seek(0)
+else:
+    file = GeneratedStream(file_size)
+
+
+def current_rss():
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * resource.getpagesize()
+
+
+peak_rss = baseline = current_rss()
+uploading = True
+
+
+def sample_rss():
+    global peak_rss
+    while uploading:
+        peak_rss = max(peak_rss, current_rss())
+        time.sleep(0.001)
+
+
+sampler = threading.Thread(target=sample_rss)
+sampler.start()
+started_at = time.perf_counter()
+manager.upload_big_file(file, 'file', file_size, '0', max_in_flight_parts=max_in_flight_parts)
+elapsed = time.perf_counter() - started_at
+uploading = False
+sampler.join()
+print(elapsed, peak_rss - baseline)
+'''
+
+
+@pytest.mark.parametrize('source', ['file', 'stream'])
+def test_upload_big_file_peak_memory(source):
+    if not os.path.exists('/proc/self/statm'):
+        pytest.skip('peak memory is sampled from /proc/self/statm')
+    file_size, part_size, max_in_flight_parts = 512 * 1024 * 1024, 8 * 1024 * 1024, 4
+    result = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            UPLOAD_MEMORY_SCRIPT,
+            source,
+            str(file_size),
+            str(part_size),
+            str(max_in_flight_parts),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    elapsed, peak_growth = result.stdout.split()
+    elapsed, peak_growth = float(elapsed), int(peak_growth)
+    print(
+        f'\nupload_big_file from {source}, {max_in_flight_parts} parts of {part_size // 1024 ** 2} MiB in flight: '
+        f'{file_size / elapsed / 1024 ** 3:.2f} GiB/s, peak RSS growth {peak_growth / 1024 ** 2:.1f} MiB'
+    )
+    assert peak_growth < part_size * (max_in_flight_parts + 2)
+
+
+def user_payload(index: int) -> dict:
+    return {
+        'type': 'user',
+        'id': str(33000 + index),
+        'name': f'User {index}',
+        'login': f'user{index}@example.com',
+    }
+
+
+def folder_mini_payload(index: int) -> dict:
+    return {
+        'type': 'folder',
+        'id': str(12000 + index),
+        'sequence_id': '3',
+        'etag': '1',
+        'name': f'Folder {index}',
+    }
+
+
+def file_full_payload(index: int) -> dict:
+    return {
+        'type': 'file',
+        'id': str(12345 + index),
+        'etag': '1',
+        'sequence_id': '3',
+        'name': f'Contract {index}.pdf',
+        'sha1': '85136c79cbf9fe36bb9d05d0639c70c265c18d37',
+        'file_version': {
+            'type': 'file_version',
+            'id': str(67890 + index),
+            'sha1': '134b65991ed521fcfe4724b7d814ab8ded5185dc',
+        },
+        'description': 'Contract for Q1 renewal',
+        'size': 629644,
+        'path_collection': {
+            'total_count': 2,
+            'entries': [folder_mini_payload(0), folder_mini_payload(1)],
+        },
+        'created_at': '2012-12-12T10:53:43-08:00',
+        'modified_at': '2012-12-12T10:53:43-08:00',
+        'trashed_at': None,
+        'purged_at': None,
+        'content_created_at': '2012-12-12T10:53:43-08:00',
+        'content_modified_at': '2012-12-12T10:53:43-08:00',
+        'created_by': user_payload(index),
+        'modified_by': user_payload(index),
+        'owned_by': user_payload(index),
+        'shared_link': {
+            'url': 'https://www.box.com/s/vspke7y05sb214wjokpk',
+            'download_url': 'https://www.box.com/shared/static/rh935iit6ewrmw0unyul.jpeg',
+            'vanity_url': None,
+            'vanity_name': None,
+            'access': 'open',
+            'effective_access': 'company',
+            'effective_permission': 'can_download',
+            'unshared_at': '2018-04-13T13:53:23-07:00',
+            'is_password_enabled': True,
+            'permissions': {
+                'can_download': True,
+                'can_preview': True,
+                'can_edit': False,
+            },
+            'download_count': 3,
+            'preview_count': 3,
+        },
+        'parent': folder_mini_payload(index),
+        'item_status': 'active',
+        'version_number': '1',
+        'comment_count': 10,
+        'permissions': {
+            'can_delete': True,
+            'can_download': True,
+            'can_invite_collaborator': True,
+            'can_rename': True,
+            'can_set_share_access': True,
+            'can_share': True,
+            'can_annotate': True,
+            'can_comment': True,
+            'can_preview': True,
+            'can_upload': True,
+            'can_view_annotations_all': True,
+            'can_view_annotations_self': True,
+        },
+        'tags': ['approved', 'contract'],
+        'lock': {
+            'id': '11446498',
+            'type': 'lock',
+            'created_by': user_payload(index),
+            'created_at': '2012-12-12T10:55:30-08:00',
+            'expired_at': '2012-12-12T10:55:30-08:00',
+            'is_download_prevented': True,
+            'app_type': 'gsuite',
+        },
+        'extension': 'pdf',
+        'is_package': False,
+        'allowed_invitee_roles': ['editor', 'viewer'],
+        'is_externally_owned': False,
+        'has_collaborations': True,
+        'metadata': {
+            'enterprise_27335': {
+                'marketingCollateral': {
+                    '$canEdit': True,
+                    '$id': '01234500-12f1-1234-aa12-b1d234cb567e',
+                    '$parent': 'folder_59449484661',
+                    '$scope': 'enterprise_27335',
+                    '$template': 'marketingCollateral',
+                    '$type': 'properties-6bcba49f-ca6d-4d2a-a758-57fe6edf44d0',
+                    '$typeVersion': 2,
+                    '$version': 1,
+                }
+            }
+        },
+        'expires_at': '2012-12-12T10:53:43-08:00',
+        'representations': {
+            'entries': [
+                {
+                    'content': {
+                        'url_template': 'https://dl.boxcloud.com/{+asset_path}'
+                    },
+                    'info': {
+                        'url': 'https://api.box.com/2.0/internal_files/123/versions/345/representations/png_paged_2048x2048'
+                    },
+                    'properties': {'dimensions': '2048x2048', 'paged': 'true'},
+                    'representation': 'png',
+                    'status': {'state': 'success'},
+                }
+            ]
+        },
+        'classification': {
+            'name': 'Top Secret',
+            'definition': 'Content that should not be shared outside the company.',
+            'color': '#FF0000',
+        },
+        'is_accessible_via_shared_link': True,
+        'shared_link_permission_options': ['can_preview'],
+        'is_associated_with_app_item': True,
+    }
+
+
+def web_link_payload(index: int) -> dict:
+    return {
+        'type': 'web_link',
+        'id': str(11446498 + index),
+        'etag': '1',
+        'url': 'https://www.example.com/example/1234',
+        'name': f'Example {index}',
+        'sequence_id': '3',
+        'parent': folder_mini_payload(index),
+        'created_at': '2012-12-12T10:53:43-08:00',
+        'modified_at': '2012-12-12T10:53:43-08:00',
+    }
+
+
+def items_payload(size: int) -> dict:
+    payload_factories = [file_full_payload, folder_mini_payload, web_link_payload]
+    return {
+        'total_count': size,
+        'limit': size,
+        'offset': 0,
+        'order': [{'by': 'type', 'direction': 'ASC'}],
+        'entries': [
+            payload_factories[index % len(payload_factories)](index)
+            for index in range(size)
+        ],
+    }
+
+
+def events_payload(size: int) -> dict:
+    sources = [
+        lambda index: {
+            'item_type': 'file',
+            'item_id': str(index),
+            'item_name': f'File {index}',
+            'parent': folder_mini_payload(index),
+            'owned_by': user_payload(index),
+        },
+        lambda index: file_full_payload(index),
+        lambda index: dict(user_payload(index)),
+    ]
+    return {
+        'chunk_size': size,
+        'next_stream_position': '1152922976252290886',
+        'entries': [
+            {
+                'type': 'event',
+                'event_id': f'f82c3ba03e41f7e8a7608363cc6c0390183c3f83-{index}',
+                'created_by': user_payload(index),
+                'created_at': '2012-12-12T10:53:43-08:00',
+                'recorded_at': '2012-12-12T10:53:48-08:00',
+                'event_type': 'ITEM_CREATE',
+                'session_id': '70090280850c8d2a1933c1',
+                'source': sources[index % len(sources)](index),
+                'additional_details': {'key': 'value'},
+            }
+            for index in range(size)
+        ],
+    }
+
+
+def metadata_query_results_payload(size: int) -> dict:
+    return {
+        'limit': size,
+        'next_marker': 'AAAAAmVYB1FWec8GH6yWu2nwmanfMh07IyYInaa7DZDYjgO1H4KoLW29vPlLY173OKsci6h6xGh61gG73gnaxoS+o0BbI1/h6le6cikjlupVhASwJ2Cj0tOD9wlnrUMHHw3/ISf+uuACzrOMhN6d5fYrbiPQD6N2XJfMs0tHbWSD1kpB90QzUKB7Nmn3Mr6ZRPJ9EZiyrnYPwYwKXYsWEsQvpTd/TEAGy86yTZjJjwcYZIGVcgvSm/UxFp4BLmOibvr0SE0xcjb',
+        'entries': [file_full_payload(index) for index in range(size)],
+    }
+
+
+@pytest.mark.parametrize('lazy', [False, True], ids=['eager', 'lazy'])
+@pytest.mark.parametrize(
+    'schema, payload, repetitions',
+    [
+        (Items, items_payload(1000), 10),
+        (Events, events_payload(500), 10),
+        (MetadataQueryResults, metadata_query_results_payload(200), 10),
+        (FileFull, file_full_payload(0), 2000),
+    ],
+    ids=['Items', 'Events', 'MetadataQueryResults', 'FileFull'],
+)
+def test_deserialization_time(schema, payload, repetitions, lazy):
+    def read_response():
+        with lazy_deserialization(lazy):
+            response = deserialize(payload, schema)
+        # Reads a single field of each entry, like listings often do
+        for entry in getattr(response, 'entries', None) or [response]:
+            entry.type
+
+    read_response()
+    started_at = time.perf_counter()
+    for _ in range(repetitions):
+        read_response()
+    elapsed = time.perf_counter() - started_at
+    tracemalloc.start()
+    read_response()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(
+        f'\ndeserialize {schema.__name__}{" lazily" if lazy else ""}: '
+        f'{elapsed / repetitions * 1000:.3f} ms per response, '
+        f'peak traced memory {peak_memory / 1024 ** 2:.1f} MiB'
+    )
+
+
+@pytest.mark.parametrize(
+    'options',
+    [{}, {'retain_raw_data': False}],
+    ids=['default', 'without raw data'],
+)
+@pytest.mark.parametrize(
+    'schema, payload_factory',
+    [
+        (FileFull, file_full_payload),
+        (Event, lambda index: events_payload(3)['entries'][index % 3]),
+        (FolderMini, folder_mini_payload),
+        (UserMini, user_payload),
+    ],
+    ids=['FileFull', 'Event', 'FolderMini', 'UserMini'],
+)
+def test_deserialized_object_memory(schema, payload_factory, options):
+    count = 2000
+    bodies = [json.dumps(payload_factory(index)) for index in range(count)]
+
+    gc.collect()
+    tracemalloc.start()
+    with deserialization_options(**options):
+        objects = [deserialize(json.loads(body), schema) for body in bodies]
+    gc.collect()
+    retained_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(objects) == count
+    print(
+        f'\n{schema.__name__} {", ".join(f"{k}={v}" for k, v in options.items()) or "default"}: '
+        f'{retained_memory / count:.0f} bytes per deserialized response'
+    )
+
+
+@pytest.mark.parametrize(
+    'body, repetitions',
+    [
+        (
+            lambda: {
+                'parts': [
+                    UploadPart(
+                        part_id=f'{index:08X}',
+                        offset=index * 8 * 1024 * 1024,
+                        size=8 * 1024 * 1024,
+                        sha_1='2jmj7l5rSw0yVb/vlWAYkK/YBwk=',
+                    )
+                    for index in range(5000)
+                ]
+            },
+            10,
+        ),
+        (lambda: serialize(deserialize(items_payload(1000), Items)), 10),
+        (lambda: deserialize(file_full_payload(0), FileFull), 2000),
+    ],
+    ids=['UploadPartsCommit', 'ItemsDict', 'FileFull'],
+)
+def test_serialization_time(body, repetitions):
+    body = body()
+
+    sd_to_json_bytes(serialize(body))
+    started_at = time.perf_counter()
+    for _ in range(repetitions):
+        sd_to_json_bytes(serialize(body))
+    elapsed = time.perf_counter() - started_at
+
+    print(f'\nserialize: {elapsed / repetitions * 1000:.3f} ms per request body')
+
+
+def test_import_time():
+    def import_box_sdk_gen():
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import box_sdk_gen'],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        # Lines are formatted as "import time: self [us] | cumulative | imported package"
+        timings = {}
+        for line in result.stderr.splitlines()[1:]:
+            _, cumulative, module = line.split('|')
+            timings[module.strip()] = int(cumulative)
+        return timings
+
+    timings = min(
+        (import_box_sdk_gen() for _ in range(5)),
+        key=lambda timings: timings['box_sdk_gen'],
+    )
+    imported_managers = [
+        module for module in timings if module.startswith('box_sdk_gen.managers.')
+    ]
+    imported_schemas = [
+        module for module in timings if module.startswith('box_sdk_gen.schemas.')
+    ]
+
+    print(
+        f'\nimport box_sdk_gen: {timings["box_sdk_gen"] / 1000:.1f} ms, '
+        f'{len(imported_managers)} managers and {len(imported_schemas)} schemas imported'
+    )
+    assert len(imported_managers) < 10
+    assert len(imported_schemas) < 100
+
+
+@pytest.mark.parametrize('escaped', [False, True], ids=['raw', 'escaped'])
+def test_webhook_validation_time(escaped):
+    body = json.dumps(
+        {
+            'type': 'webhook_event',
+            'id': '1',
+            'trigger': 'FILE.UPLOADED',
+            'webhook': {'id': '2', 'type': 'webhook'},
+            'source': file_full_payload(0),
+        },
+        ensure_ascii=False,
+    )
+    if escaped:
+        body = body.replace('"name": "', '"name": "\u00e9')
+    headers = {
+        'box-delivery-timestamp': date_time_to_string(
+            epoch_seconds_to_date_time(get_epoch_time_in_seconds())
+        ),
+        'box-signature-version': '1',
+        'box-signature-algorithm': 'HmacSHA256',
+    }
+    # Only the secondary key matches, the worst case for both implementations
+    headers['box-signature-primary'] = 'invalid'
+    headers['box-signature-secondary'] = compute_webhook_signature(
+        body, headers, 'secondary', escape_body=escaped
+    )
+    validator = WebhookSignatureValidator('primary', secondary_key='secondary')
+    repetitions = 5000
+
+    started_at = time.perf_counter()
+    for _ in range(repetitions):
+        assert WebhooksManager.validate_message(
+            body, headers, 'primary', secondary_key='secondary'
+        )
+    validate_message_elapsed = time.perf_counter() - started_at
+    started_at = time.perf_counter()
+    for _ in range(repetitions):
+        assert validator.validate(body, headers)
+    validator_elapsed = time.perf_counter() - started_at
+
+    print(
+        f'\nvalidate_message: {validate_message_elapsed / repetitions * 1e6:.1f} us,'
+        f' WebhookSignatureValidator: {validator_elapsed / repetitions * 1e6:.1f} us'
+        ' per notification'
+    )
+    assert validator_elapsed < validate_message_elapsed
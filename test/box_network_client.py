@@ -1,5 +1,7 @@
 import pytest
 import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from collections import OrderedDict
 from io import BytesIO, RawIOBase, UnsupportedOperation, SEEK_SET
 from unittest import mock
@@ -29,6 +31,23 @@ from box_sdk_gen.networking import (
     BoxRetryStrategy,
 )
 from box_sdk_gen.networking.proxy_config import ProxyConfig
+from box_sdk_gen.networking.pool_config import PoolConfig
+from box_sdk_gen.networking.base_urls import BaseUrls
+from box_sdk_gen.internal.utils import (
+    BufferByteStream,
+    ResponseByteStream,
+    iterate_chunks,
+    read_byte_stream,
+    write_input_stream_to_output_stream,
+)
+from box_sdk_gen.managers.chunked_uploads import _read_chunk_buffer
+from box_sdk_gen.serialization.json import (
+    get_json_backend,
+    json_to_serialized_data,
+    sd_to_json,
+    sd_to_json_bytes,
+    set_json_backend,
+)
 
 
 @pytest.fixture
@@ -213,6 +232,11 @@ def authentication_mock(token_mock, token2_mock):
     auth = Mock(Authentication)
     auth.retrieve_authorization_header.return_value = f"Bearer {token_mock}"
     auth.refresh_token = lambda network_session: reauthenticate_mock(auth, token2_mock)
+    auth.refresh_rejected_token = (
+        lambda rejected_access_token, network_session: reauthenticate_mock(
+            auth, token2_mock
+        )
+    )
     return auth
 
 
@@ -295,8 +319,8 @@ def test_prepare_headers_reauthenticate(
 @pytest.mark.parametrize(
     "content_type, data, expected_body",
     [
-        ("application/json", {"key": "value"}, '{"key": "value"}'),
-        ("application/json-patch+json", {"key": "value"}, '{"key": "value"}'),
+        ("application/json", {"key": "value"}, b'{"key": "value"}'),
+        ("application/json-patch+json", {"key": "value"}, b'{"key": "value"}'),
         ("application/x-www-form-urlencoded", {"key": "value"}, "key=value"),
         ("multipart/form-data", mock_byte_stream, mock_byte_stream),
         ("application/octet-stream", mock_byte_stream, mock_byte_stream),
@@ -337,7 +361,7 @@ def test_prepare_json_request(network_client, network_session_mock):
             "Content-Type": "application/json",
         },
         params={"param": "value"},
-        data='{"key": "value"}',
+        data=b'{"key": "value"}',
         content_type="application/json",
         timeout=(10, 60),
     )
@@ -496,6 +520,7 @@ def test_fetch_get_json_format_response_success(
     network_client, mock_requests_session, network_session_mock, response_200
 ):
     response_200.text = '{"id": "123456"}'
+    response_200.content = b'{"id": "123456"}'
     mock_requests_session.request.return_value = response_200
 
     fetch_response = network_client.fetch(
@@ -544,6 +569,7 @@ def test_retryable_status_codes(
 ):
     response_failure_no_status.status_code = retryable_status_code
     response_200.text = '{"id": "123456"}'
+    response_200.content = b'{"id": "123456"}'
     mock_requests_session.request.side_effect = [
         response_failure_no_status,
         response_failure_no_status,
@@ -573,7 +599,9 @@ def test_retryable_status_codes_with_invalid__response_body(
 ):
     response_failure_no_status.status_code = retryable_status_code
     response_failure_no_status.text = 'Invalid JSON'
+    response_failure_no_status.content = b'Invalid JSON'
     response_200.text = '{"id": "123456"}'
+    response_200.content = b'{"id": "123456"}'
     mock_requests_session.request.side_effect = [
         response_failure_no_status,
         response_failure_no_status,
@@ -617,6 +645,7 @@ def test_retryable_status_code_202(
     response_200,
 ):
     response_200.text = '{"id": "123456"}'
+    response_200.content = b'{"id": "123456"}'
     response_200.headers = {"Retry-After": "0"}
     mock_requests_session.request.side_effect = [
         response_202_with_retry_after,
@@ -699,6 +728,7 @@ def test_retrying_401_response_with_new_token_and_auth_provided(
     token2_mock,
 ):
     response_200.text = '{"id": "123456"}'
+    response_200.content = b'{"id": "123456"}'
     mock_requests_session.request.side_effect = [response_401, response_200]
 
     with patch("time.sleep"):
@@ -1246,3 +1276,316 @@ def test_disable_follow_redirects(
         allow_redirects=False,
         timeout=(10, 60),
     )
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'{"type": "user", "id": "123"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_base_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+def test_network_session_configures_separate_pools_for_base_urls():
+    base_urls = BaseUrls(
+        base_url='https://api.example.com',
+        upload_url='https://upload.example.com/api',
+        oauth_2_url='https://account.example.com/api/oauth2',
+    )
+    pool_config = PoolConfig(max_connections_per_host=64, block_when_exhausted=True)
+
+    network_session = NetworkSession(base_urls=base_urls, pool_config=pool_config)
+    session = network_session.network_client.requests_session
+
+    adapters = {
+        url: session.get_adapter(url)
+        for url in (
+            'https://api.example.com/2.0/users/me',
+            'https://upload.example.com/api/2.0/files/content',
+            'https://account.example.com/api/oauth2/token',
+            'https://dl.example.com/file',
+        )
+    }
+    assert len(set(map(id, adapters.values()))) == 4
+    for adapter in adapters.values():
+        assert adapter._pool_maxsize == 64
+        assert adapter._pool_block is True
+    assert set(network_session.network_client.get_pool_stats()) == {
+        'base_url',
+        'upload_url',
+        'oauth_2_url',
+        'default',
+    }
+    assert network_session.with_additional_headers({}).pool_config is pool_config
+
+
+def test_network_sessions_sharing_a_client_keep_its_pools():
+    pool_config = PoolConfig(max_connections_per_host=8)
+    network_session = NetworkSession(pool_config=pool_config)
+    network_client = network_session.network_client
+    session = network_client.requests_session
+    api_adapter = session.get_adapter('https://api.box.com/2.0/users/me')
+    api_adapter.stats.connections_opened = 1
+
+    network_session.with_custom_base_urls(BaseUrls(base_url='https://api.example.com'))
+
+    assert session.get_adapter('https://api.box.com/2.0/users/me') is api_adapter
+    assert session.get_adapter('https://api.example.com/2.0/users/me') not in (
+        api_adapter,
+        session.get_adapter('https://dl.example.com/file'),
+    )
+
+    replaced_adapters = list(set(session.adapters.values()))
+    for adapter in replaced_adapters:
+        adapter.close = Mock()
+    network_session.with_pool_config(PoolConfig(max_connections_per_host=16))
+
+    for adapter in replaced_adapters:
+        adapter.close.assert_called_once()
+    for url in (
+        'https://api.box.com/2.0/users/me',
+        'https://api.example.com/2.0/users/me',
+        'http://dl.example.com/file',
+    ):
+        assert session.get_adapter(url)._pool_maxsize == 16
+    assert network_client.get_pool_stats()['base_url'].connections_opened == 0
+
+
+def test_pool_stats_count_opened_and_reused_connections(local_base_url):
+    network_client = BoxNetworkClient(
+        pool_config=PoolConfig(tcp_keep_alive=True, tcp_keep_alive_idle_ms=30000),
+        base_urls=BaseUrls(base_url=local_base_url),
+    )
+    network_session = NetworkSession(network_client=network_client)
+
+    for _ in range(3):
+        response = network_client.fetch(
+            FetchOptions(
+                url=f'{local_base_url}/2.0/users/me',
+                method='GET',
+                network_session=network_session,
+            )
+        )
+        assert response.data == {'type': 'user', 'id': '123'}
+
+    stats = network_client.get_pool_stats()['base_url']
+    assert stats.connections_opened == 1
+    assert stats.connections_reused == 2
+    assert stats.requests_waited == 0
+
+
+def test_idle_connections_are_reopened_after_ttl(local_base_url):
+    network_client = BoxNetworkClient(
+        pool_config=PoolConfig(idle_connection_ttl_ms=0),
+        base_urls=BaseUrls(base_url=local_base_url),
+    )
+    network_session = NetworkSession(network_client=network_client)
+
+    for _ in range(2):
+        network_client.fetch(
+            FetchOptions(
+                url=f'{local_base_url}/2.0/users/me',
+                method='GET',
+                network_session=network_session,
+            )
+        )
+
+    stats = network_client.get_pool_stats()['base_url']
+    assert stats.connections_opened == 2
+    assert stats.connections_reused == 0
+
+
+def test_fetch_json_response_creates_content_stream_on_demand(
+    network_client, mock_requests_session, network_session_mock, response_200
+):
+    response_200.content = b'{"id": "123456"}'
+    mock_requests_session.request.return_value = response_200
+
+    fetch_response = network_client.fetch(
+        FetchOptions(
+            method="get",
+            url="https://example.com",
+            network_session=network_session_mock,
+        )
+    )
+
+    assert fetch_response.data == {"id": "123456"}
+    assert fetch_response._content is None
+    assert fetch_response.content.read() == b'{"id": "123456"}'
+
+
+@pytest.mark.parametrize('backend', ['json', 'orjson', 'ujson'])
+def test_json_backends_encode_and_decode_bodies(backend):
+    pytest.importorskip(backend)
+    try:
+        assert set_json_backend(backend).name == backend
+        assert json_to_serialized_data(b'{"name": "\xc5\xbc\xc3\xb3\xc5\x82w"}') == {
+            'name': 'żółw'
+        }
+        assert json.loads(sd_to_json({'entries': [{'id': '1'}]})) == {
+            'entries': [{'id': '1'}]
+        }
+        assert json.loads(sd_to_json_bytes({'entries': [{'id': '1'}]})) == {
+            'entries': [{'id': '1'}]
+        }
+    finally:
+        set_json_backend('json')
+
+
+def test_set_json_backend_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        set_json_backend('simplejson')
+    assert get_json_backend().name == 'json'
+
+
+def test_fetch_binary_response_uses_configured_download_chunk_size(
+    mock_requests_session, network_session_mock, response_200
+):
+    response_200.iter_content.return_value = iter([b"binary ", b"data"])
+    mock_requests_session.request.return_value = response_200
+    network_client = BoxNetworkClient(
+        mock_requests_session, download_chunk_size=4 * 1024 * 1024
+    )
+
+    fetch_response = network_client.fetch(
+        FetchOptions(
+            method="get",
+            url="https://example.com",
+            network_session=network_session_mock,
+            response_format=ResponseFormat.BINARY,
+        )
+    )
+
+    response_200.iter_content.assert_called_once_with(chunk_size=4 * 1024 * 1024)
+    assert fetch_response.content.read() == b"binary data"
+
+
+def test_response_byte_stream_reads_across_chunk_boundaries():
+    stream = ResponseByteStream(iter([b"abc", b"defgh", b"", b"ij"]))
+
+    assert stream.read(2) == b"ab"
+    assert stream.read(4) == b"cdef"
+    assert stream.read(0) == b""
+    assert stream.tell() == 6
+    assert stream.read() == b"ghij"
+    assert stream.read(1) == b""
+    assert stream.tell() == 10
+
+
+def test_response_byte_stream_readinto_fills_caller_buffer():
+    stream = ResponseByteStream(iter([b"abc", b"defgh", b"ij"]))
+    buffer = bytearray(4)
+
+    assert stream.readinto(buffer) == 4
+    assert buffer == b"abcd"
+    assert stream.read(2) == b"ef"
+    assert stream.readinto(buffer) == 4
+    assert buffer == b"ghij"
+    assert stream.readinto(buffer) == 0
+    assert stream.tell() == 10
+
+
+def test_response_byte_stream_seeks_forward():
+    stream = ResponseByteStream(iter([b"abc", b"defgh", b"ij"]))
+
+    assert stream.seek(4) == 4
+    assert stream.seek(2, 1) == 6
+    assert stream.read(2) == b"gh"
+    with pytest.raises(ValueError):
+        stream.seek(0)
+
+
+def test_write_input_stream_to_output_stream_copies_all_chunks():
+    chunks = [bytes([i % 256]) * 300_001 for i in range(10)]
+    output = BytesIO()
+
+    write_input_stream_to_output_stream(ResponseByteStream(iter(chunks)), output)
+
+    assert output.getvalue() == b"".join(chunks)
+
+
+def test_iterate_chunks_splits_stream_without_copying_chunks():
+    content = bytes(range(256)) * 40
+
+    chunks = list(iterate_chunks(BytesIO(content), 3000, len(content)))
+    buffers = [_read_chunk_buffer(chunk) for chunk in chunks]
+
+    assert all(isinstance(buffer, memoryview) for buffer in buffers)
+    assert [len(buffer) for buffer in buffers] == [3000, 3000, 3000, 1240]
+    assert b''.join(buffers) == content
+
+
+def test_iterate_chunks_memory_maps_regular_files(tmp_path):
+    content = bytes(range(256)) * 40
+    file_path = tmp_path / 'file'
+    file_path.write_bytes(content)
+
+    with open(file_path, 'rb') as file:
+        file.seek(10)
+        chunks = [_read_chunk_buffer(chunk) for chunk in iterate_chunks(file, 3000, 0)]
+        assert file.tell() == len(content)
+
+    assert b''.join(chunks) == content[10:]
+    assert [len(chunk) for chunk in chunks] == [3000, 3000, 3000, 1230]
+
+
+def test_buffer_byte_stream_reads_and_seeks():
+    stream = BufferByteStream(bytearray(b'0123456789'))
+    buffer = bytearray(3)
+
+    assert stream.read(4) == b'0123'
+    assert stream.readinto(buffer) == 3
+    assert buffer == b'456'
+    assert stream.seek(-2, 2) == 8
+    assert stream.read() == b'89'
+    assert stream.seek(1) == 1
+    assert bytes(_read_chunk_buffer(stream)) == b'123456789'
+    assert stream.read() == b''
+    assert stream.seek(1) == 1
+    assert read_byte_stream(stream) == b'123456789'
+    assert isinstance(read_byte_stream(BufferByteStream(bytearray(b'0'))), bytes)
+
+
+def test_response_byte_stream_returns_bytes_received_before_error():
+    def chunks():
+        yield b"abc"
+        yield b"def"
+        raise ConnectionError("connection dropped")
+
+    stream = ResponseByteStream(chunks())
+    buffer = bytearray(10)
+
+    assert stream.readinto(buffer) == 6
+    assert buffer[:6] == b"abcdef"
+    with pytest.raises(ConnectionError):
+        stream.readinto(buffer)
+
+
+def test_response_byte_stream_read_all_raises_deferred_error():
+    def chunks():
+        yield b"abc"
+        yield b"def"
+        raise ConnectionError("connection dropped")
+
+    stream = ResponseByteStream(chunks())
+
+    assert stream.read(10) == b"abcdef"
+    with pytest.raises(ConnectionError):
+        stream.read()
@@ -0,0 +1,110 @@
+import pytest
+from unittest.mock import Mock
+
+from box_sdk_gen import (
+    ChangeFeed,
+    Events,
+    InMemoryStreamPositionStorage,
+    ItemChangeType,
+)
+
+
+def event(event_id, event_type, file_id):
+    return {
+        'type': 'event',
+        'event_id': event_id,
+        'event_type': event_type,
+        'source': {'type': 'file', 'id': file_id, 'name': f'{file_id}.txt'},
+    }
+
+
+def make_pages():
+    return {
+        '10': Events.from_dict(
+            {
+                'chunk_size': 2,
+                'next_stream_position': 20,
+                'entries': [
+                    event('a', 'ITEM_UPLOAD', '1'),
+                    event('b', 'ITEM_MOVE', '1'),
+                ],
+            }
+        ),
+        '20': Events.from_dict(
+            {
+                'chunk_size': 4,
+                'next_stream_position': 30,
+                'entries': [
+                    event('c', 'ITEM_UPLOAD', '2'),
+                    event('c', 'ITEM_UPLOAD', '2'),
+                    event('d', 'ITEM_TRASH', '2'),
+                    event('e', 'COMMENT_CREATE', '3'),
+                ],
+            }
+        ),
+        '30': Events.from_dict(
+            {
+                'chunk_size': 1,
+                'next_stream_position': 40,
+                'entries': [event('f', 'ITEM_RENAME', '3')],
+            }
+        ),
+    }
+
+
+def test_change_feed_coalesces_item_events():
+    pages = make_pages()
+    client = Mock()
+    client.events.get_events.side_effect = lambda stream_position, **kwargs: pages[
+        stream_position
+    ]
+    position_storage = InMemoryStreamPositionStorage('10')
+    feed = ChangeFeed(client, position_storage=position_storage, page_size=2)
+
+    def failing_handler(change_set):
+        raise RuntimeError('Replica unavailable')
+
+    with pytest.raises(RuntimeError):
+        feed.process(failing_handler)
+    assert position_storage.get() == '10'
+
+    change_sets = []
+    feed.process(change_sets.append)
+
+    assert position_storage.get() == '40'
+    assert [
+        (change.type, change.item_id, len(change.events))
+        for change in change_sets[0].changes
+    ] == [
+        (ItemChangeType.UPLOAD, '1', 2),
+        (ItemChangeType.TRASH, '2', 2),
+        (ItemChangeType.MOVE, '3', 1),
+    ]
+    assert change_sets[0].event_count == 7
+
+
+def test_change_feed_returns_partial_change_sets_past_max_events():
+    pages = make_pages()
+    client = Mock()
+    client.events.get_events.side_effect = lambda stream_position, **kwargs: pages[
+        stream_position
+    ]
+    position_storage = InMemoryStreamPositionStorage('10')
+    feed = ChangeFeed(
+        client, position_storage=position_storage, page_size=2, max_events=4
+    )
+    change_sets = []
+
+    def handler(change_set):
+        change_sets.append(change_set)
+        if not change_set.partial:
+            feed.stop()
+
+    feed.run(handler)
+
+    assert [
+        (change_set.event_count, change_set.next_stream_position, change_set.partial)
+        for change_set in change_sets
+    ] == [(6, '30', True), (1, '40', False)]
+    assert position_storage.get() == '40'
+    client.events.get_events_with_long_polling.assert_not_called()
@@ -0,0 +1,123 @@
+import pytest
+import hashlib
+from io import BytesIO
+from unittest.mock import Mock
+
+from box_sdk_gen import (
+    BoxAPIError,
+    BoxSDKError,
+    ChunkedUploadsManager,
+    InMemoryUploadSessionStorage,
+    UploadPart,
+    UploadSession,
+    UploadedPart,
+)
+from box_sdk_gen.box.errors import RequestInfo, ResponseInfo
+
+CONTENT = b'0123456789'
+
+
+def api_error(status_code):
+    return BoxAPIError(
+        request_info=RequestInfo(method='PUT', url='url', query_params={}, headers={}),
+        response_info=ResponseInfo(status_code=status_code, headers={}),
+        message=f'{status_code}',
+    )
+
+
+def uploaded_part(file):
+    content = file.read()
+    return UploadedPart(
+        part=UploadPart(
+            part_id='1',
+            offset=0,
+            size=len(content),
+            sha_1=hashlib.sha1(content).hexdigest(),
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    'error, attempts',
+    [
+        (BoxSDKError(message='Connection reset'), 2),
+        (api_error(503), 2),
+        (api_error(404), 1),
+    ],
+)
+def test_upload_part_only_retries_network_and_server_errors(error, attempts):
+    chunked_uploads = ChunkedUploadsManager(auth=Mock())
+    errors = [error]
+
+    def upload_file_part_by_url(url, file, digest, content_range):
+        if errors:
+            raise errors.pop()
+        return uploaded_part(file)
+
+    chunked_uploads.upload_file_part_by_url = Mock(side_effect=upload_file_part_by_url)
+
+    if attempts == 1:
+        with pytest.raises(BoxAPIError):
+            chunked_uploads._upload_part('url', CONTENT, 0, len(CONTENT), max_retries=2)
+    else:
+        part = chunked_uploads._upload_part(
+            'url', CONTENT, 0, len(CONTENT), max_retries=2
+        )
+        assert part.size == len(CONTENT)
+    assert chunked_uploads.upload_file_part_by_url.call_count == attempts
+
+
+def test_upload_big_file_resumable_uploads_parts_missing_on_server():
+    upload_session = UploadSession.from_dict(
+        {
+            'id': 'session',
+            'part_size': 5,
+            'total_parts': 2,
+            'session_endpoints': {'list_parts': 'list', 'upload_part': 'upload'},
+        }
+    )
+    upload_session_storage = InMemoryUploadSessionStorage()
+    upload_session_storage.store('key', upload_session)
+    chunked_uploads = ChunkedUploadsManager(auth=Mock())
+    chunked_uploads._get_all_upload_session_parts = Mock(
+        return_value=[
+            UploadPart(
+                part_id='0',
+                offset=0,
+                size=5,
+                sha_1=hashlib.sha1(CONTENT[:5]).hexdigest(),
+            )
+        ]
+    )
+    content_ranges = []
+
+    def upload_file_part_by_url(url, file, digest, content_range):
+        content_ranges.append(content_range)
+        content = file.read()
+        return UploadedPart(
+            part=UploadPart(
+                part_id='1',
+                offset=5,
+                size=len(content),
+                sha_1=hashlib.sha1(content).hexdigest(),
+            )
+        )
+
+    chunked_uploads.upload_file_part_by_url = Mock(side_effect=upload_file_part_by_url)
+    chunked_uploads.create_file_upload_session = Mock()
+    chunked_uploads._commit_upload_session = Mock(return_value='file')
+
+    uploaded_file = chunked_uploads.upload_big_file_resumable(
+        BytesIO(CONTENT),
+        'file.txt',
+        len(CONTENT),
+        '0',
+        upload_session_storage,
+        upload_key='key',
+    )
+
+    assert uploaded_file == 'file'
+    chunked_uploads._get_all_upload_session_parts.assert_called_once_with('list')
+    chunked_uploads.create_file_upload_session.assert_not_called()
+    assert content_ranges == ['bytes 5-9/10']
+    assert upload_session_storage.get('key') is None
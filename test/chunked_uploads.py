@@ -28,6 +28,8 @@ from box_sdk_gen.internal.utils import get_uuid
 
 from box_sdk_gen.internal.utils import generate_byte_stream
 
+from box_sdk_gen.internal.utils import generate_byte_buffer
+
 from box_sdk_gen.internal.utils import ByteStream
 
 from test.commons import get_default_client
@@ -46,6 +48,8 @@ from box_sdk_gen.schemas.files import Files
 
 from box_sdk_gen.client import BoxClient
 
+from box_sdk_gen.box.upload_session_storage import InMemoryUploadSessionStorage
+
 client: BoxClient = get_default_client()
 
 
@@ -265,3 +269,58 @@ def testChunkedUploadConvenienceMethod():
     assert uploaded_file.size == file_size
     assert uploaded_file.parent.id == parent_folder_id
     client.files.delete_file_by_id(uploaded_file.id)
+
+
+def testChunkedUploadConvenienceMethodWithConcurrentParts():
+    file_size: int = (50 * 1024) * 1024
+    file_byte_stream: ByteStream = generate_byte_stream(file_size)
+    file_name: str = get_uuid()
+    parent_folder_id: str = '0'
+    uploaded_file: File = client.chunked_uploads.upload_big_file(
+        file_byte_stream,
+        file_name,
+        file_size,
+        parent_folder_id,
+        max_in_flight_parts=4,
+    )
+    assert uploaded_file.name == file_name
+    assert uploaded_file.size == file_size
+    assert uploaded_file.parent.id == parent_folder_id
+    client.files.delete_file_by_id(uploaded_file.id)
+
+
+def testResumableChunkedUploadConvenienceMethod():
+    file_size: int = (20 * 1024) * 1024
+    file_buffer: Buffer = generate_byte_buffer(file_size)
+    file_name: str = get_uuid()
+    parent_folder_id: str = '0'
+    upload_session_storage: InMemoryUploadSessionStorage = (
+        InMemoryUploadSessionStorage()
+    )
+    upload_session: UploadSession = client.chunked_uploads.create_file_upload_session(
+        parent_folder_id, file_size, file_name
+    )
+    first_part: Buffer = file_buffer[: upload_session.part_size]
+    first_part_hash: Hash = Hash(algorithm=HashName.SHA1)
+    first_part_hash.update_hash(first_part)
+    client.chunked_uploads.upload_file_part_by_url(
+        upload_session.session_endpoints.upload_part,
+        generate_byte_stream_from_buffer(first_part),
+        ''.join(['sha=', first_part_hash.digest_hash('base64')]),
+        ''.join(
+            ['bytes 0-', to_string(len(first_part) - 1), '/', to_string(file_size)]
+        ),
+    )
+    upload_session_storage.store(parent_folder_id, upload_session)
+    uploaded_file: File = client.chunked_uploads.upload_big_file_resumable(
+        generate_byte_stream_from_buffer(file_buffer),
+        file_name,
+        file_size,
+        parent_folder_id,
+        upload_session_storage,
+        upload_key=parent_folder_id,
+    )
+    assert uploaded_file.name == file_name
+    assert uploaded_file.size == file_size
+    assert upload_session_storage.get(parent_folder_id) is None
+    client.files.delete_file_by_id(uploaded_file.id)
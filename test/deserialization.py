@@ -0,0 +1,93 @@
+import pickle
+
+from box_sdk_gen import Events, FileFull, FolderMini, Items, User
+from box_sdk_gen.serialization.json import (
+    deserialization_options,
+    deserialize,
+    lazy_deserialization,
+)
+
+
+def test_deserialize_dispatches_union_members_by_discriminator():
+    items = deserialize(
+        {
+            'total_count': 3,
+            'entries': [
+                {'type': 'folder', 'id': '1', 'created_at': '2012-12-12T10:53:43Z'},
+                {'type': 'file', 'id': '2', 'sha1': 'abc', 'tags': ['a']},
+                {'id': '3'},
+            ],
+        },
+        Items,
+    )
+    folder, file, unknown = items.entries
+    assert isinstance(folder, FolderMini)
+    assert isinstance(file, FileFull)
+    assert file.sha_1 == 'abc'
+    assert file.tags == ['a']
+    # Entries without a discriminator are deserialized as the first union member
+    assert isinstance(unknown, FileFull)
+
+    events = deserialize(
+        {'entries': [{'source': {'type': 'user', 'id': '4'}, 'created_at': 'x'}]},
+        Events,
+    )
+    assert isinstance(events.entries[0].source, User)
+    # Values which do not match their annotation are kept as they are
+    assert events.entries[0].created_at == 'x'
+
+
+def test_lazy_deserialization_deserializes_entries_on_access():
+    data = {
+        'total_count': 2,
+        'entries': [
+            {
+                'type': 'file',
+                'id': '1',
+                'sha1': 'abc',
+                'parent': {'type': 'folder', 'id': '2'},
+            },
+            {'type': 'folder', 'id': '2', 'created_at': '2012-12-12T10:53:43Z'},
+        ],
+    }
+    with lazy_deserialization():
+        items = deserialize(data, Items)
+
+    assert type(items.entries) is list
+    assert items.entries + [None] == [*items.entries, None]
+    for entry in items.entries:
+        assert vars(entry).keys() == {'_raw_data', '_lazy'}
+    file = items.entries[0]
+    assert isinstance(file, FileFull)
+    assert vars(file).keys() == {'_raw_data', '_lazy'}
+    assert file.sha_1 == 'abc'
+    assert isinstance(file.parent, FolderMini)
+    assert file.description is None
+    assert not hasattr(file, 'sha1')
+    assert vars(items.entries[1]).keys() == {'_raw_data', '_lazy'}
+
+    file.description = 'changed'
+    expected = deserialize(data, Items).to_dict()
+    expected['entries'][0]['description'] = 'changed'
+    assert items.to_dict() == expected
+
+
+def test_deserialization_without_raw_data():
+    data = {
+        'type': 'file',
+        'id': '1',
+        'sha1': 'abc',
+        'parent': {'type': 'folder', 'id': '2'},
+        'unknown': 'value',
+    }
+    with deserialization_options(retain_raw_data=False):
+        file = deserialize(data, FileFull)
+
+    assert type(file) is FileFull
+    assert isinstance(file.parent, FolderMini)
+    assert file.raw_data == {}
+    assert file.to_dict() == deserialize(data, FileFull).to_dict()
+
+    restored = pickle.loads(pickle.dumps(file))
+    assert type(restored) is FileFull
+    assert restored.to_dict() == file.to_dict()
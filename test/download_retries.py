@@ -0,0 +1,171 @@
+import hashlib
+from io import BytesIO
+from unittest.mock import Mock
+
+import pytest
+
+from box_sdk_gen import (
+    BoxAPIError,
+    BoxRetryStrategy,
+    BoxSDKError,
+    DownloadsManager,
+    FetchResponse,
+    NetworkSession,
+    ResponseByteStream,
+)
+from box_sdk_gen.box.errors import RequestInfo, ResponseInfo
+
+CONTENT = b'0123456789' * 10
+
+
+def make_downloads_manager(content_responses, sha_1=hashlib.sha1(CONTENT).hexdigest()):
+    """
+    Returns a downloads manager whose content requests are answered in turn by `content_responses`,
+    functions called with the requested range returning a FetchResponse.
+    """
+    ranges = []
+
+    def fetch(options):
+        if not options.url.endswith('/content'):
+            return FetchResponse(
+                status=200,
+                headers={},
+                data={
+                    'type': 'file',
+                    'id': '1',
+                    'size': len(CONTENT),
+                    'sha1': sha_1,
+                    'file_version': {'type': 'file_version', 'id': '2'},
+                },
+            )
+        ranges.append(options.headers.get('range', None))
+        return content_responses.pop(0)(options.headers.get('range', None))
+
+    network_client = Mock()
+    network_client.fetch.side_effect = fetch
+    retry_strategy = BoxRetryStrategy(retry_base_interval=0)
+    retry_strategy.retry_after = Mock(wraps=retry_strategy.retry_after)
+    network_session = NetworkSession(
+        network_client=network_client, retry_strategy=retry_strategy
+    )
+    return DownloadsManager(auth=Mock(), network_session=network_session), ranges
+
+
+def content_response(start, end=None, fail_after=None, close_response=None):
+    def respond(range):
+        chunks = [CONTENT[start:end][:fail_after]]
+
+        def iterate():
+            yield from chunks
+            if fail_after is not None:
+                raise OSError('Connection reset')
+
+        return FetchResponse(
+            status=206 if range else 200,
+            headers={},
+            content=ResponseByteStream(iterate(), close_response=close_response),
+        )
+
+    return respond
+
+
+def not_ready_response(range):
+    return FetchResponse(status=202, headers={})
+
+
+def not_found_response(range):
+    raise BoxAPIError(
+        request_info=RequestInfo(
+            method='GET',
+            url='https://api.box.com/2.0/files/1/content',
+            query_params={},
+            headers={},
+        ),
+        response_info=ResponseInfo(status_code=404, headers={}),
+        message='Not Found',
+    )
+
+
+class NonSeekableOutputStream(BytesIO):
+    def seekable(self):
+        return False
+
+
+def test_download_file_parallel_retries_ranges_not_ready_yet():
+    close_response = Mock()
+    downloads, ranges = make_downloads_manager(
+        [
+            not_ready_response,
+            content_response(0, 50, fail_after=20, close_response=close_response),
+            content_response(20, 50),
+            content_response(50),
+        ]
+    )
+    output_stream = BytesIO()
+
+    downloads.download_file_parallel(
+        '1', output_stream, parts=1, part_size=50, max_range_retries=2
+    )
+
+    assert output_stream.getvalue() == CONTENT
+    assert ranges == ['bytes=0-49', 'bytes=0-49', 'bytes=20-49', 'bytes=50-99']
+    close_response.assert_called_once()
+    assert downloads.network_session.retry_strategy.retry_after.call_count == 2
+
+
+def test_download_file_resumable_closes_failed_responses_and_waits():
+    close_responses = [Mock(), Mock()]
+    downloads, ranges = make_downloads_manager(
+        [
+            content_response(0, fail_after=30, close_response=close_responses[0]),
+            not_ready_response,
+            content_response(30, fail_after=40, close_response=close_responses[1]),
+            content_response(70),
+        ]
+    )
+    output_stream = BytesIO()
+
+    downloads.download_file_resumable('1', output_stream, max_resume_attempts=1)
+
+    assert output_stream.getvalue() == CONTENT
+    assert ranges == [None, 'bytes=30-', 'bytes=30-', 'bytes=70-']
+    for close_response in close_responses:
+        close_response.assert_called_once()
+    assert downloads.network_session.retry_strategy.retry_after.call_count == 3
+
+
+def test_download_file_parallel_does_not_retry_client_errors():
+    downloads, ranges = make_downloads_manager([not_found_response])
+
+    with pytest.raises(BoxAPIError):
+        downloads.download_file_parallel(
+            '1', BytesIO(), parts=1, part_size=100, max_range_retries=2
+        )
+
+    assert ranges == ['bytes=0-99']
+    downloads.network_session.retry_strategy.retry_after.assert_not_called()
+
+
+def test_download_file_parallel_verifies_non_seekable_output_stream():
+    downloads, ranges = make_downloads_manager(
+        [content_response(0, fail_after=30), content_response(30)],
+        sha_1=hashlib.sha1(b'other content').hexdigest(),
+    )
+    output_stream = NonSeekableOutputStream()
+
+    with pytest.raises(BoxSDKError, match='SHA-1'):
+        downloads.download_file_parallel('1', output_stream, max_range_retries=1)
+
+    assert output_stream.getvalue() == CONTENT
+    assert ranges == [None, 'bytes=30-']
+
+
+def test_download_file_parallel_skips_verification_without_sha_1():
+    downloads, ranges = make_downloads_manager(
+        [content_response(0, 50), content_response(50)], sha_1=None
+    )
+    output_stream = BytesIO()
+
+    downloads.download_file_parallel('1', output_stream, parts=1, part_size=50)
+
+    assert output_stream.getvalue() == CONTENT
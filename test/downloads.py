@@ -88,3 +88,34 @@ def test_download_file_to_output_stream():
     downloaded_file_content: Buffer = read_buffer_from_file(new_file_name)
     assert buffer_equals(downloaded_file_content, file_buffer)
     client.files.delete_file_by_id(uploaded_file.id)
+
+
+def test_download_file_parallel():
+    new_file_name: str = get_uuid()
+    file_buffer: Buffer = generate_byte_buffer(5 * 1024 * 1024 + 123)
+    file_content_stream: ByteStream = generate_byte_stream_from_buffer(file_buffer)
+    uploaded_files: Files = client.uploads.upload_file(
+        UploadFileAttributes(
+            name=new_file_name, parent=UploadFileAttributesParentField(id='0')
+        ),
+        file_content_stream,
+    )
+    uploaded_file: FileFull = uploaded_files.entries[0]
+    file_output_stream: OutputStream = get_file_output_stream(new_file_name)
+    client.downloads.download_file_parallel(
+        uploaded_file.id, file_output_stream, parts=3, part_size=1024 * 1024
+    )
+    close_file_output_stream(file_output_stream)
+    downloaded_file_content: Buffer = read_buffer_from_file(new_file_name)
+    assert buffer_equals(downloaded_file_content, file_buffer)
+    client.files.delete_file_by_id(uploaded_file.id)
+
+
+def test_download_file_resumable():
+    uploaded_file: FileFull = upload_new_file()
+    file_output_stream: OutputStream = get_file_output_stream(uploaded_file.name)
+    client.downloads.download_file_resumable(uploaded_file.id, file_output_stream)
+    close_file_output_stream(file_output_stream)
+    downloaded_file_content: Buffer = read_buffer_from_file(uploaded_file.name)
+    assert len(downloaded_file_content) == uploaded_file.size
+    client.files.delete_file_by_id(uploaded_file.id)
@@ -0,0 +1,148 @@
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from box_sdk_gen import (
+    BoxAPIError,
+    EventDeduplicator,
+    Events,
+    EventsManager,
+    GetEventStreamQueryParams,
+    InMemoryStreamPositionStorage,
+)
+from box_sdk_gen.box.errors import RequestInfo, ResponseInfo
+
+
+def test_event_deduplicator_evicts_least_recently_seen_events():
+    deduplicator = EventDeduplicator(2, event_ids=['a', 'b'])
+
+    assert deduplicator.is_duplicate('a')
+    assert not deduplicator.is_duplicate('c')
+    assert deduplicator.event_ids == ['a', 'c']
+    assert not deduplicator.is_duplicate('b')
+    assert not deduplicator.is_duplicate(None)
+    assert deduplicator.duplicates_dropped == 1
+    assert len(deduplicator) == 2
+
+
+def test_event_stream_drops_duplicates_and_stores_position():
+    pages = {
+        '10': Events.from_dict(
+            {
+                'next_stream_position': 20,
+                'entries': [
+                    {'type': 'event', 'event_id': 'a'},
+                    {'type': 'event', 'event_id': 'b'},
+                    {'type': 'event', 'event_id': 'a'},
+                ],
+            }
+        ),
+        '20': Events.from_dict(
+            {
+                'next_stream_position': 30,
+                'entries': [
+                    {'type': 'event', 'event_id': 'b'},
+                    {'type': 'event', 'event_id': 'c'},
+                ],
+            }
+        ),
+    }
+    events_manager = Mock()
+    events_manager.get_events.side_effect = lambda stream_position, **kwargs: pages[
+        stream_position
+    ]
+    position_storage = InMemoryStreamPositionStorage('10')
+    position_storage.store_event_ids(['x'])
+    event_stream = EventsManager.get_event_stream(
+        events_manager, position_storage=position_storage
+    )
+
+    first_batch = event_stream._fetch_events()
+    assert [event.event_id for event in first_batch] == ['a', 'b']
+    assert position_storage.get() == '20'
+    assert position_storage.get_event_ids() == ['x', 'b', 'a']
+
+    second_batch = event_stream._fetch_events()
+    assert next(second_batch).event_id == 'c'
+    assert position_storage.get() == '20'
+    assert list(second_batch) == []
+    assert position_storage.get() == '30'
+    assert event_stream.duplicates_dropped == 2
+
+
+def test_event_stream_iter_batches_fetches_backlog_with_backpressure():
+    def page(next_stream_position, *event_ids):
+        return Events.from_dict(
+            {
+                'next_stream_position': next_stream_position,
+                'entries': [
+                    {'type': 'event', 'event_id': event_id} for event_id in event_ids
+                ],
+            }
+        )
+
+    pages = {
+        '0': page(1, 'a', 'b', 'c', 'd'),
+        '1': page(2, 'e', 'f', 'g', 'h'),
+        '2': page(3, 'i'),
+    }
+    events_manager = Mock()
+    events_manager.get_events.side_effect = lambda stream_position, **kwargs: pages[
+        stream_position
+    ]
+    position_storage = InMemoryStreamPositionStorage()
+    event_stream = EventsManager.get_event_stream(
+        events_manager,
+        query_params=GetEventStreamQueryParams(stream_position='0', limit=4),
+        position_storage=position_storage,
+    )
+    event_stream._get_long_poll_info_and_poll = Mock(return_value='stop')
+
+    batches = event_stream.iter_batches(max_batch=3, max_wait=0.1, max_queued_events=2)
+    first_batch = next(batches)
+    time.sleep(0.2)
+
+    assert [event.event_id for event in first_batch] == ['a', 'b', 'c']
+    assert events_manager.get_events.call_count <= 2
+    assert position_storage.get() is None
+    assert [[event.event_id for event in batch] for batch in batches] == [
+        ['d', 'e', 'f'],
+        ['g', 'h', 'i'],
+    ]
+    assert events_manager.get_events.call_args.kwargs['limit'] == 4
+    assert event_stream._get_long_poll_info_and_poll.call_count == 1
+    assert position_storage.get() == '3'
+
+
+def test_event_stream_iter_batches_raises_client_errors():
+    events_manager = Mock()
+    events_manager.get_events.side_effect = [
+        Events.from_dict(
+            {
+                'next_stream_position': 1,
+                'entries': [{'type': 'event', 'event_id': 'a'}],
+            }
+        ),
+        BoxAPIError(
+            request_info=RequestInfo(
+                method='GET',
+                url='https://api.box.com/2.0/events',
+                query_params={},
+                headers={},
+            ),
+            response_info=ResponseInfo(status_code=403, headers={}),
+            message='Forbidden',
+        ),
+    ]
+    event_stream = EventsManager.get_event_stream(
+        events_manager,
+        query_params=GetEventStreamQueryParams(stream_position='0', limit=1),
+    )
+    event_stream._get_long_poll_info_and_poll = Mock(return_value='fetch_events')
+    batches = event_stream.iter_batches(max_batch=10, max_wait=0.1)
+
+    assert [event.event_id for event in next(batches)] == ['a']
+    with pytest.raises(BoxAPIError):
+        next(batches)
+    assert events_manager.get_events.call_count == 2
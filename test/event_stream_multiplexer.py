@@ -0,0 +1,78 @@
+from unittest.mock import Mock
+
+from box_sdk_gen import (
+    EventStreamMultiplexer,
+    Events,
+    InMemoryStreamPositionStorage,
+)
+
+
+def test_event_stream_multiplexer_tags_events_with_their_user():
+    def page(next_stream_position, *event_ids):
+        return Events.from_dict(
+            {
+                'next_stream_position': next_stream_position,
+                'entries': [
+                    {'type': 'event', 'event_id': event_id} for event_id in event_ids
+                ],
+            }
+        )
+
+    pages = {
+        '1': {'5': page(6, 'a', 'b', 'a'), '6': page(6)},
+        '2': {'now': page(20), '20': page(21, 'c'), '21': page(21)},
+    }
+
+    def with_as_user_header(user_id):
+        user_client = Mock()
+        user_client.events.get_events.side_effect = (
+            lambda stream_position, **kwargs: pages[user_id][stream_position]
+        )
+        return user_client
+
+    client = Mock()
+    client.with_as_user_header.side_effect = with_as_user_header
+    position_storages = {
+        '1': InMemoryStreamPositionStorage('5'),
+        '2': InMemoryStreamPositionStorage(),
+    }
+    multiplexer = EventStreamMultiplexer(
+        client,
+        max_workers=2,
+        poll_interval=0.05,
+        page_size=3,
+        position_storage_factory=position_storages.get,
+    )
+    multiplexer.add_user('1')
+    multiplexer.add_user('2')
+    multiplexer.start()
+
+    user_events = []
+    for user_event in multiplexer:
+        user_events.append((user_event.user_id, user_event.event.event_id))
+        if len(user_events) == 3:
+            multiplexer.stop()
+
+    assert sorted(user_events) == [('1', 'a'), ('1', 'b'), ('2', 'c')]
+    assert position_storages['1'].get() == '6'
+    assert position_storages['2'].get() == '21'
+    assert multiplexer.user_ids == ['1', '2']
+
+
+def test_event_stream_multiplexer_backs_off_idle_streams():
+    client = Mock()
+    client.with_as_user_header.return_value.events.get_events.return_value = (
+        Events.from_dict({'next_stream_position': 1, 'entries': []})
+    )
+    multiplexer = EventStreamMultiplexer(
+        client, poll_interval=10, max_poll_interval=60, page_size=2
+    )
+    multiplexer.add_user('1')
+    stream = multiplexer._streams['1']
+
+    delays = [multiplexer._get_poll_delay(stream, 0) for _ in range(5)]
+    assert delays == [10, 20, 40, 60, 60]
+    assert multiplexer._get_poll_delay(stream, 1) == 10
+    assert multiplexer._get_poll_delay(stream, 0) == 10
+    assert multiplexer._get_poll_delay(stream, 2) == 0
+    assert multiplexer._poll_stream(stream) == 0
@@ -0,0 +1,289 @@
+import hashlib
+import os
+from unittest.mock import Mock
+
+from box_sdk_gen import (
+    BoxSDKError,
+    ChangeSet,
+    FileFull,
+    FileVersionMini,
+    FolderMini,
+    FolderSync,
+    ItemChange,
+    ItemChangeType,
+    SyncActionType,
+    SyncDirection,
+)
+
+
+def test_folder_sync_downloads_only_changed_files(tmp_path):
+    contents = {'1': b'first', '2': b'second'}
+    remote_files = [
+        FileFull(
+            id='1', name='a.txt', sha_1=hashlib.sha1(b'first').hexdigest(), etag='0'
+        ),
+        FileFull(
+            id='2', name='b.txt', sha_1=hashlib.sha1(b'second').hexdigest(), etag='0'
+        ),
+    ]
+    client = Mock()
+    client.folders.walk.side_effect = lambda folder_id, **kwargs: iter(
+        [
+            ('Root', [FolderMini(id='5', name='sub')], [remote_files[0]]),
+            ('Root/sub', [], [remote_files[1]]),
+        ]
+    )
+    client.downloads.download_file_to_output_stream.side_effect = (
+        lambda file_id, output_stream, **kwargs: output_stream.write(contents[file_id])
+    )
+    sync = FolderSync(client)
+
+    report = sync.sync('0', str(tmp_path), SyncDirection.DOWNLOAD, dry_run=True)
+    assert [(action.type, action.path) for action in report.actions] == [
+        (SyncActionType.CREATE_FOLDER, 'sub'),
+        (SyncActionType.DOWNLOAD, 'a.txt'),
+        (SyncActionType.DOWNLOAD, 'sub/b.txt'),
+    ]
+    assert not os.listdir(tmp_path)
+
+    report = sync.sync('0', str(tmp_path), SyncDirection.DOWNLOAD)
+    assert not report.failed
+    assert (tmp_path / 'sub' / 'b.txt').read_bytes() == b'second'
+
+    remote_files[1] = FileFull(
+        id='2', name='b.txt', sha_1=hashlib.sha1(b'changed').hexdigest(), etag='1'
+    )
+    contents['2'] = b'changed'
+    report = sync.sync('0', str(tmp_path), SyncDirection.DOWNLOAD)
+    assert [(action.type, action.path) for action in report.actions] == [
+        (SyncActionType.DOWNLOAD, 'sub/b.txt')
+    ]
+    assert report.unchanged == 1
+    assert (tmp_path / 'sub' / 'b.txt').read_bytes() == b'changed'
+
+
+def test_folder_sync_uploads_new_files_and_versions(tmp_path):
+    (tmp_path / 'new.txt').write_bytes(b'new')
+    (tmp_path / 'changed.txt').write_bytes(b'local')
+    (tmp_path / 'same.txt').write_bytes(b'same')
+    client = Mock()
+    client.folders.walk.return_value = [
+        (
+            'Root',
+            [],
+            [
+                FileFull(id='1', name='changed.txt', sha_1='0' * 40, etag='0'),
+                FileFull(
+                    id='2', name='same.txt', sha_1=hashlib.sha1(b'same').hexdigest()
+                ),
+            ],
+        )
+    ]
+    client.uploads.upload_file.return_value = Mock(entries=[FileFull(id='3')])
+    client.uploads.upload_file_version.return_value = Mock(entries=[FileFull(id='1')])
+
+    report = FolderSync(client).sync('0', str(tmp_path), SyncDirection.UPLOAD)
+
+    assert not report.failed
+    assert sorted((action.type, action.path) for action in report.actions) == [
+        (SyncActionType.UPLOAD, 'new.txt'),
+        (SyncActionType.UPLOAD_VERSION, 'changed.txt'),
+    ]
+    assert report.unchanged == 1
+    assert client.uploads.upload_file.call_args.args[0].parent.id == '0'
+    assert client.uploads.upload_file_version.call_args.args[0] == '1'
+    assert client.uploads.upload_file_version.call_args.kwargs['if_match'] == '0'
+
+
+def test_folder_sync_applies_changes_without_rescanning(tmp_path):
+    contents = {'1': b'first', '2': b'second'}
+    client = Mock()
+    client.folders.walk.return_value = [
+        (
+            'Root',
+            [FolderMini(id='5', name='sub')],
+            [
+                FileFull(
+                    id='2',
+                    name='b.txt',
+                    sha_1=hashlib.sha1(b'second').hexdigest(),
+                    etag='0',
+                )
+            ],
+        ),
+        (
+            'Root/sub',
+            [],
+            [
+                FileFull(
+                    id='1',
+                    name='a.txt',
+                    sha_1=hashlib.sha1(b'first').hexdigest(),
+                    etag='0',
+                )
+            ],
+        ),
+    ]
+    client.downloads.download_file_to_output_stream.side_effect = (
+        lambda file_id, output_stream, **kwargs: output_stream.write(contents[file_id])
+    )
+    sync = FolderSync(client)
+    sync.sync('0', str(tmp_path), SyncDirection.DOWNLOAD)
+
+    contents['2'] = b'changed'
+    path_collection = {
+        'total_count': 1,
+        'entries': [{'type': 'folder', 'id': '0', 'name': 'All Files'}],
+    }
+    changed_files = {
+        '1': FileFull.from_dict(
+            {
+                'type': 'file',
+                'id': '1',
+                'name': 'renamed.txt',
+                'sha1': hashlib.sha1(b'first').hexdigest(),
+                'etag': '1',
+                'item_status': 'active',
+                'path_collection': path_collection,
+            }
+        ),
+        '2': FileFull.from_dict(
+            {
+                'type': 'file',
+                'id': '2',
+                'name': 'b.txt',
+                'sha1': hashlib.sha1(b'changed').hexdigest(),
+                'etag': '1',
+                'item_status': 'active',
+                'path_collection': path_collection,
+            }
+        ),
+    }
+    client.files.get_file_by_id.side_effect = lambda file_id, **kwargs: changed_files[
+        file_id
+    ]
+    client.folders.walk.reset_mock()
+    change_set = ChangeSet(
+        [
+            ItemChange(ItemChangeType.MOVE, 'file', '1', None),
+            ItemChange(ItemChangeType.UPLOAD, 'file', '2', None),
+        ],
+        '10',
+    )
+
+    report = sync.apply_changes(change_set, '0', str(tmp_path))
+
+    assert not report.failed
+    assert [(action.type, action.path) for action in report.actions] == [
+        (SyncActionType.MOVE, 'renamed.txt'),
+        (SyncActionType.DOWNLOAD, 'b.txt'),
+    ]
+    assert (tmp_path / 'renamed.txt').read_bytes() == b'first'
+    assert not (tmp_path / 'sub' / 'a.txt').exists()
+    assert (tmp_path / 'b.txt').read_bytes() == b'changed'
+    client.folders.walk.assert_not_called()
+
+
+def test_folder_sync_removes_temporary_files_of_failed_downloads(tmp_path):
+    remote_file = FileFull(
+        id='1', name='a.txt', sha_1=hashlib.sha1(b'first').hexdigest(), etag='0'
+    )
+    client = Mock()
+    client.folders.walk.side_effect = lambda folder_id, **kwargs: iter(
+        [('Root', [], [remote_file])]
+    )
+
+    def download_file_to_output_stream(file_id, output_stream, **kwargs):
+        output_stream.write(b'fir')
+        raise OSError('Connection reset')
+
+    client.downloads.download_file_to_output_stream.side_effect = (
+        download_file_to_output_stream
+    )
+    # Left behind by a download interrupted by a crash
+    (tmp_path / 'b.txt.boxsync').write_bytes(b'partial')
+    sync = FolderSync(client)
+
+    report = sync.sync('0', str(tmp_path), SyncDirection.DOWNLOAD)
+    assert [(action.path, type(error)) for action, error in report.failed] == [
+        ('a.txt', OSError)
+    ]
+    assert os.listdir(tmp_path) == ['b.txt.boxsync']
+
+    report = sync.sync('0', str(tmp_path), SyncDirection.UPLOAD, dry_run=True)
+    assert report.actions == []
+
+
+def test_folder_sync_verifies_the_downloaded_version(tmp_path):
+    remote_file = FileFull(
+        id='1',
+        name='a.txt',
+        sha_1=hashlib.sha1(b'first').hexdigest(),
+        etag='0',
+        file_version=FileVersionMini(id='10'),
+    )
+    client = Mock()
+    client.folders.walk.side_effect = lambda folder_id, **kwargs: iter(
+        [('Root', [], [remote_file])]
+    )
+    # A new version was uploaded after the scan
+    client.downloads.download_file_to_output_stream.side_effect = (
+        lambda file_id, output_stream, version: output_stream.write(
+            b'first' if version == '10' else b'second'
+        )
+    )
+    sync = FolderSync(client)
+
+    report = sync.sync('0', str(tmp_path), SyncDirection.DOWNLOAD)
+    assert not report.failed
+    assert (tmp_path / 'a.txt').read_bytes() == b'first'
+
+    (tmp_path / 'a.txt').write_bytes(b'local')
+    remote_file.file_version = None
+    report = sync.sync('0', str(tmp_path), SyncDirection.DOWNLOAD)
+    assert [(action.path, type(error)) for action, error in report.failed] == [
+        ('a.txt', BoxSDKError)
+    ]
+    assert os.listdir(tmp_path) == ['a.txt']
+    assert (tmp_path / 'a.txt').read_bytes() == b'local'
+
+
+def test_folder_sync_deletes_folders_removed_from_the_source(tmp_path):
+    (tmp_path / 'kept').mkdir()
+    (tmp_path / 'kept' / 'removed.txt').write_bytes(b'removed')
+    (tmp_path / 'removed' / 'sub').mkdir(parents=True)
+    (tmp_path / 'removed' / 'a.txt').write_bytes(b'a')
+    (tmp_path / 'removed' / 'sub' / 'b.txt').write_bytes(b'b')
+    client = Mock()
+    client.folders.walk.side_effect = lambda folder_id, **kwargs: iter(
+        [('Root', [FolderMini(id='5', name='kept')], []), ('Root/kept', [], [])]
+    )
+    sync = FolderSync(client, delete=True)
+
+    report = sync.sync('0', str(tmp_path), SyncDirection.DOWNLOAD)
+    assert not report.failed
+    assert [(action.type, action.path) for action in report.actions] == [
+        (SyncActionType.DELETE_FOLDER, 'removed'),
+        (SyncActionType.DELETE, 'kept/removed.txt'),
+    ]
+    assert os.listdir(tmp_path) == ['kept']
+    assert os.listdir(tmp_path / 'kept') == []
+
+    client.folders.walk.side_effect = lambda folder_id, **kwargs: iter(
+        [
+            (
+                'Root',
+                [FolderMini(id='5', name='kept'), FolderMini(id='6', name='removed')],
+                [],
+            ),
+            ('Root/kept', [], []),
+            ('Root/removed', [FolderMini(id='7', name='sub')], []),
+            ('Root/removed/sub', [], []),
+        ]
+    )
+    report = sync.sync('0', str(tmp_path), SyncDirection.UPLOAD)
+    assert not report.failed
+    assert [(action.type, action.path) for action in report.actions] == [
+        (SyncActionType.DELETE_FOLDER, 'removed')
+    ]
+    client.folders.delete_folder_by_id.assert_called_once_with('6', recursive=True)
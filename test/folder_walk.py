@@ -0,0 +1,46 @@
+from unittest.mock import Mock
+
+from box_sdk_gen import (
+    FileFull,
+    FolderFull,
+    FolderMini,
+    FoldersManager,
+    Items,
+)
+
+
+def test_walk_folder_tree():
+    tree = {
+        '0': [FolderMini(id='1', name='a'), FolderMini(id='2', name='b')],
+        '1': [FolderMini(id='3', name='c'), FileFull(id='10', name='x.txt')],
+        '2': [FileFull(id='11', name='y.txt')],
+        '3': [FileFull(id='12', name='z.txt')],
+    }
+    folders = FoldersManager(auth=Mock(), network_session=Mock())
+    folders.get_folder_by_id = Mock(return_value=FolderFull(id='0', name='All Files'))
+    folders.get_folder_items = Mock(
+        side_effect=lambda folder_id, **kwargs: Items(entries=tree[folder_id])
+    )
+
+    walked = {
+        path: ([folder.id for folder in subfolders], [file.id for file in files])
+        for path, subfolders, files in folders.walk('0', max_concurrency=2)
+    }
+
+    assert walked == {
+        'All Files': (['1', '2'], []),
+        'All Files/a': (['3'], ['10']),
+        'All Files/b': ([], ['11']),
+        'All Files/a/c': ([], ['12']),
+    }
+    assert sorted(path for path, _, _ in folders.walk('0', max_depth=1)) == [
+        'All Files',
+        'All Files/a',
+        'All Files/b',
+    ]
+
+    pruned = []
+    for path, subfolders, _ in folders.walk('0'):
+        pruned.append(path)
+        subfolders[:] = [folder for folder in subfolders if folder.name != 'a']
+    assert pruned == ['All Files', 'All Files/b']
@@ -0,0 +1,58 @@
+import importlib
+import os
+import subprocess
+import sys
+from typing import Optional
+
+import pytest
+
+import box_sdk_gen
+from box_sdk_gen import FileFull
+from box_sdk_gen.internal.base_object import BaseObject
+
+
+def test_schemas_and_managers_are_imported_on_first_access():
+    script = '''
+import sys
+import box_sdk_gen
+
+assert 'box_sdk_gen.managers.zip_downloads' not in sys.modules
+assert 'box_sdk_gen.schemas.zip_download_status' not in sys.modules
+client = box_sdk_gen.BoxClient(auth=box_sdk_gen.BoxDeveloperTokenAuth(token='token'))
+assert 'box_sdk_gen.managers.zip_downloads' not in sys.modules
+assert isinstance(client.zip_downloads, box_sdk_gen.ZipDownloadsManager)
+assert client.zip_downloads is client.zip_downloads
+status_module = sys.modules['box_sdk_gen.schemas.zip_download_status']
+assert box_sdk_gen.ZipDownloadStatus is status_module.ZipDownloadStatus
+'''
+    subprocess.run([sys.executable, '-c', script], check=True)
+
+
+@pytest.mark.parametrize('package', [box_sdk_gen.schemas, box_sdk_gen.managers])
+def test_lazy_attributes_cover_every_module(package):
+    modules = {
+        name[: -len('.py')]
+        for name in os.listdir(os.path.dirname(package.__file__))
+        if name.endswith('.py') and name != '__init__.py'
+    }
+    lazy_modules = set(package._LAZY_ATTRIBUTES.values())
+
+    assert modules <= lazy_modules
+    for name, module in package._LAZY_ATTRIBUTES.items():
+        module = importlib.import_module(f'{package.__name__}.{module}')
+        assert getattr(package, name) is vars(module)[name]
+
+
+@pytest.mark.parametrize(
+    'package, name, value',
+    [
+        (box_sdk_gen.managers, 'FileFull', FileFull),
+        (box_sdk_gen.schemas, 'BaseObject', BaseObject),
+        (box_sdk_gen.schemas, 'Optional', Optional),
+        (box_sdk_gen, 'Optional', Optional),
+    ],
+)
+def test_lazy_attributes_fall_back_to_star_imported_names(package, name, value):
+    assert getattr(package, name) is value
+    with pytest.raises(AttributeError):
+        getattr(package, 'NotExported')
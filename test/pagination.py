@@ -0,0 +1,174 @@
+import pytest
+import threading
+import time
+from unittest import mock
+from unittest.mock import Mock
+
+from box_sdk_gen import (
+    FolderMini,
+    FoldersManager,
+    GetTrashedItemsDirection,
+    GetTrashedItemsSort,
+    Groups,
+    Items,
+    MarkerPaginator,
+    OffsetPaginator,
+    TrashedItemsManager,
+)
+
+
+def test_marker_paginator_follows_next_marker():
+    pages = {
+        None: Items(entries=[FolderMini(id='1'), FolderMini(id='2')], next_marker='m1'),
+        'm1': Items(entries=[FolderMini(id='3')], next_marker=''),
+    }
+    fetch_page = Mock(
+        side_effect=lambda folder_id, marker=None, **kwargs: pages[marker]
+    )
+    folders = FoldersManager(auth=Mock(), network_session=Mock())
+    folders.get_folder_items = fetch_page
+
+    paginator = folders.iterate_folder_items('0', fields=['name'], page_size=2)
+
+    assert isinstance(paginator, MarkerPaginator)
+    assert [item.id for item in paginator] == ['1', '2', '3']
+    fetch_page.assert_has_calls(
+        [
+            mock.call(
+                '0',
+                usemarker=True,
+                sort=None,
+                direction=None,
+                boxapi=None,
+                extra_headers=None,
+                limit=2,
+                fields=['name'],
+            ),
+            mock.call(
+                '0',
+                usemarker=True,
+                sort=None,
+                direction=None,
+                boxapi=None,
+                extra_headers=None,
+                marker='m1',
+                limit=2,
+                fields=['name'],
+            ),
+        ]
+    )
+
+
+@pytest.mark.parametrize('prefetch', [False, True])
+def test_offset_paginator_stops_at_total_count(prefetch):
+    groups = [FolderMini(id=str(index)) for index in range(5)]
+    fetch_page = Mock(
+        side_effect=lambda offset, limit: Groups(
+            entries=groups[offset:][:limit], total_count=len(groups)
+        )
+    )
+
+    paginator = OffsetPaginator(fetch_page, page_size=2, prefetch=prefetch)
+
+    assert [group.id for group in paginator] == ['0', '1', '2', '3', '4']
+    assert [call.kwargs['offset'] for call in fetch_page.call_args_list] == [0, 2, 4]
+
+
+@pytest.mark.parametrize('max_concurrency', [None, 2])
+def test_offset_paginator_advances_by_limit_past_short_pages(max_concurrency):
+    groups = [FolderMini(id=str(index)) for index in range(7)]
+    hidden_ids = {'1', '4'}
+
+    def fetch_page(offset, limit):
+        # Hidden entries are counted by the API but not returned
+        return Groups(
+            entries=[
+                group for group in groups[offset:][:limit] if group.id not in hidden_ids
+            ],
+            limit=limit,
+            offset=offset,
+            total_count=len(groups),
+        )
+
+    paginator = OffsetPaginator(
+        Mock(side_effect=fetch_page), page_size=3, max_concurrency=max_concurrency
+    )
+
+    assert [group.id for group in paginator] == ['0', '2', '3', '5', '6']
+    assert [call.kwargs['offset'] for call in paginator.fetch_page.call_args_list] == [
+        0,
+        3,
+        6,
+    ]
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_offset_paginator_fetches_pages_concurrently(ordered):
+    groups = [FolderMini(id=str(index)) for index in range(95)]
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def fetch_page(offset, limit):
+        with lock:
+            in_flight.append(offset)
+            max_in_flight.append(len(in_flight))
+        # Later pages are returned first
+        time.sleep(0.001 * (100 - offset) / 10)
+        with lock:
+            in_flight.remove(offset)
+        return Groups(
+            entries=groups[offset:][:limit],
+            limit=limit,
+            offset=offset,
+            total_count=len(groups),
+        )
+
+    paginator = OffsetPaginator(
+        fetch_page, page_size=10, max_concurrency=4, ordered=ordered
+    )
+    ids = [group.id for group in paginator]
+
+    assert len(ids) == len(groups)
+    assert sorted(ids, key=int) == [group.id for group in groups]
+    assert (ids == [group.id for group in groups]) == ordered
+    assert max(max_in_flight) <= 4
+
+
+def test_iterate_folder_items_falls_back_to_marker_past_max_offset():
+    def get_folder_items(folder_id, offset=None, marker=None, usemarker=None, **kwargs):
+        if not usemarker:
+            assert offset == 0
+            return Items(
+                entries=[FolderMini(id='0')], limit=1000, offset=0, total_count=20000
+            )
+        if marker is None:
+            return Items(entries=[FolderMini(id='1')], next_marker='m1')
+        return Items(entries=[FolderMini(id='2')], next_marker='')
+
+    folders = FoldersManager(auth=Mock(), network_session=Mock())
+    folders.get_folder_items = Mock(side_effect=get_folder_items)
+
+    paginator = folders.iterate_folder_items('0', page_size=1000, max_concurrency=4)
+
+    assert [item.id for item in paginator] == ['1', '2']
+    assert folders.get_folder_items.call_count == 3
+
+
+@pytest.mark.parametrize('max_concurrency', [None, 2])
+def test_iterate_trashed_items_forwards_sort_and_direction(max_concurrency):
+    trashed_items = TrashedItemsManager(auth=Mock(), network_session=Mock())
+    trashed_items.get_trashed_items = Mock(
+        return_value=Items(entries=[FolderMini(id='1')], next_marker='', total_count=1)
+    )
+
+    paginator = trashed_items.iterate_trashed_items(
+        sort=GetTrashedItemsSort.DATE,
+        direction=GetTrashedItemsDirection.DESC,
+        max_concurrency=max_concurrency,
+    )
+
+    assert [item.id for item in paginator] == ['1']
+    kwargs = trashed_items.get_trashed_items.call_args.kwargs
+    assert kwargs['sort'] == GetTrashedItemsSort.DATE
+    assert kwargs['direction'] == GetTrashedItemsDirection.DESC
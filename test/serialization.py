@@ -0,0 +1,20 @@
+import json
+
+from box_sdk_gen import FolderMini, UploadPart
+from box_sdk_gen.serialization.json import serialize, sd_to_json_bytes
+
+
+def test_serialize_request_body_without_intermediate_objects():
+    body = {
+        'parts': [UploadPart(part_id='A', offset=0, size=3)],
+        'parent': FolderMini(id='1'),
+        'description': None,
+        'attributes': {'sha1': 'abc', 'tags': ['one']},
+    }
+
+    assert serialize(body) == {
+        'parts': [{'part_id': 'A', 'offset': 0, 'size': 3}],
+        'parent': {'id': '1', 'type': 'folder'},
+        'attributes': {'sha1': 'abc', 'tags': ['one']},
+    }
+    assert json.loads(sd_to_json_bytes(serialize(body))) == serialize(body)
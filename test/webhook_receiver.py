@@ -0,0 +1,96 @@
+import datetime
+import json
+from io import BytesIO
+from unittest.mock import Mock
+
+from box_sdk_gen import (
+    WebhookReceiver,
+    WebhookTriggersField,
+)
+from box_sdk_gen.internal.utils import (
+    compute_webhook_signature,
+    date_time_to_string,
+)
+
+
+def test_webhook_receiver_validates_and_dispatches_notifications():
+    body = json.dumps(
+        {
+            'type': 'webhook_event',
+            'id': '1',
+            'trigger': 'FILE.UPLOADED',
+            'webhook': {'id': '2', 'type': 'webhook'},
+            'source': {'type': 'file', 'id': '3', 'name': 'caf\u00e9.txt'},
+        },
+        ensure_ascii=False,
+    )
+    headers = {
+        'box-delivery-timestamp': date_time_to_string(
+            datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+        ),
+        'box-signature-version': '1',
+        'box-signature-algorithm': 'HmacSHA256',
+    }
+    headers['box-signature-secondary'] = compute_webhook_signature(
+        body, headers, 'secondary', escape_body=True
+    )
+    received = []
+    receiver = WebhookReceiver(
+        'primary', secondary_key='secondary', max_queued_notifications=1
+    )
+    receiver.add_handler(received.append, triggers=[WebhookTriggersField.FILE_UPLOADED])
+    receiver.add_handler(Mock(), triggers=[WebhookTriggersField.FILE_DELETED])
+
+    def post(body, headers):
+        encoded_body = body.encode('utf-8')
+        environ = {
+            'REQUEST_METHOD': 'POST',
+            'CONTENT_LENGTH': str(len(encoded_body)),
+            'wsgi.input': BytesIO(encoded_body),
+        }
+        for name, value in headers.items():
+            environ['HTTP_' + name.upper().replace('-', '_')] = value
+        start_response = Mock()
+        assert receiver(environ, start_response) == []
+        return start_response.call_args.args[0]
+
+    assert post(body, {**headers, 'box-signature-secondary': 'invalid'}) == (
+        '403 Forbidden'
+    )
+    assert post(body, headers) == '200 OK'
+    assert post(body, headers) == '503 Service Unavailable'
+    receiver.start()
+    receiver.stop()
+
+    assert len(received) == 1
+    assert received[0].trigger == WebhookTriggersField.FILE_UPLOADED
+    assert received[0].source.name == 'caf\u00e9.txt'
+    assert received[0].webhook.id == '2'
+
+
+def test_webhook_receiver_rejects_invalid_bodies_and_logs_handler_errors(caplog):
+    headers = {
+        'box-delivery-timestamp': date_time_to_string(
+            datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+        ),
+        'box-signature-version': '1',
+        'box-signature-algorithm': 'HmacSHA256',
+        'box-signature-primary': 'invalid',
+    }
+    receiver = WebhookReceiver('primary')
+
+    assert receiver.receive(b'\xff\xfe', headers) == 403
+    # Returns right away, since no worker was started
+    receiver.stop()
+
+    body = b'{"type": "webhook_event", "id": "1", "trigger": "FILE.UPLOADED"}'
+    headers['box-signature-primary'] = compute_webhook_signature(
+        body.decode('utf-8'), headers, 'primary'
+    )
+    receiver.add_handler(Mock(side_effect=ValueError('handler error')))
+    assert receiver.receive(body, headers) == 200
+    receiver.start()
+    receiver.stop()
+
+    assert 'handler failed' in caplog.text
+    assert 'handler error' in caplog.text